@@ -3,10 +3,9 @@
 from __future__ import annotations
 
 import abc
-import pickle
 from collections import OrderedDict
 from functools import partial
-from typing import Any, Literal, Union
+from typing import Any, Callable, Literal, Sequence, Union
 
 import gymnasium as gym  # type: ignore
 import numpy as np
@@ -21,8 +20,11 @@ from metaworld.env_dict import (
     ALL_V3_ENVIRONMENTS_GOAL_HIDDEN,
     ALL_V3_ENVIRONMENTS_GOAL_OBSERVABLE,
 )
+from metaworld.goal_bank import load_goal_bank, save_goal_bank
 from metaworld.sawyer_xyz_env import SawyerXYZEnv  # type: ignore
+from metaworld.task_set import TaskSet
 from metaworld.types import Task  # type: ignore
+from metaworld.vector import NativeVectorEnv, SharedMemoryVectorEnv, ThreadedVectorEnv
 from metaworld.wrappers import (
     AutoTerminateOnSuccessWrapper,
     CheckpointWrapper,
@@ -60,8 +62,8 @@ class Benchmark(abc.ABC):
 
     _train_classes: _env_dict.EnvDict
     _test_classes: _env_dict.EnvDict
-    _train_tasks: list[Task]
-    _test_tasks: list[Task]
+    _train_tasks: TaskSet
+    _test_tasks: TaskSet
 
     @abc.abstractmethod
     def __init__(self):
@@ -78,12 +80,12 @@ class Benchmark(abc.ABC):
         return self._test_classes
 
     @property
-    def train_tasks(self) -> list[Task]:
+    def train_tasks(self) -> TaskSet:
         """Returns all of the training tasks for this benchmark."""
         return self._train_tasks
 
     @property
-    def test_tasks(self) -> list[Task]:
+    def test_tasks(self) -> TaskSet:
         """Returns all of the test tasks for this benchmark."""
         return self._test_tasks
 
@@ -95,20 +97,85 @@ _MT_OVERRIDE = dict(partially_observable=False)
 """The overrides for the Multi-Task benchmarks. Enables the inclusion of the goal position in the observation."""
 
 _N_GOALS = 50
-"""The number of goals to generate for each environment."""
+"""The default number of goals to generate for each environment."""
 
+VectorStrategy = Literal["sync", "async", "native", "shared_memory", "threaded"]
+"""How the sub-environments of a benchmark are vectorized.
 
-def _encode_task(env_name, data) -> Task:
-    """Instantiates a new `Task` object after pickling the data.
+- `sync`: `gymnasium.vector.SyncVectorEnv`.
+- `async`: `gymnasium.vector.AsyncVectorEnv`.
+- `native`: `metaworld.vector.NativeVectorEnv`, steps the Metaworld envs directly without going through their wrappers.
+- `shared_memory`: `metaworld.vector.SharedMemoryVectorEnv`, like `async` but step results are returned through shared memory.
+- `threaded`: `metaworld.vector.ThreadedVectorEnv`, like `native` but the physics is stepped on a pool of `num_workers` threads.
+"""
+
+
+_WORKER_VECTOR_STRATEGIES = ("threaded", "shared_memory")
+"""The vector strategies whose number of workers can be set with `num_workers`."""
+
+
+def _get_vectorizer(
+    vector_strategy: str, num_workers: int | None = None
+) -> Callable[..., gym.vector.VectorEnv]:
+    """Returns the vector environment class for a given vector strategy.
 
     Args:
-        env_name: The name of the environment.
-        data: The task data (will be pickled).
+        vector_strategy: One of the `VectorStrategy` values.
+        num_workers: The number of workers of the vector environment, for the strategies that have them.
 
     Returns:
-        A `Task` object.
+        The vector environment class, with `num_workers` bound if given.
     """
-    return Task(env_name=env_name, data=pickle.dumps(data))
+    if num_workers is not None:
+        if vector_strategy not in _WORKER_VECTOR_STRATEGIES:
+            raise ValueError(
+                f"num_workers is only supported by the {_WORKER_VECTOR_STRATEGIES} vector strategies, got {vector_strategy!r}."
+            )
+        return partial(_get_vectorizer(vector_strategy), num_workers=num_workers)
+    if vector_strategy == "threaded":
+        return ThreadedVectorEnv
+    if vector_strategy == "native":
+        return NativeVectorEnv
+    if vector_strategy == "shared_memory":
+        return SharedMemoryVectorEnv
+    return getattr(gym.vector, f"{vector_strategy.capitalize()}VectorEnv")
+
+
+def _generate_rand_vecs(
+    env_cls: type[SawyerXYZEnv], kwargs: dict[str, Any], num_goals: int = _N_GOALS
+) -> npt.NDArray[np.float64]:
+    """Generates random goals for an environment, using the global numpy RNG.
+
+    The goals are sampled in batches with `SawyerXYZEnv.sample_rand_vecs()`, and are the same as the ones
+    `num_goals` resets of the environment would sample.
+
+    Args:
+        env_cls: The environment class.
+        kwargs: The environment's task kwargs.
+        num_goals: The number of goals.
+
+    Returns:
+        A `(num_goals, rand_vec_dim)` array of unique `rand_vec`s.
+    """
+    # Init env
+    env = env_cls(visual_assets="none")
+    env._freeze_rand_vec = False
+    env._set_task_called = True
+
+    # Set task
+    kwargs = kwargs.copy()
+    del kwargs["task_id"]
+    env._set_task_inner(**kwargs)
+
+    # Generate random goals. `reset()` calls `reset_model()` twice, and keeps the second `rand_vec`.
+    rand_vecs = env.sample_rand_vecs(2 * num_goals)[1::2]
+    unique_task_rand_vecs = np.unique(rand_vecs, axis=0)
+    assert (
+        unique_task_rand_vecs.shape[0] == num_goals
+    ), f"Only generated {unique_task_rand_vecs.shape[0]} unique goals, not {num_goals}"
+    env.close()
+    del env
+    return rand_vecs
 
 
 def _make_tasks(
@@ -116,7 +183,8 @@ def _make_tasks(
     args_kwargs: _env_dict.EnvArgsKwargsDict,
     kwargs_override: dict,
     seed: int | None = None,
-) -> list[Task]:
+    num_goals: int = _N_GOALS,
+) -> TaskSet:
     """Initialises goals for a given set of environments.
 
     Args:
@@ -124,10 +192,18 @@ def _make_tasks(
         args_kwargs: The environment arguments and keyword arguments.
         kwargs_override: Any kwarg overrides.
         seed: The random seed to use.
+        num_goals: The number of goals of each environment.
 
     Returns:
-        A flat list of `Task` objects, `_N_GOALS` for each environment in `classes`.
+        The tasks, `num_goals` for each environment in `classes`.
     """
+    # Goals generated with a seed are deterministic, so they can be loaded from the goal bank
+    bank_classes = {env_name: classes[env_name] for env_name in args_kwargs}
+    goal_bank = None
+    if seed is not None:
+        goal_bank = load_goal_bank(bank_classes, seed, num_goals)
+    generated_goals: dict[str, npt.NDArray[np.float64]] = {}
+
     # Cache existing random state
     if seed is not None:
         st0 = np.random.get_state()
@@ -139,44 +215,26 @@ def _make_tasks(
         assert isinstance(kwargs, dict)
         assert len(args["args"]) == 0
 
-        # Init env
-        env = classes[env_name]()
-        env._freeze_rand_vec = False
-        env._set_task_called = True
-        rand_vecs: list[npt.NDArray[Any]] = []
+        if goal_bank is not None:
+            rand_vecs = goal_bank[env_name]
+        else:
+            rand_vecs = _generate_rand_vecs(classes[env_name], kwargs, num_goals)
+            generated_goals[env_name] = rand_vecs
 
-        # Set task
+        # The tasks of each random goal, only created when they're used
         del kwargs["task_id"]
-        env._set_task_inner(**kwargs)
-
-        for _ in range(_N_GOALS):  # Generate random goals
-            env.reset()
-            assert env._last_rand_vec is not None
-            rand_vecs.append(env._last_rand_vec)
-        unique_task_rand_vecs = np.unique(np.array(rand_vecs), axis=0)
-        assert (
-            unique_task_rand_vecs.shape[0] == _N_GOALS
-        ), f"Only generated {unique_task_rand_vecs.shape[0]} unique goals, not {_N_GOALS}"
-        env.close()
-
-        # Create a task for each random goal
-        for rand_vec in rand_vecs:
-            kwargs = args["kwargs"].copy()
-            assert isinstance(kwargs, dict)
-            del kwargs["task_id"]
+        kwargs.update(dict(rand_vec=None, env_cls=classes[env_name]))
+        kwargs.update(kwargs_override)
+        tasks.append(TaskSet.from_rand_vecs(env_name, kwargs, rand_vecs))
 
-            kwargs.update(dict(rand_vec=rand_vec, env_cls=classes[env_name]))
-            kwargs.update(kwargs_override)
-
-            tasks.append(_encode_task(env_name, kwargs))
-
-        del env
+    if seed is not None and goal_bank is None:
+        save_goal_bank(bank_classes, seed, num_goals, generated_goals)
 
     # Restore random state
     if seed is not None:
         np.random.set_state(st0)
 
-    return tasks
+    return TaskSet.concatenate(tasks)
 
 
 # MT Benchmarks
@@ -190,7 +248,7 @@ class MT1(Benchmark):
 
     ENV_NAMES = list(_env_dict.ALL_V3_ENVIRONMENTS.keys())
 
-    def __init__(self, env_name, seed=None):
+    def __init__(self, env_name, seed=None, num_goals: int = _N_GOALS):
         super().__init__()
         if env_name not in _env_dict.ALL_V3_ENVIRONMENTS:
             raise ValueError(f"{env_name} is not a V3 environment")
@@ -200,10 +258,14 @@ class MT1(Benchmark):
         args_kwargs = _env_dict.ML1_args_kwargs[env_name]
 
         self._train_tasks = _make_tasks(
-            self._train_classes, {env_name: args_kwargs}, _MT_OVERRIDE, seed=seed
+            self._train_classes,
+            {env_name: args_kwargs},
+            _MT_OVERRIDE,
+            seed=seed,
+            num_goals=num_goals,
         )
 
-        self._test_tasks = []
+        self._test_tasks = TaskSet()
 
 
 class MT10(Benchmark):
@@ -213,16 +275,20 @@ class MT10(Benchmark):
     Has an empty test set.
     """
 
-    def __init__(self, seed=None):
+    def __init__(self, seed=None, num_goals: int = _N_GOALS):
         super().__init__()
         self._train_classes = _env_dict.MT10_V3
         self._test_classes = OrderedDict()
         train_kwargs = _env_dict.MT10_V3_ARGS_KWARGS
         self._train_tasks = _make_tasks(
-            self._train_classes, train_kwargs, _MT_OVERRIDE, seed=seed
+            self._train_classes,
+            train_kwargs,
+            _MT_OVERRIDE,
+            seed=seed,
+            num_goals=num_goals,
         )
 
-        self._test_tasks = []
+        self._test_tasks = TaskSet()
         self._test_classes = []
 
 
@@ -233,15 +299,19 @@ class MT25(Benchmark):
     Has an empty test set.
     """
 
-    def __init__(self, seed=None):
+    def __init__(self, seed=None, num_goals: int = _N_GOALS):
         super().__init__()
         self._train_classes = _env_dict.MT25_V3
         train_kwargs = _env_dict.MT25_V3_ARGS_KWARGS
         self._train_tasks = _make_tasks(
-            self._train_classes, train_kwargs, _MT_OVERRIDE, seed=seed
+            self._train_classes,
+            train_kwargs,
+            _MT_OVERRIDE,
+            seed=seed,
+            num_goals=num_goals,
         )
 
-        self._test_tasks = []
+        self._test_tasks = TaskSet()
         self._test_classes = []
 
 
@@ -252,16 +322,20 @@ class MT50(Benchmark):
     Has an empty test set.
     """
 
-    def __init__(self, seed=None):
+    def __init__(self, seed=None, num_goals: int = _N_GOALS):
         super().__init__()
         self._train_classes = _env_dict.MT50_V3
         self._test_classes = OrderedDict()
         train_kwargs = _env_dict.MT50_V3_ARGS_KWARGS
         self._train_tasks = _make_tasks(
-            self._train_classes, train_kwargs, _MT_OVERRIDE, seed=seed
+            self._train_classes,
+            train_kwargs,
+            _MT_OVERRIDE,
+            seed=seed,
+            num_goals=num_goals,
         )
 
-        self._test_tasks = []
+        self._test_tasks = TaskSet()
         self._test_classes = []
 
 
@@ -278,7 +352,7 @@ class ML1(Benchmark):
 
     ENV_NAMES = list(_env_dict.ALL_V3_ENVIRONMENTS.keys())
 
-    def __init__(self, env_name, seed=None):
+    def __init__(self, env_name, seed=None, num_goals: int = _N_GOALS):
         super().__init__()
         if env_name not in _env_dict.ALL_V3_ENVIRONMENTS:
             raise ValueError(f"{env_name} is not a V3 environment")
@@ -289,13 +363,18 @@ class ML1(Benchmark):
         args_kwargs = _env_dict.ML1_args_kwargs[env_name]
 
         self._train_tasks = _make_tasks(
-            self._train_classes, {env_name: args_kwargs}, _ML_OVERRIDE, seed=seed
+            self._train_classes,
+            {env_name: args_kwargs},
+            _ML_OVERRIDE,
+            seed=seed,
+            num_goals=num_goals,
         )
         self._test_tasks = _make_tasks(
             self._test_classes,
             {env_name: args_kwargs},
             _ML_OVERRIDE,
             seed=(seed + 1 if seed is not None else seed),
+            num_goals=num_goals,
         )
 
 
@@ -306,7 +385,7 @@ class ML10(Benchmark):
     The goal position is not part of the observation.
     """
 
-    def __init__(self, seed=None):
+    def __init__(self, seed=None, num_goals: int = _N_GOALS):
         super().__init__()
         self._train_classes = _env_dict.ML10_V3["train"]
         self._test_classes = _env_dict.ML10_V3["test"]
@@ -314,11 +393,19 @@ class ML10(Benchmark):
 
         test_kwargs = _env_dict.ML10_ARGS_KWARGS["test"]
         self._train_tasks = _make_tasks(
-            self._train_classes, train_kwargs, _ML_OVERRIDE, seed=seed
+            self._train_classes,
+            train_kwargs,
+            _ML_OVERRIDE,
+            seed=seed,
+            num_goals=num_goals,
         )
 
         self._test_tasks = _make_tasks(
-            self._test_classes, test_kwargs, _ML_OVERRIDE, seed=seed
+            self._test_classes,
+            test_kwargs,
+            _ML_OVERRIDE,
+            seed=seed,
+            num_goals=num_goals,
         )
 
 
@@ -329,7 +416,7 @@ class ML25(Benchmark):
     The goal position is not part of the observation.
     """
 
-    def __init__(self, seed=None):
+    def __init__(self, seed=None, num_goals: int = _N_GOALS):
         super().__init__()
         self._train_classes = _env_dict.ML25_V3["train"]
         self._test_classes = _env_dict.ML25_V3["test"]
@@ -337,11 +424,19 @@ class ML25(Benchmark):
 
         test_kwargs = _env_dict.ML25_ARGS_KWARGS["test"]
         self._train_tasks = _make_tasks(
-            self._train_classes, train_kwargs, _ML_OVERRIDE, seed=seed
+            self._train_classes,
+            train_kwargs,
+            _ML_OVERRIDE,
+            seed=seed,
+            num_goals=num_goals,
         )
 
         self._test_tasks = _make_tasks(
-            self._test_classes, test_kwargs, _ML_OVERRIDE, seed=seed
+            self._test_classes,
+            test_kwargs,
+            _ML_OVERRIDE,
+            seed=seed,
+            num_goals=num_goals,
         )
 
 
@@ -352,7 +447,7 @@ class ML45(Benchmark):
     The goal position is not part of the observation.
     """
 
-    def __init__(self, seed=None):
+    def __init__(self, seed=None, num_goals: int = _N_GOALS):
         super().__init__()
         self._train_classes = _env_dict.ML45_V3["train"]
         self._test_classes = _env_dict.ML45_V3["test"]
@@ -360,10 +455,18 @@ class ML45(Benchmark):
         test_kwargs = _env_dict.ML45_ARGS_KWARGS["test"]
 
         self._train_tasks = _make_tasks(
-            self._train_classes, train_kwargs, _ML_OVERRIDE, seed=seed
+            self._train_classes,
+            train_kwargs,
+            _ML_OVERRIDE,
+            seed=seed,
+            num_goals=num_goals,
         )
         self._test_tasks = _make_tasks(
-            self._test_classes, test_kwargs, _ML_OVERRIDE, seed=seed
+            self._test_classes,
+            test_kwargs,
+            _ML_OVERRIDE,
+            seed=seed,
+            num_goals=num_goals,
         )
 
 
@@ -373,7 +476,13 @@ class CustomML(Benchmark):
     Provide the desired train and test env names during initialisation.
     """
 
-    def __init__(self, train_envs: list[str], test_envs: list[str], seed=None):
+    def __init__(
+        self,
+        train_envs: list[str],
+        test_envs: list[str],
+        seed=None,
+        num_goals: int = _N_GOALS,
+    ):
         if len(set(train_envs).intersection(set(test_envs))) != 0:
             raise ValueError("The test tasks cannot contain any of the train tasks.")
 
@@ -388,16 +497,24 @@ class CustomML(Benchmark):
         )
 
         self._train_tasks = _make_tasks(
-            self._train_classes, train_kwargs, _ML_OVERRIDE, seed=seed
+            self._train_classes,
+            train_kwargs,
+            _ML_OVERRIDE,
+            seed=seed,
+            num_goals=num_goals,
         )
         self._test_tasks = _make_tasks(
-            self._test_classes, test_kwargs, _ML_OVERRIDE, seed=seed
+            self._test_classes,
+            test_kwargs,
+            _ML_OVERRIDE,
+            seed=seed,
+            num_goals=num_goals,
         )
 
 
 def _init_each_env(
     env_cls: type[SawyerXYZEnv],
-    tasks: list[Task],
+    tasks: Sequence[Task],
     seed: int | None = None,
     max_episode_steps: int | None = None,
     terminate_on_success: bool = False,
@@ -416,7 +533,23 @@ def _init_each_env(
     camera_id: int | None = None,
     width: int = 480,
     height: int = 480,
+    cache_hand_reset: bool = False,
+    obs_buffer: Literal["copy", "view"] | None = None,
+    visual_assets: Literal["full", "none"] = "full",
+    step_forward: Literal["full", "kinematics"] = "full",
+    frame_skip: int | None = None,
+    control_dt: float | None = None,
 ) -> gym.Env:
+    if control_dt is not None:
+        if frame_skip is not None:
+            raise ValueError("Only one of frame_skip and control_dt can be set.")
+        frame_skip = round(control_dt / SawyerXYZEnv.SIM_TIMESTEP)
+        if frame_skip < 1 or not np.isclose(
+            frame_skip * SawyerXYZEnv.SIM_TIMESTEP, control_dt
+        ):
+            raise ValueError(
+                f"control_dt must be a multiple of the simulation timestep ({SawyerXYZEnv.SIM_TIMESTEP}s), got {control_dt}."
+            )
     env: gym.Env = env_cls(
         reward_function_version=reward_function_version,
         render_mode=render_mode,
@@ -424,7 +557,12 @@ def _init_each_env(
         camera_id=camera_id,
         width=width,
         height=height,
+        visual_assets=visual_assets,
+        frame_skip=frame_skip or SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     )
+    env.cache_hand_reset = cache_hand_reset  # type: ignore
+    env.obs_buffer = obs_buffer  # type: ignore
+    env.step_forward = step_forward  # type: ignore
     if seed is not None:
         env.seed(seed)  # type: ignore
     env = gym.wrappers.TimeLimit(env, max_episode_steps or env.max_path_length)  # type: ignore
@@ -461,26 +599,25 @@ def make_mt_envs(
     name: str,
     seed: int | None = None,
     num_tasks: int | None = None,
-    vector_strategy: Literal["sync", "async"] = "sync",
+    vector_strategy: VectorStrategy = "sync",
     autoreset_mode: gym.vector.AutoresetMode | str = gym.vector.AutoresetMode.SAME_STEP,
+    num_workers: int | None = None,
+    num_goals: int = _N_GOALS,
     **kwargs,
 ) -> gym.Env | gym.vector.VectorEnv:
     benchmark: Benchmark
     if name in ALL_V3_ENVIRONMENTS.keys():
-        benchmark = MT1(name, seed=seed)
-        tasks = [task for task in benchmark.train_tasks]
+        benchmark = MT1(name, seed=seed, num_goals=num_goals)
         return _init_each_env(  # type: ignore[misc]
             env_cls=benchmark.train_classes[name],
-            tasks=tasks,
+            tasks=benchmark.train_tasks,
             seed=seed,
             num_tasks=num_tasks or 1,
             **kwargs,
         )
     elif name == "MT10" or name == "MT25" or name == "MT50":
-        benchmark = globals()[name](seed=seed)
-        vectorizer: type[gym.vector.VectorEnv] = getattr(
-            gym.vector, f"{vector_strategy.capitalize()}VectorEnv"
-        )
+        benchmark = globals()[name](seed=seed, num_goals=num_goals)
+        vectorizer = _get_vectorizer(vector_strategy, num_workers)
         if name == "MT10":
             default_num_tasks = 10
         elif name == "MT25":
@@ -493,9 +630,7 @@ def make_mt_envs(
                 partial(
                     _init_each_env,
                     env_cls=env_cls,
-                    tasks=[
-                        task for task in benchmark.train_tasks if task.env_name == name
-                    ],
+                    tasks=benchmark.train_tasks.for_env(name),
                     seed=seed,
                     env_id=env_id,
                     num_tasks=num_tasks or default_num_tasks,
@@ -519,8 +654,9 @@ def _make_ml_envs_inner(
     seed: int | None = None,
     total_tasks_per_cls: int | None = None,
     split: Literal["train", "test"] = "train",
-    vector_strategy: Literal["sync", "async"] = "sync",
+    vector_strategy: VectorStrategy = "sync",
     autoreset_mode: gym.vector.AutoresetMode | str = gym.vector.AutoresetMode.SAME_STEP,
+    num_workers: int | None = None,
     **kwargs,
 ):
     all_classes = (
@@ -534,19 +670,19 @@ def _make_ml_envs_inner(
 
     env_tuples = []
     for env_name, env_cls in all_classes.items():
-        tasks = [task for task in all_tasks if task.env_name == env_name]
+        tasks = all_tasks.for_env(env_name)
         if total_tasks_per_cls is not None:
-            tasks = tasks[:total_tasks_per_cls]
-        subenv_tasks = [tasks[i::tasks_per_env] for i in range(0, tasks_per_env)]
+            tasks = tasks.take(slice(total_tasks_per_cls))
+        subenv_tasks = [
+            tasks.take(slice(i, None, tasks_per_env)) for i in range(0, tasks_per_env)
+        ]
         for tasks_for_subenv in subenv_tasks:
             assert (
                 len(tasks_for_subenv) == len(tasks) // tasks_per_env
             ), f"Invalid division of subtasks, expected {len(tasks) // tasks_per_env} got {len(tasks_for_subenv)}"
             env_tuples.append((env_cls, tasks_for_subenv))
 
-    vectorizer: type[gym.vector.SyncVectorEnv | gym.vector.AsyncVectorEnv] = getattr(
-        gym.vector, f"{vector_strategy.capitalize()}VectorEnv"
-    )
+    vectorizer = _get_vectorizer(vector_strategy, num_workers)
     return vectorizer(
         [
             partial(
@@ -568,15 +704,16 @@ def make_ml_envs(
     meta_batch_size: int = 20,
     total_tasks_per_cls: int | None = None,
     split: Literal["train", "test"] = "train",
-    vector_strategy: Literal["sync", "async"] = "sync",
+    vector_strategy: VectorStrategy = "sync",
     autoreset_mode: gym.vector.AutoresetMode | str = gym.vector.AutoresetMode.SAME_STEP,
+    num_goals: int = _N_GOALS,
     **kwargs,
 ) -> gym.vector.VectorEnv:
     benchmark: Benchmark
     if name in ALL_V3_ENVIRONMENTS.keys():
-        benchmark = ML1(name, seed=seed)
+        benchmark = ML1(name, seed=seed, num_goals=num_goals)
     elif name == "ML10" or name == "ML45" or name == "ML25":
-        benchmark = globals()[name](seed=seed)
+        benchmark = globals()[name](seed=seed, num_goals=num_goals)
     else:
         raise ValueError(
             "Invalid ML env name. Must either be a valid Metaworld task name (e.g. 'reach-v3'), 'ML10', 'ML25', or 'ML45'."
@@ -607,7 +744,7 @@ make_ml_envs_test = partial(
 def register_mw_envs() -> None:
     def _mt_bench_vector_entry_point(
         mt_bench: str,
-        vector_strategy: Literal["sync", "async"],
+        vector_strategy: VectorStrategy,
         autoreset_mode: gym.vector.AutoresetMode
         | str = gym.vector.AutoresetMode.SAME_STEP,
         seed=None,
@@ -615,10 +752,6 @@ def register_mw_envs() -> None:
         num_envs=None,
         **lamb_kwargs,
     ):
-        if "num_goals" in lamb_kwargs:
-            global _N_GOALS
-            _N_GOALS = lamb_kwargs["num_goals"]
-            del lamb_kwargs["num_goals"]
         return make_mt_envs(  # type: ignore
             mt_bench,
             seed=seed,
@@ -631,7 +764,7 @@ def register_mw_envs() -> None:
     def _ml_bench_vector_entry_point(
         ml_bench: str,
         split: Literal["train", "test"],
-        vector_strategy: Literal["sync", "async"],
+        vector_strategy: VectorStrategy,
         autoreset_mode: gym.vector.AutoresetMode
         | str = gym.vector.AutoresetMode.SAME_STEP,
         total_tasks_per_cls: int | None = None,
@@ -746,11 +879,10 @@ def register_mw_envs() -> None:
         | str = gym.vector.AutoresetMode.SAME_STEP,
         use_one_hot: bool = False,
         num_envs=None,
+        num_workers: int | None = None,
         **lamb_kwargs,
     ):
-        vectorizer: type[gym.vector.VectorEnv] = getattr(
-            gym.vector, f"{vector_strategy.capitalize()}VectorEnv"
-        )
+        vectorizer = _get_vectorizer(vector_strategy, num_workers)
         return vectorizer(  # type: ignore
             [
                 partial(  # type: ignore
@@ -791,10 +923,11 @@ def register_mw_envs() -> None:
         meta_batch_size: int = 20,
         seed=None,
         num_envs=None,
+        num_goals: int = _N_GOALS,
         **lamb_kwargs,
     ):
         return _make_ml_envs_inner(  # type: ignore
-            CustomML(train_envs, test_envs, seed=seed),
+            CustomML(train_envs, test_envs, seed=seed, num_goals=num_goals),
             meta_batch_size=meta_batch_size,
             vector_strategy=vector_strategy,  # type: ignore
             autoreset_mode=autoreset_mode,
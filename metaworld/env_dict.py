@@ -269,7 +269,6 @@ ALL_V3_ENVIRONMENTS = _get_env_dict(
     ]
 )
 
-
 ALL_V3_ENVIRONMENTS_GOAL_HIDDEN = _create_hidden_goal_envs(ALL_V3_ENVIRONMENTS)
 ALL_V3_ENVIRONMENTS_GOAL_OBSERVABLE = _create_observable_goal_envs(ALL_V3_ENVIRONMENTS)
 
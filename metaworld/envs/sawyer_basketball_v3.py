@@ -7,14 +7,17 @@ import numpy.typing as npt
 from gymnasium.spaces import Box
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
-from metaworld.types import InitConfigDict
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
+from metaworld.types import InitConfigDict, RandVecMinDistance, RewardContext
 from metaworld.utils import reward_utils
 
 
 class SawyerBasketballEnvV3(SawyerXYZEnv):
+    TASK_ENV_ID = 1
+
     PAD_SUCCESS_MARGIN: float = 0.06
     TARGET_RADIUS: float = 0.08
+    RAND_VEC_CONSTRAINTS = (RandVecMinDistance(0, 3, 0.15),)
 
     def __init__(
         self,
@@ -24,6 +27,8 @@ class SawyerBasketballEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         hand_low = (-0.5, 0.40, 0.05)
         hand_high = (0.5, 1, 0.5)
@@ -40,6 +45,8 @@ class SawyerBasketballEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
 
@@ -104,25 +111,22 @@ class SawyerBasketballEnvV3(SawyerXYZEnv):
         return self.get_body_com("bsktball")
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return self.data.body("bsktball").xquat
+        return self.data.xquat[self._body_ids["bsktball"]]
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
         self.prev_obs = self._get_curr_obs_combined_no_goal()
         goal_pos = self._get_state_rand_vec()
         basket_pos = goal_pos[3:]
-        while np.linalg.norm(goal_pos[:2] - basket_pos[:2]) < 0.15:
-            goal_pos = self._get_state_rand_vec()
-            basket_pos = goal_pos[3:]
         assert self.obj_init_pos is not None
         self.obj_init_pos = np.concatenate([goal_pos[:2], [self.obj_init_pos[-1]]])
         self.model.body("basket_goal").pos = basket_pos
-        self._target_pos = self.data.site("goal").xpos
+        self._target_pos = self.data.site_xpos[self._site_ids["goal"]]
         self._set_obj_xyz(self.obj_init_pos)
         self.model.site("goal").pos = self._target_pos
 
         self.liftThresh = 0.3
-        self.objHeight = self.data.geom("objGeom").xpos[2]
+        self.objHeight = self.data.geom_xpos[self._geom_ids["objGeom"]][2]
         self.heightTarget = self.objHeight + self.liftThresh
 
         self.maxPlacingDist = (
@@ -269,3 +273,54 @@ class SawyerBasketballEnvV3(SawyerXYZEnv):
             assert (placeRew >= 0) and (pickRew >= 0)
             reward = reachRew + pickRew + placeRew
             return reward, 0.0, 0.0, float(placingDist), 0.0, 0.0
+
+    def _compute_reward_batch(
+        self,
+        actions: npt.NDArray[np.float64],
+        obs: npt.NDArray[np.float64],
+        context: RewardContext,
+        tcp_center: npt.NDArray[np.float64],
+        pad_y: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        obj = obs[..., 4:7]
+        # Force target to be slightly above basketball hoop
+        target = context["target_pos"].copy()
+        target[..., 2] = 0.3
+        obj_init_pos = context["obj_init_pos"]
+
+        # Emphasize Z error
+        scale = np.array([1.0, 1.0, 2.0])
+        target_to_obj = np.linalg.norm((obj - target) * scale, axis=-1)
+        target_to_obj_init = np.linalg.norm((obj_init_pos - target) * scale, axis=-1)
+
+        in_place = reward_utils.tolerance_batch(
+            target_to_obj,
+            bounds=(0, self.TARGET_RADIUS),
+            margin=target_to_obj_init,
+            sigmoid="long_tail",
+        )
+        tcp_opened = obs[..., 3]
+        tcp_to_obj = np.linalg.norm(obj - tcp_center, axis=-1)
+
+        object_grasped = self._gripper_caging_reward_batch(
+            actions,
+            obj,
+            context,
+            tcp_center,
+            pad_y,
+            object_reach_radius=0.01,
+            obj_radius=0.025,
+            pad_success_thresh=0.06,
+            xz_thresh=0.005,
+            high_density=True,
+        )
+        grasped = (
+            (tcp_to_obj < 0.035)
+            & (tcp_opened > 0)
+            & (obj[..., 2] - 0.01 > obj_init_pos[..., 2])
+        )
+        object_grasped = np.where(grasped, 1.0, object_grasped)
+        reward = reward_utils.hamacher_product_batch(object_grasped, in_place)
+
+        reward = np.where(grasped, reward + 1.0 + 5.0 * in_place, reward)
+        return np.where(target_to_obj < self.TARGET_RADIUS, 10.0, reward)
@@ -7,7 +7,7 @@ import numpy.typing as npt
 from gymnasium.spaces import Box
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
 from metaworld.types import InitConfigDict
 from metaworld.utils import reward_utils
 
@@ -26,6 +26,8 @@ class SawyerBinPickingEnvV3(SawyerXYZEnv):
         - (11/23/20) Updated reward function to new pick-place style
     """
 
+    TASK_ENV_ID = 2
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -34,6 +36,8 @@ class SawyerBinPickingEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         hand_low = (-0.5, 0.40, 0.07)
         hand_high = (0.5, 1, 0.5)
@@ -51,6 +55,8 @@ class SawyerBinPickingEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
         self.init_config: InitConfigDict = {
@@ -126,7 +132,7 @@ class SawyerBinPickingEnvV3(SawyerXYZEnv):
         return self.get_body_com("obj")
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return self.data.body("obj").xquat
+        return self.data.xquat[self._body_ids["obj"]]
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
@@ -142,7 +148,7 @@ class SawyerBinPickingEnvV3(SawyerXYZEnv):
         self._target_pos = self.get_body_com("bin_goal")
         self._target_to_obj_init = None
 
-        self.objHeight = self.data.body("obj").xpos[2]
+        self.objHeight = self.data.xpos[self._body_ids["obj"]][2]
         self.heightTarget = self.objHeight + self.liftThresh
 
         self.maxPlacingDist = (
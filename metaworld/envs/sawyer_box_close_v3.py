@@ -8,12 +8,16 @@ import numpy.typing as npt
 from gymnasium.spaces import Box
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
-from metaworld.types import InitConfigDict
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
+from metaworld.types import InitConfigDict, RandVecMinDistance, RewardContext
 from metaworld.utils import reward_utils
 
 
 class SawyerBoxCloseEnvV3(SawyerXYZEnv):
+    TASK_ENV_ID = 3
+
+    RAND_VEC_CONSTRAINTS = (RandVecMinDistance(0, 3, 0.25),)
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -22,6 +26,8 @@ class SawyerBoxCloseEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         hand_low = (-0.5, 0.40, 0.05)
         hand_high = (0.5, 1, 0.5)
@@ -38,6 +44,8 @@ class SawyerBoxCloseEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
 
@@ -102,7 +110,7 @@ class SawyerBoxCloseEnvV3(SawyerXYZEnv):
         return self.get_body_com("top_link")
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return self.data.body("top_link").xquat
+        return self.data.xquat[self._body_ids["top_link"]]
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
@@ -111,8 +119,6 @@ class SawyerBoxCloseEnvV3(SawyerXYZEnv):
         box_height = self.get_body_com("boxbody")[2]
 
         goal_pos = self._get_state_rand_vec()
-        while np.linalg.norm(goal_pos[:2] - goal_pos[-3:-1]) < 0.25:
-            goal_pos = self._get_state_rand_vec()
         self.obj_init_pos = np.concatenate([goal_pos[:2], [self.obj_init_pos[-1]]])
         self._target_pos = goal_pos[-3:]
 
@@ -126,7 +132,7 @@ class SawyerBoxCloseEnvV3(SawyerXYZEnv):
         self._set_obj_xyz(self.obj_init_pos)
         self.model.site("goal").pos = self._target_pos
 
-        self.objHeight = self.data.geom("BoxHandleGeom").xpos[2]
+        self.objHeight = self.data.geom_xpos[self._geom_ids["BoxHandleGeom"]][2]
         self.heightTarget = self.objHeight + self.liftThresh
 
         self.maxPlacingDist = (
@@ -303,3 +309,79 @@ class SawyerBoxCloseEnvV3(SawyerXYZEnv):
             success = bool(np.linalg.norm(obs[4:7] - self._target_pos) < 0.08)
 
             return float(reward), 0.0, 0.0, 0.0, success
+
+    def _compute_reward_batch(
+        self,
+        actions: npt.NDArray[np.float64],
+        obs: npt.NDArray[np.float64],
+        context: RewardContext,
+        tcp_center: npt.NDArray[np.float64],
+        pad_y: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        target = context["target_pos"]
+        reward_grab = np.clip((np.clip(actions[..., 3], -1, 1) + 1.0) / 2.0, 0.0, 1.0)
+
+        # Ideal upright lid has quat [.707, 0, 0, .707]
+        ideal = np.array([0.707, 0, 0, 0.707])
+        error = np.linalg.norm(obs[..., 7:11] - ideal, axis=-1)
+        reward_quat = np.maximum(1.0 - error / 0.2, 0.0)
+
+        hand = obs[..., :3]
+        lid = obs[..., 4:7] + np.array([0.0, 0.0, 0.02])
+
+        threshold = 0.02
+        # floor is a 3D funnel centered on the lid's handle
+        radius = np.linalg.norm(hand[..., :2] - lid[..., :2], axis=-1)
+        above_threshold = radius > threshold
+        floor = np.where(
+            above_threshold,
+            0.04
+            * np.log(
+                radius - threshold,
+                out=np.zeros_like(radius),
+                where=above_threshold,
+            )
+            + 0.4,
+            0.0,
+        )
+        # prevent the hand from running into the handle prematurely by keeping
+        # it above the "floor"
+        above_floor = np.where(
+            hand[..., 2] >= floor,
+            1.0,
+            reward_utils.tolerance_batch(
+                np.maximum(floor - hand[..., 2], 0.0),
+                bounds=(0.0, 0.01),
+                margin=np.maximum(floor / 2.0, 0.0),
+                sigmoid="long_tail",
+            ),
+        )
+        # grab the lid's handle
+        in_place = reward_utils.tolerance_batch(
+            np.linalg.norm(hand - lid, axis=-1),
+            bounds=(0, 0.02),
+            margin=0.5,
+            sigmoid="long_tail",
+        )
+        ready_to_lift = reward_utils.hamacher_product_batch(above_floor, in_place)
+
+        # now actually put the lid on the box
+        pos_error = target - lid
+        error_scale = np.array([1.0, 1.0, 3.0])  # Emphasize Z error
+        a = 0.2  # Relative importance of just *trying* to lift the lid at all
+        b = 0.8  # Relative importance of placing the lid on the box
+        lifted = a * (lid[..., 2] > 0.04) + b * reward_utils.tolerance_batch(
+            np.linalg.norm(pos_error * error_scale, axis=-1),
+            bounds=(0, 0.05),
+            margin=0.25,
+            sigmoid="long_tail",
+        )
+
+        reward = 2.0 * reward_utils.hamacher_product_batch(
+            reward_grab, ready_to_lift
+        ) + (8.0 * lifted)
+        # Override reward on success
+        success = np.linalg.norm(obs[..., 4:7] - target, axis=-1) < 0.08
+        reward = np.where(success, 10.0, reward)
+        # STRONG emphasis on proper lid orientation to prevent reward hacking
+        return reward * reward_quat
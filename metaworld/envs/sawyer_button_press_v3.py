@@ -7,12 +7,14 @@ import numpy.typing as npt
 from gymnasium.spaces import Box
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
-from metaworld.types import InitConfigDict
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
+from metaworld.types import InitConfigDict, RewardContext
 from metaworld.utils import reward_utils
 
 
 class SawyerButtonPressEnvV3(SawyerXYZEnv):
+    TASK_ENV_ID = 6
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -21,6 +23,8 @@ class SawyerButtonPressEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         hand_low = (-0.5, 0.40, 0.05)
         hand_high = (0.5, 1, 0.5)
@@ -35,6 +39,8 @@ class SawyerButtonPressEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
 
@@ -93,7 +99,7 @@ class SawyerButtonPressEnvV3(SawyerXYZEnv):
         return self.get_body_com("button") + np.array([0.0, -0.193, 0.0])
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return self.data.body("button").xquat
+        return self.data.xquat[self._body_ids["button"]]
 
     def _set_obj_xyz(self, pos: npt.NDArray[Any]) -> None:
         qpos = self.data.qpos.flat.copy()
@@ -189,3 +195,37 @@ class SawyerButtonPressEnvV3(SawyerXYZEnv):
             reward = -reachDist + pressRew
 
             return float(reward), 0.0, 0.0, float(pressDist), 0.0, 0.0
+
+    def _compute_reward_batch(
+        self,
+        actions: npt.NDArray[np.float64],
+        obs: npt.NDArray[np.float64],
+        context: RewardContext,
+        tcp_center: npt.NDArray[np.float64],
+        pad_y: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        obj = obs[..., 4:7]
+
+        tcp_to_obj = np.linalg.norm(obj - tcp_center, axis=-1)
+        tcp_to_obj_init = np.linalg.norm(obj - context["init_tcp"], axis=-1)
+        obj_to_target = np.abs(context["target_pos"][..., 1] - obj[..., 1])
+
+        tcp_closed = np.maximum(obs[..., 3], 0.0)
+        near_button = reward_utils.tolerance_batch(
+            tcp_to_obj,
+            bounds=(0, 0.05),
+            margin=tcp_to_obj_init,
+            sigmoid="long_tail",
+        )
+        button_pressed = reward_utils.tolerance_batch(
+            obj_to_target,
+            bounds=(0, 0.005),
+            margin=context["extra"]["obj_to_target_init"],
+            sigmoid="long_tail",
+        )
+
+        reward = 2 * reward_utils.hamacher_product_batch(tcp_closed, near_button)
+        return np.where(tcp_to_obj <= 0.05, reward + 8 * button_pressed, reward)
+
+    def _reward_context_extra(self) -> dict[str, Any]:
+        return {"obj_to_target_init": self._obj_to_target_init}
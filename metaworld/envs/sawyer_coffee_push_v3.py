@@ -5,15 +5,18 @@ from typing import Any
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
-from scipy.spatial.transform import Rotation
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
-from metaworld.types import InitConfigDict
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
+from metaworld.types import InitConfigDict, RandVecMinDistance, RewardContext
 from metaworld.utils import reward_utils
 
 
 class SawyerCoffeePushEnvV3(SawyerXYZEnv):
+    TASK_ENV_ID = 10
+
+    RAND_VEC_CONSTRAINTS = (RandVecMinDistance(0, 3, 0.15),)
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -22,6 +25,8 @@ class SawyerCoffeePushEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         hand_low = (-0.5, 0.40, 0.05)
         hand_high = (0.5, 1, 0.5)
@@ -38,6 +43,8 @@ class SawyerCoffeePushEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
 
@@ -98,14 +105,13 @@ class SawyerCoffeePushEnvV3(SawyerXYZEnv):
         return [("coffee_goal", self._target_pos)]
 
     def _get_id_main_object(self) -> int:
-        return self.data.geom("mug").id
+        return self._geom_ids["mug"]
 
     def _get_pos_objects(self) -> npt.NDArray[Any]:
         return self.get_body_com("obj")
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        geom_xmat = self.data.geom("mug").xmat.reshape(3, 3)
-        return Rotation.from_matrix(geom_xmat).as_quat()
+        return self._xmat_to_quat(self.data.geom_xmat[self._geom_ids["mug"]])
 
     def _set_obj_xyz(self, pos: npt.NDArray[Any]) -> None:
         qpos = self.data.qpos.flatten()
@@ -118,8 +124,6 @@ class SawyerCoffeePushEnvV3(SawyerXYZEnv):
         self._reset_hand()
 
         pos_mug_init, pos_mug_goal = np.split(self._get_state_rand_vec(), 2)
-        while np.linalg.norm(pos_mug_init[:2] - pos_mug_goal[:2]) < 0.15:
-            pos_mug_init, pos_mug_goal = np.split(self._get_state_rand_vec(), 2)
 
         self._set_obj_xyz(pos_mug_init)
         self.obj_init_pos = pos_mug_init
@@ -226,3 +230,53 @@ class SawyerCoffeePushEnvV3(SawyerXYZEnv):
                 0.0,
                 0.0,
             )
+
+    def _compute_reward_batch(
+        self,
+        actions: npt.NDArray[np.float64],
+        obs: npt.NDArray[np.float64],
+        context: RewardContext,
+        tcp_center: npt.NDArray[np.float64],
+        pad_y: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        obj = obs[..., 4:7]
+        target = context["target_pos"]
+
+        # Emphasize X and Y errors
+        scale = np.array([2.0, 2.0, 1.0])
+        target_to_obj = np.linalg.norm((obj - target) * scale, axis=-1)
+        target_to_obj_init = np.linalg.norm(
+            (context["obj_init_pos"] - target) * scale, axis=-1
+        )
+
+        in_place = reward_utils.tolerance_batch(
+            target_to_obj,
+            bounds=(0, 0.05),
+            margin=target_to_obj_init,
+            sigmoid="long_tail",
+        )
+        tcp_opened = obs[..., 3]
+        tcp_to_obj = np.linalg.norm(obj - tcp_center, axis=-1)
+
+        object_grasped = self._gripper_caging_reward_batch(
+            actions,
+            obj,
+            context,
+            tcp_center,
+            pad_y,
+            object_reach_radius=0.04,
+            obj_radius=0.02,
+            pad_success_thresh=0.05,
+            xz_thresh=0.05,
+            desired_gripper_effort=0.7,
+            medium_density=True,
+        )
+
+        reward = reward_utils.hamacher_product_batch(object_grasped, in_place)
+
+        reward = np.where(
+            (tcp_to_obj < 0.04) & (tcp_opened > 0),
+            reward + 1.0 + 5.0 * in_place,
+            reward,
+        )
+        return np.where(target_to_obj < 0.05, 10.0, reward)
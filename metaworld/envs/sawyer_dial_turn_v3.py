@@ -7,12 +7,14 @@ import numpy.typing as npt
 from gymnasium.spaces import Box
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
-from metaworld.types import InitConfigDict
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
+from metaworld.types import InitConfigDict, RewardContext
 from metaworld.utils import reward_utils
 
 
 class SawyerDialTurnEnvV3(SawyerXYZEnv):
+    TASK_ENV_ID = 11
+
     TARGET_RADIUS: float = 0.07
 
     def __init__(
@@ -23,6 +25,8 @@ class SawyerDialTurnEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         hand_low = (-0.5, 0.40, 0.05)
         hand_high = (0.5, 1, 0.5)
@@ -39,6 +43,8 @@ class SawyerDialTurnEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
 
@@ -98,7 +104,7 @@ class SawyerDialTurnEnvV3(SawyerXYZEnv):
         return dial_center + offset
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return self.data.body("dial").xquat
+        return self.data.xquat[self._body_ids["dial"]]
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
@@ -203,3 +209,46 @@ class SawyerDialTurnEnvV3(SawyerXYZEnv):
             reward = reachRew + pullRew
 
             return float(reward), 0.0, 0.0, float(pullDist), 0.0, 0.0
+
+    def _compute_reward_batch(
+        self,
+        actions: npt.NDArray[np.float64],
+        obs: npt.NDArray[np.float64],
+        context: RewardContext,
+        tcp_center: npt.NDArray[np.float64],
+        pad_y: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        obj = obs[..., 4:7]
+        dial_push_position = obj + np.array([0.05, 0.02, 0.09])
+        dial_push_position_init = context["extra"]["dial_push_position"]
+        target = context["target_pos"]
+
+        target_to_obj = np.linalg.norm(obj - target, axis=-1)
+        target_to_obj_init = np.linalg.norm(dial_push_position_init - target, axis=-1)
+
+        in_place = reward_utils.tolerance_batch(
+            target_to_obj,
+            bounds=(0, self.TARGET_RADIUS),
+            margin=np.abs(target_to_obj_init - self.TARGET_RADIUS),
+            sigmoid="long_tail",
+        )
+
+        dial_reach_radius = 0.005
+        tcp_to_obj = np.linalg.norm(dial_push_position - tcp_center, axis=-1)
+        tcp_to_obj_init = np.linalg.norm(
+            dial_push_position_init - context["init_tcp"], axis=-1
+        )
+        reach = reward_utils.tolerance_batch(
+            tcp_to_obj,
+            bounds=(0, dial_reach_radius),
+            margin=np.abs(tcp_to_obj_init - dial_reach_radius),
+            sigmoid="gaussian",
+        )
+        gripper_closed = np.clip(actions[..., -1], 0, 1)
+
+        reach = reward_utils.hamacher_product_batch(reach, gripper_closed)
+
+        return 10 * reward_utils.hamacher_product_batch(reach, in_place)
+
+    def _reward_context_extra(self) -> dict[str, Any]:
+        return {"dial_push_position": self.dial_push_position}
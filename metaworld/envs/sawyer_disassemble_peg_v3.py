@@ -8,13 +8,16 @@ import numpy.typing as npt
 from gymnasium.spaces import Box
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
-from metaworld.types import InitConfigDict
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
+from metaworld.types import InitConfigDict, RandVecMinDistance
 from metaworld.utils import reward_utils
 
 
 class SawyerNutDisassembleEnvV3(SawyerXYZEnv):
+    TASK_ENV_ID = 12
+
     WRENCH_HANDLE_LENGTH: float = 0.02
+    RAND_VEC_CONSTRAINTS = (RandVecMinDistance(0, 3, 0.1),)
 
     def __init__(
         self,
@@ -24,6 +27,8 @@ class SawyerNutDisassembleEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         hand_low = (-0.5, 0.40, 0.05)
         hand_high = (0.5, 1, 0.5)
@@ -40,6 +45,8 @@ class SawyerNutDisassembleEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
 
@@ -106,7 +113,7 @@ class SawyerNutDisassembleEnvV3(SawyerXYZEnv):
         return self._get_site_pos("RoundNut-8")
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return self.data.body("RoundNut").xquat
+        return self.data.xquat[self._body_ids["RoundNut"]]
 
     def _get_obs_dict(self):
         obs_dict = super()._get_obs_dict()
@@ -120,8 +127,6 @@ class SawyerNutDisassembleEnvV3(SawyerXYZEnv):
         self.obj_init_angle = self.init_config["obj_init_angle"]
 
         goal_pos = self._get_state_rand_vec()
-        while np.linalg.norm(goal_pos[:2] - goal_pos[-3:-1]) < 0.1:
-            goal_pos = self._get_state_rand_vec()
         self.obj_init_pos = goal_pos[:3]
         self._target_pos = goal_pos[:3] + np.array([0, 0, 0.15])
 
@@ -134,7 +139,7 @@ class SawyerNutDisassembleEnvV3(SawyerXYZEnv):
 
         # v1s
         self.liftThresh = 0.05
-        self.objHeight = self.data.body("RoundNut").xpos[2]
+        self.objHeight = self.data.xpos[self._body_ids["RoundNut"]][2]
         self.heightTarget = self.objHeight + self.liftThresh
         self.maxPlacingDist = (
             np.linalg.norm(
@@ -5,15 +5,16 @@ from typing import Any
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
-from scipy.spatial.transform import Rotation
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
-from metaworld.types import InitConfigDict
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
+from metaworld.types import InitConfigDict, RewardContext
 from metaworld.utils import reward_utils
 
 
 class SawyerDoorCloseEnvV3(SawyerXYZEnv):
+    TASK_ENV_ID = 13
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -22,6 +23,8 @@ class SawyerDoorCloseEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         goal_low = (0.2, 0.65, 0.1499)
         goal_high = (0.3, 0.75, 0.1501)
@@ -38,6 +41,8 @@ class SawyerDoorCloseEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
 
@@ -65,12 +70,10 @@ class SawyerDoorCloseEnvV3(SawyerXYZEnv):
         return full_V3_path_for("sawyer_xyz/sawyer_door_pull.xml")
 
     def _get_pos_objects(self) -> npt.NDArray[Any]:
-        return self.data.geom("handle").xpos.copy()
+        return self.data.geom_xpos[self._geom_ids["handle"]].copy()
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return Rotation.from_matrix(
-            self.data.geom("handle").xmat.reshape(3, 3)
-        ).as_quat()
+        return self._xmat_to_quat(self.data.geom_xmat[self._geom_ids["handle"]])
 
     def _set_obj_xyz(self, pos: npt.NDArray[Any]) -> None:
         qpos = self.data.qpos.copy()
@@ -81,7 +84,7 @@ class SawyerDoorCloseEnvV3(SawyerXYZEnv):
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
-        self.objHeight = self.data.geom("handle").xpos[2]
+        self.objHeight = self.data.geom_xpos[self._geom_ids["handle"]][2]
         obj_pos = self._get_state_rand_vec()
         self.obj_init_pos = obj_pos
         goal_pos = obj_pos.copy() + np.array([0.2, -0.2, 0.0])
@@ -96,7 +99,7 @@ class SawyerDoorCloseEnvV3(SawyerXYZEnv):
 
         assert self._target_pos is not None
         self.maxPullDist = np.linalg.norm(
-            self.data.geom("handle").xpos[:-1] - self._target_pos[:-1]
+            self.data.geom_xpos[self._geom_ids["handle"]][:-1] - self._target_pos[:-1]
         )
 
         return self._get_obs()
@@ -188,3 +191,38 @@ class SawyerDoorCloseEnvV3(SawyerXYZEnv):
             reward = reachRew + pullRew
 
             return float(reward), float(pullDist), 0.0
+
+    def _compute_reward_batch(
+        self,
+        actions: npt.NDArray[np.float64],
+        obs: npt.NDArray[np.float64],
+        context: RewardContext,
+        tcp_center: npt.NDArray[np.float64],
+        pad_y: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        _TARGET_RADIUS: float = 0.05
+        obj = obs[..., 4:7]
+        target = context["target_pos"]
+
+        tcp_to_target = np.linalg.norm(tcp_center - target, axis=-1)
+        obj_to_target = np.linalg.norm(obj - target, axis=-1)
+
+        in_place_margin = np.linalg.norm(context["obj_init_pos"] - target, axis=-1)
+        in_place = reward_utils.tolerance_batch(
+            obj_to_target,
+            bounds=(0, _TARGET_RADIUS),
+            margin=in_place_margin,
+            sigmoid="gaussian",
+        )
+
+        hand_margin = np.linalg.norm(context["hand_init_pos"] - obj, axis=-1) + 0.1
+        hand_in_place = reward_utils.tolerance_batch(
+            tcp_to_target,
+            bounds=(0, 0.25 * _TARGET_RADIUS),
+            margin=hand_margin,
+            sigmoid="gaussian",
+        )
+
+        reward = 3 * hand_in_place + 6 * in_place
+
+        return np.where(obj_to_target < _TARGET_RADIUS, 10.0, reward)
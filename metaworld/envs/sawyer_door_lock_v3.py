@@ -8,12 +8,14 @@ import numpy.typing as npt
 from gymnasium.spaces import Box
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
 from metaworld.types import InitConfigDict
 from metaworld.utils import reward_utils
 
 
 class SawyerDoorLockEnvV3(SawyerXYZEnv):
+    TASK_ENV_ID = 14
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -22,6 +24,8 @@ class SawyerDoorLockEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         hand_low = (-0.5, 0.40, -0.15)
         hand_high = (0.5, 1, 0.5)
@@ -36,6 +40,8 @@ class SawyerDoorLockEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
 
@@ -103,7 +109,7 @@ class SawyerDoorLockEnvV3(SawyerXYZEnv):
         return self._get_site_pos("lockStartLock")
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return self.data.body("door_link").xquat
+        return self.data.xquat[self._body_ids["door_link"]]
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
@@ -112,7 +118,7 @@ class SawyerDoorLockEnvV3(SawyerXYZEnv):
 
         for _ in range(self.frame_skip):
             mujoco.mj_step(self.model, self.data)
-        self.obj_init_pos = self.data.body("lock_link").xpos
+        self.obj_init_pos = self.data.xpos[self._body_ids["lock_link"]]
         self._target_pos = self.obj_init_pos + np.array([0.0, -0.04, -0.1])
 
         assert self._target_pos is not None and self.obj_init_pos is not None
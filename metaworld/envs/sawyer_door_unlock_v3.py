@@ -7,12 +7,14 @@ import numpy.typing as npt
 from gymnasium.spaces import Box
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
-from metaworld.types import InitConfigDict
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
+from metaworld.types import InitConfigDict, RewardContext
 from metaworld.utils import reward_utils
 
 
 class SawyerDoorUnlockEnvV3(SawyerXYZEnv):
+    TASK_ENV_ID = 16
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -21,6 +23,8 @@ class SawyerDoorUnlockEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         hand_low = (-0.5, 0.40, -0.15)
         hand_high = (0.5, 1, 0.5)
@@ -37,6 +41,8 @@ class SawyerDoorUnlockEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
 
@@ -101,7 +107,7 @@ class SawyerDoorUnlockEnvV3(SawyerXYZEnv):
         return self._get_site_pos("lockStartUnlock")
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return self.data.body("door_link").xquat
+        return self.data.xquat[self._body_ids["door_link"]]
 
     def _set_obj_xyz(self, pos: npt.NDArray[Any]) -> None:
         qpos = self.data.qpos.flat.copy()
@@ -115,7 +121,7 @@ class SawyerDoorUnlockEnvV3(SawyerXYZEnv):
         self.model.body("door").pos = self._get_state_rand_vec()
         self._set_obj_xyz(np.array(1.5708))
 
-        self.obj_init_pos = self.data.body("lock_link").xpos
+        self.obj_init_pos = self.data.xpos[self._body_ids["lock_link"]]
         self._target_pos = self.obj_init_pos + np.array([0.1, -0.04, 0.0])
 
         assert self._target_pos is not None and self.obj_init_pos is not None
@@ -202,3 +208,43 @@ class SawyerDoorUnlockEnvV3(SawyerXYZEnv):
             reward = reachRew + pullRew
 
             return float(reward), 0.0, 0.0, float(pullDist), 0.0, 0.0
+
+    def _compute_reward_batch(
+        self,
+        actions: npt.NDArray[np.float64],
+        obs: npt.NDArray[np.float64],
+        context: RewardContext,
+        tcp_center: npt.NDArray[np.float64],
+        pad_y: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        gripper = obs[..., :3]
+        lock = obs[..., 4:7]
+
+        # Add offset to track gripper's shoulder, rather than fingers
+        offset = np.array([0.0, 0.055, 0.07])
+
+        scale = np.array([0.25, 1.0, 0.5])
+        shoulder_to_lock = (gripper + offset - lock) * scale
+        shoulder_to_lock_init = (
+            context["init_tcp"] + offset - context["obj_init_pos"]
+        ) * scale
+
+        # This `ready_to_push` reward should be a *hint* for the agent, not an
+        # end in itself. Make sure to devalue it compared to the value of
+        # actually unlocking the lock
+        ready_to_push = reward_utils.tolerance_batch(
+            np.linalg.norm(shoulder_to_lock, axis=-1),
+            bounds=(0, 0.02),
+            margin=np.linalg.norm(shoulder_to_lock_init, axis=-1),
+            sigmoid="long_tail",
+        )
+
+        obj_to_target = np.abs(context["target_pos"][..., 0] - lock[..., 0])
+        pushed = reward_utils.tolerance_batch(
+            obj_to_target,
+            bounds=(0, 0.005),
+            margin=self._lock_length,
+            sigmoid="long_tail",
+        )
+
+        return 2 * ready_to_push + 8 * pushed
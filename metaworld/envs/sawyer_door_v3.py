@@ -5,15 +5,16 @@ from typing import Any
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
-from scipy.spatial.transform import Rotation
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
 from metaworld.types import InitConfigDict
 from metaworld.utils import reward_utils
 
 
 class SawyerDoorEnvV3(SawyerXYZEnv):
+    TASK_ENV_ID = 15
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -22,6 +23,8 @@ class SawyerDoorEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         hand_low = (-0.5, 0.40, 0.05)
         hand_high = (0.5, 1, 0.5)
@@ -38,6 +41,8 @@ class SawyerDoorEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
 
@@ -95,12 +100,10 @@ class SawyerDoorEnvV3(SawyerXYZEnv):
         return []
 
     def _get_pos_objects(self) -> npt.NDArray[Any]:
-        return self.data.geom("handle").xpos.copy()
+        return self.data.geom_xpos[self._geom_ids["handle"]].copy()
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return Rotation.from_matrix(
-            self.data.geom("handle").xmat.reshape(3, 3)
-        ).as_quat()
+        return self._xmat_to_quat(self.data.geom_xmat[self._geom_ids["handle"]])
 
     def _set_obj_xyz(self, pos: npt.NDArray[Any]) -> None:
         qpos = self.data.qpos.copy()
@@ -111,7 +114,7 @@ class SawyerDoorEnvV3(SawyerXYZEnv):
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
-        self.objHeight = self.data.geom("handle").xpos[2]
+        self.objHeight = self.data.geom_xpos[self._geom_ids["handle"]][2]
 
         self.obj_init_pos = self._get_state_rand_vec()
         self._target_pos = self.obj_init_pos + np.array([-0.3, -0.45, 0.0])
@@ -121,7 +124,7 @@ class SawyerDoorEnvV3(SawyerXYZEnv):
         self._set_obj_xyz(np.array(0))
         assert self._target_pos is not None
         self.maxPullDist = np.linalg.norm(
-            self.data.geom("handle").xpos[:-1] - self._target_pos[:-1]
+            self.data.geom_xpos[self._geom_ids["handle"]][:-1] - self._target_pos[:-1]
         )
         self.target_reward = 1000 * self.maxPullDist + 1000 * 2
         self.model.site("goal").pos = self._target_pos
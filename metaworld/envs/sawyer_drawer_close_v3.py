@@ -7,12 +7,14 @@ import numpy.typing as npt
 from gymnasium.spaces import Box
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
-from metaworld.types import InitConfigDict
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
+from metaworld.types import InitConfigDict, RewardContext
 from metaworld.utils import reward_utils
 
 
 class SawyerDrawerCloseEnvV3(SawyerXYZEnv):
+    TASK_ENV_ID = 18
+
     _TARGET_RADIUS: float = 0.04
 
     def __init__(
@@ -23,6 +25,8 @@ class SawyerDrawerCloseEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         hand_low = (-0.5, 0.40, 0.05)
         hand_high = (0.5, 1, 0.5)
@@ -37,6 +41,8 @@ class SawyerDrawerCloseEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
 
@@ -198,3 +204,43 @@ class SawyerDrawerCloseEnvV3(SawyerXYZEnv):
             reward = -reachDist + pullRew
 
             return reward, 0.0, 0.0, pullDist, 0.0, 0.0
+
+    def _compute_reward_batch(
+        self,
+        actions: npt.NDArray[np.float64],
+        obs: npt.NDArray[np.float64],
+        context: RewardContext,
+        tcp_center: npt.NDArray[np.float64],
+        pad_y: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        obj = obs[..., 4:7]
+        target = context["target_pos"]
+        obj_init_pos = context["obj_init_pos"]
+
+        target_to_obj = np.linalg.norm(obj - target, axis=-1)
+        target_to_obj_init = np.linalg.norm(obj_init_pos - target, axis=-1)
+
+        in_place = reward_utils.tolerance_batch(
+            target_to_obj,
+            bounds=(0, self.TARGET_RADIUS),
+            margin=np.abs(target_to_obj_init - self.TARGET_RADIUS),
+            sigmoid="long_tail",
+        )
+
+        handle_reach_radius = 0.005
+        tcp_to_obj = np.linalg.norm(obj - tcp_center, axis=-1)
+        tcp_to_obj_init = np.linalg.norm(obj_init_pos - context["init_tcp"], axis=-1)
+        reach = reward_utils.tolerance_batch(
+            tcp_to_obj,
+            bounds=(0, handle_reach_radius),
+            margin=np.abs(tcp_to_obj_init - handle_reach_radius),
+            sigmoid="gaussian",
+        )
+        gripper_closed = np.clip(actions[..., -1], 0, 1)
+
+        reach = reward_utils.hamacher_product_batch(reach, gripper_closed)
+
+        reward = reward_utils.hamacher_product_batch(reach, in_place)
+        reward = np.where(target_to_obj <= self.TARGET_RADIUS + 0.015, 1.0, reward)
+
+        return reward * 10
@@ -7,12 +7,14 @@ import numpy.typing as npt
 from gymnasium.spaces import Box
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
-from metaworld.types import InitConfigDict
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
+from metaworld.types import InitConfigDict, RewardContext
 from metaworld.utils import reward_utils
 
 
 class SawyerDrawerOpenEnvV3(SawyerXYZEnv):
+    TASK_ENV_ID = 19
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -21,6 +23,8 @@ class SawyerDrawerOpenEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         hand_low = (-0.5, 0.40, 0.05)
         hand_high = (0.5, 1, 0.5)
@@ -35,6 +39,8 @@ class SawyerDrawerOpenEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
 
@@ -94,7 +100,7 @@ class SawyerDrawerOpenEnvV3(SawyerXYZEnv):
         return self.get_body_com("drawer_link") + np.array([0.0, -0.16, 0.0])
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return self.data.body("drawer_link").xquat
+        return self.data.xquat[self._body_ids["drawer_link"]]
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
@@ -186,3 +192,38 @@ class SawyerDrawerOpenEnvV3(SawyerXYZEnv):
             reward = reachRew + pullRew
 
             return reward, 0.0, 0.0, pullDist, 0.0, 0.0
+
+    def _compute_reward_batch(
+        self,
+        actions: npt.NDArray[np.float64],
+        obs: npt.NDArray[np.float64],
+        context: RewardContext,
+        tcp_center: npt.NDArray[np.float64],
+        pad_y: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        gripper = obs[..., :3]
+        handle = obs[..., 4:7]
+        target = context["target_pos"]
+
+        handle_error = np.linalg.norm(handle - target, axis=-1)
+
+        reward_for_opening = reward_utils.tolerance_batch(
+            handle_error, bounds=(0, 0.02), margin=self.maxDist, sigmoid="long_tail"
+        )
+
+        handle_pos_init = target + np.array([0.0, self.maxDist, 0.0])
+        # Emphasize XY error so that gripper is able to drop down and cage
+        # handle without running into it. See `compute_reward()`.
+        scale = np.array([3.0, 3.0, 1.0])
+        gripper_error = (handle - gripper) * scale
+        gripper_error_init = (handle_pos_init - context["init_tcp"]) * scale
+
+        reward_for_caging = reward_utils.tolerance_batch(
+            np.linalg.norm(gripper_error, axis=-1),
+            bounds=(0, 0.01),
+            margin=np.linalg.norm(gripper_error_init, axis=-1),
+            sigmoid="long_tail",
+        )
+
+        reward = reward_for_caging + reward_for_opening
+        return reward * 5.0
@@ -8,12 +8,14 @@ import numpy.typing as npt
 from gymnasium.spaces import Box
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
-from metaworld.types import InitConfigDict
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
+from metaworld.types import InitConfigDict, RewardContext
 from metaworld.utils import reward_utils
 
 
 class SawyerFaucetCloseEnvV3(SawyerXYZEnv):
+    TASK_ENV_ID = 21
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -22,6 +24,8 @@ class SawyerFaucetCloseEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         hand_low = (-0.5, 0.40, -0.15)
         hand_high = (0.5, 1, 0.5)
@@ -38,6 +42,8 @@ class SawyerFaucetCloseEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
 
@@ -96,7 +102,7 @@ class SawyerFaucetCloseEnvV3(SawyerXYZEnv):
         ]
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return self.data.body("faucetBase").xquat
+        return self.data.xquat[self._body_ids["faucetBase"]]
 
     def _get_pos_objects(self) -> npt.NDArray[Any]:
         return self._get_site_pos("handleStartClose") + np.array([0.0, 0.0, -0.01])
@@ -201,3 +207,39 @@ class SawyerFaucetCloseEnvV3(SawyerXYZEnv):
             reward = reachRew + pullRew
 
             return float(reward), 0.0, 0.0, float(pullDist), 0.0, 0.0
+
+    def _compute_reward_batch(
+        self,
+        actions: npt.NDArray[np.float64],
+        obs: npt.NDArray[np.float64],
+        context: RewardContext,
+        tcp_center: npt.NDArray[np.float64],
+        pad_y: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        obj = obs[..., 4:7]
+        target = context["target_pos"]
+        obj_init_pos = context["obj_init_pos"]
+
+        target_to_obj = np.linalg.norm(obj - target, axis=-1)
+        target_to_obj_init = np.linalg.norm(obj_init_pos - target, axis=-1)
+
+        in_place = reward_utils.tolerance_batch(
+            target_to_obj,
+            bounds=(0, self._target_radius),
+            margin=np.abs(target_to_obj_init - self._target_radius),
+            sigmoid="long_tail",
+        )
+
+        faucet_reach_radius = 0.01
+        tcp_to_obj = np.linalg.norm(obj - tcp_center, axis=-1)
+        tcp_to_obj_init = np.linalg.norm(obj_init_pos - context["init_tcp"], axis=-1)
+        reach = reward_utils.tolerance_batch(
+            tcp_to_obj,
+            bounds=(0, faucet_reach_radius),
+            margin=np.abs(tcp_to_obj_init - faucet_reach_radius),
+            sigmoid="gaussian",
+        )
+
+        reward = 2 * reach + 3 * in_place
+        reward *= 2
+        return np.where(target_to_obj <= self._target_radius, 10.0, reward)
@@ -7,12 +7,14 @@ import numpy.typing as npt
 from gymnasium.spaces import Box
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
 from metaworld.types import HammerInitConfigDict
 from metaworld.utils import reward_utils
 
 
 class SawyerHammerEnvV3(SawyerXYZEnv):
+    TASK_ENV_ID = 22
+
     HAMMER_HANDLE_LENGTH = 0.14
 
     def __init__(
@@ -23,6 +25,8 @@ class SawyerHammerEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         hand_low = (-0.5, 0.40, 0.05)
         hand_high = (0.5, 1, 0.5)
@@ -39,6 +43,8 @@ class SawyerHammerEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
 
@@ -95,7 +101,10 @@ class SawyerHammerEnvV3(SawyerXYZEnv):
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
         return np.hstack(
-            (self.data.body("hammer").xquat, self.data.body("nail_link").xquat)
+            (
+                self.data.xquat[self._body_ids["hammer"]],
+                self.data.xquat[self._body_ids["nail_link"]],
+            )
         )
 
     def _set_hammer_xyz(self, pos: npt.NDArray[Any]) -> None:
@@ -214,8 +223,8 @@ class SawyerHammerEnvV3(SawyerXYZEnv):
             )
         else:
             hammerPos = obs[4:7]
-            hammerHeadPos = self.data.geom("HammerHead").xpos.copy()
-            objPos = self.data.site("nailHead").xpos
+            hammerHeadPos = self.data.geom_xpos[self._geom_ids["HammerHead"]].copy()
+            objPos = self.data.site_xpos[self._site_ids["nailHead"]]
 
             rightFinger, leftFinger = self._get_site_pos(
                 "rightEndEffector"
@@ -7,13 +7,16 @@ import numpy.typing as npt
 from gymnasium.spaces import Box
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
-from metaworld.types import InitConfigDict
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
+from metaworld.types import InitConfigDict, RandVecMinDistance, RewardContext
 from metaworld.utils import reward_utils
 
 
 class SawyerHandInsertEnvV3(SawyerXYZEnv):
+    TASK_ENV_ID = 17
+
     TARGET_RADIUS: float = 0.05
+    RAND_VEC_CONSTRAINTS = (RandVecMinDistance(0, 3, 0.15),)
 
     def __init__(
         self,
@@ -23,6 +26,8 @@ class SawyerHandInsertEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         hand_low = (-0.5, 0.40, -0.15)
         hand_high = (0.5, 1, 0.5)
@@ -39,6 +44,8 @@ class SawyerHandInsertEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
 
@@ -103,7 +110,7 @@ class SawyerHandInsertEnvV3(SawyerXYZEnv):
         return self.get_body_com("obj")
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return self.data.body("obj").xquat
+        return self.data.xquat[self._body_ids["obj"]]
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
@@ -112,8 +119,6 @@ class SawyerHandInsertEnvV3(SawyerXYZEnv):
         self.objHeight = self.get_body_com("obj")[2]
 
         goal_pos = self._get_state_rand_vec()
-        while np.linalg.norm(goal_pos[:2] - goal_pos[-3:-1]) < 0.15:
-            goal_pos = self._get_state_rand_vec()
         assert self.obj_init_pos is not None
         self.obj_init_pos = np.concatenate([goal_pos[:2], [self.obj_init_pos[-1]]])
         self._target_pos = goal_pos[-3:]
@@ -208,3 +213,48 @@ class SawyerHandInsertEnvV3(SawyerXYZEnv):
                 0.0,
                 0.0,
             )
+
+    def _compute_reward_batch(
+        self,
+        actions: npt.NDArray[np.float64],
+        obs: npt.NDArray[np.float64],
+        context: RewardContext,
+        tcp_center: npt.NDArray[np.float64],
+        pad_y: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        obj = obs[..., 4:7]
+        target = context["target_pos"]
+
+        target_to_obj = np.linalg.norm(obj - target, axis=-1)
+        target_to_obj_init = np.linalg.norm(context["obj_init_pos"] - target, axis=-1)
+
+        in_place = reward_utils.tolerance_batch(
+            target_to_obj,
+            bounds=(0, self.TARGET_RADIUS),
+            margin=target_to_obj_init,
+            sigmoid="long_tail",
+        )
+
+        object_grasped = self._gripper_caging_reward_batch(
+            actions,
+            obj,
+            context,
+            tcp_center,
+            pad_y,
+            object_reach_radius=0.01,
+            obj_radius=0.015,
+            pad_success_thresh=0.05,
+            xz_thresh=0.005,
+            high_density=True,
+        )
+        reward = reward_utils.hamacher_product_batch(object_grasped, in_place)
+
+        tcp_opened = obs[..., 3]
+        tcp_to_obj = np.linalg.norm(obj - tcp_center, axis=-1)
+
+        reward = np.where(
+            (tcp_to_obj < 0.02) & (tcp_opened > 0),
+            reward + 1.0 + 7.0 * in_place,
+            reward,
+        )
+        return np.where(target_to_obj < self.TARGET_RADIUS, 10.0, reward)
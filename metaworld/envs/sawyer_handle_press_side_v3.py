@@ -7,8 +7,8 @@ import numpy.typing as npt
 from gymnasium.spaces import Box
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
-from metaworld.types import InitConfigDict
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
+from metaworld.types import InitConfigDict, RewardContext
 from metaworld.utils import reward_utils
 
 
@@ -26,6 +26,8 @@ class SawyerHandlePressSideEnvV3(SawyerXYZEnv):
         - (6/30/20) Increased goal's Z coordinate by 0.01 in XML
     """
 
+    TASK_ENV_ID = 23
+
     TARGET_RADIUS: float = 0.02
 
     def __init__(
@@ -36,6 +38,8 @@ class SawyerHandlePressSideEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         hand_low = (-0.5, 0.40, 0.05)
         hand_high = (0.5, 1.0, 0.5)
@@ -50,6 +54,8 @@ class SawyerHandlePressSideEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
 
@@ -127,7 +133,8 @@ class SawyerHandlePressSideEnvV3(SawyerXYZEnv):
         self._handle_init_pos = self._get_pos_objects()
 
         self.maxDist = np.abs(
-            self.data.site("handleStart").xpos[-1] - self._target_pos[-1]
+            self.data.site_xpos[self._site_ids["handleStart"]][-1]
+            - self._target_pos[-1]
         )
 
         return self._get_obs()
@@ -206,3 +213,42 @@ class SawyerHandlePressSideEnvV3(SawyerXYZEnv):
             reward = -reachDist + pressRew
 
             return float(reward), 0.0, 0.0, float(pressDist), 0.0, 0.0
+
+    def _compute_reward_batch(
+        self,
+        actions: npt.NDArray[np.float64],
+        obs: npt.NDArray[np.float64],
+        context: RewardContext,
+        tcp_center: npt.NDArray[np.float64],
+        pad_y: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        obj = obs[..., 4:7]
+        target = context["target_pos"]
+        handle_init_pos = context["extra"]["handle_init_pos"]
+
+        target_to_obj = np.abs(obj[..., 2] - target[..., 2])
+        target_to_obj_init = np.abs(handle_init_pos[..., 2] - target[..., 2])
+
+        in_place = reward_utils.tolerance_batch(
+            target_to_obj,
+            bounds=(0, self.TARGET_RADIUS),
+            margin=np.abs(target_to_obj_init - self.TARGET_RADIUS),
+            sigmoid="long_tail",
+        )
+
+        handle_radius = 0.02
+        tcp_to_obj = np.linalg.norm(obj - tcp_center, axis=-1)
+        tcp_to_obj_init = np.linalg.norm(handle_init_pos - context["init_tcp"], axis=-1)
+        reach = reward_utils.tolerance_batch(
+            tcp_to_obj,
+            bounds=(0, handle_radius),
+            margin=np.abs(tcp_to_obj_init - handle_radius),
+            sigmoid="long_tail",
+        )
+
+        reward = reward_utils.hamacher_product_batch(reach, in_place)
+        reward = np.where(target_to_obj <= self.TARGET_RADIUS, 1.0, reward)
+        return reward * 10
+
+    def _reward_context_extra(self) -> dict[str, Any]:
+        return {"handle_init_pos": self._handle_init_pos}
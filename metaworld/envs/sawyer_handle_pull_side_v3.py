@@ -7,12 +7,14 @@ import numpy.typing as npt
 from gymnasium.spaces import Box
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
-from metaworld.types import InitConfigDict
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
+from metaworld.types import InitConfigDict, RewardContext
 from metaworld.utils import reward_utils
 
 
 class SawyerHandlePullSideEnvV3(SawyerXYZEnv):
+    TASK_ENV_ID = 25
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -21,6 +23,8 @@ class SawyerHandlePullSideEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         hand_low = (-0.5, 0.40, 0.05)
         hand_high = (0.5, 1.0, 0.5)
@@ -35,6 +39,8 @@ class SawyerHandlePullSideEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
 
@@ -114,7 +120,8 @@ class SawyerHandlePullSideEnvV3(SawyerXYZEnv):
         self._set_obj_xyz(np.array(-0.1))
         self._target_pos = self._get_site_pos("goalPull")
         self.maxDist = np.abs(
-            self.data.site("handleStart").xpos[-1] - self._target_pos[-1]
+            self.data.site_xpos[self._site_ids["handleStart"]][-1]
+            - self._target_pos[-1]
         )
         self.target_reward = 1000 * self.maxDist + 1000 * 2
         self.obj_init_pos = self._get_pos_objects()
@@ -203,3 +210,51 @@ class SawyerHandlePullSideEnvV3(SawyerXYZEnv):
             reward = -reachDist + pressRew
 
             return float(reward), 0.0, 0.0, float(pressDist), 0.0, 0.0
+
+    def _compute_reward_batch(
+        self,
+        actions: npt.NDArray[np.float64],
+        obs: npt.NDArray[np.float64],
+        context: RewardContext,
+        tcp_center: npt.NDArray[np.float64],
+        pad_y: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        obj = obs[..., 4:7]
+        target = context["target_pos"]
+        obj_init_pos = context["obj_init_pos"]
+
+        target_to_obj = np.linalg.norm(obj - target, axis=-1)
+        target_to_obj_init = np.linalg.norm(obj_init_pos - target, axis=-1)
+
+        in_place = reward_utils.tolerance_batch(
+            target_to_obj,
+            bounds=(0, self.TARGET_RADIUS),
+            margin=target_to_obj_init,
+            sigmoid="long_tail",
+        )
+
+        object_grasped = self._gripper_caging_reward_batch(
+            actions,
+            obj,
+            context,
+            tcp_center,
+            pad_y,
+            pad_success_thresh=0.06,
+            obj_radius=0.032,
+            object_reach_radius=0.01,
+            xz_thresh=0.01,
+            high_density=True,
+        )
+        reward = reward_utils.hamacher_product_batch(object_grasped, in_place)
+
+        tcp_opened = obs[..., 3]
+        tcp_to_obj = np.linalg.norm(obj - tcp_center, axis=-1)
+
+        reward = np.where(
+            (tcp_to_obj < 0.035)
+            & (tcp_opened > 0)
+            & (obj[..., 2] - 0.01 > obj_init_pos[..., 2]),
+            reward + 1.0 + 5.0 * in_place,
+            reward,
+        )
+        return np.where(target_to_obj < self.TARGET_RADIUS, 10.0, reward)
@@ -6,10 +6,9 @@ import mujoco
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
-from scipy.spatial.transform import Rotation
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
 from metaworld.types import InitConfigDict
 from metaworld.utils import reward_utils
 
@@ -28,6 +27,8 @@ class SawyerLeverPullEnvV3(SawyerXYZEnv):
             This ensures that the target point is above the table.
     """
 
+    TASK_ENV_ID = 27
+
     LEVER_RADIUS = 0.2
 
     def __init__(
@@ -38,6 +39,8 @@ class SawyerLeverPullEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         hand_low = (-0.5, 0.40, -0.15)
         hand_high = (0.5, 1, 0.5)
@@ -52,6 +55,8 @@ class SawyerLeverPullEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
 
@@ -107,8 +112,7 @@ class SawyerLeverPullEnvV3(SawyerXYZEnv):
         return self._get_site_pos("leverStart")
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        geom_xmat = self.data.geom("objGeom").xmat.reshape(3, 3)
-        return Rotation.from_matrix(geom_xmat).as_quat()
+        return self._xmat_to_quat(self.data.geom_xmat[self._geom_ids["objGeom"]])
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
@@ -5,15 +5,16 @@ from typing import Any
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
-from scipy.spatial.transform import Rotation
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
-from metaworld.types import InitConfigDict
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
+from metaworld.types import InitConfigDict, RandVecMinDistance
 from metaworld.utils import reward_utils
 
 
 class SawyerPegInsertionSideEnvV3(SawyerXYZEnv):
+    TASK_ENV_ID = 35
+
     TARGET_RADIUS: float = 0.07
     """
     Motivation for V3:
@@ -32,6 +33,8 @@ class SawyerPegInsertionSideEnvV3(SawyerXYZEnv):
             the hole's position, as opposed to hand_low and hand_high
     """
 
+    RAND_VEC_CONSTRAINTS = (RandVecMinDistance(0, 3, 0.1),)
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -40,6 +43,8 @@ class SawyerPegInsertionSideEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         hand_init_pos = (0, 0.6, 0.2)
 
@@ -58,6 +63,8 @@ class SawyerPegInsertionSideEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
 
@@ -131,14 +138,11 @@ class SawyerPegInsertionSideEnvV3(SawyerXYZEnv):
         return self._get_site_pos("pegGrasp")
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        geom_xmat = self.data.site("pegGrasp").xmat.reshape(3, 3)
-        return Rotation.from_matrix(geom_xmat).as_quat()
+        return self._xmat_to_quat(self.data.site_xmat[self._site_ids["pegGrasp"]])
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
         pos_peg, pos_box = np.split(self._get_state_rand_vec(), 2)
-        while np.linalg.norm(pos_peg[:2] - pos_box[:2]) < 0.1:
-            pos_peg, pos_box = np.split(self._get_state_rand_vec(), 2)
         self.obj_init_pos = pos_peg
         self.peg_head_pos_init = self._get_site_pos("pegHead")
         self._set_obj_xyz(self.obj_init_pos)
@@ -7,12 +7,14 @@ import numpy.typing as npt
 from gymnasium.spaces import Box
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
-from metaworld.types import InitConfigDict
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
+from metaworld.types import InitConfigDict, RewardContext
 from metaworld.utils import reward_utils
 
 
 class SawyerPegUnplugSideEnvV3(SawyerXYZEnv):
+    TASK_ENV_ID = 36
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -21,6 +23,8 @@ class SawyerPegUnplugSideEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         hand_low = (-0.5, 0.40, 0.05)
         hand_high = (0.5, 1, 0.5)
@@ -37,6 +41,8 @@ class SawyerPegUnplugSideEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
 
@@ -91,7 +97,7 @@ class SawyerPegUnplugSideEnvV3(SawyerXYZEnv):
         return self._get_site_pos("pegEnd")
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return self.data.body("plug1").xquat
+        return self.data.xquat[self._body_ids["plug1"]]
 
     def _set_obj_xyz(self, pos: npt.NDArray[Any]) -> None:
         qpos = self.data.qpos.flat.copy()
@@ -218,3 +224,56 @@ class SawyerPegUnplugSideEnvV3(SawyerXYZEnv):
             reward = reachRew + placeRew
 
             return float(reward), 0.0, 0.0, float(placingDist), 0.0, 0.0, 0.0
+
+    def _compute_reward_batch(
+        self,
+        actions: npt.NDArray[np.float64],
+        obs: npt.NDArray[np.float64],
+        context: RewardContext,
+        tcp_center: npt.NDArray[np.float64],
+        pad_y: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        obj = obs[..., 4:7]
+        tcp_opened = obs[..., 3]
+        target = context["target_pos"]
+        obj_init_pos = context["obj_init_pos"]
+        tcp_to_obj = np.linalg.norm(obj - tcp_center, axis=-1)
+        obj_to_target = np.linalg.norm(obj - target, axis=-1)
+        pad_success_margin = 0.05
+        object_reach_radius = 0.01
+        x_z_margin = 0.005
+        obj_radius = 0.025
+
+        object_grasped = self._gripper_caging_reward_batch(
+            actions,
+            obj,
+            context,
+            tcp_center,
+            pad_y,
+            object_reach_radius=object_reach_radius,
+            obj_radius=obj_radius,
+            pad_success_thresh=pad_success_margin,
+            xz_thresh=x_z_margin,
+            desired_gripper_effort=0.8,
+            high_density=True,
+        )
+        in_place_margin = np.linalg.norm(obj_init_pos - target, axis=-1)
+
+        in_place = reward_utils.tolerance_batch(
+            obj_to_target,
+            bounds=(0, 0.05),
+            margin=in_place_margin,
+            sigmoid="long_tail",
+        )
+        grasp_success = (tcp_opened > 0.5) & (
+            obj[..., 0] - obj_init_pos[..., 0] > 0.015
+        )
+
+        reward = 2 * object_grasped
+
+        reward = np.where(
+            grasp_success & (tcp_to_obj < 0.035),
+            1 + 2 * object_grasped + 5 * in_place,
+            reward,
+        )
+        return np.where(obj_to_target <= 0.05, 10.0, reward)
@@ -7,13 +7,16 @@ import numpy.typing as npt
 from gymnasium.spaces import Box
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
-from metaworld.types import InitConfigDict
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
+from metaworld.types import InitConfigDict, RandVecMinDistance, RewardContext
 from metaworld.utils import reward_utils
 
 
 class SawyerPickOutOfHoleEnvV3(SawyerXYZEnv):
+    TASK_ENV_ID = 29
+
     _TARGET_RADIUS: float = 0.02
+    RAND_VEC_CONSTRAINTS = (RandVecMinDistance(0, 3, 0.15),)
 
     def __init__(
         self,
@@ -23,6 +26,8 @@ class SawyerPickOutOfHoleEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         hand_low = (-0.5, 0.40, -0.05)
         hand_high = (0.5, 1, 0.5)
@@ -39,6 +44,8 @@ class SawyerPickOutOfHoleEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
 
@@ -106,14 +113,12 @@ class SawyerPickOutOfHoleEnvV3(SawyerXYZEnv):
         return self.get_body_com("obj")
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return self.data.body("obj").xquat
+        return self.data.xquat[self._body_ids["obj"]]
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
 
         pos_obj, pos_goal = np.split(self._get_state_rand_vec(), 2)
-        while np.linalg.norm(pos_obj[:2] - pos_goal[:2]) < 0.15:
-            pos_obj, pos_goal = np.split(self._get_state_rand_vec(), 2)
 
         self.obj_init_pos = pos_obj
         self._set_obj_xyz(self.obj_init_pos)
@@ -121,7 +126,7 @@ class SawyerPickOutOfHoleEnvV3(SawyerXYZEnv):
         self.model.site("goal").pos = self._target_pos
 
         self.liftThresh = 0.11
-        self.objHeight = self.data.geom("objGeom").xpos[2]
+        self.objHeight = self.data.geom_xpos[self._geom_ids["objGeom"]][2]
         self.heightTarget = self.objHeight + self.liftThresh
         self.maxPlacingDist = (
             np.linalg.norm(
@@ -268,3 +273,82 @@ class SawyerPickOutOfHoleEnvV3(SawyerXYZEnv):
             reward = reachRew + pickRew + placeRew
 
             return float(reward), 0.0, 0.0, float(placingDist), 0.0, 0.0
+
+    def _compute_reward_batch(
+        self,
+        actions: npt.NDArray[np.float64],
+        obs: npt.NDArray[np.float64],
+        context: RewardContext,
+        tcp_center: npt.NDArray[np.float64],
+        pad_y: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        obj = obs[..., 4:7]
+        gripper = tcp_center
+        target = context["target_pos"]
+        obj_init_pos = context["obj_init_pos"]
+
+        obj_to_target = np.linalg.norm(obj - target, axis=-1)
+        tcp_to_obj = np.linalg.norm(obj - gripper, axis=-1)
+        in_place_margin = np.linalg.norm(obj_init_pos - target, axis=-1)
+
+        threshold = 0.03
+        # floor is a 3D funnel centered on the initial object pos
+        radius = np.linalg.norm(gripper[..., :2] - obj_init_pos[..., :2], axis=-1)
+        above_threshold = radius > threshold
+        floor = np.where(
+            above_threshold,
+            0.015
+            * np.log(
+                radius - threshold,
+                out=np.zeros_like(radius),
+                where=above_threshold,
+            )
+            + 0.15,
+            0.0,
+        )
+        # prevent the hand from running into cliff edge by staying above floor
+        above_floor = np.where(
+            gripper[..., 2] >= floor,
+            1.0,
+            reward_utils.tolerance_batch(
+                np.maximum(floor - gripper[..., 2], 0.0),
+                bounds=(0.0, 0.01),
+                margin=0.02,
+                sigmoid="long_tail",
+            ),
+        )
+        object_grasped = self._gripper_caging_reward_batch(
+            actions,
+            obj,
+            context,
+            tcp_center,
+            pad_y,
+            object_reach_radius=0.01,
+            obj_radius=0.015,
+            pad_success_thresh=0.02,
+            xz_thresh=0.03,
+            desired_gripper_effort=0.1,
+            high_density=True,
+        )
+        in_place = reward_utils.tolerance_batch(
+            obj_to_target,
+            bounds=(0, 0.02),
+            margin=in_place_margin,
+            sigmoid="long_tail",
+        )
+        reward = reward_utils.hamacher_product_batch(object_grasped, in_place)
+
+        near_object = tcp_to_obj < 0.04
+        pinched_without_obj = obs[..., 3] < 0.33
+        lifted = obj[..., 2] - 0.02 > obj_init_pos[..., 2]
+        # Increase reward when properly grabbed obj
+        grasp_success = near_object & lifted & ~pinched_without_obj
+        reward = np.where(
+            grasp_success,
+            reward
+            + 1.0
+            + 5.0 * reward_utils.hamacher_product_batch(in_place, above_floor),
+            reward,
+        )
+        # Maximize reward on success
+        return np.where(obj_to_target < self.TARGET_RADIUS, 10.0, reward)
@@ -5,11 +5,10 @@ from typing import Any
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
-from scipy.spatial.transform import Rotation
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
-from metaworld.types import InitConfigDict
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
+from metaworld.types import InitConfigDict, RandVecMinDistance, RewardContext
 from metaworld.utils import reward_utils
 
 
@@ -28,6 +27,10 @@ class SawyerPickPlaceEnvV3(SawyerXYZEnv):
         - (6/15/20) Separated reach-push-pick-place into 3 separate envs.
     """
 
+    TASK_ENV_ID = 30
+
+    RAND_VEC_CONSTRAINTS = (RandVecMinDistance(0, 3, 0.15),)
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -36,6 +39,8 @@ class SawyerPickPlaceEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         goal_low = (-0.1, 0.8, 0.05)
         goal_high = (0.1, 0.9, 0.3)
@@ -52,6 +57,8 @@ class SawyerPickPlaceEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
 
@@ -116,15 +123,13 @@ class SawyerPickPlaceEnvV3(SawyerXYZEnv):
         return reward, info
 
     def _get_id_main_object(self) -> int:
-        return self.data.geom("objGeom").id
+        return self._geom_ids["objGeom"]
 
     def _get_pos_objects(self) -> npt.NDArray[Any]:
         return self.get_body_com("obj")
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return Rotation.from_matrix(
-            self.data.geom("objGeom").xmat.reshape(3, 3)
-        ).as_quat()
+        return self._xmat_to_quat(self.data.geom_xmat[self._geom_ids["objGeom"]])
 
     def fix_extreme_obj_pos(self, orig_init_pos: npt.NDArray[Any]) -> npt.NDArray[Any]:
         # This is to account for meshes for the geom and object are not
@@ -145,10 +150,6 @@ class SawyerPickPlaceEnvV3(SawyerXYZEnv):
         self.obj_init_angle = self.init_config["obj_init_angle"]
 
         goal_pos = self._get_state_rand_vec()
-        self._target_pos = goal_pos[3:]
-        while np.linalg.norm(goal_pos[:2] - self._target_pos[:2]) < 0.15:
-            goal_pos = self._get_state_rand_vec()
-            self._target_pos = goal_pos[3:]
         self._target_pos = goal_pos[-3:]
         self.obj_init_pos = goal_pos[:3]
         self.init_tcp = self.tcp_center
@@ -158,7 +159,7 @@ class SawyerPickPlaceEnvV3(SawyerXYZEnv):
         self._set_obj_xyz(self.obj_init_pos)
         self.model.site("goal").pos = self._target_pos
 
-        self.objHeight = self.data.geom("objGeom").xpos[2]
+        self.objHeight = self.data.geom_xpos[self._geom_ids["objGeom"]][2]
         self.heightTarget = self.objHeight + 0.04
 
         self.maxPlacingDist = (
@@ -363,3 +364,117 @@ class SawyerPickPlaceEnvV3(SawyerXYZEnv):
             reward = reachRew + pickRew + placeRew
 
             return float(reward), 0.0, 0.0, float(placingDist), 0.0, 0.0
+
+    def _compute_reward_batch(
+        self,
+        actions: npt.NDArray[np.float64],
+        obs: npt.NDArray[np.float64],
+        context: RewardContext,
+        tcp_center: npt.NDArray[np.float64],
+        pad_y: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        _TARGET_RADIUS: float = 0.05
+        obj = obs[..., 4:7]
+        tcp_opened = obs[..., 3]
+        target = context["target_pos"]
+        obj_init_pos = context["obj_init_pos"]
+
+        obj_to_target = np.linalg.norm(obj - target, axis=-1)
+        tcp_to_obj = np.linalg.norm(obj - tcp_center, axis=-1)
+        in_place_margin = np.linalg.norm(obj_init_pos - target, axis=-1)
+
+        in_place = reward_utils.tolerance_batch(
+            obj_to_target,
+            bounds=(0, _TARGET_RADIUS),
+            margin=in_place_margin,
+            sigmoid="long_tail",
+        )
+
+        object_grasped = self._gripper_caging_reward_batch(
+            actions, obj, context, tcp_center, pad_y
+        )
+        in_place_and_object_grasped = reward_utils.hamacher_product_batch(
+            object_grasped, in_place
+        )
+        reward = in_place_and_object_grasped
+
+        reward = np.where(
+            (tcp_to_obj < 0.02)
+            & (tcp_opened > 0)
+            & (obj[..., 2] - 0.01 > obj_init_pos[..., 2]),
+            reward + 1.0 + 5.0 * in_place,
+            reward,
+        )
+        return np.where(obj_to_target < _TARGET_RADIUS, 10.0, reward)
+
+    def _gripper_caging_reward_batch(
+        self,
+        actions: npt.NDArray[np.float64],
+        obj_pos: npt.NDArray[np.float64],
+        context: RewardContext,
+        tcp_center: npt.NDArray[np.float64],
+        pad_y: npt.NDArray[np.float64],
+        obj_radius: float = 0,  # All of these args are unused, just here to match
+        pad_success_thresh: float = 0,  # the parent's type signature
+        object_reach_radius: float = 0,
+        xz_thresh: float = 0,
+        desired_gripper_effort: float = 1.0,
+        high_density: bool = False,
+        medium_density: bool = False,
+    ) -> npt.NDArray[np.float64]:
+        pad_success_margin = 0.05
+        x_z_success_margin = 0.005
+        obj_radius = 0.015
+        # `init_left_pad` and `init_right_pad` are views of the current pad positions
+        delta_object_y_left_pad = pad_y[..., 0] - obj_pos[..., 1]
+        delta_object_y_right_pad = obj_pos[..., 1] - pad_y[..., 1]
+        right_caging_margin = np.abs(
+            np.abs(obj_pos[..., 1] - pad_y[..., 1]) - pad_success_margin
+        )
+        left_caging_margin = np.abs(
+            np.abs(obj_pos[..., 1] - pad_y[..., 0]) - pad_success_margin
+        )
+
+        right_caging = reward_utils.tolerance_batch(
+            delta_object_y_right_pad,
+            bounds=(obj_radius, pad_success_margin),
+            margin=right_caging_margin,
+            sigmoid="long_tail",
+        )
+        left_caging = reward_utils.tolerance_batch(
+            delta_object_y_left_pad,
+            bounds=(obj_radius, pad_success_margin),
+            margin=left_caging_margin,
+            sigmoid="long_tail",
+        )
+
+        y_caging = reward_utils.hamacher_product_batch(left_caging, right_caging)
+
+        # compute the tcp_obj distance in the x_z plane
+        xz = [0, 2]
+        tcp_obj_norm_x_z = np.linalg.norm(
+            tcp_center[..., xz] - obj_pos[..., xz], axis=-1
+        )
+
+        # used for computing the tcp to object object margin in the x_z plane
+        tcp_obj_x_z_margin = (
+            np.linalg.norm(
+                context["obj_init_pos"][..., xz] - context["init_tcp"][..., xz],
+                axis=-1,
+            )
+            - x_z_success_margin
+        )
+
+        x_z_caging = reward_utils.tolerance_batch(
+            tcp_obj_norm_x_z,
+            bounds=(0, x_z_success_margin),
+            margin=tcp_obj_x_z_margin,
+            sigmoid="long_tail",
+        )
+
+        gripper_closed = np.clip(actions[..., -1], 0, 1)
+        caging = reward_utils.hamacher_product_batch(y_caging, x_z_caging)
+
+        gripping = np.where(caging > 0.97, gripper_closed, 0.0)
+        caging_and_gripping = reward_utils.hamacher_product_batch(caging, gripping)
+        return (caging_and_gripping + caging) / 2
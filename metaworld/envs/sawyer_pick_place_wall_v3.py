@@ -5,11 +5,10 @@ from typing import Any
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
-from scipy.spatial.transform import Rotation
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
-from metaworld.types import InitConfigDict
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
+from metaworld.types import InitConfigDict, RandVecMinDistance, RewardContext
 from metaworld.utils import reward_utils
 
 
@@ -29,6 +28,10 @@ class SawyerPickPlaceWallEnvV3(SawyerXYZEnv):
           reach-push-pick-place-wall.
     """
 
+    TASK_ENV_ID = 28
+
+    RAND_VEC_CONSTRAINTS = (RandVecMinDistance(0, 3, 0.15),)
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -37,6 +40,8 @@ class SawyerPickPlaceWallEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         goal_low = (-0.05, 0.85, 0.05)
         goal_high = (0.05, 0.9, 0.3)
@@ -53,6 +58,8 @@ class SawyerPickPlaceWallEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
 
@@ -116,21 +123,26 @@ class SawyerPickPlaceWallEnvV3(SawyerXYZEnv):
         return reward, info
 
     def _get_pos_objects(self) -> npt.NDArray[Any]:
-        return self.data.geom("objGeom").xpos
+        return self.data.geom_xpos[self._geom_ids["objGeom"]]
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return Rotation.from_matrix(
-            self.data.geom("objGeom").xmat.reshape(3, 3)
-        ).as_quat()
+        return self._xmat_to_quat(self.data.geom_xmat[self._geom_ids["objGeom"]])
 
     def adjust_initObjPos(self, orig_init_pos):
         # This is to account for meshes for the geom and object are not aligned
         # If this is not done, the object could be initialized in an extreme position
-        diff = self.get_body_com("obj")[:2] - self.data.geom("objGeom").xpos[:2]
+        diff = (
+            self.get_body_com("obj")[:2]
+            - self.data.geom_xpos[self._geom_ids["objGeom"]][:2]
+        )
         adjustedPos = orig_init_pos[:2] + diff
 
         # The convention we follow is that body_com[2] is always 0, and geom_pos[2] is the object height
-        return [adjustedPos[0], adjustedPos[1], self.data.geom("objGeom").xpos[-1]]
+        return [
+            adjustedPos[0],
+            adjustedPos[1],
+            self.data.geom_xpos[self._geom_ids["objGeom"]][-1],
+        ]
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
@@ -139,10 +151,6 @@ class SawyerPickPlaceWallEnvV3(SawyerXYZEnv):
         self.obj_init_angle = self.init_config["obj_init_angle"]
 
         goal_pos = self._get_state_rand_vec()
-        self._target_pos = goal_pos[3:]
-        while np.linalg.norm(goal_pos[:2] - self._target_pos[:2]) < 0.15:
-            goal_pos = self._get_state_rand_vec()
-            self._target_pos = goal_pos[3:]
         self._target_pos = goal_pos[-3:]
         self.obj_init_pos = goal_pos[:3]
 
@@ -150,7 +158,7 @@ class SawyerPickPlaceWallEnvV3(SawyerXYZEnv):
         self.model.site("goal").pos = self._target_pos
 
         self.liftThresh = 0.04
-        self.objHeight = self.data.geom("objGeom").xpos[2]
+        self.objHeight = self.data.geom_xpos[self._geom_ids["objGeom"]][2]
         self.heightTarget = self.objHeight + self.liftThresh
 
         self.maxReachDist = np.linalg.norm(self.init_tcp - np.array(self._target_pos))
@@ -318,3 +326,74 @@ class SawyerPickPlaceWallEnvV3(SawyerXYZEnv):
             reward = reachRew + pickRew + placeRew
 
             return float(reward), 0.0, 0.0, float(placingDist), 0.0, 0.0
+
+    def _compute_reward_batch(
+        self,
+        actions: npt.NDArray[np.float64],
+        obs: npt.NDArray[np.float64],
+        context: RewardContext,
+        tcp_center: npt.NDArray[np.float64],
+        pad_y: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        _TARGET_RADIUS: float = 0.05
+        obj = obs[..., 4:7]
+        tcp_opened = obs[..., 3]
+        target = context["target_pos"]
+        obj_init_pos = context["obj_init_pos"]
+        midpoint = np.stack(np.broadcast_arrays(target[..., 0], 0.77, 0.25), axis=-1)
+
+        tcp_to_obj = np.linalg.norm(obj - tcp_center, axis=-1)
+
+        in_place_scaling = np.array([1.0, 1.0, 3.0])
+        obj_to_midpoint = np.linalg.norm((obj - midpoint) * in_place_scaling, axis=-1)
+        obj_to_midpoint_init = np.linalg.norm(
+            (obj_init_pos - midpoint) * in_place_scaling, axis=-1
+        )
+
+        obj_to_target = np.linalg.norm(obj - target, axis=-1)
+        obj_to_target_init = np.linalg.norm(obj_init_pos - target, axis=-1)
+
+        in_place_part1 = reward_utils.tolerance_batch(
+            obj_to_midpoint,
+            bounds=(0, _TARGET_RADIUS),
+            margin=obj_to_midpoint_init,
+            sigmoid="long_tail",
+        )
+
+        in_place_part2 = reward_utils.tolerance_batch(
+            obj_to_target,
+            bounds=(0, _TARGET_RADIUS),
+            margin=obj_to_target_init,
+            sigmoid="long_tail",
+        )
+
+        object_grasped = self._gripper_caging_reward_batch(
+            actions,
+            obj,
+            context,
+            tcp_center,
+            pad_y,
+            obj_radius=0.015,
+            pad_success_thresh=0.05,
+            object_reach_radius=0.01,
+            xz_thresh=0.005,
+            high_density=False,
+        )
+
+        in_place_and_object_grasped = reward_utils.hamacher_product_batch(
+            object_grasped, in_place_part1
+        )
+        reward = in_place_and_object_grasped
+
+        reward = np.where(
+            (tcp_to_obj < 0.02)
+            & (tcp_opened > 0)
+            & (obj[..., 2] - 0.015 > obj_init_pos[..., 2]),
+            np.where(
+                obj[..., 1] > 0.75,
+                in_place_and_object_grasped + 1.0 + 4.0 + 3.0 * in_place_part2,
+                in_place_and_object_grasped + 1.0 + 4.0 * in_place_part1,
+            ),
+            reward,
+        )
+        return np.where(obj_to_target < _TARGET_RADIUS, 10.0, reward)
@@ -5,15 +5,16 @@ from typing import Any
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
-from scipy.spatial.transform import Rotation
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
-from metaworld.types import InitConfigDict
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
+from metaworld.types import InitConfigDict, RewardContext
 from metaworld.utils import reward_utils
 
 
 class SawyerPlateSlideBackEnvV3(SawyerXYZEnv):
+    TASK_ENV_ID = 33
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -22,6 +23,8 @@ class SawyerPlateSlideBackEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         goal_low = (-0.1, 0.6, 0.015)
         goal_high = (0.1, 0.6, 0.015)
@@ -38,6 +41,8 @@ class SawyerPlateSlideBackEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
 
@@ -90,11 +95,10 @@ class SawyerPlateSlideBackEnvV3(SawyerXYZEnv):
         return reward, info
 
     def _get_pos_objects(self) -> npt.NDArray[Any]:
-        return self.data.geom("puck").xpos
+        return self.data.geom_xpos[self._geom_ids["puck"]]
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        geom_xmat = self.data.geom("puck").xmat.reshape(3, 3)
-        return Rotation.from_matrix(geom_xmat).as_quat()
+        return self._xmat_to_quat(self.data.geom_xmat[self._geom_ids["puck"]])
 
     def _set_obj_xyz(self, pos: npt.NDArray[Any]) -> None:
         qpos = self.data.qpos.flat.copy()
@@ -111,13 +115,13 @@ class SawyerPlateSlideBackEnvV3(SawyerXYZEnv):
         rand_vec = self._get_state_rand_vec()
         self.obj_init_pos = rand_vec[:3]
         self._target_pos = rand_vec[3:]
-        self.data.body("puck_goal").xpos = self._target_pos
+        self.data.xpos[self._body_ids["puck_goal"]] = self._target_pos
         self._set_obj_xyz(np.array([0, 0.15]))
 
         self.model.site("goal").pos = self._target_pos
 
         self.maxDist = np.linalg.norm(
-            self.data.geom("puck").xpos[:-1] - self._target_pos[:-1]
+            self.data.geom_xpos[self._geom_ids["puck"]][:-1] - self._target_pos[:-1]
         )
 
         return self._get_obs()
@@ -196,3 +200,43 @@ class SawyerPlateSlideBackEnvV3(SawyerXYZEnv):
             reward = -reachDist + pullRew
 
             return float(reward), 0.0, 0.0, float(pullDist), 0.0, 0.0
+
+    def _compute_reward_batch(
+        self,
+        actions: npt.NDArray[np.float64],
+        obs: npt.NDArray[np.float64],
+        context: RewardContext,
+        tcp_center: npt.NDArray[np.float64],
+        pad_y: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        _TARGET_RADIUS: float = 0.05
+        obj = obs[..., 4:7]
+        target = context["target_pos"]
+        obj_init_pos = context["obj_init_pos"]
+
+        obj_to_target = np.linalg.norm(obj - target, axis=-1)
+        in_place_margin = np.linalg.norm(obj_init_pos - target, axis=-1)
+        in_place = reward_utils.tolerance_batch(
+            obj_to_target,
+            bounds=(0, _TARGET_RADIUS),
+            margin=in_place_margin - _TARGET_RADIUS,
+            sigmoid="long_tail",
+        )
+
+        tcp_to_obj = np.linalg.norm(tcp_center - obj, axis=-1)
+        obj_grasped_margin = np.linalg.norm(context["init_tcp"] - obj_init_pos, axis=-1)
+        object_grasped = reward_utils.tolerance_batch(
+            tcp_to_obj,
+            bounds=(0, _TARGET_RADIUS),
+            margin=obj_grasped_margin - _TARGET_RADIUS,
+            sigmoid="long_tail",
+        )
+
+        reward = 1.5 * object_grasped
+
+        reward = np.where(
+            (tcp_center[..., 2] <= 0.03) & (tcp_to_obj < 0.07),
+            2.0 + (7.0 * in_place),
+            reward,
+        )
+        return np.where(obj_to_target < _TARGET_RADIUS, 10.0, reward)
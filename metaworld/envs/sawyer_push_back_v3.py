@@ -5,17 +5,19 @@ from typing import Any
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
-from scipy.spatial.transform import Rotation
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
-from metaworld.types import InitConfigDict
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
+from metaworld.types import InitConfigDict, RandVecMinDistance, RewardContext
 from metaworld.utils import reward_utils
 
 
 class SawyerPushBackEnvV3(SawyerXYZEnv):
+    TASK_ENV_ID = 42
+
     OBJ_RADIUS: float = 0.007
     TARGET_RADIUS: float = 0.05
+    RAND_VEC_CONSTRAINTS = (RandVecMinDistance(0, 3, 0.15),)
 
     def __init__(
         self,
@@ -25,6 +27,8 @@ class SawyerPushBackEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         goal_low = (-0.1, 0.6, 0.0199)
         goal_high = (0.1, 0.7, 0.0201)
@@ -41,6 +45,8 @@ class SawyerPushBackEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
 
@@ -99,22 +105,27 @@ class SawyerPushBackEnvV3(SawyerXYZEnv):
         return reward, info
 
     def _get_pos_objects(self) -> npt.NDArray[Any]:
-        return self.data.geom("objGeom").xpos
+        return self.data.geom_xpos[self._geom_ids["objGeom"]]
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return Rotation.from_matrix(
-            self.data.geom("objGeom").xmat.reshape(3, 3)
-        ).as_quat()
+        return self._xmat_to_quat(self.data.geom_xmat[self._geom_ids["objGeom"]])
 
     def adjust_initObjPos(self, orig_init_pos: npt.NDArray[Any]) -> npt.NDArray[Any]:
         # This is to account for meshes for the geom and object are not aligned
         # If this is not done, the object could be initialized in an extreme position
-        diff = self.get_body_com("obj")[:2] - self.data.geom("objGeom").xpos[:2]
+        diff = (
+            self.get_body_com("obj")[:2]
+            - self.data.geom_xpos[self._geom_ids["objGeom"]][:2]
+        )
         adjustedPos = orig_init_pos[:2] + diff
 
         # The convention we follow is that body_com[2] is always 0, and geom_pos[2] is the object height
         return np.array(
-            [adjustedPos[0], adjustedPos[1], self.data.geom("objGeom").xpos[-1]]
+            [
+                adjustedPos[0],
+                adjustedPos[1],
+                self.data.geom_xpos[self._geom_ids["objGeom"]][-1],
+            ]
         )
 
     def reset_model(self) -> npt.NDArray[np.float64]:
@@ -126,11 +137,6 @@ class SawyerPushBackEnvV3(SawyerXYZEnv):
         assert self.obj_init_pos is not None
         goal_pos = self._get_state_rand_vec()
         self._target_pos = np.concatenate([goal_pos[-3:-1], [self.obj_init_pos[-1]]])
-        while np.linalg.norm(goal_pos[:2] - self._target_pos[:2]) < 0.15:
-            goal_pos = self._get_state_rand_vec()
-            self._target_pos = np.concatenate(
-                [goal_pos[-3:-1], [self.obj_init_pos[-1]]]
-            )
         self.obj_init_pos = np.concatenate([goal_pos[:2], [self.obj_init_pos[-1]]])
 
         self._set_obj_xyz(self.obj_init_pos)
@@ -138,7 +144,7 @@ class SawyerPushBackEnvV3(SawyerXYZEnv):
 
         self.liftThresh = 0.04
 
-        self.objHeight = self.data.geom("objGeom").xpos[2]
+        self.objHeight = self.data.geom_xpos[self._geom_ids["objGeom"]][2]
         self.heightTarget = self.objHeight + self.liftThresh
 
         self.maxReachDist = np.linalg.norm(self.init_tcp - np.array(self._target_pos))
@@ -319,3 +325,121 @@ class SawyerPushBackEnvV3(SawyerXYZEnv):
                 pushRew = 0
             reward = reachRew + pushRew
             return reward, 0.0, 0.0, float(pushDist), 0.0, 0.0
+
+    def _compute_reward_batch(
+        self,
+        actions: npt.NDArray[np.float64],
+        obs: npt.NDArray[np.float64],
+        context: RewardContext,
+        tcp_center: npt.NDArray[np.float64],
+        pad_y: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        obj = obs[..., 4:7]
+        tcp_opened = obs[..., 3]
+        target = context["target_pos"]
+        tcp_to_obj = np.linalg.norm(obj - tcp_center, axis=-1)
+        target_to_obj = np.linalg.norm(obj - target, axis=-1)
+        target_to_obj_init = np.linalg.norm(context["obj_init_pos"] - target, axis=-1)
+
+        in_place = reward_utils.tolerance_batch(
+            target_to_obj,
+            bounds=(0, self.TARGET_RADIUS),
+            margin=target_to_obj_init,
+            sigmoid="long_tail",
+        )
+        object_grasped = self._gripper_caging_reward_batch(
+            actions, obj, context, tcp_center, pad_y, self.OBJ_RADIUS
+        )
+
+        reward = reward_utils.hamacher_product_batch(object_grasped, in_place)
+
+        reward = np.where(
+            (tcp_to_obj < 0.01)
+            & (0 < tcp_opened)
+            & (tcp_opened < 0.55)
+            & (target_to_obj_init - target_to_obj > 0.01),
+            reward + 1.0 + 5.0 * in_place,
+            reward,
+        )
+        return np.where(target_to_obj < self.TARGET_RADIUS, 10.0, reward)
+
+    def _gripper_caging_reward_batch(
+        self,
+        actions: npt.NDArray[np.float64],
+        obj_pos: npt.NDArray[np.float64],
+        context: RewardContext,
+        tcp_center: npt.NDArray[np.float64],
+        pad_y: npt.NDArray[np.float64],
+        obj_radius: float,
+        pad_success_thresh: float = 0,  # All of these args are unused
+        object_reach_radius: float = 0,  # just here to match the parent's type signature
+        xz_thresh: float = 0,
+        desired_gripper_effort: float = 1.0,
+        high_density: bool = False,
+        medium_density: bool = False,
+    ) -> npt.NDArray[np.float64]:
+        pad_success_margin = 0.05
+        grip_success_margin = obj_radius + 0.003
+        x_z_success_margin = 0.01
+
+        # `init_left_pad` and `init_right_pad` are views of the current pad positions
+        delta_object_y_left_pad = pad_y[..., 0] - obj_pos[..., 1]
+        delta_object_y_right_pad = obj_pos[..., 1] - pad_y[..., 1]
+        right_caging_margin = np.abs(
+            np.abs(obj_pos[..., 1] - pad_y[..., 1]) - pad_success_margin
+        )
+        left_caging_margin = np.abs(
+            np.abs(obj_pos[..., 1] - pad_y[..., 0]) - pad_success_margin
+        )
+
+        right_caging = reward_utils.tolerance_batch(
+            delta_object_y_right_pad,
+            bounds=(obj_radius, pad_success_margin),
+            margin=right_caging_margin,
+            sigmoid="long_tail",
+        )
+        left_caging = reward_utils.tolerance_batch(
+            delta_object_y_left_pad,
+            bounds=(obj_radius, pad_success_margin),
+            margin=left_caging_margin,
+            sigmoid="long_tail",
+        )
+
+        right_gripping = reward_utils.tolerance_batch(
+            delta_object_y_right_pad,
+            bounds=(obj_radius, grip_success_margin),
+            margin=right_caging_margin,
+            sigmoid="long_tail",
+        )
+        left_gripping = reward_utils.tolerance_batch(
+            delta_object_y_left_pad,
+            bounds=(obj_radius, grip_success_margin),
+            margin=left_caging_margin,
+            sigmoid="long_tail",
+        )
+
+        y_caging = reward_utils.hamacher_product_batch(right_caging, left_caging)
+        y_gripping = reward_utils.hamacher_product_batch(right_gripping, left_gripping)
+
+        xz = [0, 2]
+        tcp_obj_norm_x_z = np.linalg.norm(
+            tcp_center[..., xz] - obj_pos[..., xz], axis=-1
+        )
+        tcp_obj_x_z_margin = (
+            np.linalg.norm(
+                context["obj_init_pos"][..., xz] - context["init_tcp"][..., xz],
+                axis=-1,
+            )
+            - x_z_success_margin
+        )
+        x_z_caging = reward_utils.tolerance_batch(
+            tcp_obj_norm_x_z,
+            bounds=(0, x_z_success_margin),
+            margin=tcp_obj_x_z_margin,
+            sigmoid="long_tail",
+        )
+
+        caging = reward_utils.hamacher_product_batch(y_caging, x_z_caging)
+        gripping = np.where(caging > 0.95, y_gripping, 0.0)
+
+        return (caging + gripping) / 2
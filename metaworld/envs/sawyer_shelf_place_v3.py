@@ -6,15 +6,18 @@ import mujoco
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
-from scipy.spatial.transform import Rotation
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
-from metaworld.types import InitConfigDict
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
+from metaworld.types import InitConfigDict, RandVecMinDistance, RewardContext
 from metaworld.utils import reward_utils
 
 
 class SawyerShelfPlaceEnvV3(SawyerXYZEnv):
+    TASK_ENV_ID = 45
+
+    RAND_VEC_CONSTRAINTS = (RandVecMinDistance(0, 3, 0.1),)
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -23,6 +26,8 @@ class SawyerShelfPlaceEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         goal_low = (-0.1, 0.8, 0.299)
         goal_high = (0.1, 0.9, 0.301)
@@ -39,6 +44,8 @@ class SawyerShelfPlaceEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
 
@@ -103,13 +110,15 @@ class SawyerShelfPlaceEnvV3(SawyerXYZEnv):
         return self.get_body_com("obj")
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        geom_xmat = self.data.geom("objGeom").xmat.reshape(3, 3)
-        return Rotation.from_matrix(geom_xmat).as_quat()
+        return self._xmat_to_quat(self.data.geom_xmat[self._geom_ids["objGeom"]])
 
     def adjust_initObjPos(self, orig_init_pos: npt.NDArray[Any]) -> npt.NDArray[Any]:
         # This is to account for meshes for the geom and object are not aligned
         # If this is not done, the object could be initialized in an extreme position
-        diff = self.get_body_com("obj")[:2] - self.data.geom("objGeom").xpos[:2]
+        diff = (
+            self.get_body_com("obj")[:2]
+            - self.data.geom_xpos[self._geom_ids["objGeom"]][:2]
+        )
         adjustedPos = orig_init_pos[:2] + diff
 
         # The convention we follow is that body_com[2] is always 0, and geom_pos[2] is the object height
@@ -121,8 +130,6 @@ class SawyerShelfPlaceEnvV3(SawyerXYZEnv):
         self.obj_init_angle = self.init_config["obj_init_angle"]
 
         goal_pos = self._get_state_rand_vec()
-        while np.linalg.norm(goal_pos[:2] - goal_pos[-3:-1]) < 0.1:
-            goal_pos = self._get_state_rand_vec()
         base_shelf_pos = goal_pos - np.array([0, 0, 0, 0, 0, 0.3])
         self.obj_init_pos = np.concatenate(
             (base_shelf_pos[:2], [self.obj_init_pos[-1]])
@@ -138,7 +145,7 @@ class SawyerShelfPlaceEnvV3(SawyerXYZEnv):
         self._set_pos_site("goal", self._target_pos)
 
         self.liftThresh = 0.04
-        self.objHeight = self.data.geom("objGeom").xpos[2]
+        self.objHeight = self.data.geom_xpos[self._geom_ids["objGeom"]][2]
         self.heightTarget = self.objHeight + self.liftThresh
         self.maxPlacingDist = (
             np.linalg.norm(
@@ -285,3 +292,74 @@ class SawyerShelfPlaceEnvV3(SawyerXYZEnv):
             reward = reachRew + pickRew + placeRew
 
             return float(reward), 0.0, 0.0, float(placingDist), 0.0, 0.0
+
+    def _compute_reward_batch(
+        self,
+        actions: npt.NDArray[np.float64],
+        obs: npt.NDArray[np.float64],
+        context: RewardContext,
+        tcp_center: npt.NDArray[np.float64],
+        pad_y: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        _TARGET_RADIUS: float = 0.05
+        obj = obs[..., 4:7]
+        tcp_opened = obs[..., 3]
+        target = context["target_pos"]
+        obj_init_pos = context["obj_init_pos"]
+
+        obj_to_target = np.linalg.norm(obj - target, axis=-1)
+        tcp_to_obj = np.linalg.norm(obj - tcp_center, axis=-1)
+        in_place_margin = np.linalg.norm(obj_init_pos - target, axis=-1)
+
+        in_place = reward_utils.tolerance_batch(
+            obj_to_target,
+            bounds=(0, _TARGET_RADIUS),
+            margin=in_place_margin,
+            sigmoid="long_tail",
+        )
+
+        object_grasped = self._gripper_caging_reward_batch(
+            actions,
+            obj,
+            context,
+            tcp_center,
+            pad_y,
+            obj_radius=0.02,
+            pad_success_thresh=0.05,
+            object_reach_radius=0.01,
+            xz_thresh=0.01,
+            high_density=False,
+        )
+        reward = reward_utils.hamacher_product_batch(object_grasped, in_place)
+
+        below_shelf = (
+            (0.0 < obj[..., 2])
+            & (obj[..., 2] < 0.24)
+            & (target[..., 0] - 0.15 < obj[..., 0])
+            & (obj[..., 0] < target[..., 0] + 0.15)
+        )
+        in_front_of_shelf = (
+            below_shelf
+            & (target[..., 1] - 3 * _TARGET_RADIUS < obj[..., 1])
+            & (obj[..., 1] < target[..., 1])
+        )
+        z_scaling = (0.24 - obj[..., 2]) / 0.24
+        y_scaling = (obj[..., 1] - (target[..., 1] - 3 * _TARGET_RADIUS)) / (
+            3 * _TARGET_RADIUS
+        )
+        bound_loss = reward_utils.hamacher_product_batch(
+            np.where(in_front_of_shelf, y_scaling, 0.0),
+            np.where(in_front_of_shelf, z_scaling, 0.0),
+        )
+        in_place = np.where(
+            in_front_of_shelf, np.clip(in_place - bound_loss, 0.0, 1.0), in_place
+        )
+        in_place = np.where(below_shelf & (obj[..., 1] > target[..., 1]), 0.0, in_place)
+
+        grasped = (
+            (tcp_to_obj < 0.025)
+            & (tcp_opened > 0)
+            & (obj[..., 2] - 0.01 > obj_init_pos[..., 2])
+        )
+        reward = np.where(grasped, reward + 1.0 + 5.0 * in_place, reward)
+        return np.where(obj_to_target < _TARGET_RADIUS, 10.0, reward)
@@ -5,17 +5,19 @@ from typing import Any
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
-from scipy.spatial.transform import Rotation
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
-from metaworld.types import InitConfigDict
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
+from metaworld.types import InitConfigDict, RandVecMinDistance, RewardContext
 from metaworld.utils import reward_utils
 
 
 class SawyerSoccerEnvV3(SawyerXYZEnv):
+    TASK_ENV_ID = 37
+
     OBJ_RADIUS: float = 0.013
     TARGET_RADIUS: float = 0.07
+    RAND_VEC_CONSTRAINTS = (RandVecMinDistance(0, 3, 0.15),)
 
     def __init__(
         self,
@@ -25,6 +27,8 @@ class SawyerSoccerEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         goal_low = (-0.1, 0.8, 0.0)
         goal_high = (0.1, 0.9, 0.0)
@@ -41,6 +45,8 @@ class SawyerSoccerEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
 
@@ -103,8 +109,7 @@ class SawyerSoccerEnvV3(SawyerXYZEnv):
         return self.get_body_com("soccer_ball")
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        geom_xmat = self.data.body("soccer_ball").xmat.reshape(3, 3)
-        return Rotation.from_matrix(geom_xmat).as_quat()
+        return self._xmat_to_quat(self.data.xmat[self._body_ids["soccer_ball"]])
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
@@ -113,9 +118,6 @@ class SawyerSoccerEnvV3(SawyerXYZEnv):
 
         goal_pos = self._get_state_rand_vec()
         self._target_pos = goal_pos[3:]
-        while np.linalg.norm(goal_pos[:2] - self._target_pos[:2]) < 0.15:
-            goal_pos = self._get_state_rand_vec()
-            self._target_pos = goal_pos[3:]
         assert self.obj_init_pos is not None
         self.obj_init_pos = np.concatenate([goal_pos[:2], [self.obj_init_pos[-1]]])
         self.model.body("goal_whole").pos = self._target_pos
@@ -296,3 +298,124 @@ class SawyerSoccerEnvV3(SawyerXYZEnv):
             reward = reachRew + pushRew
 
             return float(reward), 0.0, 0.0, float(pushDist), 0.0, 0.0
+
+    def _compute_reward_batch(
+        self,
+        actions: npt.NDArray[np.float64],
+        obs: npt.NDArray[np.float64],
+        context: RewardContext,
+        tcp_center: npt.NDArray[np.float64],
+        pad_y: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        obj = obs[..., 4:7]
+        target = context["target_pos"]
+        x_scaling = np.array([3.0, 1.0, 1.0])
+        target_to_obj = np.linalg.norm((obj - target) * x_scaling, axis=-1)
+        target_to_obj_init = np.linalg.norm(
+            (obj - context["obj_init_pos"]) * x_scaling, axis=-1
+        )
+
+        in_place = reward_utils.tolerance_batch(
+            target_to_obj,
+            bounds=(0, self.TARGET_RADIUS),
+            margin=target_to_obj_init,
+            sigmoid="long_tail",
+        )
+
+        goal_line = target[..., 1] - 0.1
+        in_place = np.where(
+            (obj[..., 1] > goal_line) & (np.abs(obj[..., 0] - target[..., 0]) > 0.10),
+            np.clip(
+                in_place - 2 * ((obj[..., 1] - goal_line) / (1 - goal_line)), 0.0, 1.0
+            ),
+            in_place,
+        )
+
+        object_grasped = self._gripper_caging_reward_batch(
+            actions, obj, context, tcp_center, pad_y, self.OBJ_RADIUS
+        )
+
+        reward = (3 * object_grasped) + (6.5 * in_place)
+
+        return np.where(target_to_obj < self.TARGET_RADIUS, 10.0, reward)
+
+    def _gripper_caging_reward_batch(
+        self,
+        actions: npt.NDArray[np.float64],
+        obj_pos: npt.NDArray[np.float64],
+        context: RewardContext,
+        tcp_center: npt.NDArray[np.float64],
+        pad_y: npt.NDArray[np.float64],
+        obj_radius: float,
+        pad_success_thresh: float = 0,  # All of these args are unused
+        object_reach_radius: float = 0,  # just here to match the parent's type signature
+        xz_thresh: float = 0,
+        desired_gripper_effort: float = 1.0,
+        high_density: bool = False,
+        medium_density: bool = False,
+    ) -> npt.NDArray[np.float64]:
+        pad_success_margin = 0.05
+        grip_success_margin = obj_radius + 0.01
+        x_z_success_margin = 0.005
+
+        # `init_left_pad` and `init_right_pad` are views of the current pad positions
+        delta_object_y_left_pad = pad_y[..., 0] - obj_pos[..., 1]
+        delta_object_y_right_pad = obj_pos[..., 1] - pad_y[..., 1]
+        right_caging_margin = np.abs(
+            np.abs(obj_pos[..., 1] - pad_y[..., 1]) - pad_success_margin
+        )
+        left_caging_margin = np.abs(
+            np.abs(obj_pos[..., 1] - pad_y[..., 0]) - pad_success_margin
+        )
+
+        right_caging = reward_utils.tolerance_batch(
+            delta_object_y_right_pad,
+            bounds=(obj_radius, pad_success_margin),
+            margin=right_caging_margin,
+            sigmoid="long_tail",
+        )
+        left_caging = reward_utils.tolerance_batch(
+            delta_object_y_left_pad,
+            bounds=(obj_radius, pad_success_margin),
+            margin=left_caging_margin,
+            sigmoid="long_tail",
+        )
+
+        right_gripping = reward_utils.tolerance_batch(
+            delta_object_y_right_pad,
+            bounds=(obj_radius, grip_success_margin),
+            margin=right_caging_margin,
+            sigmoid="long_tail",
+        )
+        left_gripping = reward_utils.tolerance_batch(
+            delta_object_y_left_pad,
+            bounds=(obj_radius, grip_success_margin),
+            margin=left_caging_margin,
+            sigmoid="long_tail",
+        )
+
+        y_caging = reward_utils.hamacher_product_batch(right_caging, left_caging)
+        y_gripping = reward_utils.hamacher_product_batch(right_gripping, left_gripping)
+
+        xz = [0, 2]
+        tcp_obj_norm_x_z = np.linalg.norm(
+            tcp_center[..., xz] - obj_pos[..., xz], axis=-1
+        )
+        tcp_obj_x_z_margin = (
+            np.linalg.norm(
+                context["obj_init_pos"][..., xz] - context["init_tcp"][..., xz],
+                axis=-1,
+            )
+            - x_z_success_margin
+        )
+        x_z_caging = reward_utils.tolerance_batch(
+            tcp_obj_norm_x_z,
+            bounds=(0, x_z_success_margin),
+            margin=tcp_obj_x_z_margin,
+            sigmoid="long_tail",
+        )
+
+        caging = reward_utils.hamacher_product_batch(y_caging, x_z_caging)
+        gripping = np.where(caging > 0.95, y_gripping, 0.0)
+
+        return (caging + gripping) / 2
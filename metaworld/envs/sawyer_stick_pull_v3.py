@@ -5,15 +5,18 @@ from typing import Any
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
-from scipy.spatial.transform import Rotation
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
-from metaworld.types import ObservationDict, StickInitConfigDict
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
+from metaworld.types import ObservationDict, RandVecMinDistance, StickInitConfigDict
 from metaworld.utils import reward_utils
 
 
 class SawyerStickPullEnvV3(SawyerXYZEnv):
+    TASK_ENV_ID = 39
+
+    RAND_VEC_CONSTRAINTS = (RandVecMinDistance(0, 3, 0.1),)
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -22,6 +25,8 @@ class SawyerStickPullEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         hand_low = (-0.5, 0.35, 0.05)
         hand_high = (0.5, 1, 0.5)
@@ -38,6 +43,8 @@ class SawyerStickPullEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
 
@@ -113,10 +120,9 @@ class SawyerStickPullEnvV3(SawyerXYZEnv):
         )
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        geom_xmat = self.data.body("stick").xmat.reshape(3, 3)
         return np.hstack(
             (
-                Rotation.from_matrix(geom_xmat).as_quat(),
+                self._xmat_to_quat(self.data.xmat[self._body_ids["stick"]]),
                 np.array(
                     [
                         0.0,
@@ -155,8 +161,6 @@ class SawyerStickPullEnvV3(SawyerXYZEnv):
         self._target_pos = np.array([0.3, 0.4, self.stick_init_pos[-1]])
 
         goal_pos = self._get_state_rand_vec()
-        while np.linalg.norm(goal_pos[:2] - goal_pos[-3:-1]) < 0.1:
-            goal_pos = self._get_state_rand_vec()
         self.stick_init_pos = np.concatenate([goal_pos[:2], [self.stick_init_pos[-1]]])
         self._target_pos = np.concatenate([goal_pos[-3:-1], [self.stick_init_pos[-1]]])
 
@@ -5,15 +5,23 @@ from typing import Any
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
-from scipy.spatial.transform import Rotation
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
-from metaworld.types import ObservationDict, StickInitConfigDict
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
+from metaworld.types import (
+    ObservationDict,
+    RandVecMinDistance,
+    RewardContext,
+    StickInitConfigDict,
+)
 from metaworld.utils import reward_utils
 
 
 class SawyerStickPushEnvV3(SawyerXYZEnv):
+    TASK_ENV_ID = 38
+
+    RAND_VEC_CONSTRAINTS = (RandVecMinDistance(0, 3, 0.1),)
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -22,6 +30,8 @@ class SawyerStickPushEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         hand_low = (-0.5, 0.40, 0.05)
         hand_high = (0.5, 1, 0.5)
@@ -38,6 +48,8 @@ class SawyerStickPushEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
 
@@ -108,10 +120,9 @@ class SawyerStickPushEnvV3(SawyerXYZEnv):
         )
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        geom_xmat = self.data.body("stick").xmat.reshape(3, 3)
         return np.hstack(
             (
-                Rotation.from_matrix(geom_xmat).as_quat(),
+                self._xmat_to_quat(self.data.xmat[self._body_ids["stick"]]),
                 np.array(
                     [
                         0.0,
@@ -150,8 +161,6 @@ class SawyerStickPushEnvV3(SawyerXYZEnv):
         self._target_pos = np.array([0.4, 0.6, self.stick_init_pos[-1]])
 
         goal_pos = self._get_state_rand_vec()
-        while np.linalg.norm(goal_pos[:2] - goal_pos[-3:-1]) < 0.1:
-            goal_pos = self._get_state_rand_vec()
         self.stick_init_pos = np.concatenate([goal_pos[:2], [self.stick_init_pos[-1]]])
         self._target_pos = np.concatenate(
             [goal_pos[-3:-1], [self._get_site_pos("insertion")[-1]]]
@@ -409,3 +418,102 @@ class SawyerStickPushEnvV3(SawyerXYZEnv):
             reward = reachRew + pickRew + pushRew
 
             return float(reward), 0.0, 0.0, float(pushDist), 0.0, 0.0
+
+    def _compute_reward_batch(
+        self,
+        actions: npt.NDArray[np.float64],
+        obs: npt.NDArray[np.float64],
+        context: RewardContext,
+        tcp_center: npt.NDArray[np.float64],
+        pad_y: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        _TARGET_RADIUS: float = 0.12
+        stick = obs[..., 4:7] + np.array([0.015, 0.0, 0.0])
+        container = obs[..., 11:14]
+        tcp_opened = obs[..., 3]
+        target = context["target_pos"]
+        stick_init_pos = context["extra"]["stick_init_pos"]
+
+        tcp_to_stick = np.linalg.norm(stick - tcp_center, axis=-1)
+        stick_to_target = np.linalg.norm(stick - target, axis=-1)
+        stick_in_place_margin = (
+            np.linalg.norm(stick_init_pos - target, axis=-1) - _TARGET_RADIUS
+        )
+        stick_in_place = reward_utils.tolerance_batch(
+            stick_to_target,
+            bounds=(0, _TARGET_RADIUS),
+            margin=stick_in_place_margin,
+            sigmoid="long_tail",
+        )
+
+        container_to_target = np.linalg.norm(container - target, axis=-1)
+        container_in_place_margin = (
+            np.linalg.norm(context["obj_init_pos"] - target, axis=-1) - _TARGET_RADIUS
+        )
+        container_in_place = reward_utils.tolerance_batch(
+            container_to_target,
+            bounds=(0, _TARGET_RADIUS),
+            margin=container_in_place_margin,
+            sigmoid="long_tail",
+        )
+
+        object_grasped = self._gripper_caging_reward_batch(
+            actions,
+            stick,
+            context,
+            tcp_center,
+            pad_y,
+            obj_radius=0.04,
+            pad_success_thresh=0.05,
+            object_reach_radius=0.01,
+            xz_thresh=0.01,
+            high_density=True,
+        )
+
+        reward = object_grasped
+
+        return np.where(
+            (tcp_to_stick < 0.02)
+            & (tcp_opened > 0)
+            & (stick[..., 2] - 0.01 > stick_init_pos[..., 2]),
+            np.where(
+                container_to_target <= _TARGET_RADIUS,
+                10.0,
+                2.0 + 5.0 * stick_in_place + 3.0 * container_in_place,
+            ),
+            reward,
+        )
+
+    def _reward_context_extra(self) -> dict[str, Any]:
+        return {"stick_init_pos": self.stick_init_pos}
+
+    def _gripper_caging_reward_batch(
+        self,
+        actions: npt.NDArray[np.float64],
+        obj_pos: npt.NDArray[np.float64],
+        context: RewardContext,
+        tcp_center: npt.NDArray[np.float64],
+        pad_y: npt.NDArray[np.float64],
+        obj_radius: float,
+        pad_success_thresh: float,
+        object_reach_radius: float,
+        xz_thresh: float,
+        desired_gripper_effort: float = 1.0,
+        high_density: bool = False,
+        medium_density: bool = False,
+    ) -> npt.NDArray[np.float64]:
+        # Same as the parent's, with the stick's initial position instead of the object's
+        return super()._gripper_caging_reward_batch(
+            actions,
+            obj_pos,
+            {**context, "obj_init_pos": context["extra"]["stick_init_pos"]},
+            tcp_center,
+            pad_y,
+            obj_radius,
+            pad_success_thresh,
+            object_reach_radius,
+            xz_thresh,
+            desired_gripper_effort,
+            high_density,
+            medium_density,
+        )
@@ -5,16 +5,19 @@ from typing import Any
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
-from scipy.spatial.transform import Rotation
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
-from metaworld.types import InitConfigDict
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
+from metaworld.types import InitConfigDict, RandVecMinDistance, RewardContext
 from metaworld.utils import reward_utils
 
 
 class SawyerSweepIntoGoalEnvV3(SawyerXYZEnv):
+    TASK_ENV_ID = 46
+
     OBJ_RADIUS: float = 0.02
+    # The object must start away from the fixed goal, not the goal in the rand vec
+    RAND_VEC_CONSTRAINTS = (RandVecMinDistance(0, (0.0, 0.84), 0.15),)
 
     def __init__(
         self,
@@ -24,6 +27,8 @@ class SawyerSweepIntoGoalEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         hand_low = (-0.5, 0.40, 0.05)
         hand_high = (0.5, 1, 0.5)
@@ -40,6 +45,8 @@ class SawyerSweepIntoGoalEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
 
@@ -92,8 +99,7 @@ class SawyerSweepIntoGoalEnvV3(SawyerXYZEnv):
         return reward, info
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        geom_xmat = self.data.geom("objGeom").xmat.reshape(3, 3)
-        return Rotation.from_matrix(geom_xmat).as_quat()
+        return self._xmat_to_quat(self.data.geom_xmat[self._geom_ids["objGeom"]])
 
     def _get_pos_objects(self) -> npt.NDArray[Any]:
         return self.get_body_com("obj")
@@ -106,8 +112,6 @@ class SawyerSweepIntoGoalEnvV3(SawyerXYZEnv):
         self.objHeight = self.get_body_com("obj")[2]
 
         goal_pos = self._get_state_rand_vec()
-        while np.linalg.norm(goal_pos[:2] - self._target_pos[:2]) < 0.15:
-            goal_pos = self._get_state_rand_vec()
         assert self.obj_init_pos is not None
         self.obj_init_pos = np.concatenate([goal_pos[:2], [self.obj_init_pos[-1]]])
 
@@ -294,3 +298,123 @@ class SawyerSweepIntoGoalEnvV3(SawyerXYZEnv):
             reward = reachRew + pushRew
 
             return reward, 0.0, 0.0, float(pushDist), 0.0, 0.0
+
+    def _compute_reward_batch(
+        self,
+        actions: npt.NDArray[np.float64],
+        obs: npt.NDArray[np.float64],
+        context: RewardContext,
+        tcp_center: npt.NDArray[np.float64],
+        pad_y: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        _TARGET_RADIUS: float = 0.05
+        obj = obs[..., 4:7]
+        target = np.concatenate(
+            [
+                np.broadcast_to(context["target_pos"][..., :2], obj[..., :2].shape),
+                obj[..., 2:],
+            ],
+            axis=-1,
+        )
+
+        obj_to_target = np.linalg.norm(obj - target, axis=-1)
+        in_place_margin = np.linalg.norm(context["obj_init_pos"] - target, axis=-1)
+
+        in_place = reward_utils.tolerance_batch(
+            obj_to_target,
+            bounds=(0, _TARGET_RADIUS),
+            margin=in_place_margin,
+            sigmoid="long_tail",
+        )
+
+        object_grasped = self._gripper_caging_reward_batch(
+            actions, obj, context, tcp_center, pad_y, self.OBJ_RADIUS
+        )
+        in_place_and_object_grasped = reward_utils.hamacher_product_batch(
+            object_grasped, in_place
+        )
+
+        reward = (2 * object_grasped) + (6 * in_place_and_object_grasped)
+
+        return np.where(obj_to_target < _TARGET_RADIUS, 10.0, reward)
+
+    def _gripper_caging_reward_batch(
+        self,
+        actions: npt.NDArray[np.float64],
+        obj_pos: npt.NDArray[np.float64],
+        context: RewardContext,
+        tcp_center: npt.NDArray[np.float64],
+        pad_y: npt.NDArray[np.float64],
+        obj_radius: float,
+        pad_success_thresh: float = 0,  # All of these args are unused
+        object_reach_radius: float = 0,  # just here to match the parent's type signature
+        xz_thresh: float = 0,
+        desired_gripper_effort: float = 1.0,
+        high_density: bool = False,
+        medium_density: bool = False,
+    ) -> npt.NDArray[np.float64]:
+        pad_success_margin = 0.05
+        grip_success_margin = obj_radius + 0.005
+        x_z_success_margin = 0.01
+
+        # `init_left_pad` and `init_right_pad` are views of the current pad positions
+        delta_object_y_left_pad = pad_y[..., 0] - obj_pos[..., 1]
+        delta_object_y_right_pad = obj_pos[..., 1] - pad_y[..., 1]
+        right_caging_margin = np.abs(
+            np.abs(obj_pos[..., 1] - pad_y[..., 1]) - pad_success_margin
+        )
+        left_caging_margin = np.abs(
+            np.abs(obj_pos[..., 1] - pad_y[..., 0]) - pad_success_margin
+        )
+
+        right_caging = reward_utils.tolerance_batch(
+            delta_object_y_right_pad,
+            bounds=(obj_radius, pad_success_margin),
+            margin=right_caging_margin,
+            sigmoid="long_tail",
+        )
+        left_caging = reward_utils.tolerance_batch(
+            delta_object_y_left_pad,
+            bounds=(obj_radius, pad_success_margin),
+            margin=left_caging_margin,
+            sigmoid="long_tail",
+        )
+
+        right_gripping = reward_utils.tolerance_batch(
+            delta_object_y_right_pad,
+            bounds=(obj_radius, grip_success_margin),
+            margin=right_caging_margin,
+            sigmoid="long_tail",
+        )
+        left_gripping = reward_utils.tolerance_batch(
+            delta_object_y_left_pad,
+            bounds=(obj_radius, grip_success_margin),
+            margin=left_caging_margin,
+            sigmoid="long_tail",
+        )
+
+        y_caging = reward_utils.hamacher_product_batch(right_caging, left_caging)
+        y_gripping = reward_utils.hamacher_product_batch(right_gripping, left_gripping)
+
+        xz = [0, 2]
+        tcp_obj_norm_x_z = np.linalg.norm(
+            tcp_center[..., xz] - obj_pos[..., xz], axis=-1
+        )
+        tcp_obj_x_z_margin = (
+            np.linalg.norm(
+                context["obj_init_pos"][..., xz] - context["init_tcp"][..., xz],
+                axis=-1,
+            )
+            - x_z_success_margin
+        )
+        x_z_caging = reward_utils.tolerance_batch(
+            tcp_obj_norm_x_z,
+            bounds=(0, x_z_success_margin),
+            margin=tcp_obj_x_z_margin,
+            sigmoid="long_tail",
+        )
+
+        caging = reward_utils.hamacher_product_batch(y_caging, x_z_caging)
+        gripping = np.where(caging > 0.95, y_gripping, 0.0)
+
+        return (caging + gripping) / 2
@@ -7,8 +7,8 @@ import numpy.typing as npt
 from gymnasium.spaces import Box
 
 from metaworld.asset_path_utils import full_V3_path_for
-from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv
-from metaworld.types import InitConfigDict
+from metaworld.sawyer_xyz_env import RenderMode, SawyerXYZEnv, VisualAssets
+from metaworld.types import InitConfigDict, RewardContext
 from metaworld.utils import reward_utils
 
 
@@ -25,6 +25,8 @@ class SawyerWindowCloseEnvV3(SawyerXYZEnv):
         - (6/15/20) Increased max_path_length from 150 to 200
     """
 
+    TASK_ENV_ID = 49
+
     TARGET_RADIUS: float = 0.05
 
     def __init__(
@@ -35,6 +37,8 @@ class SawyerWindowCloseEnvV3(SawyerXYZEnv):
         reward_function_version: str = "v2",
         height: int = 480,
         width: int = 480,
+        visual_assets: VisualAssets = "full",
+        frame_skip: int = SawyerXYZEnv.DEFAULT_FRAME_SKIP,
     ) -> None:
         liftThresh = 0.02
         hand_low = (-0.5, 0.40, 0.05)
@@ -50,6 +54,8 @@ class SawyerWindowCloseEnvV3(SawyerXYZEnv):
             camera_id=camera_id,
             height=height,
             width=width,
+            visual_assets=visual_assets,
+            frame_skip=frame_skip,
         )
         self.reward_function_version = reward_function_version
 
@@ -208,3 +214,42 @@ class SawyerWindowCloseEnvV3(SawyerXYZEnv):
             reward = reachRew + pullRew
 
             return reward, 0.0, 0.0, pullDist, 0.0, 0.0
+
+    def _compute_reward_batch(
+        self,
+        actions: npt.NDArray[np.float64],
+        obs: npt.NDArray[np.float64],
+        context: RewardContext,
+        tcp_center: npt.NDArray[np.float64],
+        pad_y: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        obj = obs[..., 4:7]
+        target = context["target_pos"]
+        window_handle_pos_init = context["extra"]["window_handle_pos_init"]
+
+        target_to_obj = np.abs(obj[..., 0] - target[..., 0])
+        target_to_obj_init = np.abs(window_handle_pos_init[..., 0] - target[..., 0])
+
+        in_place = reward_utils.tolerance_batch(
+            target_to_obj,
+            bounds=(0, self.TARGET_RADIUS),
+            margin=np.abs(target_to_obj_init - self.TARGET_RADIUS),
+            sigmoid="long_tail",
+        )
+
+        handle_radius = 0.02
+        tcp_to_obj = np.linalg.norm(obj - tcp_center, axis=-1)
+        tcp_to_obj_init = np.linalg.norm(
+            window_handle_pos_init - context["init_tcp"], axis=-1
+        )
+        reach = reward_utils.tolerance_batch(
+            tcp_to_obj,
+            bounds=(0, handle_radius),
+            margin=np.abs(tcp_to_obj_init - handle_radius),
+            sigmoid="gaussian",
+        )
+
+        return 10 * reward_utils.hamacher_product_batch(reach, in_place)
+
+    def _reward_context_extra(self) -> dict[str, Any]:
+        return {"window_handle_pos_init": self.window_handle_pos_init}
@@ -0,0 +1,169 @@
+"""An on-disk cache for the goals (`rand_vec`s) generated when a benchmark is created with a seed."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+GOAL_BANK_VERSION = 1
+"""Bump whenever the sampling code of `metaworld._make_tasks` changes, to invalidate existing goal banks.
+
+The reset space bounds and the `RAND_VEC_CONSTRAINTS` of each environment are part of the goal bank key already.
+"""
+
+GOAL_BANK_DIR_ENV_VAR = "METAWORLD_GOAL_BANK_DIR"
+"""Environment variable overriding the goal bank directory. Set it to an empty string to disable the goal bank."""
+
+
+def _package_version() -> str:
+    try:
+        return version("metaworld")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+@lru_cache(maxsize=None)
+def _goal_sampling_key(env_cls: type) -> list[Any]:
+    """The values of an environment that determine its goals, its `_random_reset_space` bounds and `RAND_VEC_CONSTRAINTS`.
+
+    The bounds are only set by the constructor, so this creates a headless instance of the environment.
+    """
+    env = env_cls(visual_assets="none")
+    try:
+        reset_space = env._random_reset_space
+        bounds = (
+            None
+            if reset_space is None
+            else [reset_space.low.tolist(), reset_space.high.tolist()]
+        )
+        constraints = [list(constraint) for constraint in env.RAND_VEC_CONSTRAINTS]
+    finally:
+        env.close()
+    return [bounds, constraints]
+
+
+def goal_bank_dir() -> Path | None:
+    """Returns the directory the goal banks are stored in, or `None` if the goal bank is disabled.
+
+    Defaults to `$XDG_CACHE_HOME/metaworld/goal_banks` (`~/.cache/metaworld/goal_banks`).
+    """
+    override = os.environ.get(GOAL_BANK_DIR_ENV_VAR)
+    if override is not None:
+        return Path(override) if override else None
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "metaworld" / "goal_banks"
+
+
+def goal_bank_path(
+    env_classes: dict[str, type], seed: int, num_goals: int
+) -> Path | None:
+    """Returns the path of the goal bank for a set of environments.
+
+    Args:
+        env_classes: The environment classes the goals are generated for, in generation order.
+        seed: The seed the goals are generated with.
+        num_goals: The number of goals generated for each environment.
+
+    Returns:
+        The path of the `.npz` file, or `None` if the goal bank is disabled.
+    """
+    directory = goal_bank_dir()
+    if directory is None:
+        return None
+    key = json.dumps(
+        [
+            GOAL_BANK_VERSION,
+            _package_version(),
+            [
+                (
+                    env_name,
+                    f"{env_cls.__module__}.{env_cls.__qualname__}",
+                    _goal_sampling_key(env_cls),
+                )
+                for env_name, env_cls in env_classes.items()
+            ],
+        ]
+    )
+    digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+    return directory / f"goals-{digest}-seed{seed}-n{num_goals}.npz"
+
+
+def load_goal_bank(
+    env_classes: dict[str, type], seed: int, num_goals: int
+) -> dict[str, npt.NDArray[np.float64]] | None:
+    """Loads the goals of a set of environments from the goal bank.
+
+    Args:
+        env_classes: The environment classes the goals are generated for, in generation order.
+        seed: The seed the goals are generated with.
+        num_goals: The number of goals generated for each environment.
+
+    Returns:
+        A `(num_goals, rand_vec_dim)` array of goals for each environment name, or `None` if
+        the goals aren't in the goal bank (or the goal bank file is invalid).
+    """
+    path = goal_bank_path(env_classes, seed, num_goals)
+    if path is None or not path.is_file():
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as bank:
+            goals = {env_name: bank[env_name] for env_name in env_classes}
+    except (OSError, KeyError, ValueError):
+        return None
+    if any(
+        rand_vecs.ndim != 2 or rand_vecs.shape[0] != num_goals
+        for rand_vecs in goals.values()
+    ):
+        return None
+    return goals
+
+
+def save_goal_bank(
+    env_classes: dict[str, type],
+    seed: int,
+    num_goals: int,
+    goals: dict[str, Any],
+) -> None:
+    """Saves the goals of a set of environments to the goal bank.
+
+    The file is written atomically, so concurrent workers generating the same goals are safe.
+    Failures to write (e.g. a read-only file system) are ignored.
+
+    Args:
+        env_classes: The environment classes the goals are generated for, in generation order.
+        seed: The seed the goals are generated with.
+        num_goals: The number of goals generated for each environment.
+        goals: The list of `num_goals` goals of each environment, keyed by environment name.
+    """
+    path = goal_bank_path(env_classes, seed, num_goals)
+    if path is None:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".npz")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(
+                f,
+                **{
+                    env_name: np.asarray(rand_vecs, dtype=np.float64)
+                    for env_name, rand_vecs in goals.items()
+                },
+            )
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
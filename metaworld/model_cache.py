@@ -0,0 +1,179 @@
+"""Caches for the compiled MuJoCo models of the envs, so that creating an env doesn't parse its XML and load its assets."""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+
+import mujoco
+
+from metaworld.asset_path_utils import ENV_ASSET_DIR_V3
+
+MODEL_CACHE_VERSION = 1
+"""Bump whenever the way models are compiled changes, to invalidate existing model caches."""
+
+MODEL_CACHE_DIR_ENV_VAR = "METAWORLD_MODEL_CACHE_DIR"
+"""Environment variable overriding the model cache directory. Set it to an empty string to disable the on-disk cache."""
+
+MODEL_CACHE_SIZE = 16
+"""The maximum number of models kept in memory, least recently used models are evicted first."""
+
+_MODELS: OrderedDict[tuple[str, str], mujoco.MjModel] = OrderedDict()
+"""The compiled models of this process, keyed by XML path and visual assets. They are copied before being handed out."""
+
+_ASSETS_ROOT = ENV_ASSET_DIR_V3.resolve()
+
+
+def model_cache_dir() -> Path | None:
+    """Returns the directory the compiled models are stored in, or `None` if the on-disk cache is disabled.
+
+    Defaults to `$XDG_CACHE_HOME/metaworld/models` (`~/.cache/metaworld/models`).
+    """
+    override = os.environ.get(MODEL_CACHE_DIR_ENV_VAR)
+    if override is not None:
+        return Path(override) if override else None
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "metaworld" / "models"
+
+
+@lru_cache(maxsize=None)
+def _assets_digest() -> str:
+    """Hashes the contents of all the files in `metaworld/assets`, which the models can include or load."""
+    digest = hashlib.sha256()
+    for path in sorted(_ASSETS_ROOT.rglob("*")):
+        if path.is_file():
+            digest.update(str(path.relative_to(_ASSETS_ROOT)).encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def model_cache_path(xml_path: str, visual_assets: str = "full") -> Path | None:
+    """Returns the path of the compiled model (MJB file) of an XML file.
+
+    Args:
+        xml_path: The path of the model's XML file.
+        visual_assets: Whether the model has all of its visual assets (`"full"`) or none of them (`"none"`).
+
+    Returns:
+        The path of the `.mjb` file, or `None` if the on-disk cache is disabled or the XML file isn't
+        one of Meta-World's assets (whose contents are what the cache is keyed by).
+    """
+    directory = model_cache_dir()
+    if directory is None:
+        return None
+    try:
+        relative_path = Path(xml_path).resolve().relative_to(_ASSETS_ROOT)
+    except ValueError:
+        return None
+    key = json.dumps(
+        [
+            MODEL_CACHE_VERSION,
+            mujoco.__version__,
+            str(relative_path),
+            visual_assets,
+            _assets_digest(),
+        ]
+    )
+    digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+    return directory / f"{relative_path.stem}-{visual_assets}-{digest}.mjb"
+
+
+def _save_model(model: mujoco.MjModel, path: Path) -> None:
+    """Saves a compiled model atomically, ignoring failures to write (e.g. a read-only file system)."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".mjb")
+    except OSError:
+        return
+    try:
+        os.close(fd)
+        mujoco.mj_saveModel(model, tmp_path, None)
+        os.replace(tmp_path, path)
+    except (OSError, ValueError):
+        pass
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _strip_visual_assets(spec: mujoco.MjSpec) -> None:
+    """Removes the textures, visual-only geoms and unused meshes from a model spec.
+
+    Visual-only geoms neither collide (`contype` and `conaffinity` are 0) nor contribute to the inertia of
+    their bodies (their group is outside of `inertiagrouprange`), so the physics of the model is unchanged.
+    Named geoms are kept, since the envs may look them up (e.g. to observe an object's orientation).
+    """
+    for material in spec.materials:
+        material.textures = [""] * len(material.textures)
+    for texture in list(spec.textures):
+        texture.delete()
+    min_group, max_group = spec.compiler.inertiagrouprange
+    for geom in list(spec.geoms):
+        if (
+            not geom.name
+            and geom.contype == 0
+            and geom.conaffinity == 0
+            and not min_group <= geom.group <= max_group
+        ):
+            geom.delete()
+    used_meshes = {geom.meshname for geom in spec.geoms}
+    for mesh in list(spec.meshes):
+        if mesh.name not in used_meshes:
+            mesh.delete()
+
+
+def _compile_model(xml_path: str, visual_assets: str) -> mujoco.MjModel:
+    """Loads a compiled model from the on-disk cache, or compiles it from XML and adds it to the cache."""
+    path = model_cache_path(xml_path, visual_assets)
+    if path is not None and path.is_file():
+        try:
+            return mujoco.MjModel.from_binary_path(str(path))
+        except ValueError:
+            pass
+    if visual_assets == "full":
+        model = mujoco.MjModel.from_xml_path(xml_path)
+    elif visual_assets == "none":
+        spec = mujoco.MjSpec.from_file(xml_path)
+        _strip_visual_assets(spec)
+        model = spec.compile()
+    else:
+        raise ValueError(
+            f"visual_assets must be 'full' or 'none', got {visual_assets!r}"
+        )
+    if path is not None:
+        _save_model(model, path)
+    return model
+
+
+def load_model(xml_path: str, visual_assets: str = "full") -> mujoco.MjModel:
+    """Returns the compiled model of an XML file.
+
+    The model comes from the in-process cache, then the on-disk cache, and is only compiled from XML
+    if it is in neither. Envs modify their models (e.g. to move objects on reset), so every call
+    returns a new copy.
+
+    Args:
+        xml_path: The path of the model's XML file.
+        visual_assets: `"full"` for the model as is, or `"none"` to leave out the textures and the
+            visual-only geoms and meshes. Both have the same physics, but `"none"` models are smaller
+            and faster to load, and are meant for training without rendering.
+
+    Returns:
+        A copy of the compiled model.
+    """
+    key = (xml_path, visual_assets)
+    model = _MODELS.get(key)
+    if model is None:
+        model = _compile_model(xml_path, visual_assets)
+        _MODELS[key] = model
+        if len(_MODELS) > MODEL_CACHE_SIZE:
+            _MODELS.popitem(last=False)
+    else:
+        _MODELS.move_to_end(key)
+    return copy.copy(model)
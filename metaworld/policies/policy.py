@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import abc
 import warnings
-from typing import Any, Callable
+from typing import Any, Callable, Sequence
 
 import numpy as np
 import numpy.typing as npt
@@ -20,11 +20,16 @@ def assert_fully_parsed(
         The input function, decorated to assert full parsing
     """
 
+    # The parsed layout only depends on the observation length, so each length is checked once
+    checked_lengths: set[int] = set()
+
     def inner(obs) -> dict[str, Any]:
         obs_dict = func(obs)
-        assert len(obs) == sum(
-            [len(i) if isinstance(i, np.ndarray) else 1 for i in obs_dict.values()]
-        ), "Observation not fully parsed"
+        if len(obs) not in checked_lengths:
+            assert len(obs) == sum(
+                [len(i) if isinstance(i, np.ndarray) else 1 for i in obs_dict.values()]
+            ), "Observation not fully parsed"
+            checked_lengths.add(len(obs))
         return obs_dict
 
     return inner
@@ -53,6 +58,57 @@ def move(
     return response
 
 
+def select(
+    conditions: Sequence[npt.NDArray[np.bool_]],
+    choices: Sequence[npt.ArrayLike],
+    default: npt.ArrayLike,
+) -> npt.NDArray[Any]:
+    """Batched `if`/`elif`/`else` chain, picking the choice of the first true condition of each row.
+
+    Like `np.select()`, except that the `(N,)` conditions are broadcast along the trailing axes of the
+    choices, so that a condition selects whole `(N, 3)` positions.
+
+    Args:
+        conditions: `(N,)` boolean arrays, in order.
+        choices: The value for each condition, `(N, ...)` arrays or scalars.
+        default: The value of the rows where no condition is true.
+
+    Returns:
+        The selected `(N, ...)` values.
+    """
+    choices = [np.asarray(choice) for choice in choices]
+    default = np.asarray(default)
+    value_ndim = max(0, max(np.ndim(choice) for choice in [*choices, default]) - 1)
+    conditions = [
+        np.reshape(condition, np.shape(condition) + (1,) * value_ndim)
+        for condition in conditions
+    ]
+    return np.select(conditions, choices, default)
+
+
+def stack_xyz(x: npt.ArrayLike, y: npt.ArrayLike, z: npt.ArrayLike) -> npt.NDArray[Any]:
+    """Stacks `(N,)` coordinates, or scalars, into `(N, 3)` positions."""
+    return np.stack(np.broadcast_arrays(x, y, z), axis=-1)
+
+
+def batch_action(
+    delta_pos: npt.NDArray[Any], grab_effort: npt.ArrayLike
+) -> npt.NDArray[np.float32]:
+    """Assembles `(N, 4)` actions.
+
+    Args:
+        delta_pos: `(N, 3)` hand movements.
+        grab_effort: `(N,)` gripper efforts, or a scalar for all the actions.
+
+    Returns:
+        The actions, in the layout of `Action.array`.
+    """
+    actions = np.empty((len(delta_pos), 4), dtype=np.float32)
+    actions[:, :3] = delta_pos
+    actions[:, 3] = grab_effort
+    return actions
+
+
 class Policy(abc.ABC):
     """Abstract base class for policies."""
 
@@ -69,6 +125,17 @@ class Policy(abc.ABC):
         """
         raise NotImplementedError
 
+    def _parse_obs_batch(
+        self, obs: npt.NDArray[np.float64]
+    ) -> dict[str, npt.NDArray[np.float64]]:
+        """Batched `_parse_obs()`, with the same fields for `(N, obs_dim)` observations.
+
+        The fields are found by parsing the observation indices, so it only relies on `_parse_obs()` slicing.
+        """
+        obs = np.asarray(obs)
+        layout = self._parse_obs(np.arange(obs.shape[-1]))
+        return {key: obs[:, index] for key, index in layout.items()}
+
     @abc.abstractmethod
     def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
         """Gets an action in response to an observation.
@@ -80,3 +147,19 @@ class Policy(abc.ABC):
             Array (usually 4 elements) representing the action to take
         """
         raise NotImplementedError
+
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        """Gets the actions in response to a batch of observations.
+
+        Equivalent to `get_action()` applied to each observation, which is what this default does.
+        Policies override it with branch-free array code, with `select()` in place of `if`/`elif`.
+
+        Args:
+            obs: `(N, obs_dim)` observations which conform to env.observation_space
+
+        Returns:
+            `(N, 4)` array of the actions to take
+        """
+        return np.stack([self.get_action(o.copy()) for o in np.asarray(obs)]).astype(
+            np.float32
+        )
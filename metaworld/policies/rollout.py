@@ -0,0 +1,127 @@
+"""Rolls out the scripted policies over a vector environment, for generating expert demonstrations in bulk."""
+
+from __future__ import annotations
+
+from typing import NamedTuple, Sequence
+
+import gymnasium as gym
+import numpy as np
+import numpy.typing as npt
+from gymnasium.vector import AutoresetMode
+
+from metaworld.evaluation import _get_task_names
+from metaworld.policies import ENV_POLICY_MAP
+from metaworld.policies.policy import Policy
+
+_POLICY_OBS_DIM = 39
+"""The observations the policies read, without the one-hot task IDs appended by `use_one_hot`."""
+
+
+class Trajectories(NamedTuple):
+    """The transitions of a rollout, as arrays with leading `(num_steps, num_envs)` dimensions."""
+
+    observations: npt.NDArray[np.floating]  # In the dtype of the env's observations
+    actions: npt.NDArray[np.float32]
+    rewards: npt.NDArray[np.float64]
+    next_observations: npt.NDArray[np.floating]  # The final observation at episode ends
+    terminations: npt.NDArray[np.bool_]
+    truncations: npt.NDArray[np.bool_]
+    successes: npt.NDArray[np.bool_]
+    # False for the steps that only reset a sub-environment, with `AutoresetMode.NEXT_STEP`
+    valid: npt.NDArray[np.bool_]
+
+    def save(self, path: str) -> None:
+        """Saves the arrays to an uncompressed `.npz` file."""
+        np.savez(path, **self._asdict())
+
+    @classmethod
+    def load(cls, path: str) -> Trajectories:
+        """Loads trajectories saved by `save()`."""
+        with np.load(path) as data:
+            return cls(**{field: data[field] for field in cls._fields})
+
+
+def rollout(
+    envs: gym.vector.VectorEnv,
+    num_steps: int,
+    policies: Sequence[Policy] | None = None,
+    seed: int | None = None,
+) -> Trajectories:
+    """Steps a vector environment with scripted policies, and records every transition.
+
+    The actions of all the sub-environments that share a policy are computed in one
+    `Policy.get_action_batch()` call, and the transitions are written to preallocated arrays.
+    Episodes are reset automatically, so `num_steps` can span many episodes per sub-environment.
+
+    Args:
+        envs: The vector environment, with `AutoresetMode.SAME_STEP` or `AutoresetMode.NEXT_STEP`. With
+            `NEXT_STEP`, the step after each episode end only resets the sub-environment, and is marked
+            as not `valid`.
+        num_steps: The number of vector steps.
+        policies: The policy of each sub-environment. Defaults to the `ENV_POLICY_MAP` policy of
+            each sub-environment's task.
+        seed: The seed of the first reset.
+
+    Returns:
+        The `(num_steps, num_envs, ...)` transitions.
+
+    Raises:
+        ValueError: If the vector environment doesn't reset automatically, or if the number of
+            policies doesn't match the number of sub-environments.
+    """
+    autoreset_mode = AutoresetMode(
+        envs.metadata.get("autoreset_mode", AutoresetMode.NEXT_STEP)
+    )
+    if autoreset_mode not in (AutoresetMode.SAME_STEP, AutoresetMode.NEXT_STEP):
+        raise ValueError(
+            f"rollout() needs a vector env that resets automatically, got {autoreset_mode}."
+        )
+    num_envs = envs.num_envs
+    if policies is None:
+        task_names = _get_task_names(envs)
+        policy_of_name = {name: ENV_POLICY_MAP[name]() for name in set(task_names)}
+        policies = [policy_of_name[name] for name in task_names]
+    if len(policies) != num_envs:
+        raise ValueError(f"Expected {num_envs} policies, got {len(policies)}.")
+    groups: dict[Policy, list[int]] = {}
+    for i, policy in enumerate(policies):
+        groups.setdefault(policy, []).append(i)
+    env_ids = [(policy, np.array(ids)) for policy, ids in groups.items()]
+
+    obs, _ = envs.reset(seed=seed)
+    obs_dim = obs.shape[-1]
+    trajectories = Trajectories(
+        observations=np.empty((num_steps, num_envs, obs_dim), dtype=obs.dtype),
+        actions=np.empty((num_steps, num_envs, 4), dtype=np.float32),
+        rewards=np.empty((num_steps, num_envs)),
+        next_observations=np.empty((num_steps, num_envs, obs_dim), dtype=obs.dtype),
+        terminations=np.empty((num_steps, num_envs), dtype=np.bool_),
+        truncations=np.empty((num_steps, num_envs), dtype=np.bool_),
+        successes=np.zeros((num_steps, num_envs), dtype=np.bool_),
+        valid=np.ones((num_steps, num_envs), dtype=np.bool_),
+    )
+    autoreset = np.zeros(num_envs, dtype=np.bool_)
+    for t in range(num_steps):
+        trajectories.observations[t] = obs
+        actions = trajectories.actions[t]
+        for policy, ids in env_ids:
+            actions[ids] = policy.get_action_batch(obs[ids, :_POLICY_OBS_DIM])
+
+        obs, rewards, terminations, truncations, infos = envs.step(actions)
+        trajectories.rewards[t] = rewards
+        trajectories.terminations[t] = terminations
+        trajectories.truncations[t] = truncations
+        trajectories.next_observations[t] = obs
+        if autoreset_mode == AutoresetMode.NEXT_STEP:
+            trajectories.valid[t] = ~autoreset
+            autoreset = terminations | truncations
+        if "success" in infos:
+            trajectories.successes[t] = infos["success"]
+        if "_final_obs" in infos:
+            for i in np.flatnonzero(infos["_final_obs"]):
+                trajectories.next_observations[t, i] = infos["final_obs"][i]
+            final_info = infos["final_info"]
+            if "success" in final_info:
+                done = infos["_final_info"]
+                trajectories.successes[t, done] = final_info["success"][done]
+    return trajectories
@@ -6,7 +6,14 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+    stack_xyz,
+)
 
 
 class SawyerAssemblyV3Policy(Policy):
@@ -31,6 +38,13 @@ class SawyerAssemblyV3Policy(Policy):
         action["grab_effort"] = self._grab_effort(o_d)
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=10.0),
+            self._grab_effort_batch(o_d),
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         pos_curr = o_d["hand_pos"]
@@ -53,6 +67,28 @@ class SawyerAssemblyV3Policy(Policy):
         else:
             return pos_peg
 
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        pos_curr = o_d["hand_pos"]
+        pos_wrench = o_d["wrench_pos"] + np.array([-0.02, 0.0, 0.0])
+        pos_peg = o_d["peg_pos"] + np.array([0.12, 0.0, 0.14])
+
+        return select(
+            [
+                np.linalg.norm(pos_curr[:, :2] - pos_wrench[:, :2], axis=-1) > 0.02,
+                np.linalg.norm(pos_curr[:, :2] - pos_peg[:, :2], axis=-1) <= 0.02,
+                np.abs(pos_curr[:, 2] - pos_wrench[:, 2]) > 0.05,
+                np.abs(pos_curr[:, 2] - pos_peg[:, 2]) > 0.04,
+            ],
+            [
+                pos_wrench + np.array([0.0, 0.0, 0.1]),
+                pos_peg + np.array([0.0, 0.0, -0.2]),
+                pos_wrench + np.array([0.0, 0.0, 0.03]),
+                stack_xyz(pos_curr[:, 0], pos_curr[:, 1], pos_peg[:, 2]),
+            ],
+            pos_peg,
+        )
+
     @staticmethod
     def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
         pos_curr = o_d["hand_pos"]
@@ -67,3 +103,17 @@ class SawyerAssemblyV3Policy(Policy):
         # Until hovering over peg, keep hold of wrench
         else:
             return 0.6
+
+    @staticmethod
+    def _grab_effort_batch(
+        o_d: dict[str, npt.NDArray[np.float64]]
+    ) -> npt.NDArray[np.float64]:
+        pos_curr = o_d["hand_pos"]
+        pos_wrench = o_d["wrench_pos"] + np.array([-0.02, 0.0, 0.0])
+
+        return np.where(
+            (np.linalg.norm(pos_curr[:, :2] - pos_wrench[:, :2], axis=-1) > 0.02)
+            | (np.abs(pos_curr[:, 2] - pos_wrench[:, 2]) > 0.12),
+            0.0,
+            0.6,
+        )
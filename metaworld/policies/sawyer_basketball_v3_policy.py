@@ -6,7 +6,14 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+    stack_xyz,
+)
 
 
 class SawyerBasketballV3Policy(Policy):
@@ -31,6 +38,13 @@ class SawyerBasketballV3Policy(Policy):
         action["grab_effort"] = self._grab_effort(o_d)
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=25.0),
+            self._grab_effort_batch(o_d),
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         pos_curr = o_d["hand_pos"]
@@ -49,6 +63,26 @@ class SawyerBasketballV3Policy(Policy):
         else:
             return pos_hoop
 
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        pos_curr = o_d["hand_pos"]
+        pos_ball = o_d["ball_pos"] + np.array([0.0, 0.0, 0.01])
+        pos_hoop = stack_xyz(o_d["hoop_x"], 0.875, 0.35)
+
+        return select(
+            [
+                np.linalg.norm(pos_curr[:, :2] - pos_ball[:, :2], axis=-1) > 0.04,
+                np.abs(pos_curr[:, 2] - pos_ball[:, 2]) > 0.025,
+                np.abs(pos_ball[:, 2] - pos_hoop[:, 2]) > 0.025,
+            ],
+            [
+                pos_ball + np.array([0.0, 0.0, 0.3]),
+                pos_ball,
+                stack_xyz(pos_curr[:, 0], pos_curr[:, 1], pos_hoop[:, 2]),
+            ],
+            pos_hoop,
+        )
+
     @staticmethod
     def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
         pos_curr = o_d["hand_pos"]
@@ -60,3 +94,17 @@ class SawyerBasketballV3Policy(Policy):
             return -1.0
         else:
             return 0.6
+
+    @staticmethod
+    def _grab_effort_batch(
+        o_d: dict[str, npt.NDArray[np.float64]]
+    ) -> npt.NDArray[np.float64]:
+        pos_curr = o_d["hand_pos"]
+        pos_ball = o_d["ball_pos"]
+
+        return np.where(
+            (np.linalg.norm(pos_curr[:, :2] - pos_ball[:, :2], axis=-1) > 0.04)
+            | (np.abs(pos_curr[:, 2] - pos_ball[:, 2]) > 0.15),
+            -1.0,
+            0.6,
+        )
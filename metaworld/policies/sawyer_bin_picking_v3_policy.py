@@ -6,7 +6,13 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+)
 
 
 class SawyerBinPickingV3Policy(Policy):
@@ -32,6 +38,13 @@ class SawyerBinPickingV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=25.0),
+            self._grab_effort_batch(o_d),
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         pos_curr = o_d["hand_pos"]
@@ -55,6 +68,32 @@ class SawyerBinPickingV3Policy(Policy):
         else:
             return pos_bin
 
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        pos_curr = o_d["hand_pos"]
+        pos_cube = o_d["cube_pos"] + np.array([0.0, 0.0, 0.03])
+        pos_bin = np.array([0.12, 0.7, 0.02])
+
+        # See note above in `_desired_pos`
+        pos_cube[:, 1] = np.clip(pos_cube[:, 1], 0.675, 0.725)
+
+        above_bin = np.linalg.norm(pos_curr[:, :2] - pos_bin[:2], axis=-1) <= 0.02
+        return select(
+            [
+                np.linalg.norm(pos_curr[:, :2] - pos_cube[:, :2], axis=-1) > 0.02,
+                np.abs(pos_curr[:, 2] - pos_cube[:, 2]) > 0.01,
+                ~above_bin & (pos_curr[:, 2] < 0.15),
+                ~above_bin,
+            ],
+            [
+                pos_cube + np.array([0.0, 0.0, 0.15]),
+                pos_cube,
+                pos_curr + np.array([0.0, 0.0, 0.1]),
+                np.array([*pos_bin[:2], 0.18]),
+            ],
+            pos_bin,
+        )
+
     @staticmethod
     def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
         pos_curr = o_d["hand_pos"]
@@ -70,3 +109,20 @@ class SawyerBinPickingV3Policy(Policy):
             return -1.0
         else:
             return 0.6
+
+    @staticmethod
+    def _grab_effort_batch(
+        o_d: dict[str, npt.NDArray[np.float64]]
+    ) -> npt.NDArray[np.float64]:
+        pos_curr = o_d["hand_pos"]
+        pos_cube = o_d["cube_pos"] + np.array([0.0, 0.0, 0.03])
+
+        # See note above in `_desired_pos`
+        pos_cube[:, 1] = np.clip(pos_cube[:, 1], 0.675, 0.725)
+
+        return np.where(
+            (np.linalg.norm(pos_curr[:, :2] - pos_cube[:, :2], axis=-1) > 0.02)
+            | (np.abs(pos_curr[:, 2] - pos_cube[:, 2]) > 0.02),
+            -1.0,
+            0.6,
+        )
@@ -6,7 +6,14 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+    stack_xyz,
+)
 
 
 class SawyerBoxCloseV3Policy(Policy):
@@ -33,6 +40,13 @@ class SawyerBoxCloseV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=25.0),
+            self._grab_effort_batch(o_d),
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         pos_curr = o_d["hand_pos"]
@@ -52,6 +66,26 @@ class SawyerBoxCloseV3Policy(Policy):
         else:
             return pos_box
 
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        pos_curr = o_d["hand_pos"]
+        pos_lid = o_d["lid_pos"] + np.array([0.0, 0.0, +0.02])
+        pos_box = stack_xyz(o_d["box_pos"][:, 0], o_d["box_pos"][:, 1], 0.15)
+
+        return select(
+            [
+                np.linalg.norm(pos_curr[:, :2] - pos_lid[:, :2], axis=-1) > 0.01,
+                np.abs(pos_curr[:, 2] - pos_lid[:, 2]) > 0.05,
+                np.abs(pos_curr[:, 2] - pos_box[:, 2]) > 0.04,
+            ],
+            [
+                stack_xyz(pos_lid[:, 0], pos_lid[:, 1], 0.2),
+                pos_lid,
+                stack_xyz(pos_curr[:, 0], pos_curr[:, 1], pos_box[:, 2]),
+            ],
+            pos_box,
+        )
+
     @staticmethod
     def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
         pos_curr = o_d["hand_pos"]
@@ -65,3 +99,17 @@ class SawyerBoxCloseV3Policy(Policy):
         # While end effector is moving down toward the puck, begin closing the grabber
         else:
             return 1.0
+
+    @staticmethod
+    def _grab_effort_batch(
+        o_d: dict[str, npt.NDArray[np.float64]]
+    ) -> npt.NDArray[np.float64]:
+        pos_curr = o_d["hand_pos"]
+        pos_lid = o_d["lid_pos"] + np.array([0.0, 0.0, +0.02])
+
+        return np.where(
+            (np.linalg.norm(pos_curr[:, :2] - pos_lid[:, :2], axis=-1) > 0.01)
+            | (np.abs(pos_curr[:, 2] - pos_lid[:, 2]) > 0.13),
+            0.5,
+            1.0,
+        )
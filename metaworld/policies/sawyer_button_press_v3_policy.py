@@ -6,7 +6,7 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, move
+from metaworld.policies.policy import Policy, batch_action, move
 
 
 class SawyerButtonPressV3Policy(Policy):
@@ -31,6 +31,13 @@ class SawyerButtonPressV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=25.0),
+            0.0,
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         pos_curr = o_d["hand_pos"]
@@ -54,3 +61,16 @@ class SawyerButtonPressV3Policy(Policy):
         pos_button[1] += 0.02
 
         return pos_button
+
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        pos_curr = o_d["hand_pos"]
+        pos_button = o_d["button_pos"] + np.array([0.0, 0.0, -0.07])
+
+        aligned = np.all(
+            np.isclose(pos_curr[:, [0, 2]], pos_button[:, [0, 2]], atol=0.02), axis=-1
+        )
+        pos_button[:, 1] = np.where(
+            aligned, pos_button[:, 1] + 0.02, pos_curr[:, 1] - 0.1
+        )
+        return pos_button
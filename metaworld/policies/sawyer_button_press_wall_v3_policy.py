@@ -6,7 +6,7 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, move
+from metaworld.policies.policy import Policy, batch_action, move, select, stack_xyz
 
 
 class SawyerButtonPressWallV3Policy(Policy):
@@ -31,6 +31,13 @@ class SawyerButtonPressWallV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=15.0),
+            self._grab_effort_batch(o_d),
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         pos_curr = o_d["hand_pos"]
@@ -45,6 +52,25 @@ class SawyerButtonPressWallV3Policy(Policy):
         else:
             return pos_button + np.array([0.0, -0.02, 0.0])
 
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        pos_curr = o_d["hand_pos"]
+        pos_button = o_d["button_pos"] + np.array([0.0, 0.0, 0.04])
+
+        return select(
+            [
+                np.abs(pos_curr[:, 0] - pos_button[:, 0]) > 0.02,
+                pos_button[:, 1] - pos_curr[:, 1] > 0.09,
+                np.abs(pos_curr[:, 2] - pos_button[:, 2]) > 0.02,
+            ],
+            [
+                stack_xyz(pos_button[:, 0], pos_curr[:, 1], 0.3),
+                stack_xyz(pos_button[:, 0], pos_button[:, 1], 0.3),
+                pos_button + np.array([0.0, -0.05, 0.0]),
+            ],
+            pos_button + np.array([0.0, -0.02, 0.0]),
+        )
+
     @staticmethod
     def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
         pos_curr = o_d["hand_pos"]
@@ -58,3 +84,18 @@ class SawyerButtonPressWallV3Policy(Policy):
             return 1.0
         else:
             return -1.0
+
+    @staticmethod
+    def _grab_effort_batch(
+        o_d: dict[str, npt.NDArray[np.float64]]
+    ) -> npt.NDArray[np.float64]:
+        pos_curr = o_d["hand_pos"]
+        pos_button = o_d["button_pos"] + np.array([0.0, 0.0, 0.04])
+
+        return np.where(
+            (np.abs(pos_curr[:, 0] - pos_button[:, 0]) > 0.02)
+            | (pos_button[:, 1] - pos_curr[:, 1] > 0.09)
+            | (np.abs(pos_curr[:, 2] - pos_button[:, 2]) > 0.02),
+            1.0,
+            -1.0,
+        )
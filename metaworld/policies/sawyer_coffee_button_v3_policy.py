@@ -6,7 +6,14 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+    stack_xyz,
+)
 
 
 class SawyerCoffeeButtonV3Policy(Policy):
@@ -32,6 +39,13 @@ class SawyerCoffeeButtonV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=10.0),
+            -1.0,
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         pos_curr = o_d["hand_pos"]
@@ -41,3 +55,17 @@ class SawyerCoffeeButtonV3Policy(Policy):
             return np.array([pos_button[0], pos_curr[1], pos_button[2]])
         else:
             return pos_button + np.array([0.0, 0.2, 0.0])
+
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        pos_curr = o_d["hand_pos"]
+        pos_button = o_d["button_pos"] + np.array([0.0, 0.0, -0.07])
+
+        return select(
+            [
+                np.linalg.norm(pos_curr[:, [0, 2]] - pos_button[:, [0, 2]], axis=-1)
+                > 0.02
+            ],
+            [stack_xyz(pos_button[:, 0], pos_curr[:, 1], pos_button[:, 2])],
+            pos_button + np.array([0.0, 0.2, 0.0]),
+        )
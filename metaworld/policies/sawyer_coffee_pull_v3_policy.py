@@ -6,7 +6,13 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+)
 
 
 class SawyerCoffeePullV3Policy(Policy):
@@ -33,6 +39,13 @@ class SawyerCoffeePullV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=10.0),
+            self._grab_effort_batch(o_d),
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         pos_curr = o_d["hand_pos"]
@@ -45,6 +58,20 @@ class SawyerCoffeePullV3Policy(Policy):
         else:
             return o_d["target_pos"]
 
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        pos_curr = o_d["hand_pos"]
+        pos_mug = o_d["mug_pos"] + np.array([-0.005, 0.0, 0.05])
+
+        return select(
+            [
+                np.linalg.norm(pos_curr[:, :2] - pos_mug[:, :2], axis=-1) > 0.06,
+                np.abs(pos_curr[:, 2] - pos_mug[:, 2]) > 0.02,
+            ],
+            [pos_mug + np.array([0.0, 0.0, 0.15]), pos_mug],
+            o_d["target_pos"],
+        )
+
     @staticmethod
     def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
         pos_curr = o_d["hand_pos"]
@@ -57,3 +84,17 @@ class SawyerCoffeePullV3Policy(Policy):
             return -1.0
         else:
             return 0.7
+
+    @staticmethod
+    def _grab_effort_batch(
+        o_d: dict[str, npt.NDArray[np.float64]]
+    ) -> npt.NDArray[np.float64]:
+        pos_curr = o_d["hand_pos"]
+        pos_mug = o_d["mug_pos"] + np.array([0.01, 0.0, 0.05])
+
+        return np.where(
+            (np.linalg.norm(pos_curr[:, :2] - pos_mug[:, :2], axis=-1) > 0.06)
+            | (np.abs(pos_curr[:, 2] - pos_mug[:, 2]) > 0.1),
+            -1.0,
+            0.7,
+        )
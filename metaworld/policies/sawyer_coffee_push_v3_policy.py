@@ -6,7 +6,14 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+    stack_xyz,
+)
 
 
 class SawyerCoffeePushV3Policy(Policy):
@@ -34,6 +41,13 @@ class SawyerCoffeePushV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=10.0),
+            self._grab_effort_batch(o_d),
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         pos_curr = o_d["hand_pos"]
@@ -47,6 +61,21 @@ class SawyerCoffeePushV3Policy(Policy):
         else:
             return np.array([pos_goal[0], pos_goal[1], 0.1])
 
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        pos_curr = o_d["hand_pos"]
+        pos_mug = o_d["mug_pos"] + np.array([0.01, 0.0, 0.05])
+        pos_goal = o_d["goal_xy"]
+
+        return select(
+            [
+                np.linalg.norm(pos_curr[:, :2] - pos_mug[:, :2], axis=-1) > 0.06,
+                np.abs(pos_curr[:, 2] - pos_mug[:, 2]) > 0.02,
+            ],
+            [pos_mug + np.array([0.0, 0.0, 0.2]), pos_mug],
+            stack_xyz(pos_goal[:, 0], pos_goal[:, 1], 0.1),
+        )
+
     @staticmethod
     def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
         pos_curr = o_d["hand_pos"]
@@ -59,3 +88,17 @@ class SawyerCoffeePushV3Policy(Policy):
             return -1.0
         else:
             return 0.5
+
+    @staticmethod
+    def _grab_effort_batch(
+        o_d: dict[str, npt.NDArray[np.float64]]
+    ) -> npt.NDArray[np.float64]:
+        pos_curr = o_d["hand_pos"]
+        pos_mug = o_d["mug_pos"] + np.array([0.01, 0.0, 0.05])
+
+        return np.where(
+            (np.linalg.norm(pos_curr[:, :2] - pos_mug[:, :2], axis=-1) > 0.06)
+            | (np.abs(pos_curr[:, 2] - pos_mug[:, 2]) > 0.1),
+            -1.0,
+            0.5,
+        )
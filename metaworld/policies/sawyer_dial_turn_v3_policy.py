@@ -6,7 +6,14 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+    stack_xyz,
+)
 
 
 class SawyerDialTurnV3Policy(Policy):
@@ -32,6 +39,13 @@ class SawyerDialTurnV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=10.0),
+            1.0,
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         hand_pos = o_d["hand_pos"]
@@ -42,3 +56,17 @@ class SawyerDialTurnV3Policy(Policy):
         if abs(hand_pos[2] - dial_pos[2]) > 0.02:
             return dial_pos
         return dial_pos + np.array([-0.05, 0.005, 0.0])
+
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        hand_pos = o_d["hand_pos"]
+        dial_pos = o_d["dial_pos"] + np.array([0.05, 0.02, 0.09])
+
+        return select(
+            [
+                np.linalg.norm(hand_pos[:, :2] - dial_pos[:, :2], axis=-1) > 0.02,
+                np.abs(hand_pos[:, 2] - dial_pos[:, 2]) > 0.02,
+            ],
+            [stack_xyz(dial_pos[:, 0], dial_pos[:, 1], 0.2), dial_pos],
+            dial_pos + np.array([-0.05, 0.005, 0.0]),
+        )
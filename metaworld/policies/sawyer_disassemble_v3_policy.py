@@ -6,7 +6,13 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+)
 
 
 class SawyerDisassembleV3Policy(Policy):
@@ -33,6 +39,13 @@ class SawyerDisassembleV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=10.0),
+            self._grab_effort_batch(o_d),
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         pos_curr = o_d["hand_pos"]
@@ -49,6 +62,20 @@ class SawyerDisassembleV3Policy(Policy):
         else:
             return pos_curr + np.array([0.0, 0.0, 0.1])
 
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        pos_curr = o_d["hand_pos"]
+        pos_wrench = o_d["wrench_pos"] + np.array([-0.02, 0.0, 0.01])
+
+        return select(
+            [
+                np.linalg.norm(pos_curr[:, :2] - pos_wrench[:, :2], axis=-1) > 0.02,
+                np.abs(pos_curr[:, 2] - pos_wrench[:, 2]) > 0.03,
+            ],
+            [pos_wrench + np.array([0.0, 0.0, 0.1]), pos_wrench],
+            pos_curr + np.array([0.0, 0.0, 0.1]),
+        )
+
     @staticmethod
     def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
         pos_curr = o_d["hand_pos"]
@@ -61,3 +88,17 @@ class SawyerDisassembleV3Policy(Policy):
             return 0.0
         else:
             return 0.8
+
+    @staticmethod
+    def _grab_effort_batch(
+        o_d: dict[str, npt.NDArray[np.float64]]
+    ) -> npt.NDArray[np.float64]:
+        pos_curr = o_d["hand_pos"]
+        pos_wrench = o_d["wrench_pos"] + np.array([-0.02, 0.0, 0.01])
+
+        return np.where(
+            (np.linalg.norm(pos_curr[:, :2] - pos_wrench[:, :2], axis=-1) > 0.02)
+            | (np.abs(pos_curr[:, 2] - pos_wrench[:, 2]) > 0.07),
+            0.0,
+            0.8,
+        )
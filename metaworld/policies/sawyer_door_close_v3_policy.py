@@ -6,7 +6,14 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+    stack_xyz,
+)
 
 
 class SawyerDoorCloseV3Policy(Policy):
@@ -33,6 +40,13 @@ class SawyerDoorCloseV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=25.0),
+            1.0,
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         pos_curr = o_d["hand_pos"]
@@ -55,3 +69,24 @@ class SawyerDoorCloseV3Policy(Policy):
         # push from outer edge toward door handle's centroid
         # else:
         return pos_goal
+
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        pos_curr = o_d["hand_pos"]
+        pos_door = o_d["door_pos"] + np.array([0.05, 0.12, 0.1])
+        pos_goal = o_d["goal_pos"]
+
+        right_of_door = pos_curr[:, 0] > pos_door[:, 0]
+        return select(
+            [
+                right_of_door & (pos_curr[:, 2] < pos_door[:, 2] + 0.2),
+                right_of_door,
+                np.abs(pos_curr[:, 2] - pos_door[:, 2]) > 0.04,
+            ],
+            [
+                stack_xyz(pos_curr[:, 0], pos_curr[:, 1], pos_door[:, 2] + 0.25),
+                stack_xyz(pos_door[:, 0] - 0.02, pos_door[:, 1], pos_curr[:, 2]),
+                pos_door + np.array([-0.02, 0.0, 0.0]),
+            ],
+            pos_goal,
+        )
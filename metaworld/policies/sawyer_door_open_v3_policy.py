@@ -6,7 +6,13 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+)
 
 
 class SawyerDoorOpenV3Policy(Policy):
@@ -32,6 +38,13 @@ class SawyerDoorOpenV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=25.0),
+            1.0,
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         pos_curr = o_d["hand_pos"]
@@ -47,3 +60,20 @@ class SawyerDoorOpenV3Policy(Policy):
         # push from front edge toward door handle's centroid
         else:
             return pos_door
+
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        pos_curr = o_d["hand_pos"]
+        pos_door = o_d["door_pos"] - np.array([0.05, 0.0, 0.0])
+
+        return select(
+            [
+                np.linalg.norm(pos_curr[:, :2] - pos_door[:, :2], axis=-1) > 0.12,
+                np.abs(pos_curr[:, 2] - pos_door[:, 2]) > 0.04,
+            ],
+            [
+                pos_door + np.array([0.06, 0.02, 0.2]),
+                pos_door + np.array([0.06, 0.02, 0.0]),
+            ],
+            pos_door,
+        )
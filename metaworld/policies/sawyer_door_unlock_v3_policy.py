@@ -6,7 +6,13 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+)
 
 
 class SawyerDoorUnlockV3Policy(Policy):
@@ -32,6 +38,13 @@ class SawyerDoorUnlockV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=25.0),
+            1.0,
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         pos_curr = o_d["hand_pos"]
@@ -43,3 +56,15 @@ class SawyerDoorUnlockV3Policy(Policy):
             return pos_lock
         else:
             return pos_lock + np.array([0.1, 0.0, 0.01])
+
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        pos_curr = o_d["hand_pos"]
+        pos_lock = o_d["lock_pos"] + np.array([-0.04, -0.02, -0.03])
+
+        not_at_lock = np.linalg.norm(pos_curr[:, :2] - pos_lock[:, :2], axis=-1) > 0.02
+        return select(
+            [not_at_lock & (pos_curr[:, 2] > 0.15), not_at_lock],
+            [pos_curr + np.array([0.0, -0.1, -0.1]), pos_lock],
+            pos_lock + np.array([0.1, 0.0, 0.01]),
+        )
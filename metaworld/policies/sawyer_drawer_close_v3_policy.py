@@ -6,7 +6,14 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+    stack_xyz,
+)
 
 
 class SawyerDrawerCloseV3Policy(Policy):
@@ -32,6 +39,13 @@ class SawyerDrawerCloseV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=25.0),
+            1.0,
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         pos_curr = o_d["hand_pos"]
@@ -51,3 +65,23 @@ class SawyerDrawerCloseV3Policy(Policy):
         # push toward drawer handle's centroid
         else:
             return pos_drwr
+
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        pos_curr = o_d["hand_pos"]
+        pos_drwr = o_d["drwr_pos"] + np.array([0.0, 0.0, -0.02])
+
+        behind_drawer = pos_curr[:, 1] > pos_drwr[:, 1]
+        return select(
+            [
+                behind_drawer & (pos_curr[:, 2] < pos_drwr[:, 2] + 0.23),
+                behind_drawer,
+                np.abs(pos_curr[:, 2] - pos_drwr[:, 2]) > 0.04,
+            ],
+            [
+                stack_xyz(pos_curr[:, 0], pos_curr[:, 1], pos_drwr[:, 2] + 0.5),
+                pos_drwr + np.array([0.0, -0.075, 0.23]),
+                pos_drwr + np.array([0.0, -0.075, 0.0]),
+            ],
+            pos_drwr,
+        )
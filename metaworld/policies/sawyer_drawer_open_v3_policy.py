@@ -4,7 +4,13 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+)
 
 
 class SawyerDrawerOpenV3Policy(Policy):
@@ -46,3 +52,21 @@ class SawyerDrawerOpenV3Policy(Policy):
         action["grab_effort"] = -1.0
 
         return action.array
+
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+
+        pos_curr = o_d["hand_pos"]
+        pos_drwr = o_d["drwr_pos"] + np.array([0.0, 0.0, -0.02])
+
+        conditions = [
+            np.linalg.norm(pos_curr[:, :2] - pos_drwr[:, :2], axis=-1) > 0.06,
+            np.abs(pos_curr[:, 2] - pos_drwr[:, 2]) > 0.04,
+        ]
+        to_pos = select(
+            conditions,
+            [pos_drwr + np.array([0.0, 0.0, 0.3]), pos_drwr],
+            pos_drwr + np.array([0.0, -0.06, 0.0]),
+        )
+        p = select(conditions, [4.0, 4.0], 50.0)
+        return batch_action(move(o_d["hand_pos"], to_pos, p=p[:, None]), -1.0)
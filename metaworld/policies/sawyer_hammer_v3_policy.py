@@ -6,7 +6,14 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+    stack_xyz,
+)
 
 
 class SawyerHammerV3Policy(Policy):
@@ -31,6 +38,13 @@ class SawyerHammerV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=10.0),
+            self._grab_effort_batch(o_d),
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         pos_curr = o_d["hand_pos"]
@@ -50,6 +64,27 @@ class SawyerHammerV3Policy(Policy):
         else:
             return pos_goal
 
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        pos_curr = o_d["hand_pos"]
+        pos_puck = o_d["hammer_pos"] + np.array([-0.04, 0.0, -0.01])
+        pos_goal = np.array([0.24, 0.71, 0.11]) + np.array([-0.19, 0.0, 0.05])
+
+        return select(
+            [
+                np.linalg.norm(pos_curr[:, :2] - pos_puck[:, :2], axis=-1) > 0.04,
+                (np.abs(pos_curr[:, 2] - pos_puck[:, 2]) > 0.05)
+                & (pos_puck[:, -1] < 0.03),
+                np.linalg.norm(pos_curr[:, [0, 2]] - pos_goal[[0, 2]], axis=-1) > 0.02,
+            ],
+            [
+                pos_puck + np.array([0.0, 0.0, 0.1]),
+                pos_puck + np.array([0.0, 0.0, 0.03]),
+                stack_xyz(pos_goal[0], pos_curr[:, 1], pos_goal[2]),
+            ],
+            pos_goal,
+        )
+
     @staticmethod
     def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
         pos_curr = o_d["hand_pos"]
@@ -63,3 +98,17 @@ class SawyerHammerV3Policy(Policy):
         # While end effector is moving down toward the hammer, begin closing the grabber
         else:
             return 0.8
+
+    @staticmethod
+    def _grab_effort_batch(
+        o_d: dict[str, npt.NDArray[np.float64]]
+    ) -> npt.NDArray[np.float64]:
+        pos_curr = o_d["hand_pos"]
+        pos_puck = o_d["hammer_pos"] + np.array([-0.04, 0.0, -0.01])
+
+        return np.where(
+            (np.linalg.norm(pos_curr[:, :2] - pos_puck[:, :2], axis=-1) > 0.04)
+            | (np.abs(pos_curr[:, 2] - pos_puck[:, 2]) > 0.1),
+            0.0,
+            0.8,
+        )
@@ -6,7 +6,14 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+    stack_xyz,
+)
 
 
 class SawyerHandInsertV3Policy(Policy):
@@ -33,6 +40,13 @@ class SawyerHandInsertV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=10.0),
+            self._grab_effort_batch(o_d),
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         hand_pos = o_d["hand_pos"]
@@ -51,6 +65,26 @@ class SawyerHandInsertV3Policy(Policy):
         else:
             return goal_pos
 
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        hand_pos = o_d["hand_pos"]
+        obj_pos = o_d["obj_pos"]
+        goal_pos = o_d["goal_pos"]
+
+        return select(
+            [
+                np.linalg.norm(hand_pos[:, :2] - obj_pos[:, :2], axis=-1) > 0.02,
+                np.abs(hand_pos[:, 2] - obj_pos[:, 2]) > 0.05,
+                np.linalg.norm(hand_pos[:, :2] - goal_pos[:, :2], axis=-1) > 0.04,
+            ],
+            [
+                obj_pos + np.array([0.0, 0.0, 0.1]),
+                obj_pos + np.array([0.0, 0.0, 0.03]),
+                stack_xyz(goal_pos[:, 0], goal_pos[:, 1], hand_pos[:, 2]),
+            ],
+            goal_pos,
+        )
+
     @staticmethod
     def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
         hand_pos = o_d["hand_pos"]
@@ -62,3 +96,17 @@ class SawyerHandInsertV3Policy(Policy):
             return 0.0
         else:
             return 0.65
+
+    @staticmethod
+    def _grab_effort_batch(
+        o_d: dict[str, npt.NDArray[np.float64]]
+    ) -> npt.NDArray[np.float64]:
+        hand_pos = o_d["hand_pos"]
+        obj_pos = o_d["obj_pos"]
+
+        return np.where(
+            (np.linalg.norm(hand_pos[:, :2] - obj_pos[:, :2], axis=-1) > 0.02)
+            | (np.abs(hand_pos[:, 2] - obj_pos[:, 2]) > 0.1),
+            0.0,
+            0.65,
+        )
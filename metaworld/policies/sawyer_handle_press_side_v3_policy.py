@@ -6,7 +6,13 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+)
 
 
 class SawyerHandlePressSideV3Policy(Policy):
@@ -32,6 +38,13 @@ class SawyerHandlePressSideV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=25.0),
+            1.0,
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         pos_curr = o_d["hand_pos"]
@@ -41,3 +54,14 @@ class SawyerHandlePressSideV3Policy(Policy):
             return pos_button + np.array([0.0, 0.0, 0.2])
         else:
             return pos_button + np.array([0.0, 0.0, -0.5])
+
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        pos_curr = o_d["hand_pos"]
+        pos_button = o_d["handle_pos"]
+
+        return select(
+            [np.linalg.norm(pos_curr[:, :2] - pos_button[:, :2], axis=-1) > 0.02],
+            [pos_button + np.array([0.0, 0.0, 0.2])],
+            pos_button + np.array([0.0, 0.0, -0.5]),
+        )
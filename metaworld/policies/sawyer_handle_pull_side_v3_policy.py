@@ -6,7 +6,13 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+)
 
 
 class SawyerHandlePullSideV3Policy(Policy):
@@ -31,6 +37,13 @@ class SawyerHandlePullSideV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=25.0),
+            self._grab_effort_batch(o_d),
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         pos_curr = o_d["hand_pos"]
@@ -41,6 +54,20 @@ class SawyerHandlePullSideV3Policy(Policy):
             return pos_handle
         return pos_handle + np.array([0.0, 0.0, 1.0])
 
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        pos_curr = o_d["hand_pos"]
+        pos_handle = o_d["handle_pos"]
+
+        return select(
+            [
+                np.linalg.norm(pos_curr[:, :2] - pos_handle[:, :2], axis=-1) > 0.04,
+                np.abs(pos_curr[:, 2] - pos_handle[:, 2]) > 0.03,
+            ],
+            [pos_handle + np.array([0.0, 0.0, 0.1]), pos_handle],
+            pos_handle + np.array([0.0, 0.0, 1.0]),
+        )
+
     @staticmethod
     def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
         pos_curr = o_d["hand_pos"]
@@ -52,3 +79,17 @@ class SawyerHandlePullSideV3Policy(Policy):
             return 0.0
         else:
             return 0.6
+
+    @staticmethod
+    def _grab_effort_batch(
+        o_d: dict[str, npt.NDArray[np.float64]]
+    ) -> npt.NDArray[np.float64]:
+        pos_curr = o_d["hand_pos"]
+        pos_handle = o_d["handle_pos"]
+
+        return np.where(
+            (np.linalg.norm(pos_curr[:, :2] - pos_handle[:, :2], axis=-1) > 0.04)
+            | (np.abs(pos_curr[:, 2] - pos_handle[:, 2]) > 0.04),
+            0.0,
+            0.6,
+        )
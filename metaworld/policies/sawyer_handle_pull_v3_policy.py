@@ -6,7 +6,13 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+)
 
 
 class SawyerHandlePullV3Policy(Policy):
@@ -31,6 +37,13 @@ class SawyerHandlePullV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=25.0),
+            1.0,
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         pos_curr = o_d["hand_pos"]
@@ -42,6 +55,21 @@ class SawyerHandlePullV3Policy(Policy):
             return pos_handle[2]
         return pos_handle + np.array([0.0, 0.0, 0.1])
 
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        pos_curr = o_d["hand_pos"]
+        pos_handle = o_d["handle_pos"] + np.array([0, -0.04, 0])
+
+        # Like `_desired_pos`, the second branch moves every axis towards the handle's height
+        return select(
+            [
+                np.linalg.norm(pos_curr[:, :2] - pos_handle[:, :2], axis=-1) > 0.02,
+                np.abs(pos_curr[:, 2] - pos_handle[:, 2]) > 0.02,
+            ],
+            [pos_handle, pos_handle[:, 2:3]],
+            pos_handle + np.array([0.0, 0.0, 0.1]),
+        )
+
     @staticmethod
     def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
         return 1.0
@@ -6,7 +6,14 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+    stack_xyz,
+)
 
 
 class SawyerPegInsertionSideV3Policy(Policy):
@@ -35,6 +42,13 @@ class SawyerPegInsertionSideV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=25.0),
+            self._grab_effort_batch(o_d),
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         pos_curr = o_d["hand_pos"]
@@ -53,6 +67,26 @@ class SawyerPegInsertionSideV3Policy(Policy):
         else:
             return pos_hole
 
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        pos_curr = o_d["hand_pos"]
+        pos_peg = o_d["peg_pos"]
+        pos_hole = stack_xyz(-0.35, o_d["goal_pos"][:, 1], 0.16)
+
+        return select(
+            [
+                np.linalg.norm(pos_curr[:, :2] - pos_peg[:, :2], axis=-1) > 0.04,
+                np.abs(pos_curr[:, 2] - pos_peg[:, 2]) > 0.025,
+                np.linalg.norm(pos_peg[:, 1:] - pos_hole[:, 1:], axis=-1) > 0.03,
+            ],
+            [
+                pos_peg + np.array([0.0, 0.0, 0.3]),
+                pos_peg,
+                pos_hole + np.array([0.4, 0.0, 0.0]),
+            ],
+            pos_hole,
+        )
+
     @staticmethod
     def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
         pos_curr = o_d["hand_pos"]
@@ -65,3 +99,17 @@ class SawyerPegInsertionSideV3Policy(Policy):
             return -1.0
         else:
             return 0.6
+
+    @staticmethod
+    def _grab_effort_batch(
+        o_d: dict[str, npt.NDArray[np.float64]]
+    ) -> npt.NDArray[np.float64]:
+        pos_curr = o_d["hand_pos"]
+        pos_peg = o_d["peg_pos"]
+
+        return np.where(
+            (np.linalg.norm(pos_curr[:, :2] - pos_peg[:, :2], axis=-1) > 0.04)
+            | (np.abs(pos_curr[:, 2] - pos_peg[:, 2]) > 0.15),
+            -1.0,
+            0.6,
+        )
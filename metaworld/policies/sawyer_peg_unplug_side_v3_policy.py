@@ -6,7 +6,14 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+    stack_xyz,
+)
 
 
 class SawyerPegUnplugSideV3Policy(Policy):
@@ -32,6 +39,13 @@ class SawyerPegUnplugSideV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=25.0),
+            self._grab_effort_batch(o_d),
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         pos_curr = o_d["hand_pos"]
@@ -44,6 +58,23 @@ class SawyerPegUnplugSideV3Policy(Policy):
         else:
             return pos_curr + np.array([0.01, 0.0, 0.0])
 
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        pos_curr = o_d["hand_pos"]
+        pos_peg = o_d["peg_pos"] + np.array([-0.02, 0.0, 0.035])
+
+        return select(
+            [
+                np.linalg.norm(pos_curr[:, :2] - pos_peg[:, :2], axis=-1) > 0.04,
+                np.abs(pos_curr[:, 2] - 0.15) > 0.02,
+            ],
+            [
+                pos_peg + np.array([0.0, 0.0, 0.2]),
+                stack_xyz(pos_peg[:, 0], pos_peg[:, 1], 0.15),
+            ],
+            pos_curr + np.array([0.01, 0.0, 0.0]),
+        )
+
     @staticmethod
     def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
         pos_curr = o_d["hand_pos"]
@@ -56,3 +87,17 @@ class SawyerPegUnplugSideV3Policy(Policy):
             return -1.0
         else:
             return 0.1
+
+    @staticmethod
+    def _grab_effort_batch(
+        o_d: dict[str, npt.NDArray[np.float64]]
+    ) -> npt.NDArray[np.float64]:
+        pos_curr = o_d["hand_pos"]
+        pos_peg = o_d["peg_pos"] + np.array([-0.02, 0.0, 0.035])
+
+        return np.where(
+            (np.linalg.norm(pos_curr[:, :2] - pos_peg[:, :2], axis=-1) > 0.04)
+            | (np.abs(pos_curr[:, 2] - pos_peg[:, 2]) > 0.15),
+            -1.0,
+            0.1,
+        )
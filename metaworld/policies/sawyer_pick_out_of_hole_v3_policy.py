@@ -6,7 +6,14 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+    stack_xyz,
+)
 
 
 class SawyerPickOutOfHoleV3Policy(Policy):
@@ -33,6 +40,13 @@ class SawyerPickOutOfHoleV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=25.0),
+            self._grab_effort_batch(o_d),
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         pos_curr = o_d["hand_pos"]
@@ -52,6 +66,26 @@ class SawyerPickOutOfHoleV3Policy(Policy):
         else:
             return pos_goal
 
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        pos_curr = o_d["hand_pos"]
+        pos_puck = o_d["puck_pos"] + np.array([0.0, 0.0, 0.02])
+        pos_goal = o_d["goal_pos"]
+
+        return select(
+            [
+                np.linalg.norm(pos_curr[:, :2] - pos_puck[:, :2], axis=-1) > 0.02,
+                np.abs(pos_curr[:, 2] - pos_puck[:, 2]) > 0.01,
+                np.abs(pos_curr[:, 2] - pos_goal[:, 2]) > 0.04,
+            ],
+            [
+                pos_puck + np.array([0.0, 0.0, 0.15]),
+                pos_puck,
+                stack_xyz(pos_curr[:, 0], pos_curr[:, 1], pos_goal[:, 2]),
+            ],
+            pos_goal,
+        )
+
     @staticmethod
     def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
         pos_curr = o_d["hand_pos"]
@@ -65,3 +99,17 @@ class SawyerPickOutOfHoleV3Policy(Policy):
         # While end effector is moving down toward the puck, begin closing the grabber
         else:
             return 0.1
+
+    @staticmethod
+    def _grab_effort_batch(
+        o_d: dict[str, npt.NDArray[np.float64]]
+    ) -> npt.NDArray[np.float64]:
+        pos_curr = o_d["hand_pos"]
+        pos_puck = o_d["puck_pos"] + np.array([0.0, 0.0, 0.02])
+
+        return np.where(
+            (np.linalg.norm(pos_curr[:, :2] - pos_puck[:, :2], axis=-1) > 0.02)
+            | (np.abs(pos_curr[:, 2] - pos_puck[:, 2]) > 0.15),
+            0.0,
+            0.1,
+        )
@@ -6,7 +6,13 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+)
 
 
 class SawyerPickPlaceV3Policy(Policy):
@@ -35,6 +41,13 @@ class SawyerPickPlaceV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=10.0),
+            self._grab_effort_batch(o_d),
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         pos_curr = o_d["hand_pos"]
@@ -54,6 +67,28 @@ class SawyerPickPlaceV3Policy(Policy):
         else:
             return pos_goal
 
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        pos_curr = o_d["hand_pos"]
+        pos_puck = o_d["puck_pos"] + np.array([-0.005, 0, 0])
+        pos_goal = o_d["goal_pos"]
+        gripper_separation = o_d["gripper_distance_apart"]
+
+        return select(
+            [
+                np.linalg.norm(pos_curr[:, :2] - pos_puck[:, :2], axis=-1) > 0.02,
+                (np.abs(pos_curr[:, 2] - pos_puck[:, 2]) > 0.05)
+                & (pos_puck[:, -1] < 0.04),
+                gripper_separation > 0.73,
+            ],
+            [
+                pos_puck + np.array([0.0, 0.0, 0.1]),
+                pos_puck + np.array([0.0, 0.0, 0.03]),
+                pos_curr,
+            ],
+            pos_goal,
+        )
+
     @staticmethod
     def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
         pos_curr = o_d["hand_pos"]
@@ -62,3 +97,12 @@ class SawyerPickPlaceV3Policy(Policy):
             return 1.0
         else:
             return 0.0
+
+    @staticmethod
+    def _grab_effort_batch(
+        o_d: dict[str, npt.NDArray[np.float64]]
+    ) -> npt.NDArray[np.float64]:
+        pos_curr = o_d["hand_pos"]
+        pos_puck = o_d["puck_pos"]
+
+        return np.where(np.linalg.norm(pos_curr - pos_puck, axis=-1) < 0.07, 1.0, 0.0)
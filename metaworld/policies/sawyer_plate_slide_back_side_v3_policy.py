@@ -6,7 +6,14 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+    stack_xyz,
+)
 
 
 class SawyerPlateSlideBackSideV3Policy(Policy):
@@ -32,6 +39,13 @@ class SawyerPlateSlideBackSideV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=10.0),
+            1.0,
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         pos_curr = o_d["hand_pos"]
@@ -43,3 +57,17 @@ class SawyerPlateSlideBackSideV3Policy(Policy):
             return pos_puck
         else:
             return np.array([pos_curr[0] + 0.1, 0.6, pos_curr[2]])
+
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        pos_curr = o_d["hand_pos"]
+        pos_puck = o_d["puck_pos"] + np.array([0.023, 0.0, 0.025])
+
+        return select(
+            [
+                np.linalg.norm(pos_curr[:, :2] - pos_puck[:, :2], axis=-1) > 0.01,
+                np.abs(pos_curr[:, 2] - pos_puck[:, 2]) > 0.04,
+            ],
+            [pos_puck + np.array([0.0, 0.0, 0.07]), pos_puck],
+            stack_xyz(pos_curr[:, 0] + 0.1, 0.6, pos_curr[:, 2]),
+        )
@@ -6,7 +6,14 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+    stack_xyz,
+)
 
 
 class SawyerPlateSlideSideV3Policy(Policy):
@@ -37,6 +44,13 @@ class SawyerPlateSlideSideV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=25.0),
+            1.0,
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         pos_curr = o_d["hand_pos"]
@@ -50,3 +64,22 @@ class SawyerPlateSlideSideV3Policy(Policy):
             return np.array([pos_curr[0] - 0.1, 0.6, pos_curr[2]])
         else:
             return pos_puck + np.array([-0.1, 0.0, 0.0])
+
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        pos_curr = o_d["hand_pos"]
+        pos_puck = o_d["puck_pos"] + np.array([0.07, 0.0, -0.005])
+
+        return select(
+            [
+                np.linalg.norm(pos_curr[:, :2] - pos_puck[:, :2], axis=-1) > 0.04,
+                np.abs(pos_curr[:, 2] - pos_puck[:, 2]) > 0.04,
+                pos_curr[:, 0] > -0.2,
+            ],
+            [
+                pos_puck + np.array([0.0, 0.0, 0.1]),
+                pos_puck,
+                stack_xyz(pos_curr[:, 0] - 0.1, 0.6, pos_curr[:, 2]),
+            ],
+            pos_puck + np.array([-0.1, 0.0, 0.0]),
+        )
@@ -6,7 +6,14 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+    stack_xyz,
+)
 
 
 class SawyerPlateSlideV3Policy(Policy):
@@ -34,6 +41,13 @@ class SawyerPlateSlideV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=10.0),
+            -1.0,
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         pos_curr = o_d["hand_pos"]
@@ -47,3 +61,17 @@ class SawyerPlateSlideV3Policy(Policy):
             return pos_puck
         else:
             return np.array([o_d["shelf_x"], 0.9, pos_puck[2]])
+
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        pos_curr = o_d["hand_pos"]
+        pos_puck = o_d["puck_pos"] + np.array([0.0, -0.055, 0.03])
+
+        aligned_with_puck = (
+            np.linalg.norm(pos_curr[:, :2] - pos_puck[:, :2], axis=-1) <= 0.03
+        )
+        return select(
+            [~aligned_with_puck, np.abs(pos_curr[:, 2] - pos_puck[:, 2]) > 0.04],
+            [pos_puck + np.array([0.0, 0.0, 0.1]), pos_puck],
+            stack_xyz(o_d["shelf_x"], 0.9, pos_puck[:, 2]),
+        )
@@ -6,7 +6,13 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+)
 
 
 class SawyerPushWallV3Policy(Policy):
@@ -33,6 +39,13 @@ class SawyerPushWallV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=10.0),
+            self._grab_effort_batch(o_d),
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         pos_curr = o_d["hand_pos"]
@@ -55,6 +68,30 @@ class SawyerPushWallV3Policy(Policy):
                 return pos_curr + np.array([0, 1, 0])
             return o_d["goal_pos"]
 
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        pos_curr = o_d["hand_pos"]
+        pos_obj = o_d["obj_pos"] + np.array([-0.005, 0, 0])
+
+        x, y = pos_obj[:, 0], pos_obj[:, 1]
+        return select(
+            [
+                np.linalg.norm(pos_curr[:, :2] - pos_obj[:, :2], axis=-1) > 0.02,
+                np.abs(pos_curr[:, 2] - pos_obj[:, 2]) > 0.04,
+                (-0.1 <= x) & (x <= 0.3) & (0.65 <= y) & (y <= 0.75),
+                (((-0.15 < x) & (x < 0.05)) | ((0.15 < x) & (x < 0.35)))
+                & (0.695 <= y)
+                & (y <= 0.755),
+            ],
+            [
+                pos_obj + np.array([0.0, 0.0, 0.2]),
+                pos_obj + np.array([0.0, 0.0, 0.03]),
+                pos_curr + np.array([-1, 0, 0]),
+                pos_curr + np.array([0, 1, 0]),
+            ],
+            o_d["goal_pos"],
+        )
+
     @staticmethod
     def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
         pos_curr = o_d["hand_pos"]
@@ -67,3 +104,17 @@ class SawyerPushWallV3Policy(Policy):
         # While end effector is moving down toward the obj, begin closing the grabber
         else:
             return 0.6
+
+    @staticmethod
+    def _grab_effort_batch(
+        o_d: dict[str, npt.NDArray[np.float64]]
+    ) -> npt.NDArray[np.float64]:
+        pos_curr = o_d["hand_pos"]
+        pos_obj = o_d["obj_pos"]
+
+        return np.where(
+            (np.linalg.norm(pos_curr[:, :2] - pos_obj[:, :2], axis=-1) > 0.02)
+            | (np.abs(pos_curr[:, 2] - pos_obj[:, 2]) > 0.1),
+            0.0,
+            0.6,
+        )
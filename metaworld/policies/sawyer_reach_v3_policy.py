@@ -4,7 +4,7 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import Policy, assert_fully_parsed, batch_action, move
 
 
 class SawyerReachV3Policy(Policy):
@@ -28,3 +28,7 @@ class SawyerReachV3Policy(Policy):
         action["grab_effort"] = 0.0
 
         return action.array
+
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(move(o_d["hand_pos"], to_xyz=o_d["goal_pos"], p=5.0), 0.0)
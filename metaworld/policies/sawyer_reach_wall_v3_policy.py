@@ -6,7 +6,7 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, move
+from metaworld.policies.policy import Policy, batch_action, move, select
 
 
 class SawyerReachWallV3Policy(Policy):
@@ -32,6 +32,13 @@ class SawyerReachWallV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=5.0),
+            0.0,
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         pos_hand = o_d["hand_pos"]
@@ -45,3 +52,20 @@ class SawyerReachWallV3Policy(Policy):
         ):
             return pos_goal + np.array([0.0, 0.0, 1.0])
         return pos_goal
+
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        pos_hand = o_d["hand_pos"]
+        pos_goal = o_d["goal_pos"]
+
+        return select(
+            [
+                (-0.1 <= pos_hand[:, 0])
+                & (pos_hand[:, 0] <= 0.3)
+                & (0.60 <= pos_hand[:, 1])
+                & (pos_hand[:, 1] <= 0.80)
+                & (pos_hand[:, 2] < 0.25)
+            ],
+            [pos_goal + np.array([0.0, 0.0, 1.0])],
+            pos_goal,
+        )
@@ -6,7 +6,14 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+    stack_xyz,
+)
 
 
 class SawyerShelfPlaceV3Policy(Policy):
@@ -34,6 +41,13 @@ class SawyerShelfPlaceV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=25.0),
+            self._grab_effort_batch(o_d),
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         pos_curr = o_d["hand_pos"]
@@ -57,6 +71,28 @@ class SawyerShelfPlaceV3Policy(Policy):
             pos_new = pos_curr + np.array([0.0, 0.05, 0.0])
             return pos_new
 
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        pos_curr = o_d["hand_pos"]
+        pos_block = o_d["block_pos"] + np.array([-0.005, 0.0, 0.015])
+        pos_shelf_x = o_d["shelf_x"]
+
+        return select(
+            [
+                np.linalg.norm(pos_curr[:, :2] - pos_block[:, :2], axis=-1) > 0.04,
+                np.abs(pos_curr[:, 2] - pos_block[:, 2]) > 0.04,
+                np.abs(pos_curr[:, 0] - pos_shelf_x) > 0.02,
+                pos_curr[:, 2] < 0.30,
+            ],
+            [
+                pos_block + np.array([0.0, 0.0, 0.3]),
+                pos_block,
+                stack_xyz(pos_shelf_x, pos_curr[:, 1], 0.3),
+                pos_curr + np.array([0.0, 0.0, 0.30]),
+            ],
+            pos_curr + np.array([0.0, 0.05, 0.0]),
+        )
+
     @staticmethod
     def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
         pos_curr = o_d["hand_pos"]
@@ -69,3 +105,17 @@ class SawyerShelfPlaceV3Policy(Policy):
             return -1.0
         else:
             return 0.7
+
+    @staticmethod
+    def _grab_effort_batch(
+        o_d: dict[str, npt.NDArray[np.float64]]
+    ) -> npt.NDArray[np.float64]:
+        pos_curr = o_d["hand_pos"]
+        pos_block = o_d["block_pos"]
+
+        return np.where(
+            (np.linalg.norm(pos_curr[:, :2] - pos_block[:, :2], axis=-1) > 0.04)
+            | (np.abs(pos_curr[:, 2] - pos_block[:, 2]) > 0.15),
+            -1.0,
+            0.7,
+        )
@@ -6,7 +6,13 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+)
 
 
 class SawyerSoccerV3Policy(Policy):
@@ -33,6 +39,13 @@ class SawyerSoccerV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=25.0),
+            1.0,
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         pos_curr = o_d["hand_pos"]
@@ -56,3 +69,32 @@ class SawyerSoccerV3Policy(Policy):
         if np.linalg.norm(pos_curr - push_location) > 0.01:
             return push_location
         return pos_ball
+
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        pos_curr = o_d["hand_pos"]
+        pos_ball = o_d["ball_pos"] + np.array([0.0, 0.0, 0.03])
+        pos_goal = o_d["goal_pos"]
+
+        desired_z = np.where(
+            np.linalg.norm(pos_curr[:, :2] - pos_ball[:, :2], axis=-1) < 0.02, 0.1, 0.03
+        )
+        to_left_of_goal = pos_ball[:, 0] - pos_goal[:, 0] < -0.05
+        to_right_of_goal = pos_ball[:, 0] - pos_goal[:, 0] > 0.05
+
+        offset = 0.03
+        push_location = select(
+            [to_left_of_goal, to_right_of_goal],
+            [
+                pos_ball + np.array([-offset, 0.0, 0.0]),
+                pos_ball + np.array([+offset, 0.0, 0.0]),
+            ],
+            pos_ball + np.array([0.0, -offset, 0.0]),
+        )
+        push_location[:, 2] = desired_z
+
+        return select(
+            [np.linalg.norm(pos_curr - push_location, axis=-1) > 0.01],
+            [push_location],
+            pos_ball,
+        )
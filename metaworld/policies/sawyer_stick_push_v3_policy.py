@@ -6,7 +6,14 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+    stack_xyz,
+)
 
 
 class SawyerStickPushV3Policy(Policy):
@@ -35,6 +42,13 @@ class SawyerStickPushV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=10.0),
+            self._grab_effort_batch(o_d),
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         hand_pos = o_d["hand_pos"]
@@ -56,6 +70,33 @@ class SawyerStickPushV3Policy(Policy):
         else:
             return goal_pos
 
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        hand_pos = o_d["hand_pos"]
+        stick_pos = o_d["stick_pos"] + np.array([0.015, 0.0, 0.03])
+        thermos_pos = o_d["obj_pos"]
+        goal_pos = o_d["goal_pos"] + np.array([0.0, 0.0, 0.132])
+
+        apart = np.abs(stick_pos[:, 0] - thermos_pos[:, 0]) > 0.04
+        return select(
+            [
+                apart
+                & (np.linalg.norm(hand_pos[:, :2] - stick_pos[:, :2], axis=-1) > 0.02),
+                apart & (np.abs(hand_pos[:, 2] - stick_pos[:, 2]) > 0.02),
+                apart & (np.abs(stick_pos[:, 1] - thermos_pos[:, 1]) > 0.02),
+                apart & (np.abs(stick_pos[:, 2] - thermos_pos[:, 2]) > 0.02),
+                apart,
+            ],
+            [
+                stick_pos + np.array([0.0, 0.0, 0.1]),
+                stick_pos,
+                stack_xyz(stick_pos[:, 0], thermos_pos[:, 1], stick_pos[:, 2]),
+                stack_xyz(stick_pos[:, 0], thermos_pos[:, 1], thermos_pos[:, 2]),
+                thermos_pos,
+            ],
+            goal_pos,
+        )
+
     @staticmethod
     def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
         hand_pos = o_d["hand_pos"]
@@ -68,3 +109,17 @@ class SawyerStickPushV3Policy(Policy):
             return -1.0
         else:
             return +0.7
+
+    @staticmethod
+    def _grab_effort_batch(
+        o_d: dict[str, npt.NDArray[np.float64]]
+    ) -> npt.NDArray[np.float64]:
+        hand_pos = o_d["hand_pos"]
+        stick_pos = o_d["stick_pos"] + np.array([0.015, 0.0, 0.03])
+
+        return np.where(
+            (np.linalg.norm(hand_pos[:, :2] - stick_pos[:, :2], axis=-1) > 0.02)
+            | (np.abs(hand_pos[:, 2] - stick_pos[:, 2]) > 0.1),
+            -1.0,
+            0.7,
+        )
@@ -6,7 +6,13 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+)
 
 
 class SawyerSweepIntoV3Policy(Policy):
@@ -33,6 +39,13 @@ class SawyerSweepIntoV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=25.0),
+            self._grab_effort_batch(o_d),
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         pos_curr = o_d["hand_pos"]
@@ -46,6 +59,20 @@ class SawyerSweepIntoV3Policy(Policy):
         else:
             return pos_goal
 
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        pos_curr = o_d["hand_pos"]
+        pos_cube = o_d["cube_pos"] + np.array([-0.005, 0.0, 0.01])
+
+        return select(
+            [
+                np.linalg.norm(pos_curr[:, :2] - pos_cube[:, :2], axis=-1) > 0.04,
+                np.abs(pos_curr[:, 2] - pos_cube[:, 2]) > 0.04,
+            ],
+            [pos_cube + np.array([0.0, 0.0, 0.3]), pos_cube],
+            o_d["goal_pos"],
+        )
+
     @staticmethod
     def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
         pos_curr = o_d["hand_pos"]
@@ -58,3 +85,17 @@ class SawyerSweepIntoV3Policy(Policy):
             return -1.0
         else:
             return 0.7
+
+    @staticmethod
+    def _grab_effort_batch(
+        o_d: dict[str, npt.NDArray[np.float64]]
+    ) -> npt.NDArray[np.float64]:
+        pos_curr = o_d["hand_pos"]
+        pos_cube = o_d["cube_pos"]
+
+        return np.where(
+            (np.linalg.norm(pos_curr[:, :2] - pos_cube[:, :2], axis=-1) > 0.04)
+            | (np.abs(pos_curr[:, 2] - pos_cube[:, 2]) > 0.15),
+            -1.0,
+            0.7,
+        )
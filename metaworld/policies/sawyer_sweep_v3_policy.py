@@ -6,7 +6,13 @@ import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batch_action,
+    move,
+    select,
+)
 
 
 class SawyerSweepV3Policy(Policy):
@@ -33,6 +39,13 @@ class SawyerSweepV3Policy(Policy):
 
         return action.array
 
+    def get_action_batch(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+        return batch_action(
+            move(o_d["hand_pos"], to_xyz=self._desired_pos_batch(o_d), p=25.0),
+            self._grab_effort_batch(o_d),
+        )
+
     @staticmethod
     def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
         pos_curr = o_d["hand_pos"]
@@ -47,6 +60,23 @@ class SawyerSweepV3Policy(Policy):
 
         return pos_goal + np.array([0, 0, 0.1])
 
+    @staticmethod
+    def _desired_pos_batch(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+        pos_curr = o_d["hand_pos"]
+        pos_cube = o_d["cube_pos"] + np.array([0.0, 0.0, 0.015])
+        pos_goal = o_d["goal_pos"]
+
+        before_cube = pos_curr[:, 0] < 0.2
+        return select(
+            [
+                before_cube
+                & (np.linalg.norm(pos_curr[:, :2] - pos_cube[:, :2], axis=-1) > 0.04),
+                before_cube & (np.abs(pos_curr[:, 2] - pos_cube[:, 2]) > 0.04),
+            ],
+            [pos_cube + np.array([0.0, 0.0, 0.3]), pos_cube],
+            pos_goal + np.array([0, 0, 0.1]),
+        )
+
     @staticmethod
     def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
         pos_curr = o_d["hand_pos"]
@@ -61,3 +91,20 @@ class SawyerSweepV3Policy(Policy):
             return 0.7
         else:
             return -1.0
+
+    @staticmethod
+    def _grab_effort_batch(
+        o_d: dict[str, npt.NDArray[np.float64]]
+    ) -> npt.NDArray[np.float64]:
+        pos_curr = o_d["hand_pos"]
+        pos_cube = o_d["cube_pos"]
+
+        return select(
+            [
+                (np.linalg.norm(pos_curr[:, :2] - pos_cube[:, :2], axis=-1) > 0.04)
+                | (np.abs(pos_curr[:, 2] - pos_cube[:, 2]) > 0.15),
+                pos_cube[:, 0] < 0.4,
+            ],
+            [-1.0, 0.7],
+            -1.0,
+        )
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import copy
+import math
 import pickle
+from collections import OrderedDict
 from functools import cached_property
-from typing import Any, Callable, Literal, SupportsFloat
+from typing import Any, Callable, Literal, Sequence, SupportsFloat
 
 import mujoco
 import numpy as np
@@ -16,10 +18,29 @@ from gymnasium.utils import seeding
 from gymnasium.utils.ezpickle import EzPickle
 from typing_extensions import TypeAlias
 
-from metaworld.types import XYZ, EnvironmentStateDict, ObservationDict, Task
+from metaworld.model_cache import load_model
+from metaworld.task_set import decode_task_data
+from metaworld.types import (
+    XYZ,
+    EnvironmentStateDict,
+    EnvSnapshot,
+    ObservationDict,
+    RandVecMinDistance,
+    RewardContext,
+    Task,
+)
 from metaworld.utils import reward_utils
 
 RenderMode: TypeAlias = "Literal['human', 'rgb_array', 'depth_array']"
+VisualAssets: TypeAlias = "Literal['full', 'none']"
+
+
+def _name_to_id(
+    model: mujoco.MjModel, obj_type: mujoco.mjtObj, count: int
+) -> dict[str, int]:
+    """Maps the names of all the named objects of a given type in a model to their IDs."""
+    names = (mujoco.mj_id2name(model, obj_type, i) for i in range(count))
+    return {name: i for i, name in enumerate(names) if name}
 
 
 class SawyerMocapBase(mjenv_gym):
@@ -49,7 +70,10 @@ class SawyerMocapBase(mjenv_gym):
         camera_id: int | None = None,
         width: int = 480,
         height: int = 480,
+        visual_assets: VisualAssets = "full",
     ) -> None:
+        self.visual_assets = visual_assets
+        self.frame_skip = frame_skip
         mjenv_gym.__init__(
             self,
             model_name,
@@ -64,9 +88,31 @@ class SawyerMocapBase(mjenv_gym):
         self.reset_mocap_welds()
         self.frame_skip = frame_skip
 
+    def _initialize_simulation(self) -> tuple[mujoco.MjModel, mujoco.MjData]:
+        model = load_model(self.fullpath, self.visual_assets)
+        # Same as `MujocoEnv._initialize_simulation()`, which compiles the model from XML every time
+        model.vis.global_.offwidth = max(model.vis.global_.offwidth, self.width)
+        model.vis.global_.offheight = max(model.vis.global_.offheight, self.height)
+        data = mujoco.MjData(model)
+        # `MujocoEnv` checks that the render FPS matches the control frequency, which depends on `frame_skip`
+        self.metadata = {
+            **self.metadata,
+            "render_fps": int(np.round(1.0 / (model.opt.timestep * self.frame_skip))),
+        }
+        # Named accessors such as `data.body(name)` look the name up on every call,
+        # so resolve the IDs of all the named bodies, sites and geoms once per model
+        self._body_ids = _name_to_id(model, mujoco.mjtObj.mjOBJ_BODY, model.nbody)
+        self._site_ids = _name_to_id(model, mujoco.mjtObj.mjOBJ_SITE, model.nsite)
+        self._geom_ids = _name_to_id(model, mujoco.mjtObj.mjOBJ_GEOM, model.ngeom)
+        return model, data
+
+    def get_body_com(self, body_name: str) -> npt.NDArray[np.float64]:
+        """Returns a view of the position of a body's frame."""
+        return self.data.xpos[self._body_ids[body_name]]
+
     def get_endeff_pos(self) -> npt.NDArray[Any]:
         """Returns the position of the end effector."""
-        return self.data.body("hand").xpos
+        return self.data.xpos[self._body_ids["hand"]]
 
     @property
     def tcp_center(self) -> npt.NDArray[Any]:
@@ -75,9 +121,10 @@ class SawyerMocapBase(mjenv_gym):
         Returns:
             3-element position.
         """
-        right_finger_pos = self.data.site("rightEndEffector")
-        left_finger_pos = self.data.site("leftEndEffector")
-        tcp_center = (right_finger_pos.xpos + left_finger_pos.xpos) / 2.0
+        site_xpos = self.data.site_xpos
+        right_finger_pos = site_xpos[self._site_ids["rightEndEffector"]]
+        left_finger_pos = site_xpos[self._site_ids["leftEndEffector"]]
+        tcp_center = (right_finger_pos + left_finger_pos) / 2.0
         return tcp_center
 
     @property
@@ -88,11 +135,9 @@ class SawyerMocapBase(mjenv_gym):
         """Get the environment state.
 
         Returns:
-            A tuple of (qpos, qvel).
+            A tuple of (qpos, qvel). See `SawyerXYZEnv.get_physics_state()` for the full physics state.
         """
-        qpos = np.copy(self.data.qpos)
-        qvel = np.copy(self.data.qvel)
-        return copy.deepcopy((qpos, qvel))
+        return np.copy(self.data.qpos), np.copy(self.data.qvel)
 
     def set_env_state(
         self, state: tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]
@@ -151,11 +196,35 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
     """Bounds for hand position."""
 
     max_path_length: int = 500
-    """The maximum path length for the environment (the task horizon)."""
+    """The maximum path length for the environment (the task horizon), at the default `frame_skip`."""
+
+    DEFAULT_FRAME_SKIP: int = 5
+    """The number of simulation steps per env step the horizon, the hand warm-up and the scripted policies are tuned for."""
+
+    SIM_TIMESTEP: float = 0.0025
+    """The simulation timestep of all the envs' models, in seconds."""
 
     TARGET_RADIUS: float = 0.05
     """Upper bound for distance from the target when checking for task completion."""
 
+    RAND_VEC_CONSTRAINTS: tuple[RandVecMinDistance, ...] = ()
+    """The constraints a `rand_vec` sampled from `_random_reset_space` must satisfy, it's resampled until it does."""
+
+    TASK_ENV_ID: int | None = None
+    """The ID of the environment in binary task data (see `metaworld.task_set.encode_task_data()`).
+
+    Declared by each environment of `metaworld.env_dict.ALL_V3_ENVIRONMENTS` (its index, which is also its
+    `task_id`), and inherited by their subclasses. The tasks of environments without an ID are pickled instead.
+    """
+
+    _HAND_RESET_CACHE: OrderedDict[
+        tuple[Any, ...], tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]
+    ] = OrderedDict()
+    """`(initial state, state before the last physics step)` of cached `_reset_hand()` warm-ups, shared by all envs in the process."""
+
+    _HAND_RESET_CACHE_SIZE: int = 1024
+    """The maximum number of states in `_HAND_RESET_CACHE`, least recently used states are evicted first."""
+
     class _Decorators:
         @classmethod
         def assert_task_is_set(cls, func: Callable) -> Callable:
@@ -174,7 +243,7 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
 
     def __init__(
         self,
-        frame_skip: int = 5,
+        frame_skip: int = DEFAULT_FRAME_SKIP,
         hand_low: XYZ = (-0.2, 0.55, 0.05),
         hand_high: XYZ = (0.2, 0.75, 0.3),
         mocap_low: XYZ | None = None,
@@ -187,8 +256,15 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
         reward_function_version: str | None = None,
         width: int = 480,
         height: int = 480,
+        visual_assets: VisualAssets = "full",
     ) -> None:
-        self.action_scale = action_scale
+        if frame_skip < 1:
+            raise ValueError(f"frame_skip must be a positive integer, got {frame_skip}")
+        # Keep the hand's speed for a given action, and the horizon, the same in simulated time
+        self.action_scale = action_scale * (frame_skip / self.DEFAULT_FRAME_SKIP)
+        self.max_path_length = math.ceil(
+            type(self).max_path_length * self.DEFAULT_FRAME_SKIP / frame_skip
+        )
         self.action_rot_scale = action_rot_scale
         self.hand_low = np.array(hand_low)
         self.hand_high = np.array(hand_high)
@@ -204,6 +280,20 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
         self._last_rand_vec: npt.NDArray[Any] | None = None
         self.num_resets: int = 0
         self.current_seed: int | None = None
+        self.cache_hand_reset: bool = False
+        # What is recomputed after the physics step before observing the new state: everything
+        # ("full", `mj_forward()`), or only the poses of the bodies, geoms and sites ("kinematics").
+        # The observations, rewards and infos are the same either way, but since `mj_forward()`
+        # also updates the solver's warm start, trajectories only match up to the solver's tolerance
+        self.step_forward: Literal["full", "kinematics"] = "full"
+        self._forward_pending: bool = False
+        # If set, observations are assembled in place in a preallocated buffer. `step()` then
+        # returns either a copy of it ("copy"), or a reused output buffer that is overwritten
+        # by the next `step()` ("view")
+        self.obs_buffer: Literal["copy", "view"] | None = None
+        self._obs_buffer = np.zeros(39)
+        self._obs_out_buffer = np.zeros(39)
+        self._quat_buffer = np.zeros(4)
         self.obj_init_pos: npt.NDArray[Any] | None = None
 
         self.width = width
@@ -226,6 +316,7 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
             camera_id=camera_id,
             width=width,
             height=height,
+            visual_assets=visual_assets,
         )
 
         mujoco.mj_forward(
@@ -300,23 +391,211 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
 
         Args:
             task: The task to set.
+
+        Raises:
+            ValueError: If the task is of another environment.
         """
         self._set_task_called = True
-        data = pickle.loads(task.data)
-        assert isinstance(self, data["env_cls"])
-        del data["env_cls"]
+        decoded = decode_task_data(task.data)
+        if decoded is not None:
+            # Binary task data, checked against the env by its ID
+            env_id, new_observability, rand_vec = decoded
+            if env_id != self.TASK_ENV_ID:
+                raise ValueError(
+                    f"The task is of the environment with ID {env_id}, not {type(self).__name__} "
+                    f"(ID {self.TASK_ENV_ID})."
+                )
+            data: dict[str, Any] = {}
+        else:
+            data = pickle.loads(task.data)
+            assert isinstance(self, data.pop("env_cls"))
+            rand_vec = data.pop("rand_vec")
+            new_observability = data.pop("partially_observable")
         self._freeze_rand_vec = True
-        self._last_rand_vec = data["rand_vec"]
-        del data["rand_vec"]
-        new_observability = data["partially_observable"]
+        self._last_rand_vec = rand_vec
         if new_observability != self._partially_observable:
             # Force recomputation of the observation space
             # See https://docs.python.org/3/library/functools.html#functools.cached_property
-            del self.sawyer_observation_space
+            self.__dict__.pop("sawyer_observation_space", None)
         self._partially_observable = new_observability
-        del data["partially_observable"]
         self._set_task_inner(**data)
 
+    _SNAPSHOT_DATA_FIELDS = (
+        "qpos",
+        "qvel",
+        "act",
+        "ctrl",
+        "mocap_pos",
+        "mocap_quat",
+        "qacc_warmstart",
+    )
+    """The `MjData` fields of a snapshot, which along with `time` make up the simulation state."""
+
+    _SNAPSHOT_EXCLUDED_ATTRIBUTES = frozenset(
+        (
+            "fullpath",
+            "visual_assets",
+            "frame_skip",
+            "max_path_length",
+            "render_mode",
+            "camera_name",
+            "camera_id",
+            "width",
+            "height",
+            "cache_hand_reset",
+            "step_forward",
+            "obs_buffer",
+            "_obs_buffer",
+            "_obs_out_buffer",
+            "_quat_buffer",
+            "_last_stable_obs",
+        )
+    )
+    """Attributes that configure the env (or are scratch buffers) rather than being part of its state."""
+
+    def snapshot(self) -> EnvSnapshot:
+        """Captures the dynamic state of the env, to restore it later with `restore()`.
+
+        Unlike pickling, this only copies the state that changes as the env is reset and stepped: the
+        simulation state, the body and site poses set on reset, the env's RNG and its scalar and array
+        attributes (path length, task, goal, frame-stacked observation...). Arrays that are views of the
+        simulation (e.g. `init_left_pad`) are left out, as they are kept up to date by MuJoCo.
+
+        Returns:
+            The snapshot, which can be restored into any env of the same class.
+        """
+        data, model = self.data, self.model
+        attributes = {}
+        for name, value in self.__dict__.items():
+            if name in self._SNAPSHOT_EXCLUDED_ATTRIBUTES:
+                continue
+            if isinstance(value, np.ndarray):
+                root = value
+                while isinstance(root.base, np.ndarray):
+                    root = root.base
+                # Not backed by MuJoCo's memory (goals decoded from task data are backed by bytes)
+                if root.base is None or isinstance(root.base, bytes):
+                    attributes[name] = value.copy()
+            elif value is None or isinstance(
+                value, (bool, int, float, str, np.generic)
+            ):
+                attributes[name] = value
+        return EnvSnapshot(
+            env_cls=type(self),
+            data={
+                "time": np.array(data.time),
+                **{
+                    name: getattr(data, name).copy()
+                    for name in self._SNAPSHOT_DATA_FIELDS
+                },
+            },
+            model={
+                "body_pos": model.body_pos.copy(),
+                "site_pos": model.site_pos.copy(),
+            },
+            attributes=attributes,
+            rng_state=(
+                None
+                if self._np_random is None
+                else copy.deepcopy(self._np_random.bit_generator.state)
+            ),
+        )
+
+    def restore(self, snapshot: EnvSnapshot) -> None:
+        """Restores a snapshot taken with `snapshot()`, by this env or another env of the same class.
+
+        Args:
+            snapshot: The snapshot to restore.
+        """
+        if snapshot.env_cls is not type(self):
+            raise ValueError(
+                f"Can't restore a snapshot of {snapshot.env_cls.__name__} into {type(self).__name__}"
+            )
+        self.model.body_pos[:] = snapshot.model["body_pos"]
+        self.model.site_pos[:] = snapshot.model["site_pos"]
+        self.data.time = snapshot.data["time"].item()
+        for name in self._SNAPSHOT_DATA_FIELDS:
+            getattr(self.data, name)[:] = snapshot.data[name]
+        mujoco.mj_forward(self.model, self.data)
+        # `mj_forward()` warm starts the constraint solver from, and then overwrites, `qacc_warmstart`
+        self.data.qacc_warmstart[:] = snapshot.data["qacc_warmstart"]
+
+        attributes = snapshot.attributes
+        if attributes["_partially_observable"] != self._partially_observable:
+            # Same as in `set_task()`
+            self.__dict__.pop("sawyer_observation_space", None)
+        for name, value in attributes.items():
+            setattr(
+                self, name, value.copy() if isinstance(value, np.ndarray) else value
+            )
+        if snapshot.rng_state is not None:
+            self.np_random.bit_generator.state = snapshot.rng_state
+
+    _PHYSICS_STATE_SPEC = mujoco.mjtState.mjSTATE_INTEGRATION
+    """The MuJoCo state components of a physics state: everything `mj_step()` depends on."""
+
+    @property
+    def physics_state_size(self) -> int:
+        """The size of the vectors returned by `get_physics_state()`, which is the same for all envs of a class."""
+        return (
+            mujoco.mj_stateSize(self.model, self._PHYSICS_STATE_SPEC)
+            + len(self._prev_obs)
+            + 1
+        )
+
+    def get_physics_state(
+        self, out: npt.NDArray[np.float64] | None = None
+    ) -> npt.NDArray[np.float64]:
+        """Gets the full physics state of the env as a single vector, to set it later with `set_physics_state()`.
+
+        The vector is MuJoCo's integration state (`mjSTATE_INTEGRATION`: time, `qpos`, `qvel`, actuator
+        activations, `qacc_warmstart`, controls, applied forces, mocap poses...), followed by the
+        frame-stacked observation and the path length. Its layout only depends on the env class.
+
+        Unlike `snapshot()`, this doesn't include the task, the poses set on reset or the RNG, so the state
+        can only be set into envs in the same episode (e.g. copies of the env made after `reset()`).
+
+        Args:
+            out: An optional contiguous `float64` array of size `physics_state_size` to write the state into.
+
+        Returns:
+            The physics state.
+        """
+        if out is None:
+            out = np.empty(self.physics_state_size)
+        elif out.shape != (self.physics_state_size,):
+            raise ValueError(
+                f"Expected an array of shape ({self.physics_state_size},), got {out.shape}"
+            )
+        size = mujoco.mj_stateSize(self.model, self._PHYSICS_STATE_SPEC)
+        mujoco.mj_getState(self.model, self.data, out[:size], self._PHYSICS_STATE_SPEC)
+        out[size:-1] = self._prev_obs
+        out[-1] = self.curr_path_length
+        return out
+
+    def set_physics_state(self, state: npt.NDArray[np.float64]) -> None:
+        """Sets a physics state returned by `get_physics_state()`.
+
+        Args:
+            state: The physics state.
+        """
+        if state.shape != (self.physics_state_size,):
+            raise ValueError(
+                f"Expected a state of shape ({self.physics_state_size},), got {state.shape}"
+            )
+        size = mujoco.mj_stateSize(self.model, self._PHYSICS_STATE_SPEC)
+        mujoco_state = np.ascontiguousarray(state[:size], dtype=np.float64)
+        mujoco.mj_setState(
+            self.model, self.data, mujoco_state, self._PHYSICS_STATE_SPEC
+        )
+        mujoco.mj_forward(self.model, self.data)
+        # `mj_forward()` warm starts the constraint solver from, and then overwrites, `qacc_warmstart`
+        mujoco.mj_setState(
+            self.model, self.data, mujoco_state, self._PHYSICS_STATE_SPEC
+        )
+        self._prev_obs[:] = state[size:-1]
+        self.curr_path_length = int(state[-1])
+
     def set_xyz_action(self, action: npt.NDArray[Any]) -> None:
         """Adjusts the position of the mocap body from the given action.
         Moves each body axis in XYZ by the amount described by the action.
@@ -369,7 +648,7 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
         Returns:
             Flat, 3 element array indicating site's location.
         """
-        return self.data.site(site_name).xpos.copy()
+        return self.data.site_xpos[self._site_ids[site_name]].copy()
 
     def _set_pos_site(self, name: str, pos: npt.NDArray[Any]) -> None:
         """Sets the position of a given site.
@@ -381,7 +660,7 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
         assert isinstance(pos, np.ndarray)
         assert pos.ndim == 1
 
-        self.data.site(name).xpos = pos[:3]
+        self.data.site_xpos[self._site_ids[name]] = pos[:3]
 
     @property
     def _target_site_config(self) -> list[tuple[str, npt.NDArray[Any]]]:
@@ -407,40 +686,36 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
         Returns:
             Whether the gripper is touching the object
         """
-
-        leftpad_geom_id = self.data.geom("leftpad_geom").id
-        rightpad_geom_id = self.data.geom("rightpad_geom").id
-
-        leftpad_object_contacts = [
-            x
-            for x in self.data.contact
-            if (
-                leftpad_geom_id in (x.geom1, x.geom2)
-                and object_geom_id in (x.geom1, x.geom2)
-            )
-        ]
-
-        rightpad_object_contacts = [
-            x
-            for x in self.data.contact
-            if (
-                rightpad_geom_id in (x.geom1, x.geom2)
-                and object_geom_id in (x.geom1, x.geom2)
-            )
-        ]
-
-        leftpad_object_contact_force = sum(
-            self.data.efc_force[x.efc_address] for x in leftpad_object_contacts
+        if self._forward_pending:
+            # Only the kinematics were updated after the last step (`step_forward="kinematics"`)
+            mujoco.mj_forward(self.model, self.data)
+            self._forward_pending = False
+        if self.data.ncon == 0:
+            return False
+        contact = self.data.contact
+        # The geom each contact with the object is with (-1 for the other contacts)
+        object_contact_geom = np.where(
+            contact.geom1 == object_geom_id,
+            contact.geom2,
+            np.where(contact.geom2 == object_geom_id, contact.geom1, -1),
         )
-
-        rightpad_object_contact_force = sum(
-            self.data.efc_force[x.efc_address] for x in rightpad_object_contacts
+        contact_force = self.data.efc_force[contact.efc_address]
+        leftpad_geom_id = self._geom_ids["leftpad_geom"]
+        rightpad_geom_id = self._geom_ids["rightpad_geom"]
+
+        leftpad_object_contact_force = contact_force[
+            object_contact_geom == leftpad_geom_id
+        ].sum()
+        rightpad_object_contact_force = contact_force[
+            object_contact_geom == rightpad_geom_id
+        ].sum()
+
+        return bool(
+            0 < leftpad_object_contact_force and 0 < rightpad_object_contact_force
         )
 
-        return 0 < leftpad_object_contact_force and 0 < rightpad_object_contact_force
-
     def _get_id_main_object(self) -> int:
-        return self.data.geom("objGeom").id
+        return self._geom_ids["objGeom"]
 
     def _get_pos_objects(self) -> npt.NDArray[Any]:
         """Retrieves object position(s) from mujoco properties or instance vars.
@@ -462,6 +737,29 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
         # V1 environments don't have to implement it
         raise NotImplementedError
 
+    def _xmat_to_quat(self, xmat: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        """Converts a rotation matrix to a quaternion.
+
+        Matches `scipy.spatial.transform.Rotation.from_matrix(xmat.reshape(3, 3)).as_quat()`,
+        including its (x, y, z, w) order and sign, at a fraction of the cost.
+
+        Args:
+            xmat: Flat, 9 element rotation matrix, e.g. a row of `data.geom_xmat`.
+
+        Returns:
+            The (x, y, z, w) quaternion.
+        """
+        mujoco.mju_mat2Quat(self._quat_buffer, xmat)
+        w, x, y, z = self._quat_buffer
+        quat = np.array([x, y, z, w])
+        # scipy picks the sign that makes the component it solves for first positive,
+        # which is the one matching the largest of the diagonal entries and the trace
+        m00, m11, m22 = xmat[0], xmat[4], xmat[8]
+        decision = (m00, m11, m22, m00 + m11 + m22)
+        if quat[max(range(4), key=decision.__getitem__)] < 0:
+            quat = -quat
+        return quat
+
     def _get_pos_goal(self) -> npt.NDArray[Any]:
         """Retrieves goal position from mujoco properties or instance vars.
 
@@ -472,20 +770,27 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
         assert self._target_pos.ndim == 1
         return self._target_pos
 
-    def _get_curr_obs_combined_no_goal(self) -> npt.NDArray[np.float64]:
+    def _get_curr_obs_combined_no_goal(
+        self, out: npt.NDArray[np.float64] | None = None
+    ) -> npt.NDArray[np.float64]:
         """Combines the end effector's {pos, closed amount} and the object(s)' {pos, quat} into a single flat observation.
 
         Note: The goal's position is *not* included in this.
 
+        Args:
+            out: An optional 18 element array to write the observation to.
+
         Returns:
-            The flat observation array (18 elements)
+            The flat observation array (18 elements), `out` if given.
         """
+        if out is None:
+            out = np.empty(4 + self._obs_obj_max_len)
 
-        pos_hand = self.get_endeff_pos()
+        out[:3] = self.get_endeff_pos()
 
         finger_right, finger_left = (
-            self.data.body("rightclaw"),
-            self.data.body("leftclaw"),
+            self.data.xpos[self._body_ids["rightclaw"]],
+            self.data.xpos[self._body_ids["leftclaw"]],
         )
         # the gripper can be at maximum about ~0.1 m apart.
         # dividing by 0.1 normalized the gripper distance between
@@ -494,36 +799,37 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
         # clipping removes the effects of this random extra distance
         # that is produced by mujoco
 
-        gripper_distance_apart = np.linalg.norm(finger_right.xpos - finger_left.xpos)
-        gripper_distance_apart = np.clip(gripper_distance_apart / 0.1, 0.0, 1.0)
+        gripper_distance_apart = np.linalg.norm(finger_right - finger_left)
+        out[3] = np.clip(gripper_distance_apart / 0.1, 0.0, 1.0)
 
-        obs_obj_padded = np.zeros(self._obs_obj_max_len)
         obj_pos = self._get_pos_objects()
         assert len(obj_pos) % 3 == 0
-        obj_pos_split = np.split(obj_pos, len(obj_pos) // 3)
-
         obj_quat = self._get_quat_objects()
         assert len(obj_quat) % 4 == 0
-        obj_quat_split = np.split(obj_quat, len(obj_quat) // 4)
-        obs_obj_padded[: len(obj_pos) + len(obj_quat)] = np.hstack(
-            [np.hstack((pos, quat)) for pos, quat in zip(obj_pos_split, obj_quat_split)]
-        )
-        return np.hstack((pos_hand, gripper_distance_apart, obs_obj_padded))
+        # each object's position is followed by its quaternion, the rest is zero-padded
+        for i in range(len(obj_pos) // 3):
+            out[4 + 7 * i : 7 + 7 * i] = obj_pos[3 * i : 3 * i + 3]
+            out[7 + 7 * i : 11 + 7 * i] = obj_quat[4 * i : 4 * i + 4]
+        out[4 + len(obj_pos) + len(obj_quat) :] = 0.0
+        return out
 
     def _get_obs(self) -> npt.NDArray[np.float64]:
         """Frame stacks `_get_curr_obs_combined_no_goal()` and concatenates the goal position to form a single flat observation.
 
+        When `obs_buffer` is set, the observation is written to the env's preallocated buffer instead of a new array.
+
         Returns:
             The flat observation array (39 elements)
         """
+        obs = self._obs_buffer if self.obs_buffer is not None else np.empty(39)
         # do frame stacking
-        pos_goal = self._get_pos_goal()
+        obs[18:36] = self._prev_obs
+        self._get_curr_obs_combined_no_goal(out=obs[:18])
+        self._prev_obs[:] = obs[:18]
         if self._partially_observable:
-            pos_goal = np.zeros_like(pos_goal)
-        curr_obs = self._get_curr_obs_combined_no_goal()
-        # do frame stacking
-        obs = np.hstack((curr_obs, self._prev_obs, pos_goal))
-        self._prev_obs = curr_obs
+            obs[36:] = 0.0
+        else:
+            obs[36:] = self._get_pos_goal()
         return obs
 
     def _get_obs_dict(self) -> ObservationDict:
@@ -590,11 +896,43 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
         """
         assert len(action) == 4, f"Actions should be size 4, got {len(action)}"
         self.set_xyz_action(action[:3])
+        self._step_physics(action)
+        obs, reward, terminated, truncated, info = self._step_evaluate(action)
+        if self.obs_buffer == "view":
+            np.copyto(self._obs_out_buffer, obs)
+            obs = self._obs_out_buffer
+        else:
+            obs = obs.copy()
+        return (
+            obs,
+            reward,
+            terminated,
+            truncated,
+            info,
+        )
+
+    def _step_physics(self, action: npt.NDArray[np.float32]) -> None:
+        """Runs the simulation part of `step()`, after the mocap target has been set.
+
+        Args:
+            action: The action being taken. Only the gripper effort (last element) is used here.
+        """
         if self.curr_path_length >= self.max_path_length:
             raise ValueError("You must reset the env manually once truncate==True")
         self.do_simulation([action[-1], -action[-1]], n_frames=self.frame_skip)
         self.curr_path_length += 1
 
+    def _step_evaluate(
+        self, action: npt.NDArray[np.float32]
+    ) -> tuple[npt.NDArray[np.float64], float, bool, bool, dict[str, Any]]:
+        """Computes the observation, reward and info dict once `_step_physics()` has run.
+
+        Args:
+            action: The action that was taken.
+
+        Returns:
+            The (next_obs, reward, terminated, truncated, info) tuple. `next_obs` is not copied.
+        """
         # Running the simulator can sometimes mess up site positions, so
         # re-position them here to make sure they're accurate
         for site in self._target_site_config:
@@ -617,14 +955,19 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
                     "unscaled_reward": 0.0,
                 },
             )
-        mujoco.mj_forward(self.model, self.data)
-        self._last_stable_obs = self._get_obs()
-
+        if self.step_forward == "full":
+            mujoco.mj_forward(self.model, self.data)
+        else:
+            # The observations and most rewards only depend on the poses of the bodies and sites,
+            # the contacts are updated by `touching_object()` if it's called
+            mujoco.mj_kinematics(self.model, self.data)
+            self._forward_pending = True
+        obs = self._get_obs()
         self._last_stable_obs = np.clip(
-            self._last_stable_obs,
+            obs,
             a_max=self.sawyer_observation_space.high,
             a_min=self.sawyer_observation_space.low,
-            dtype=np.float64,
+            out=obs,
         )
         assert isinstance(self._last_stable_obs, np.ndarray)
         reward, info = self.evaluate_state(self._last_stable_obs, action)
@@ -633,13 +976,7 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
         truncate = False
         if self.curr_path_length == self.max_path_length:
             truncate = True
-        return (
-            np.array(self._last_stable_obs, dtype=np.float64),
-            reward,
-            False,
-            truncate,
-            info,
-        )
+        return self._last_stable_obs, reward, False, truncate, info
 
     def evaluate_state(
         self, obs: npt.NDArray[np.float64], action: npt.NDArray[np.float32]
@@ -655,6 +992,120 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
         # V1 environments don't have to implement it
         raise NotImplementedError
 
+    def get_reward_context(self) -> RewardContext:
+        """Records the per-episode values `compute_reward_batch()` needs, for the current episode.
+
+        All of them are fixed by `reset()`, so with a task set through `set_task()` they only depend
+        on the task and only need to be recorded once per task.
+
+        Returns:
+            The current episode's `RewardContext`.
+
+        Raises:
+            NotImplementedError: If the environment doesn't support `compute_reward_batch()`.
+        """
+        self._check_reward_batch_support()
+        assert (
+            self._target_pos is not None and self.obj_init_pos is not None
+        ), "`reset()` must be called before `get_reward_context()`."
+        return {
+            "hand_init_pos": np.array(self.hand_init_pos, dtype=np.float64),
+            "init_tcp": np.array(self.init_tcp, dtype=np.float64),
+            "obj_init_pos": np.array(self.obj_init_pos, dtype=np.float64),
+            "target_pos": np.array(self._target_pos, dtype=np.float64),
+            "extra": {
+                key: np.array(value, dtype=np.float64)
+                for key, value in self._reward_context_extra().items()
+            },
+        }
+
+    def _reward_context_extra(self) -> dict[str, Any]:
+        """Env-specific values for `RewardContext["extra"]`. To be overridden by subclasses as appropriate."""
+        return {}
+
+    def compute_reward_batch(
+        self,
+        actions: npt.ArrayLike,
+        obs: npt.ArrayLike,
+        context: RewardContext,
+        tcp_center: npt.ArrayLike,
+        pad_y: npt.ArrayLike,
+    ) -> npt.NDArray[np.float64]:
+        """Computes the rewards of a batch of stored transitions without stepping the simulation.
+
+        Equivalent to the reward of `compute_reward()` for each transition. The observations hold the
+        hand position but not the TCP or the pad positions, so those have to be recorded during the
+        rollout, see `get_gripper_positions()`.
+
+        Args:
+            actions: `(..., 4)` actions.
+            obs: `(..., 39)` observations the actions resulted in.
+            context: The episode's `RewardContext`, see `get_reward_context()`. Its arrays can also have
+                the leading dimensions of `obs`, to mix transitions of several episodes in one batch.
+            tcp_center: `(..., 3)` TCP positions (`tcp_center`) the actions resulted in.
+            pad_y: `(..., 2)` y positions of the left and right pads the actions resulted in.
+
+        Returns:
+            The `(...)` rewards.
+
+        Raises:
+            NotImplementedError: If the environment doesn't support `compute_reward_batch()`.
+        """
+        self._check_reward_batch_support()
+        return self._compute_reward_batch(
+            np.asarray(actions, dtype=np.float64),
+            np.asarray(obs, dtype=np.float64),
+            context,
+            np.asarray(tcp_center, dtype=np.float64),
+            np.asarray(pad_y, dtype=np.float64),
+        )
+
+    def _compute_reward_batch(
+        self,
+        actions: npt.NDArray[np.float64],
+        obs: npt.NDArray[np.float64],
+        context: RewardContext,
+        tcp_center: npt.NDArray[np.float64],
+        pad_y: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        """Does the heavy-lifting for `compute_reward_batch()`. To be overridden by the environments that support it."""
+        raise NotImplementedError
+
+    @classmethod
+    def supports_compute_reward_batch(cls) -> bool:
+        """Whether `compute_reward_batch()` is available for this environment.
+
+        It isn't for the environments whose v2 reward reads simulation state that isn't in the
+        observations or in the `RewardContext` (joint angles, sites, the full pad positions), i.e.
+        assembly, disassemble, door-open, door-lock, hammer, lever-pull, peg-insert-side and
+        stick-pull, and for bin-picking, which sets its reward margin on the first step of an episode.
+        """
+        return cls._compute_reward_batch is not SawyerXYZEnv._compute_reward_batch
+
+    def _check_reward_batch_support(self) -> None:
+        if not self.supports_compute_reward_batch():
+            raise NotImplementedError(
+                f"{type(self).__name__} doesn't support `compute_reward_batch()`, see "
+                "`supports_compute_reward_batch()`."
+            )
+        if self.reward_function_version != "v2":
+            raise NotImplementedError(
+                "`compute_reward_batch()` only supports the v2 reward functions."
+            )
+
+    def get_gripper_positions(
+        self,
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Returns the current `tcp_center` and `pad_y` inputs of `compute_reward_batch()`.
+
+        Returns:
+            The `(3,)` TCP position and the `(2,)` y positions of the left and right pads.
+        """
+        pad_y = np.array(
+            [self.get_body_com("leftpad")[1], self.get_body_com("rightpad")[1]]
+        )
+        return self.tcp_center, pad_y
+
     def reset_model(self) -> npt.NDArray[np.float64]:
         qpos = self.init_qpos
         qvel = self.init_qvel
@@ -674,6 +1125,11 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
             The `(obs, info)` tuple.
         """
         self.curr_path_length = 0
+        if self.cache_hand_reset:
+            # `MujocoEnv.reset()` resets the simulation and then calls `reset_model()` again, so only the second
+            # call's simulation state is kept. Starting the first one from a reset simulation too lets both of them
+            # use the cached hand warm-up.
+            mujoco.mj_resetData(self.model, self.data)
         self.reset_model()
         obs, info = super().reset()
         self._prev_obs = obs[:18].copy()
@@ -685,38 +1141,160 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
         """Resets the hand position.
 
         Args:
-            steps: The number of steps to take to reset the hand.
+            steps: The number of steps to take to reset the hand, at the default `frame_skip`.
         """
-        mocap_id = self.model.body_mocapid[self.data.body("mocap").id]
+        # Keep the warm-up the same in simulated time
+        steps = math.ceil(steps * self.DEFAULT_FRAME_SKIP / self.frame_skip)
+        if self.cache_hand_reset:
+            self._reset_hand_cached(steps)
+            return
+        mocap_id = self.model.body_mocapid[self._body_ids["mocap"]]
         for _ in range(steps):
             self.data.mocap_pos[mocap_id][:] = self.hand_init_pos
             self.data.mocap_quat[mocap_id][:] = np.array([1, 0, 1, 0])
             self.do_simulation([-1, 1], self.frame_skip)
         self.init_tcp = self.tcp_center
 
+    def _reset_hand_cached(self, steps: int) -> None:
+        """Same as `_reset_hand()`, but restores the settled state from `_HAND_RESET_CACHE` when possible.
+
+        Starting from a freshly reset simulation, the outcome of the warm-up only depends on the env class,
+        the hand's initial position, the number of steps and the (task-dependent) body poses of the model.
+        Warm-ups that start from any other state are simulated as usual. The cached state is the one right
+        before the last physics step, which is then replayed so that all of the quantities MuJoCo derives
+        during a step match the uncached warm-up exactly.
+
+        Args:
+            steps: The number of steps to take to reset the hand.
+        """
+        key = (
+            type(self),
+            np.asarray(self.hand_init_pos, dtype=np.float64).tobytes(),
+            steps,
+            self.frame_skip,
+            self.model.body_pos.tobytes(),
+            self.model.body_quat.tobytes(),
+        )
+        spec = mujoco.mjtState.mjSTATE_INTEGRATION
+        state = np.empty(mujoco.mj_stateSize(self.model, spec))
+        mujoco.mj_getState(self.model, self.data, state, spec)
+        cache = SawyerXYZEnv._HAND_RESET_CACHE
+        entry = cache.get(key)
+        if entry is None:
+            mujoco.mj_resetData(self.model, self.data)
+            initial_state = np.empty_like(state)
+            mujoco.mj_getState(self.model, self.data, initial_state, spec)
+            mujoco.mj_setState(self.model, self.data, state, spec)
+        else:
+            initial_state, settled_state = entry
+        mocap_id = self.model.body_mocapid[self._body_ids["mocap"]]
+
+        if not np.array_equal(state, initial_state):
+            for _ in range(steps):
+                self.data.mocap_pos[mocap_id][:] = self.hand_init_pos
+                self.data.mocap_quat[mocap_id][:] = np.array([1, 0, 1, 0])
+                self.do_simulation([-1, 1], self.frame_skip)
+        elif entry is None:
+            for i in range(steps):
+                self.data.mocap_pos[mocap_id][:] = self.hand_init_pos
+                self.data.mocap_quat[mocap_id][:] = np.array([1, 0, 1, 0])
+                if i < steps - 1:
+                    self.do_simulation([-1, 1], self.frame_skip)
+                elif self.frame_skip > 1:
+                    self.do_simulation([-1, 1], self.frame_skip - 1)
+            settled_state = np.empty_like(state)
+            mujoco.mj_getState(self.model, self.data, settled_state, spec)
+            cache[key] = (initial_state, settled_state)
+            if len(cache) > self._HAND_RESET_CACHE_SIZE:
+                cache.popitem(last=False)
+            self.do_simulation([-1, 1], 1)
+        else:
+            cache.move_to_end(key)
+            mujoco.mj_setState(self.model, self.data, settled_state, spec)
+            self.do_simulation([-1, 1], 1)
+        self.init_tcp = self.tcp_center
+
     def _get_state_rand_vec(self) -> npt.NDArray[np.float64]:
-        """Gets or generates a random vector for the hand position at reset."""
+        """Gets or generates a random vector for the hand position at reset.
+
+        Generated vectors are resampled until they satisfy `RAND_VEC_CONSTRAINTS`.
+        """
         if self._freeze_rand_vec:
             assert self._last_rand_vec is not None
             return self._last_rand_vec
-        elif self.seeded_rand_vec:
-            assert self._random_reset_space is not None
-            rand_vec = self.np_random.uniform(
-                self._random_reset_space.low,
-                self._random_reset_space.high,
-                size=self._random_reset_space.low.size,
-            )
-            self._last_rand_vec = rand_vec
-            return rand_vec
-        else:
-            assert self._random_reset_space is not None
-            rand_vec: npt.NDArray[np.float64] = np.random.uniform(  # type: ignore
+        assert self._random_reset_space is not None
+        np_random = self.np_random if self.seeded_rand_vec else np.random
+        while True:
+            rand_vec: npt.NDArray[np.float64] = np_random.uniform(  # type: ignore
                 self._random_reset_space.low,
                 self._random_reset_space.high,
                 size=self._random_reset_space.low.size,
             ).astype(np.float64)
-            self._last_rand_vec = rand_vec
-            return rand_vec
+            if self.rand_vec_is_valid(rand_vec):
+                break
+        self._last_rand_vec = rand_vec
+        return rand_vec
+
+    @classmethod
+    def rand_vec_is_valid(cls, rand_vecs: npt.NDArray[np.float64]) -> Any:
+        """Checks `rand_vec`s against the env's `RAND_VEC_CONSTRAINTS`.
+
+        Args:
+            rand_vecs: A `rand_vec`, or an `(N, rand_vec size)` batch of them.
+
+        Returns:
+            Whether each of the `rand_vec`s is valid, as a bool or an `(N,)` array.
+        """
+        valid = np.ones(rand_vecs.shape[:-1], dtype=np.bool_)
+        for first, second, min_distance in cls.RAND_VEC_CONSTRAINTS:
+            first_pos = rand_vecs[..., first : first + 2]
+            second_pos = (
+                rand_vecs[..., second : second + 2]
+                if isinstance(second, int)
+                else np.asarray(second)
+            )
+            valid &= np.linalg.norm(first_pos - second_pos, axis=-1) >= min_distance
+        return valid[()]
+
+    def sample_rand_vecs(
+        self,
+        num: int,
+        np_random: np.random.Generator | np.random.RandomState | None = None,
+    ) -> npt.NDArray[np.float64]:
+        """Samples valid `rand_vec`s in batches, without resetting the env.
+
+        The candidates are drawn from `_random_reset_space` in a single call and the ones that don't satisfy
+        `RAND_VEC_CONSTRAINTS` are filtered out. Only the candidates up to the last valid one are consumed
+        from the RNG, so this returns the same vectors, and leaves the RNG in the same state, as `num` calls to
+        `_get_state_rand_vec()`.
+
+        Args:
+            num: The number of `rand_vec`s.
+            np_random: The RNG to draw the candidates from. Defaults to the one `reset()` uses: the env's
+                `np_random` if `seeded_rand_vec` is set, else the global numpy RNG.
+
+        Returns:
+            A `(num, rand_vec size)` array.
+        """
+        assert self._random_reset_space is not None
+        if np_random is None:
+            np_random = self.np_random if self.seeded_rand_vec else np.random  # type: ignore
+        low, high = self._random_reset_space.low, self._random_reset_space.high
+        batches: list[npt.NDArray[np.float64]] = []
+        while num > 0:
+            rng_state = _get_rng_state(np_random)
+            candidates = np_random.uniform(low, high, size=(2 * num + 16, low.size))
+            valid = np.flatnonzero(self.rand_vec_is_valid(candidates))
+            if len(valid) >= num:
+                # Redraw only the candidates up to the last valid one that is kept
+                _set_rng_state(np_random, rng_state)
+                candidates = np_random.uniform(
+                    low, high, size=(valid[num - 1] + 1, low.size)
+                )
+                valid = valid[:num]
+            batches.append(candidates[valid].astype(np.float64))
+            num -= len(valid)
+        return np.concatenate(batches) if batches else np.zeros((0, low.size))
 
     def _gripper_caging_reward(
         self,
@@ -856,3 +1434,155 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
             caging_and_gripping = (caging_and_gripping + float(reach)) / 2
 
         return caging_and_gripping
+
+    def _gripper_caging_reward_batch(
+        self,
+        actions: npt.NDArray[np.float64],
+        obj_pos: npt.NDArray[np.float64],
+        context: RewardContext,
+        tcp_center: npt.NDArray[np.float64],
+        pad_y: npt.NDArray[np.float64],
+        obj_radius: float,
+        pad_success_thresh: float,
+        object_reach_radius: float,
+        xz_thresh: float,
+        desired_gripper_effort: float = 1.0,
+        high_density: bool = False,
+        medium_density: bool = False,
+    ) -> npt.NDArray[np.float64]:
+        """Batched `_gripper_caging_reward()`, for `_compute_reward_batch()`.
+
+        Args:
+            actions: `(..., 4)` actions.
+            obj_pos: `(..., 3)` object positions.
+            context: The episode's `RewardContext`.
+            tcp_center: `(..., 3)` TCP positions.
+            pad_y: `(..., 2)` y positions of the left and right pads.
+            obj_radius: See `_gripper_caging_reward()`.
+            pad_success_thresh: See `_gripper_caging_reward()`.
+            object_reach_radius: See `_gripper_caging_reward()`.
+            xz_thresh: See `_gripper_caging_reward()`.
+            desired_gripper_effort: See `_gripper_caging_reward()`.
+            high_density: See `_gripper_caging_reward()`.
+            medium_density: See `_gripper_caging_reward()`.
+
+        Returns:
+            The `(...)` reward values.
+        """
+        if high_density and medium_density:
+            raise ValueError("Can only be either high_density or medium_density")
+        obj_init_pos = context["obj_init_pos"]
+        init_tcp = context["init_tcp"]
+
+        pad_to_obj_lr = np.abs(pad_y - obj_pos[..., 1:2])
+        pad_to_objinit_lr = np.abs(pad_y - obj_init_pos[..., 1:2])
+        caging_lr = reward_utils.tolerance_batch(
+            pad_to_obj_lr,
+            bounds=(obj_radius, pad_success_thresh),
+            margin=np.abs(pad_to_objinit_lr - pad_success_thresh),
+            sigmoid="long_tail",
+        )
+        caging_y = reward_utils.hamacher_product_batch(
+            caging_lr[..., 0], caging_lr[..., 1]
+        )
+
+        xz = [0, 2]
+        caging_xz_margin = np.linalg.norm(
+            obj_init_pos[..., xz] - init_tcp[..., xz], axis=-1
+        )
+        caging_xz = reward_utils.tolerance_batch(
+            np.linalg.norm(tcp_center[..., xz] - obj_pos[..., xz], axis=-1),
+            bounds=(0, xz_thresh),
+            margin=caging_xz_margin - xz_thresh,
+            sigmoid="long_tail",
+        )
+
+        gripper_closed = (
+            np.clip(actions[..., -1], 0, desired_gripper_effort)
+            / desired_gripper_effort
+        )
+
+        caging = reward_utils.hamacher_product_batch(caging_y, caging_xz)
+        gripping = np.where(caging > 0.97, gripper_closed, 0.0)
+        caging_and_gripping = reward_utils.hamacher_product_batch(caging, gripping)
+
+        if high_density:
+            caging_and_gripping = (caging_and_gripping + caging) / 2
+        if medium_density:
+            tcp_to_obj = np.linalg.norm(obj_pos - tcp_center, axis=-1)
+            tcp_to_obj_init = np.linalg.norm(obj_init_pos - init_tcp, axis=-1)
+            reach = reward_utils.tolerance_batch(
+                tcp_to_obj,
+                bounds=(0, object_reach_radius),
+                margin=np.abs(tcp_to_obj_init - object_reach_radius),
+                sigmoid="long_tail",
+            )
+            caging_and_gripping = (caging_and_gripping + reach) / 2
+
+        return caging_and_gripping
+
+
+def _get_rng_state(np_random: Any) -> Any:
+    """Gets the state of a `Generator`, a `RandomState` or the global numpy RNG (`np.random`)."""
+    if isinstance(np_random, np.random.Generator):
+        return np_random.bit_generator.state
+    return np_random.get_state()
+
+
+def _set_rng_state(np_random: Any, state: Any) -> None:
+    if isinstance(np_random, np.random.Generator):
+        np_random.bit_generator.state = state
+    else:
+        np_random.set_state(state)
+
+
+def get_physics_states(
+    envs: Sequence[SawyerXYZEnv], out: npt.NDArray[np.float64] | None = None
+) -> npt.NDArray[np.float64]:
+    """Gets the physics states of many envs of the same class, see `SawyerXYZEnv.get_physics_state()`.
+
+    Args:
+        envs: The envs.
+        out: An optional `(len(envs), physics_state_size)` array to write the states into.
+
+    Returns:
+        The physics states, one row per env.
+    """
+    state_size = _physics_state_size(envs)
+    if out is None:
+        out = np.empty((len(envs), state_size))
+    elif out.shape != (len(envs), state_size) or not out.flags.c_contiguous:
+        raise ValueError(
+            f"Expected a contiguous array of shape ({len(envs)}, {state_size}), got {out.shape}"
+        )
+    for env, state in zip(envs, out):
+        env.get_physics_state(out=state)
+    return out
+
+
+def set_physics_states(
+    envs: Sequence[SawyerXYZEnv], states: npt.NDArray[np.float64]
+) -> None:
+    """Sets the physics states returned by `get_physics_states()`.
+
+    Args:
+        envs: The envs, of the same class.
+        states: The physics states, one row per env.
+    """
+    state_size = _physics_state_size(envs)
+    if states.shape != (len(envs), state_size):
+        raise ValueError(
+            f"Expected states of shape ({len(envs)}, {state_size}), got {states.shape}"
+        )
+    for env, state in zip(envs, states):
+        env.set_physics_state(state)
+
+
+def _physics_state_size(envs: Sequence[SawyerXYZEnv]) -> int:
+    """The physics state size shared by a batch of envs, which must be of the same class."""
+    env_classes = {type(env) for env in envs}
+    if len(env_classes) > 1:
+        raise ValueError(
+            f"All envs must be of the same class, got {sorted(cls.__name__ for cls in env_classes)}"
+        )
+    return envs[0].physics_state_size if envs else 0
@@ -0,0 +1,290 @@
+"""A sequence of `Task`s stored as arrays of goals, with the `Task`s created on access."""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import itertools
+import pickle
+import struct
+from typing import Any, Iterable, NamedTuple, Sequence, Union, overload
+
+import numpy as np
+import numpy.typing as npt
+
+from metaworld.types import Task
+
+_TASK_DATA_HEADER = struct.Struct("<2sBBHH")
+"""The header of binary task data: magic, version, flags, env ID and `rand_vec` dimension.
+
+It's followed by the `rand_vec`, as float64s.
+"""
+
+_TASK_DATA_MAGIC = b"MW"
+_TASK_DATA_VERSION = 1
+_PARTIALLY_OBSERVABLE_FLAG = 1
+
+
+def encode_task_data(
+    env_id: int, rand_vec: npt.ArrayLike, partially_observable: bool
+) -> bytes:
+    """Encodes a task's data in the fixed-layout binary format read by `SawyerXYZEnv.set_task()`.
+
+    Args:
+        env_id: The `TASK_ENV_ID` of the environment class.
+        rand_vec: The goal.
+        partially_observable: Whether the goal is hidden from the observations.
+
+    Returns:
+        The task data, to be used as `Task.data`.
+    """
+    rand_vec = np.ascontiguousarray(rand_vec, dtype="<f8")
+    header = _TASK_DATA_HEADER.pack(
+        _TASK_DATA_MAGIC,
+        _TASK_DATA_VERSION,
+        _PARTIALLY_OBSERVABLE_FLAG if partially_observable else 0,
+        env_id,
+        len(rand_vec),
+    )
+    return header + rand_vec.tobytes()
+
+
+def decode_task_data(
+    data: bytes,
+) -> tuple[int, bool, npt.NDArray[np.float64]] | None:
+    """Decodes task data encoded by `encode_task_data()`.
+
+    Args:
+        data: The task data.
+
+    Returns:
+        The env ID, whether the task is partially observable and the (read-only, zero-copy) `rand_vec`,
+        or `None` if the data isn't in the binary format (e.g. pickled task data).
+    """
+    if data[:2] != _TASK_DATA_MAGIC:
+        return None
+    _, version, flags, env_id, rand_vec_dim = _TASK_DATA_HEADER.unpack_from(data)
+    if version != _TASK_DATA_VERSION:
+        raise ValueError(f"Unsupported task data version {version}.")
+    rand_vec = np.frombuffer(
+        data, dtype="<f8", count=rand_vec_dim, offset=_TASK_DATA_HEADER.size
+    )
+    return env_id, bool(flags & _PARTIALLY_OBSERVABLE_FLAG), rand_vec
+
+
+class _RandVecTasks(NamedTuple):
+    """The tasks of an environment that only differ by their `rand_vec`."""
+
+    env_name: str
+    data: dict[str, Any]  # The task data, with a `None` `rand_vec`
+    rand_vecs: npt.NDArray[np.float64]  # (num_tasks, rand_vec_dim)
+
+    def task(self, index: int) -> Task:
+        env_id = getattr(self.data["env_cls"], "TASK_ENV_ID", None)
+        if env_id is not None and self.data.keys() == _BINARY_TASK_DATA_KEYS:
+            data = encode_task_data(
+                env_id, self.rand_vecs[index], self.data["partially_observable"]
+            )
+            return Task(env_name=self.env_name, data=data)
+        # Task data with extra parameters, or of an environment without an ID
+        data = dict(self.data)
+        data["rand_vec"] = self.rand_vecs[index]
+        return Task(env_name=self.env_name, data=pickle.dumps(data))
+
+
+_BINARY_TASK_DATA_KEYS = {"env_cls", "rand_vec", "partially_observable"}
+
+
+_TaskGroup = Union[_RandVecTasks, Sequence[Task]]
+"""The tasks of a single environment."""
+
+
+class TaskSet(Sequence[Task]):
+    """An immutable sequence of tasks, stored as one `(num_tasks, rand_vec_dim)` array of goals per environment.
+
+    The `Task`s, and their binary data (see `encode_task_data()`), are only created when they're accessed, so a task set can hold
+    many thousands of goals per environment. A task set can also be a subset of another one (see `take()`,
+    `for_env()`), in which case the goals are shared. Tasks are identified by their index in the task set
+    they were taken from (see `indices`), which is what the task select wrappers store in their checkpoints.
+
+    Indexing a task set with an int returns a `Task`, and with a slice returns a list of `Task`s.
+    """
+
+    def __init__(
+        self,
+        groups: Sequence[_TaskGroup] = (),
+        indices: npt.ArrayLike | None = None,
+    ):
+        """Creates a task set.
+
+        Args:
+            groups: The tasks, in order. Either the goals of an environment, or a sequence of `Task`s of
+                an environment.
+            indices: The indices of the tasks of `groups` in this task set. Defaults to all of them.
+        """
+        self._groups = list(groups)
+        self._offsets = np.cumsum([0] + [_group_len(group) for group in self._groups])
+        self._offset_list: list[int] = self._offsets.tolist()
+        self._indices = (
+            np.arange(self._offsets[-1])
+            if indices is None
+            else np.asarray(indices, dtype=np.int64)
+        )
+        if len(self._indices) and not (
+            0 <= self._indices.min() and self._indices.max() < self._offsets[-1]
+        ):
+            raise IndexError("TaskSet indices out of range.")
+
+    @classmethod
+    def from_rand_vecs(
+        cls, env_name: str, data: dict[str, Any], rand_vecs: npt.ArrayLike
+    ) -> TaskSet:
+        """Creates the task set of an environment's goals.
+
+        Args:
+            env_name: The name of the environment.
+            data: The task data besides the goal, as passed to `SawyerXYZEnv.set_task()` in `Task.data`.
+            rand_vecs: A `(num_tasks, rand_vec_dim)` array of goals.
+
+        Returns:
+            The task set, with a task for each goal.
+        """
+        data = dict(data)
+        data["rand_vec"] = None
+        return cls(
+            [_RandVecTasks(env_name, data, np.asarray(rand_vecs, dtype=np.float64))]
+        )
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[Task]) -> TaskSet:
+        """Creates a task set from `Task`s, which are kept as they are."""
+        return cls(
+            [
+                list(env_tasks)
+                for _, env_tasks in itertools.groupby(tasks, lambda task: task.env_name)
+            ]
+        )
+
+    @classmethod
+    def concatenate(cls, task_sets: Iterable[TaskSet]) -> TaskSet:
+        """Concatenates task sets, whose goals are shared with the new task set."""
+        groups: list[_TaskGroup] = []
+        indices = []
+        for task_set in task_sets:
+            indices.append(task_set._indices + sum(map(_group_len, groups)))
+            groups.extend(task_set._groups)
+        return cls(groups, np.concatenate(indices) if indices else None)
+
+    @property
+    def indices(self) -> npt.NDArray[np.int64]:
+        """The indices of the tasks in the task set they were taken from."""
+        return self._indices.copy()
+
+    @property
+    def env_names(self) -> list[str]:
+        """The names of the environments of the tasks, in order of first appearance."""
+        group_ids = self._group_ids(self._indices)
+        _, first = np.unique(group_ids, return_index=True)
+        return list(
+            dict.fromkeys(_env_name(self._groups[group_ids[i]]) for i in np.sort(first))
+        )
+
+    @property
+    def source(self) -> TaskSet:
+        """All the tasks of the task set this one was taken from, which `indices` index."""
+        return TaskSet(self._groups)
+
+    def fingerprint(self) -> str:
+        """Returns a digest of the tasks of `source`, identifying task sets taken from the same tasks."""
+        digest = hashlib.sha1()
+        for group in self._groups:
+            digest.update(_env_name(group).encode())
+            if isinstance(group, _RandVecTasks):
+                digest.update(pickle.dumps(sorted(group.data.items())))
+                digest.update(np.ascontiguousarray(group.rand_vecs).tobytes())
+            else:
+                for task in group:
+                    digest.update(task.data)
+        return digest.hexdigest()
+
+    def with_indices(self, indices: npt.ArrayLike) -> TaskSet:
+        """Returns the tasks with the given `indices` in the task set this one was taken from."""
+        return TaskSet(self._groups, indices)
+
+    def take(self, indices: npt.ArrayLike | slice) -> TaskSet:
+        """Returns a subset of the tasks, by their index in this task set."""
+        return self.with_indices(self._indices[indices])
+
+    def for_env(self, env_name: str) -> TaskSet:
+        """Returns the tasks of an environment.
+
+        The returned task set only keeps the goals of that environment, so it's cheap to send to a worker
+        process.
+        """
+        group_ids = self._group_ids(self._indices)
+        keep = [
+            i for i, group in enumerate(self._groups) if _env_name(group) == env_name
+        ]
+        mask = np.isin(group_ids, keep)
+        new_offsets = np.zeros(len(self._groups), dtype=np.int64)
+        new_offsets[keep] = np.cumsum(
+            [0] + [_group_len(self._groups[i]) for i in keep]
+        )[:-1]
+        indices = self._indices[mask]
+        group_ids = group_ids[mask]
+        return TaskSet(
+            [self._groups[i] for i in keep],
+            indices - self._offsets[group_ids] + new_offsets[group_ids],
+        )
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    @overload
+    def __getitem__(self, index: int) -> Task:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Task]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> Task | list[Task]:
+        if isinstance(index, slice):
+            return [self._task(i) for i in self._indices[index]]
+        return self._task(int(self._indices[index]))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TaskSet):
+            return len(self) == len(other) and all(
+                task == other_task for task, other_task in zip(self, other)
+            )
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(num_tasks={len(self)})"
+
+    def _group_ids(self, indices: npt.NDArray[np.int64]) -> npt.NDArray[np.int64]:
+        return np.searchsorted(self._offsets, indices, side="right") - 1
+
+    def _task(self, index: int) -> Task:
+        offsets = self._offset_list
+        group_id = bisect.bisect_right(offsets, index) - 1
+        group = self._groups[group_id]
+        local_index = index - offsets[group_id]
+        if isinstance(group, _RandVecTasks):
+            return group.task(local_index)
+        return group[local_index]
+
+
+def _group_len(group: _TaskGroup) -> int:
+    if isinstance(group, _RandVecTasks):
+        return len(group.rand_vecs)
+    return len(group)
+
+
+def _env_name(group: _TaskGroup) -> str:
+    if isinstance(group, _RandVecTasks):
+        return group.env_name
+    return group[0].env_name
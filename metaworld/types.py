@@ -21,18 +21,54 @@ XYZ: TypeAlias = "Tuple[float, float, float]"
 """A 3D coordinate."""
 
 
+class RandVecMinDistance(NamedTuple):
+    """Requires two xy positions of an env's `rand_vec` to be at least `min_distance` apart.
+
+    See `SawyerXYZEnv.RAND_VEC_CONSTRAINTS`.
+    """
+
+    first: int  # The index of the first position's x in the `rand_vec`
+    second: int | Tuple[
+        float, float
+    ]  # The index of the second position's x, or a fixed xy position
+    min_distance: float
+
+
 class EnvironmentStateDict(TypedDict):
     state: dict[str, Any]
     mjb: str
     mocap: tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]
 
 
+class EnvSnapshot(NamedTuple):
+    """The dynamic state of an env, see `SawyerXYZEnv.snapshot()`."""
+
+    env_cls: type
+    data: dict[str, npt.NDArray[np.float64]]  # The simulation state
+    model: dict[str, npt.NDArray[np.float64]]  # The body and site poses set on reset
+    attributes: dict[str, Any]  # The env's scalar and array attributes
+    rng_state: dict[str, Any] | None
+
+
 class ObservationDict(TypedDict):
     state_observation: npt.NDArray[np.float64]
     state_desired_goal: npt.NDArray[np.float64]
     state_achieved_goal: npt.NDArray[np.float64]
 
 
+class RewardContext(TypedDict):
+    """The per-episode values the V3 reward functions depend on besides the observations and actions.
+
+    See `SawyerXYZEnv.get_reward_context()`.
+    """
+
+    hand_init_pos: npt.NDArray[np.float64]
+    init_tcp: npt.NDArray[np.float64]
+    obj_init_pos: npt.NDArray[np.float64]
+    target_pos: npt.NDArray[np.float64]
+    extra: dict[str, npt.NDArray[np.float64]]
+
+
 class InitConfigDict(TypedDict):
     obj_init_angle: NotRequired[float]
     obj_init_pos: npt.NDArray[Any]
@@ -242,3 +242,110 @@ def hamacher_product(a: float, b: float) -> float:
 
     assert 0.0 <= h_prod <= 1.0
     return h_prod
+
+
+# Batched versions of the functions above, which take `(N,)` arrays (or anything broadcastable
+# to them) for every numeric argument and avoid any per-element Python branching.
+
+
+def tolerance_batch(
+    x: npt.ArrayLike,
+    bounds: tuple[npt.ArrayLike, npt.ArrayLike] = (0.0, 0.0),
+    margin: npt.ArrayLike = 0.0,
+    sigmoid: SIGMOID_TYPE = "gaussian",
+    value_at_margin: float = _DEFAULT_VALUE_AT_MARGIN,
+) -> npt.NDArray[np.float64]:
+    """Batched `tolerance()`, where `bounds` and `margin` can also vary per element.
+
+    Args:
+        x: The inputs.
+        bounds: Inclusive `(lower, upper)` bounds for the target interval, either floats or arrays.
+        margin: The margins, either a float or an array. Elements with a margin of 0 are
+        0 outside of their bounds.
+        sigmoid: Choice of sigmoid type. Valid values are 'gaussian', 'hyperbolic',
+        'long_tail', 'reciprocal', 'cosine', 'linear', 'quadratic', 'tanh_squared'.
+        value_at_margin: A value between 0 and 1 specifying the output when
+        the distance from `x` to the nearest bound is equal to `margin`.
+
+    Returns:
+        A float64 array with values between 0.0 and 1.0, equal to `tolerance()` applied to each element.
+
+    Raises:
+        ValueError: If any lower bound is greater than its upper bound.
+        ValueError: If any margin is negative.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    lower = np.asarray(bounds[0], dtype=np.float64)
+    upper = np.asarray(bounds[1], dtype=np.float64)
+    margin = np.asarray(margin, dtype=np.float64)
+    if np.any(lower > upper):
+        raise ValueError("Lower bound must be <= upper bound.")
+    if np.any(margin < 0):
+        raise ValueError(f"`margin` must be non-negative. Current value: {margin}")
+
+    in_bounds = np.logical_and(lower <= x, x <= upper)
+    distance = np.where(x < lower, lower - x, x - upper)
+    has_margin = margin > 0
+    d = np.divide(
+        distance,
+        margin,
+        out=np.zeros(np.broadcast_shapes(distance.shape, margin.shape)),
+        where=has_margin,
+    )
+    outside = np.where(has_margin, _sigmoids(d, value_at_margin, sigmoid), 0.0)
+    return np.where(in_bounds, 1.0, outside)
+
+
+def rect_prism_tolerance_batch(
+    curr: npt.ArrayLike,
+    zero: npt.ArrayLike,
+    one: npt.ArrayLike,
+) -> npt.NDArray[np.float64]:
+    """Batched `rect_prism_tolerance()`.
+
+    Args:
+        curr: `(N, 3)` points that the prism reward region is being applied for.
+        zero: `(3,)` or `(N, 3)` diagonal opposite corners of the prism with reward 0.
+        one: `(3,)` or `(N, 3)` corners of the prism with reward 1.
+
+    Returns:
+        An `(N,)` array, equal to `rect_prism_tolerance()` applied to each point.
+    """
+    curr = np.asarray(curr, dtype=np.float64)
+    zero = np.asarray(zero, dtype=np.float64)
+    one = np.asarray(one, dtype=np.float64)
+    in_prism = np.all(
+        (np.minimum(zero, one) <= curr) & (curr <= np.maximum(zero, one)), axis=-1
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = (curr - zero) / (one - zero)
+    return np.where(in_prism, scale[..., 0] * scale[..., 1] * scale[..., 2], 1.0)
+
+
+def hamacher_product_batch(
+    a: npt.ArrayLike, b: npt.ArrayLike
+) -> npt.NDArray[np.float64]:
+    """Batched `hamacher_product()`.
+
+    Args:
+        a: 1st terms of the hamacher product.
+        b: 2nd terms of the hamacher product.
+
+    Returns:
+        The element-wise hammacher products of a and b.
+
+    Raises:
+        ValueError: a and b must range between 0 and 1
+    """
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    if not (np.all((0.0 <= a) & (a <= 1.0)) and np.all((0.0 <= b) & (b <= 1.0))):
+        raise ValueError("a and b must range between 0 and 1")
+
+    denominator = a + b - (a * b)
+    return np.divide(
+        a * b,
+        denominator,
+        out=np.zeros(np.broadcast_shapes(a.shape, b.shape)),
+        where=denominator > 0,
+    )
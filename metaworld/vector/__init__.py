@@ -0,0 +1,14 @@
+"""Metaworld-specific vector environments."""
+
+from metaworld.vector.checkpoint import pack_checkpoints, unpack_checkpoints
+from metaworld.vector.native import NativeVectorEnv
+from metaworld.vector.shared_memory import SharedMemoryVectorEnv
+from metaworld.vector.threaded import ThreadedVectorEnv
+
+__all__ = [
+    "NativeVectorEnv",
+    "SharedMemoryVectorEnv",
+    "ThreadedVectorEnv",
+    "pack_checkpoints",
+    "unpack_checkpoints",
+]
@@ -0,0 +1,63 @@
+"""Checkpoints of vector environments, which store the tasks shared by their sub-environments once."""
+
+from __future__ import annotations
+
+from typing import Any, Sequence
+
+from metaworld.task_set import TaskSet
+
+CHECKPOINT_VERSION = 1
+"""The version of the vector environment checkpoint format."""
+
+
+def pack_checkpoints(env_ckpts: Sequence[tuple[str, dict]]) -> dict[str, Any]:
+    """Packs the checkpoints of the sub-environments of a vector env into a single checkpoint.
+
+    The sub-environments' checkpoints are taken with `CheckpointWrapper.get_checkpoint(tasks=True)`. Their
+    task sets are moved to a task bank, which stores each distinct task set once, so the checkpoint of
+    each sub-environment only keeps what's specific to it (task indices, RNG states...).
+
+    Args:
+        env_ckpts: The `(env_id, checkpoint)` of each sub-environment.
+
+    Returns:
+        The vector env checkpoint.
+    """
+    task_bank: dict[str, TaskSet] = {}
+    envs = []
+    for env_id, ckpt in env_ckpts:
+        ckpt = dict(ckpt)
+        task_set = ckpt.pop("task_set", None)
+        if task_set is not None:
+            key = task_set.fingerprint()
+            task_bank.setdefault(key, task_set)
+            ckpt["task_set_key"] = key
+        envs.append((env_id, ckpt))
+    return {"version": CHECKPOINT_VERSION, "task_bank": task_bank, "envs": envs}
+
+
+def unpack_checkpoints(ckpt: dict[str, Any], num_envs: int) -> list[tuple[str, dict]]:
+    """Unpacks a vector env checkpoint created by `pack_checkpoints()`.
+
+    Args:
+        ckpt: The vector env checkpoint.
+        num_envs: The number of sub-environments of the vector env it's loaded into.
+
+    Returns:
+        The `(env_id, checkpoint)` of each sub-environment, to be loaded with `CheckpointWrapper.load_checkpoint()`.
+    """
+    if ckpt.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(
+            f"Unsupported checkpoint version {ckpt.get('version')}, expected {CHECKPOINT_VERSION}."
+        )
+    if len(ckpt["envs"]) != num_envs:
+        raise ValueError(
+            f"The checkpoint has {len(ckpt['envs'])} sub-environments, expected {num_envs}."
+        )
+    env_ckpts = []
+    for env_id, env_ckpt in ckpt["envs"]:
+        if "task_set_key" in env_ckpt:
+            env_ckpt = dict(env_ckpt)
+            env_ckpt["task_set"] = ckpt["task_bank"][env_ckpt.pop("task_set_key")]
+        env_ckpts.append((env_id, env_ckpt))
+    return env_ckpts
@@ -0,0 +1,506 @@
+"""A vector environment that steps Metaworld sub-environments natively, without going through their wrappers."""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Sequence
+
+import gymnasium as gym
+import numpy as np
+import numpy.typing as npt
+from gymnasium.vector import AutoresetMode
+from gymnasium.vector.utils import batch_space
+
+from metaworld.sawyer_xyz_env import SawyerXYZEnv
+from metaworld.vector.checkpoint import pack_checkpoints, unpack_checkpoints
+from metaworld.wrappers import (
+    AutoTerminateOnSuccessWrapper,
+    CheckpointWrapper,
+    OneHotWrapper,
+    PseudoRandomTaskSelectWrapper,
+    RandomTaskSelectWrapper,
+    RNNBasedMetaRLWrapper,
+)
+
+INFO_KEYS = (
+    "success",
+    "near_object",
+    "grasp_success",
+    "grasp_reward",
+    "in_place_reward",
+    "obj_to_target",
+    "unscaled_reward",
+)
+"""The keys of the info dict returned by every Metaworld environment's `step()`."""
+
+_CONTROL_WRAPPERS = (
+    RandomTaskSelectWrapper,
+    PseudoRandomTaskSelectWrapper,
+    CheckpointWrapper,
+)
+"""Wrappers that don't change `step()` and are only used through `reset()`, `call()` and `get_attr()`."""
+
+
+class _SubEnvSpec:
+    """What the wrapper stack of a single sub-environment does to `step()`, flattened."""
+
+    def __init__(self, env: gym.Env):
+        self.max_episode_steps: int | None = None
+        self.auto_terminate: AutoTerminateOnSuccessWrapper | None = None
+        self.one_hot: npt.NDArray[np.float64] | None = None
+        self.recurrent_info: bool = False
+        self.normalize_recurrent_reward: bool = True
+        self.episode_statistics: gym.wrappers.RecordEpisodeStatistics | None = None
+
+        while isinstance(env, gym.Wrapper):
+            if isinstance(env, gym.wrappers.TimeLimit):
+                self.max_episode_steps = env._max_episode_steps
+            elif isinstance(env, AutoTerminateOnSuccessWrapper):
+                self.auto_terminate = env
+            elif isinstance(env, OneHotWrapper):
+                self.one_hot = env.one_hot
+            elif isinstance(env, RNNBasedMetaRLWrapper):
+                self.recurrent_info = True
+                self.normalize_recurrent_reward = env._normalize_reward
+            elif isinstance(env, gym.wrappers.RecordEpisodeStatistics):
+                self.episode_statistics = env
+            elif not isinstance(env, _CONTROL_WRAPPERS):
+                raise ValueError(
+                    f"{type(env).__name__} is not supported by NativeVectorEnv, use `vector_strategy='sync'` instead."
+                )
+            env = env.env
+
+        if not isinstance(env, SawyerXYZEnv):
+            raise ValueError(
+                f"NativeVectorEnv only supports Metaworld environments, got {type(env).__name__}."
+            )
+        self.env: SawyerXYZEnv = env
+
+    def layout(self) -> tuple[Any, ...]:
+        return (
+            self.max_episode_steps is not None,
+            self.auto_terminate is not None,
+            None if self.one_hot is None else len(self.one_hot),
+            self.recurrent_info,
+            self.episode_statistics is not None,
+        )
+
+
+class NativeVectorEnv(gym.vector.VectorEnv):
+    """Vectorized environment that steps all Metaworld sub-environments in the calling process.
+
+    Takes the same `env_fns` as `gymnasium.vector.SyncVectorEnv`, but only uses the wrapped
+    environments for `reset()`, `call()`, `get_attr()` and `set_attr()`. `step()` goes straight to
+    the underlying `SawyerXYZEnv`s and reproduces what the Metaworld wrapper stack
+    (`TimeLimit`, `AutoTerminateOnSuccessWrapper`, `OneHotWrapper`, `RNNBasedMetaRLWrapper`,
+    `RecordEpisodeStatistics`) does to the step outputs with batched array operations,
+    writing into preallocated buffers instead of merging per-env info dicts.
+
+    Every value in the returned info dict is stored as a `float64` array.
+    """
+
+    def __init__(
+        self,
+        env_fns: Sequence[Callable[[], gym.Env]],
+        copy: bool = True,
+        autoreset_mode: str | AutoresetMode = AutoresetMode.NEXT_STEP,
+    ):
+        super().__init__()
+        self.env_fns = env_fns
+        self.copy = copy
+        self.autoreset_mode = (
+            autoreset_mode
+            if isinstance(autoreset_mode, AutoresetMode)
+            else AutoresetMode(autoreset_mode)
+        )
+
+        self.envs = [env_fn() for env_fn in env_fns]
+        self.num_envs = len(self.envs)
+        self.metadata = dict(self.envs[0].metadata)
+        self.metadata["autoreset_mode"] = self.autoreset_mode
+        self.render_mode = self.envs[0].render_mode
+
+        self.single_action_space = self.envs[0].action_space
+        self.action_space = batch_space(self.single_action_space, self.num_envs)
+        self.single_observation_space = self.envs[0].observation_space
+        self.observation_space = batch_space(
+            self.single_observation_space, self.num_envs
+        )
+        for env in self.envs:
+            if env.observation_space != self.single_observation_space:
+                raise RuntimeError(
+                    "NativeVectorEnv requires all sub-environments to have the same observation space."
+                )
+            if env.action_space != self.single_action_space:
+                raise RuntimeError(
+                    "NativeVectorEnv requires all sub-environments to have the same action space."
+                )
+
+        self._specs = [_SubEnvSpec(env) for env in self.envs]
+        if len({spec.layout() for spec in self._specs}) != 1:
+            raise ValueError(
+                "NativeVectorEnv requires all sub-environments to be wrapped the same way."
+            )
+        self._base_envs = [spec.env for spec in self._specs]
+        spec = self._specs[0]
+
+        self._mocap_low = np.stack([env.mocap_low for env in self._base_envs])
+        self._mocap_high = np.stack([env.mocap_high for env in self._base_envs])
+        self._action_scale = np.array(
+            [[env.action_scale] for env in self._base_envs], dtype=np.float64
+        )
+        self._mocap_pos = np.zeros((self.num_envs, 3), dtype=np.float64)
+        self._mocap_quat = np.array([1, 0, 1, 0])
+
+        self._max_episode_steps = (
+            np.array([s.max_episode_steps for s in self._specs], dtype=np.int64)
+            if spec.max_episode_steps is not None
+            else None
+        )
+        self._use_auto_terminate = spec.auto_terminate is not None
+        self._record_statistics = spec.episode_statistics is not None
+        self._recurrent_info = spec.recurrent_info
+
+        # Observation layout: [base obs | one hot | action | reward | done]
+        obs_dim = int(np.prod(self.single_observation_space.shape))
+        self._base_obs_dim = int(
+            np.prod(self._base_envs[0].sawyer_observation_space.shape)
+        )
+        # Sub-env observations are float64, the batched ones use the dtype of the observation space
+        self._env_obs = np.zeros((self.num_envs, obs_dim), dtype=np.float64)
+        self._observations = np.zeros(
+            (self.num_envs, obs_dim), dtype=self.single_observation_space.dtype
+        )
+        offset = self._base_obs_dim
+        if spec.one_hot is not None:
+            num_tasks = len(spec.one_hot)
+            for i, s in enumerate(self._specs):
+                self._env_obs[i, offset : offset + num_tasks] = s.one_hot
+            offset += num_tasks
+        if self._recurrent_info:
+            action_dim = int(np.prod(self.single_action_space.shape))
+            self._action_slice = slice(offset, offset + action_dim)
+            self._reward_index = offset + action_dim
+            self._done_index = offset + action_dim + 1
+            self._reward_obs_divisor = np.array(
+                [10.0 if s.normalize_recurrent_reward else 1.0 for s in self._specs]
+            )
+
+        self._rewards = np.zeros((self.num_envs,), dtype=np.float64)
+        self._terminations = np.zeros((self.num_envs,), dtype=np.bool_)
+        self._truncations = np.zeros((self.num_envs,), dtype=np.bool_)
+        self._infos = np.zeros((len(INFO_KEYS), self.num_envs), dtype=np.float64)
+        self._autoreset_envs = np.zeros((self.num_envs,), dtype=np.bool_)
+
+        self._elapsed_steps = np.zeros((self.num_envs,), dtype=np.int64)
+        self._episode_returns = np.zeros((self.num_envs,), dtype=np.float64)
+        self._episode_start_times = np.zeros((self.num_envs,), dtype=np.float64)
+
+    def reset(
+        self,
+        *,
+        seed: int | list[int | None] | None = None,
+        options: dict[str, Any] | None = None,
+    ) -> tuple[npt.NDArray[Any], dict[str, Any]]:
+        """Resets the sub-environments through their wrapper stacks.
+
+        Args:
+            seed: Either `None`, an int (seeds become `[seed, seed + 1, ...]`) or a list of seeds.
+            options: Passed to each sub-environment's `reset()`. A `reset_mask` boolean array
+                can be passed to only reset some of the sub-environments.
+
+        Returns:
+            The batched `(obs, info)` tuple.
+        """
+        if seed is None:
+            seed = [None for _ in range(self.num_envs)]
+        elif isinstance(seed, int):
+            seed = [seed + i for i in range(self.num_envs)]
+        if len(seed) != self.num_envs:
+            raise ValueError(
+                f"If seeds are passed as a list the length must match num_envs={self.num_envs} but got length={len(seed)}."
+            )
+
+        reset_mask = np.ones((self.num_envs,), dtype=np.bool_)
+        if options is not None and "reset_mask" in options:
+            options = dict(options)
+            reset_mask = options.pop("reset_mask")
+            if not (
+                isinstance(reset_mask, np.ndarray)
+                and reset_mask.shape == (self.num_envs,)
+                and reset_mask.dtype == np.bool_
+            ):
+                raise ValueError(
+                    f"`options['reset_mask']` must be a boolean array of shape ({self.num_envs},)"
+                )
+
+        infos: dict[str, Any] = {}
+        for i in np.flatnonzero(reset_mask):
+            infos = self._reset_env(i, infos, seed=seed[i], options=options)
+        self._terminations[reset_mask] = False
+        self._truncations[reset_mask] = False
+        self._autoreset_envs[reset_mask] = False
+
+        return self._get_observations(), infos
+
+    def _reset_env(
+        self, i: int, infos: dict[str, Any], **reset_kwargs: Any
+    ) -> dict[str, Any]:
+        obs, info = self.envs[i].reset(**reset_kwargs)
+        self._env_obs[i] = obs
+        self._elapsed_steps[i] = 0
+        self._episode_returns[i] = 0.0
+        self._episode_start_times[i] = time.perf_counter()
+        return self._add_info(infos, info, i)
+
+    def step(
+        self, actions: npt.NDArray[Any]
+    ) -> tuple[
+        npt.NDArray[Any],
+        npt.NDArray[np.float64],
+        npt.NDArray[np.bool_],
+        npt.NDArray[np.bool_],
+        dict[str, Any],
+    ]:
+        """Steps all of the sub-environments.
+
+        Args:
+            actions: A `(num_envs, 4)` array of actions.
+
+        Returns:
+            The batched `(obs, reward, terminated, truncated, info)` tuple.
+        """
+        if self.autoreset_mode == AutoresetMode.NEXT_STEP:
+            step_mask = ~self._autoreset_envs
+        else:
+            assert not (
+                self.autoreset_mode == AutoresetMode.DISABLED
+                and self._autoreset_envs.any()
+            ), f"{self._autoreset_envs=}"
+            step_mask = np.ones((self.num_envs,), dtype=np.bool_)
+        step_ids = np.flatnonzero(step_mask)
+
+        self._step_envs(actions, step_ids)
+        if self._recurrent_info:
+            self._env_obs[step_ids, self._action_slice] = actions[step_ids]
+
+        infos: dict[str, Any] = {}
+        dones = np.logical_or(self._terminations, self._truncations) & step_mask
+        if self._record_statistics and dones.any():
+            self._record_episode_statistics(dones, infos)
+
+        if self.autoreset_mode == AutoresetMode.NEXT_STEP:
+            for i in np.flatnonzero(self._autoreset_envs):
+                self._rewards[i] = 0.0
+                self._terminations[i] = False
+                self._truncations[i] = False
+                infos = self._reset_env(i, infos)
+        elif self.autoreset_mode == AutoresetMode.SAME_STEP and dones.any():
+            final_obs = np.full(self.num_envs, fill_value=None, dtype=object)
+            for i in np.flatnonzero(dones):
+                final_obs[i] = self._env_obs[i].copy()
+            final_info = self._step_info(dones)
+            if "episode" in infos:
+                final_info["episode"] = infos.pop("episode")
+                final_info["_episode"] = infos.pop("_episode")
+            infos["final_obs"], infos["_final_obs"] = final_obs, dones.copy()
+            infos["final_info"], infos["_final_info"] = final_info, dones.copy()
+            for i in np.flatnonzero(dones):
+                infos = self._reset_env(i, infos)
+            step_mask = step_mask & ~dones
+
+        infos.update(self._step_info(step_mask))
+        self._autoreset_envs = np.logical_or(self._terminations, self._truncations)
+
+        return (
+            self._get_observations(),
+            np.copy(self._rewards),
+            np.copy(self._terminations),
+            np.copy(self._truncations),
+            infos,
+        )
+
+    def _step_envs(self, actions: npt.NDArray[Any], step_ids: npt.NDArray[Any]) -> None:
+        """Runs `SawyerXYZEnv.step()` for the given sub-environments and writes the results to the buffers."""
+        envs = self._base_envs
+        for i in step_ids:
+            if not envs[i]._set_task_called:
+                raise RuntimeError("You must call env.set_task before using env.step")
+            self._mocap_pos[i] = envs[i].data.mocap_pos[0]
+
+        # Same operations as `SawyerXYZEnv.set_xyz_action()`, for all envs at once
+        pos_delta = np.clip(actions[:, :3], -1, 1) * self._action_scale.astype(
+            actions.dtype, copy=False
+        )
+        new_mocap_pos = np.clip(
+            self._mocap_pos + pos_delta, self._mocap_low, self._mocap_high
+        )
+        for i in step_ids:
+            data = envs[i].data
+            data.mocap_pos[0] = new_mocap_pos[i]
+            data.mocap_quat = self._mocap_quat
+        self._step_physics(actions, step_ids)
+
+        base_obs = self._env_obs[:, : self._base_obs_dim]
+        for i in step_ids:
+            (
+                base_obs[i],
+                self._rewards[i],
+                self._terminations[i],
+                self._truncations[i],
+                info,
+            ) = envs[i]._step_evaluate(actions[i])
+            for k, key in enumerate(INFO_KEYS):
+                self._infos[k, i] = info[key]
+
+        self._elapsed_steps[step_ids] += 1
+        if self._max_episode_steps is not None:
+            self._truncations[step_ids] |= (
+                self._elapsed_steps[step_ids] >= self._max_episode_steps[step_ids]
+            )
+        if self._use_auto_terminate:
+            for i in step_ids:
+                if self._specs[i].auto_terminate.terminate_on_success:  # type: ignore[union-attr]
+                    self._terminations[i] = self._infos[0, i] == 1.0
+        if self._recurrent_info:
+            self._env_obs[step_ids, self._reward_index] = (
+                self._rewards[step_ids] / self._reward_obs_divisor[step_ids]
+            )
+            self._env_obs[step_ids, self._done_index] = np.logical_or(
+                self._terminations[step_ids], self._truncations[step_ids]
+            )
+        self._episode_returns[step_ids] += self._rewards[step_ids]
+
+    def _step_physics(
+        self, actions: npt.NDArray[Any], step_ids: npt.NDArray[Any]
+    ) -> None:
+        """Runs `SawyerXYZEnv._step_physics()` for the given sub-environments, once their mocap targets are set."""
+        for i in step_ids:
+            self._base_envs[i]._step_physics(actions[i])
+
+    def _step_info(self, mask: npt.NDArray[np.bool_]) -> dict[str, Any]:
+        info: dict[str, Any] = {}
+        for k, key in enumerate(INFO_KEYS):
+            info[key] = np.where(mask, self._infos[k], 0.0)
+            info[f"_{key}"] = mask.copy()
+        return info
+
+    def _record_episode_statistics(
+        self, dones: npt.NDArray[np.bool_], infos: dict[str, Any]
+    ) -> None:
+        now = time.perf_counter()
+        episode = {
+            "r": np.where(dones, self._episode_returns, 0.0),
+            "l": np.where(dones, self._elapsed_steps, 0),
+            "t": np.where(dones, np.round(now - self._episode_start_times, 6), 0.0),
+            "_r": dones.copy(),
+            "_l": dones.copy(),
+            "_t": dones.copy(),
+        }
+        for i in np.flatnonzero(dones):
+            # Keep the statistics of the (bypassed) wrappers up to date
+            wrapper = self._specs[i].episode_statistics
+            assert wrapper is not None
+            wrapper.time_queue.append(float(episode["t"][i]))
+            wrapper.return_queue.append(float(episode["r"][i]))
+            wrapper.length_queue.append(int(episode["l"][i]))
+            wrapper.episode_count += 1
+        infos["episode"], infos["_episode"] = episode, dones.copy()
+
+    def _get_observations(self) -> npt.NDArray[Any]:
+        if self.copy:
+            return self._env_obs.astype(self._observations.dtype)
+        np.copyto(self._observations, self._env_obs)
+        return self._observations
+
+    def render(self) -> tuple[Any, ...]:
+        """Returns the rendered frames from the sub-environments."""
+        return tuple(env.render() for env in self.envs)
+
+    def call(self, name: str, *args: Any, **kwargs: Any) -> tuple[Any, ...]:
+        """Calls a method (or gets an attribute) of each wrapped sub-environment.
+
+        Args:
+            name: The method name.
+            *args: The method args.
+            **kwargs: The method kwargs.
+
+        Returns:
+            Tuple of results.
+        """
+        results = []
+        for env in self.envs:
+            function = env.get_wrapper_attr(name)
+            if callable(function):
+                results.append(function(*args, **kwargs))
+            else:
+                results.append(function)
+        return tuple(results)
+
+    def get_attr(self, name: str) -> tuple[Any, ...]:
+        """Gets an attribute from each wrapped sub-environment.
+
+        Args:
+            name: The attribute name.
+
+        Returns:
+            Tuple of the attribute values.
+        """
+        return self.call(name)
+
+    def set_attr(self, name: str, values: list[Any] | tuple[Any, ...] | Any) -> None:
+        """Sets an attribute of the wrapped sub-environments.
+
+        Args:
+            name: The attribute name.
+            values: Either a single value for all sub-environments, or one value per sub-environment.
+        """
+        if not isinstance(values, (list, tuple)):
+            values = [values for _ in range(self.num_envs)]
+        if len(values) != self.num_envs:
+            raise ValueError(
+                f"Values must be a list or tuple with length equal to the number of environments. Got `{len(values)}` values for {self.num_envs} environments."
+            )
+        for env, value in zip(self.envs, values):
+            env.set_wrapper_attr(name, value)
+
+    def get_checkpoint(self, physics: bool = False) -> dict[str, Any]:
+        """Returns the checkpoint of all the sub-environments, see `metaworld.vector.pack_checkpoints()`.
+
+        Args:
+            physics: Whether to include the state of the current episodes (the sub-environments' snapshots,
+                their last observations and whether they're autoresetting), so that loading the checkpoint
+                resumes them. The episode statistics aren't restored.
+
+        Returns:
+            The checkpoint.
+        """
+        ckpt = pack_checkpoints(
+            [
+                env.get_wrapper_attr("get_checkpoint")(tasks=True, physics=physics)
+                for env in self.envs
+            ]
+        )
+        if physics:
+            ckpt["observations"] = self._env_obs.copy()
+            ckpt["autoreset"] = self._autoreset_envs.copy()
+        return ckpt
+
+    def load_checkpoint(self, ckpt: dict[str, Any]) -> None:
+        """Loads a checkpoint returned by `get_checkpoint()`.
+
+        Args:
+            ckpt: The checkpoint.
+        """
+        for env, env_ckpt in zip(self.envs, unpack_checkpoints(ckpt, self.num_envs)):
+            env.get_wrapper_attr("load_checkpoint")([env_ckpt])
+        if "observations" in ckpt:
+            self._env_obs[:] = ckpt["observations"]
+            self._autoreset_envs[:] = ckpt["autoreset"]
+            self._elapsed_steps[:] = [env.curr_path_length for env in self._base_envs]
+
+    def close_extras(self, **kwargs: Any) -> None:
+        """Closes the sub-environments."""
+        if hasattr(self, "envs"):
+            for env in self.envs:
+                env.close()
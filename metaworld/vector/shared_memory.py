@@ -0,0 +1,926 @@
+"""A multiprocess vector environment that returns step results through shared memory instead of pipes."""
+
+from __future__ import annotations
+
+import multiprocessing
+import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.connection import Connection, wait
+from typing import Any, Callable, Sequence
+
+import gymnasium as gym
+import numpy as np
+import numpy.typing as npt
+from gymnasium.error import (
+    AlreadyPendingCallError,
+    ClosedEnvironmentError,
+    NoAsyncCallError,
+)
+from gymnasium.vector import AutoresetMode
+from gymnasium.vector.async_vector_env import AsyncState
+from gymnasium.vector.utils import CloudpickleWrapper, batch_space, clear_mpi_env_vars
+
+from metaworld.vector.checkpoint import pack_checkpoints, unpack_checkpoints
+from metaworld.vector.native import INFO_KEYS
+
+EPISODE_KEYS = ("r", "l", "t")
+"""The keys of the `episode` info added by `gymnasium.wrappers.RecordEpisodeStatistics`."""
+
+INFO_DTYPE = np.dtype(
+    [(key, np.float64) for key in INFO_KEYS]
+    + [(f"_{key}", np.bool_) for key in INFO_KEYS]
+    + [
+        ("episode", [("r", np.float64), ("l", np.int64), ("t", np.float64)]),
+        ("_episode", np.bool_),
+    ]
+)
+"""The fixed-size part of a Metaworld info dict, with a mask field for every key."""
+
+_EMPTY_INFO = np.zeros((), dtype=INFO_DTYPE)
+
+
+def make_record_dtype(single_observation_space: gym.spaces.Box) -> np.dtype:
+    """Returns the dtype of the shared-memory record that a worker writes a step into.
+
+    Args:
+        single_observation_space: The observation space of one sub-environment.
+
+    Returns:
+        A structured dtype with the observation, reward, termination flags and infos of one
+        sub-environment, plus the final observation and info of an episode that was reset in the same step.
+    """
+    shape = single_observation_space.shape
+    return np.dtype(
+        [
+            ("obs", single_observation_space.dtype, shape),
+            ("reward", np.float64),
+            ("terminated", np.bool_),
+            ("truncated", np.bool_),
+            ("info", INFO_DTYPE),
+            ("final_obs", np.float64, shape),
+            ("final_info", INFO_DTYPE),
+            ("_final", np.bool_),
+        ]
+    )
+
+
+def write_info(
+    record: npt.NDArray[np.void], info: dict[str, Any]
+) -> dict[str, Any] | None:
+    """Writes the fixed keys of an info dict into an `INFO_DTYPE` record.
+
+    Args:
+        record: The 0-d `INFO_DTYPE` array to write into.
+        info: The info dict of one sub-environment.
+
+    Returns:
+        The keys of `info` that don't fit into the record, or `None` if there are none.
+    """
+    record[...] = _EMPTY_INFO
+    extra = None
+    for key, value in info.items():
+        if key in INFO_DTYPE.fields and not key.startswith("_"):
+            if key == "episode":
+                record["episode"] = tuple(value[k] for k in EPISODE_KEYS)
+            else:
+                record[key] = value
+            record[f"_{key}"] = True
+        else:
+            if extra is None:
+                extra = {}
+            extra[key] = value
+    return extra
+
+
+def read_info(records: npt.NDArray[np.void]) -> dict[str, Any]:
+    """Builds a batched info dict from the `INFO_DTYPE` records of all sub-environments.
+
+    Args:
+        records: A `(num_envs,)` array of `INFO_DTYPE` records.
+
+    Returns:
+        The same dict `gymnasium.vector.VectorEnv._add_info` would build from the per-env infos.
+    """
+    infos: dict[str, Any] = {}
+    for key in INFO_KEYS:
+        mask = records[f"_{key}"]
+        if mask.any():
+            infos[key] = np.where(mask, records[key], 0.0)
+            infos[f"_{key}"] = mask.copy()
+    mask = records["_episode"]
+    if mask.any():
+        episode = {}
+        for key in EPISODE_KEYS:
+            episode[key] = np.where(mask, records["episode"][key], 0)
+            episode[f"_{key}"] = mask.copy()
+        infos["episode"], infos["_episode"] = episode, mask.copy()
+    return infos
+
+
+def _select_info(
+    infos: dict[str, Any], env_ids: npt.NDArray[np.int64]
+) -> dict[str, Any]:
+    """Selects the entries of some sub-environments from a batched info dict, dropping the keys they don't have."""
+    selected: dict[str, Any] = {}
+    for key, value in infos.items():
+        if key.startswith("_"):
+            continue
+        mask = infos[f"_{key}"][env_ids]
+        if mask.any():
+            selected[key] = (
+                _select_info(value, env_ids)
+                if isinstance(value, dict)
+                else value[env_ids]
+            )
+            selected[f"_{key}"] = mask
+    return selected
+
+
+class SharedMemoryVectorEnv(gym.vector.VectorEnv):
+    """Vectorized environment that runs the Metaworld sub-environments in worker processes.
+
+    Unlike `gymnasium.vector.AsyncVectorEnv`, the workers don't send their step results back through
+    a pipe. Actions, observations, rewards, termination flags and the fixed Metaworld info keys
+    (see `INFO_DTYPE`) are exchanged through preallocated shared-memory structured arrays, so
+    the pipes only carry a small command and acknowledgement per step. Info keys that aren't
+    part of `INFO_DTYPE` are still sent through the pipe.
+
+    By default each sub-environment gets its own process. With `num_workers`, the sub-environments
+    are split into that many contiguous shards instead, each stepped by one process (serially, or
+    on `worker_threads` threads) with a single command and acknowledgement per shard.
+
+    Besides `step()`, groups of sub-environments can be stepped in the background with `send()` and
+    collected with `recv()`, e.g. to compute the actions of one group while the physics of the other
+    group runs, or to act on whichever sub-environments finish first so that the slowest tasks don't
+    gate the others.
+
+    Every value in the returned info dict is stored as a `float64` array.
+    """
+
+    def __init__(
+        self,
+        env_fns: Sequence[Callable[[], gym.Env]],
+        copy: bool = True,
+        context: str | None = None,
+        daemon: bool = True,
+        autoreset_mode: str | AutoresetMode = AutoresetMode.NEXT_STEP,
+        num_workers: int | None = None,
+        worker_threads: int = 1,
+        recv_seed: int | None = None,
+    ):
+        """Creates the worker processes.
+
+        Args:
+            env_fns: Functions that create the sub-environments.
+            copy: Whether `reset()` and `step()` return a copy of the observations.
+            context: The `multiprocessing` context. If `None`, the default context is used.
+            daemon: Whether the worker processes are daemonic.
+            autoreset_mode: The autoreset mode of the sub-environments.
+            num_workers: The number of worker processes, at most the number of sub-environments.
+                Defaults to one process per sub-environment.
+            worker_threads: The number of threads each worker steps its sub-environments with.
+            recv_seed: If set, `recv()` doesn't depend on which sub-environments finish first, for
+                reproducible runs: it waits for all the sub-environments that are stepping, and picks
+                the `batch_size` ones it returns at random with this seed.
+        """
+        super().__init__()
+        self.env_fns = env_fns
+        self.num_envs = len(env_fns)
+        self.copy = copy
+        self.autoreset_mode = (
+            autoreset_mode
+            if isinstance(autoreset_mode, AutoresetMode)
+            else AutoresetMode(autoreset_mode)
+        )
+
+        dummy_env = env_fns[0]()
+        self.metadata = dict(dummy_env.metadata)
+        self.metadata["autoreset_mode"] = self.autoreset_mode
+        self.render_mode = dummy_env.render_mode
+        self.single_observation_space = dummy_env.observation_space
+        self.single_action_space = dummy_env.action_space
+        dummy_env.close()
+        del dummy_env
+        self.observation_space = batch_space(
+            self.single_observation_space, self.num_envs
+        )
+        self.action_space = batch_space(self.single_action_space, self.num_envs)
+
+        if num_workers is None:
+            num_workers = self.num_envs
+        if num_workers < 1:
+            raise ValueError(f"num_workers must be at least 1, got {num_workers}")
+        if worker_threads < 1:
+            raise ValueError(f"worker_threads must be at least 1, got {worker_threads}")
+        self.num_workers = min(num_workers, self.num_envs)
+        self._shards = np.array_split(np.arange(self.num_envs), self.num_workers)
+        self._worker_of_env = np.zeros((self.num_envs,), dtype=np.int64)
+        for index, shard in enumerate(self._shards):
+            self._worker_of_env[shard] = index
+
+        ctx = multiprocessing.get_context(context)
+        record_dtype = make_record_dtype(self.single_observation_space)
+        action_dtype = np.dtype(self.single_action_space.dtype)
+        action_shape = (self.num_envs, *self.single_action_space.shape)
+        records_buffer = ctx.RawArray("B", self.num_envs * record_dtype.itemsize)
+        actions_buffer = ctx.RawArray(
+            "B", int(np.prod(action_shape)) * action_dtype.itemsize
+        )
+        self._records = np.frombuffer(records_buffer, dtype=record_dtype)
+        self._actions = np.frombuffer(actions_buffer, dtype=action_dtype).reshape(
+            action_shape
+        )
+
+        self.parent_pipes: list[Connection | None] = []
+        self.processes = []
+        self.error_queue = ctx.Queue()
+        with clear_mpi_env_vars():
+            for index, shard in enumerate(self._shards):
+                parent_pipe, child_pipe = ctx.Pipe()
+                process = ctx.Process(
+                    target=_shared_memory_worker,
+                    name=f"Worker<{type(self).__name__}>-{index}",
+                    args=(
+                        index,
+                        [(int(i), CloudpickleWrapper(env_fns[i])) for i in shard],
+                        child_pipe,
+                        parent_pipe,
+                        records_buffer,
+                        actions_buffer,
+                        record_dtype,
+                        action_shape,
+                        action_dtype,
+                        self.error_queue,
+                        self.autoreset_mode,
+                        worker_threads,
+                    ),
+                )
+                self.parent_pipes.append(parent_pipe)
+                self.processes.append(process)
+                process.daemon = daemon
+                process.start()
+                child_pipe.close()
+
+        self._state = AsyncState.DEFAULT
+        # Sub-environments sent a step with `send()` that are still stepping, or whose
+        # results are ready but haven't been returned by `recv()` yet
+        self._stepping = np.zeros((self.num_envs,), dtype=np.bool_)
+        self._ready = np.zeros((self.num_envs,), dtype=np.bool_)
+        self._extras: dict[int, dict[str, Any] | None] = {}
+        self._steps_in_flight = np.zeros((self.num_workers,), dtype=np.int64)
+        # The order in which the ready sub-environments finished stepping
+        self._ready_order = np.zeros((self.num_envs,), dtype=np.int64)
+        self._num_ready_messages = 0
+        self._recv_rng = (
+            np.random.default_rng(recv_seed) if recv_seed is not None else None
+        )
+        self._check_spaces()
+
+    def reset(
+        self,
+        *,
+        seed: int | list[int | None] | None = None,
+        options: dict[str, Any] | None = None,
+    ) -> tuple[npt.NDArray[Any], dict[str, Any]]:
+        """Resets the sub-environments.
+
+        Args:
+            seed: Either `None`, an int (seeds become `[seed, seed + 1, ...]`) or a list of seeds.
+            options: Passed to each sub-environment's `reset()`. A `reset_mask` boolean array
+                can be passed to only reset some of the sub-environments.
+
+        Returns:
+            The batched `(obs, info)` tuple.
+        """
+        self._assert_is_running()
+        self._assert_not_pending("reset")
+        if seed is None:
+            seed = [None for _ in range(self.num_envs)]
+        elif isinstance(seed, int):
+            seed = [seed + i for i in range(self.num_envs)]
+        if len(seed) != self.num_envs:
+            raise ValueError(
+                f"If seeds are passed as a list the length must match num_envs={self.num_envs} but got length={len(seed)}."
+            )
+
+        reset_mask = np.ones((self.num_envs,), dtype=np.bool_)
+        if options is not None and "reset_mask" in options:
+            options = dict(options)
+            reset_mask = options.pop("reset_mask")
+            if not (
+                isinstance(reset_mask, np.ndarray)
+                and reset_mask.shape == (self.num_envs,)
+                and reset_mask.dtype == np.bool_
+            ):
+                raise ValueError(
+                    f"`options['reset_mask']` must be a boolean array of shape ({self.num_envs},)"
+                )
+
+        env_ids = np.flatnonzero(reset_mask)
+        results = self._recv(
+            self._send(
+                "reset", {i: {"seed": seed[i], "options": options} for i in env_ids}
+            )
+        )
+        infos: dict[str, Any] = {}
+        for i in env_ids:
+            infos = self._add_info(infos, results[i], i)
+        return self._get_observations(), infos
+
+    def step_async(self, actions: npt.NDArray[Any]) -> None:
+        """Writes the actions to shared memory and tells the workers to step.
+
+        Args:
+            actions: A `(num_envs, 4)` array of actions.
+        """
+        self._assert_is_running()
+        self._assert_not_pending("step_async")
+        self._send_step(actions, np.arange(self.num_envs))
+        self._state = AsyncState.WAITING_STEP
+
+    def step_wait(
+        self,
+    ) -> tuple[
+        npt.NDArray[Any],
+        npt.NDArray[np.float64],
+        npt.NDArray[np.bool_],
+        npt.NDArray[np.bool_],
+        dict[str, Any],
+    ]:
+        """Waits for the workers to finish stepping and reads their results from shared memory.
+
+        Returns:
+            The batched `(obs, reward, terminated, truncated, info)` tuple.
+        """
+        self._assert_is_running()
+        if self._state != AsyncState.WAITING_STEP:
+            raise NoAsyncCallError(
+                "Calling `step_wait` without any prior call to `step_async`.",
+                AsyncState.WAITING_STEP.value,
+            )
+        try:
+            while self._stepping.any():
+                self._poll_steps()
+        finally:
+            self._state = AsyncState.DEFAULT
+        return self._read_step(self._take_results(np.arange(self.num_envs)))
+
+    def step(
+        self, actions: npt.NDArray[Any]
+    ) -> tuple[
+        npt.NDArray[Any],
+        npt.NDArray[np.float64],
+        npt.NDArray[np.bool_],
+        npt.NDArray[np.bool_],
+        dict[str, Any],
+    ]:
+        """Steps all of the sub-environments.
+
+        Args:
+            actions: A `(num_envs, 4)` array of actions.
+
+        Returns:
+            The batched `(obs, reward, terminated, truncated, info)` tuple.
+        """
+        self.step_async(actions)
+        return self.step_wait()
+
+    def send(
+        self,
+        actions: npt.NDArray[Any],
+        env_ids: Sequence[int] | npt.NDArray[Any] | None = None,
+    ) -> None:
+        """Starts stepping some of the sub-environments, without waiting for them to finish.
+
+        Along with `recv()`, this allows stepping groups of sub-environments in the background, e.g. to
+        compute the actions of one group while the other one is being stepped.
+
+        Args:
+            actions: A `(len(env_ids), 4)` array of actions.
+            env_ids: The sub-environments to step, all of them by default. Their previous results must
+                have been returned by `recv()`.
+        """
+        self._assert_is_running()
+        if self._state != AsyncState.DEFAULT:
+            raise AlreadyPendingCallError(
+                f"Calling `send` while waiting for a pending call to `{self._state.value}` to complete.",
+                str(self._state.value),
+            )
+        env_ids = (
+            np.arange(self.num_envs)
+            if env_ids is None
+            else np.asarray(env_ids, dtype=np.int64)
+        )
+        if (self._stepping[env_ids] | self._ready[env_ids]).any():
+            raise AlreadyPendingCallError(
+                "Calling `send` for sub-environments whose results haven't been returned by `recv` yet.",
+                AsyncState.WAITING_STEP.value,
+            )
+        self._send_step(actions, env_ids)
+
+    def recv(
+        self,
+        env_ids: Sequence[int] | npt.NDArray[Any] | None = None,
+        batch_size: int | None = None,
+    ) -> tuple[
+        npt.NDArray[Any],
+        npt.NDArray[np.float64],
+        npt.NDArray[np.bool_],
+        npt.NDArray[np.bool_],
+        dict[str, Any],
+        npt.NDArray[np.int64],
+    ]:
+        """Waits for sub-environments stepped with `send()` and returns their results.
+
+        Args:
+            env_ids: The sub-environments to wait for. By default, waits until at least one sub-environment
+                has finished stepping and returns the results of all of those that have.
+            batch_size: If set instead of `env_ids`, waits until `batch_size` sub-environments have finished
+                stepping and returns the first ones that did. The others stay in flight for later calls.
+
+        Returns:
+            The `(obs, reward, terminated, truncated, info, env_ids)` tuple of the returned
+            sub-environments, batched in the order of `env_ids`.
+        """
+        self._assert_is_running()
+        pending = self._stepping | self._ready
+        if env_ids is None:
+            if not pending.any():
+                raise NoAsyncCallError(
+                    "Calling `recv` without any prior call to `send`.",
+                    AsyncState.WAITING_STEP.value,
+                )
+            if batch_size is not None and not 1 <= batch_size <= pending.sum():
+                raise ValueError(
+                    f"batch_size must be between 1 and the {pending.sum()} sub-environments stepped with `send`, got {batch_size}."
+                )
+            if self._recv_rng is not None:
+                while self._stepping.any():
+                    self._poll_steps()
+                env_ids = np.flatnonzero(self._ready)
+                if batch_size is not None:
+                    env_ids = np.sort(
+                        self._recv_rng.choice(env_ids, batch_size, replace=False)
+                    )
+            else:
+                while self._ready.sum() < (batch_size or 1):
+                    self._poll_steps()
+                # Also collect the sub-environments that finished in the meantime
+                self._poll_steps(timeout=0)
+                env_ids = np.flatnonzero(self._ready)
+                if batch_size is not None:
+                    first = np.argsort(self._ready_order[env_ids], kind="stable")
+                    env_ids = np.sort(env_ids[first[:batch_size]])
+        elif batch_size is not None:
+            raise ValueError("Only one of env_ids and batch_size can be set.")
+        else:
+            env_ids = np.asarray(env_ids, dtype=np.int64)
+            if not pending[env_ids].all():
+                raise NoAsyncCallError(
+                    "Calling `recv` for sub-environments that weren't stepped with `send`.",
+                    AsyncState.WAITING_STEP.value,
+                )
+            while not self._ready[env_ids].all():
+                self._poll_steps()
+
+        extras: list[dict[str, Any] | None] = [None] * self.num_envs
+        for i, extra in zip(env_ids, self._take_results(env_ids)):
+            extras[i] = extra
+        observations, rewards, terminations, truncations, infos = self._read_step(
+            extras
+        )
+        return (
+            observations[env_ids],
+            rewards[env_ids],
+            terminations[env_ids],
+            truncations[env_ids],
+            _select_info(infos, env_ids),
+            env_ids,
+        )
+
+    def _send_step(
+        self, actions: npt.NDArray[Any], env_ids: npt.NDArray[np.int64]
+    ) -> None:
+        self._actions[env_ids] = actions
+        for index in self._send("step", dict.fromkeys(env_ids.tolist())):
+            self._steps_in_flight[index] += 1
+        self._stepping[env_ids] = True
+
+    def _poll_steps(self, timeout: float | None = None) -> None:
+        """Receives the step results of the workers that have finished stepping.
+
+        Args:
+            timeout: How long to wait for at least one worker to finish, forever by default.
+        """
+        pipes = {
+            self.parent_pipes[index]: index
+            for index in np.flatnonzero(self._steps_in_flight)
+        }
+        for pipe in wait(list(pipes), timeout=timeout):
+            index = pipes[pipe]  # type: ignore[index]
+            self._steps_in_flight[index] -= 1
+            try:
+                results = self._recv([index])
+            except Exception:
+                # The worker has been shut down, its steps will never complete
+                self._steps_in_flight[index] = 0
+                self._stepping[self._shards[index]] = False
+                raise
+            self._num_ready_messages += 1
+            for i, extra in results.items():
+                self._stepping[i] = False
+                self._ready[i] = True
+                self._ready_order[i] = self._num_ready_messages
+                self._extras[i] = extra
+
+    def _take_results(self, env_ids: npt.NDArray[np.int64]) -> list[Any]:
+        """Marks the results of some sub-environments as returned, and returns their extra infos."""
+        self._ready[env_ids] = False
+        return [self._extras.pop(i) for i in env_ids.tolist()]
+
+    def _read_step(
+        self, extras: list[dict[str, Any] | None]
+    ) -> tuple[
+        npt.NDArray[Any],
+        npt.NDArray[np.float64],
+        npt.NDArray[np.bool_],
+        npt.NDArray[np.bool_],
+        dict[str, Any],
+    ]:
+        records = self._records
+        infos = read_info(records["info"])
+        final_mask = records["_final"]
+        if final_mask.any():
+            final_obs = np.full(self.num_envs, fill_value=None, dtype=object)
+            for i in np.flatnonzero(final_mask):
+                final_obs[i] = records["final_obs"][i].copy()
+            infos["final_obs"], infos["_final_obs"] = final_obs, final_mask.copy()
+            infos["final_info"] = read_info(records["final_info"])
+            infos["_final_info"] = final_mask.copy()
+        for i, extra in enumerate(extras):
+            if extra is not None:
+                infos = self._add_info(infos, extra, i)
+
+        return (
+            self._get_observations(),
+            records["reward"].copy(),
+            records["terminated"].copy(),
+            records["truncated"].copy(),
+            infos,
+        )
+
+    def _get_observations(self) -> npt.NDArray[Any]:
+        observations = self._records["obs"]
+        return observations.copy() if self.copy else observations
+
+    def render(self) -> tuple[Any, ...]:
+        """Returns the rendered frames from the sub-environments."""
+        return self.call("render")
+
+    def call(self, name: str, *args: Any, **kwargs: Any) -> tuple[Any, ...]:
+        """Calls a method (or gets an attribute) of each sub-environment.
+
+        Args:
+            name: The method name.
+            *args: The method args.
+            **kwargs: The method kwargs.
+
+        Returns:
+            Tuple of results.
+        """
+        self._assert_is_running()
+        self._assert_not_pending("call")
+        results = self._recv(
+            self._send(
+                "_call", dict.fromkeys(range(self.num_envs), (name, args, kwargs))
+            )
+        )
+        return tuple(results[i] for i in range(self.num_envs))
+
+    def get_attr(self, name: str) -> tuple[Any, ...]:
+        """Gets an attribute from each sub-environment.
+
+        Args:
+            name: The attribute name.
+
+        Returns:
+            Tuple of the attribute values.
+        """
+        return self.call(name)
+
+    def set_attr(self, name: str, values: list[Any] | tuple[Any, ...] | Any) -> None:
+        """Sets an attribute of the sub-environments.
+
+        Args:
+            name: The attribute name.
+            values: Either a single value for all sub-environments, or one value per sub-environment.
+        """
+        self._assert_is_running()
+        self._assert_not_pending("set_attr")
+        if not isinstance(values, (list, tuple)):
+            values = [values for _ in range(self.num_envs)]
+        if len(values) != self.num_envs:
+            raise ValueError(
+                f"Values must be a list or tuple with length equal to the number of environments. Got `{len(values)}` values for {self.num_envs} environments."
+            )
+        self._recv(
+            self._send("_setattr", {i: (name, value) for i, value in enumerate(values)})
+        )
+
+    def get_checkpoint(self, physics: bool = False) -> dict[str, Any]:
+        """Returns the checkpoint of all the sub-environments, see `metaworld.vector.pack_checkpoints()`.
+
+        The checkpoints are gathered from all the workers in a single round-trip.
+
+        Args:
+            physics: Whether to include the state of the current episodes (the sub-environments' snapshots,
+                their last observations and whether they're autoresetting), so that loading the checkpoint
+                resumes them. The state of the sub-environments' wrappers, besides their time limit, isn't
+                restored.
+
+        Returns:
+            The checkpoint.
+        """
+        self._assert_is_running()
+        self._assert_not_pending("get_checkpoint")
+        results = self._recv(
+            self._send("_get_checkpoint", dict.fromkeys(range(self.num_envs), physics))
+        )
+        ckpt = pack_checkpoints([results[i][0] for i in range(self.num_envs)])
+        if physics:
+            ckpt["observations"] = self._records["obs"].copy()
+            ckpt["autoreset"] = np.array(
+                [results[i][1] for i in range(self.num_envs)], dtype=np.bool_
+            )
+        return ckpt
+
+    def load_checkpoint(self, ckpt: dict[str, Any]) -> None:
+        """Loads a checkpoint returned by `get_checkpoint()`, in a single round-trip to the workers.
+
+        Args:
+            ckpt: The checkpoint.
+        """
+        self._assert_is_running()
+        self._assert_not_pending("load_checkpoint")
+        env_ckpts = unpack_checkpoints(ckpt, self.num_envs)
+        autoreset = ckpt.get("autoreset")
+        self._recv(
+            self._send(
+                "_load_checkpoint",
+                {
+                    i: (env_ckpt, None if autoreset is None else bool(autoreset[i]))
+                    for i, env_ckpt in enumerate(env_ckpts)
+                },
+            )
+        )
+        if "observations" in ckpt:
+            self._records["obs"] = ckpt["observations"]
+
+    def close_extras(self, terminate: bool = False, **kwargs: Any) -> None:
+        """Shuts down the worker processes.
+
+        Args:
+            terminate: If `True`, the workers are terminated instead of being asked to close their sub-environments.
+            **kwargs: Unused.
+        """
+        if not hasattr(self, "processes"):
+            return
+        if self._state == AsyncState.WAITING_STEP and not terminate:
+            try:
+                self.step_wait()
+            except Exception:
+                terminate = True
+        elif self._stepping.any() and not terminate:
+            try:
+                while self._stepping.any():
+                    self._poll_steps()
+            except Exception:
+                terminate = True
+
+        if terminate:
+            for process in self.processes:
+                if process.is_alive():
+                    process.terminate()
+        else:
+            live_pipes = [
+                p for p in self.parent_pipes if p is not None and not p.closed
+            ]
+            for pipe in live_pipes:
+                pipe.send(("close", None))
+            for pipe in live_pipes:
+                pipe.recv()
+
+        for pipe in self.parent_pipes:
+            if pipe is not None:
+                pipe.close()
+        for process in self.processes:
+            process.join()
+
+    def _check_spaces(self) -> None:
+        results = self._recv(
+            self._send(
+                "_check_spaces",
+                dict.fromkeys(
+                    range(self.num_envs),
+                    (self.single_observation_space, self.single_action_space),
+                ),
+            )
+        )
+        same_observation_spaces, same_action_spaces = zip(*results.values())
+        if not all(same_observation_spaces):
+            raise RuntimeError(
+                "SharedMemoryVectorEnv requires all sub-environments to have the same observation space."
+            )
+        if not all(same_action_spaces):
+            raise RuntimeError(
+                "SharedMemoryVectorEnv requires all sub-environments to have the same action space."
+            )
+
+    def _send(self, command: str, data: dict[int, Any]) -> list[int]:
+        """Sends a command to the workers of some sub-environments, in one message per worker.
+
+        Args:
+            command: The command.
+            data: The data of the command for each sub-environment it is sent to.
+
+        Returns:
+            The indices of the workers the command was sent to.
+        """
+        items: dict[int, list[tuple[int, Any]]] = {}
+        for i, env_data in data.items():
+            items.setdefault(int(self._worker_of_env[i]), []).append((i, env_data))
+        for index, worker_items in items.items():
+            pipe = self.parent_pipes[index]
+            assert pipe is not None
+            pipe.send((command, worker_items))
+        return list(items)
+
+    def _recv(self, workers: Sequence[int] | range) -> dict[int, Any]:
+        """Receives the results of a command from some workers, keyed by sub-environment."""
+        results, failed = {}, []
+        for index in workers:
+            pipe = self.parent_pipes[index]
+            assert pipe is not None
+            result, success = pipe.recv()
+            if success:
+                results.update(result)
+            else:
+                failed.append(index)
+        if failed:
+            self._state = AsyncState.DEFAULT
+            self._raise_errors(len(failed))
+        return results
+
+    def _raise_errors(self, num_errors: int) -> None:
+        for i in range(num_errors):
+            index, exctype, value, trace = self.error_queue.get()
+            gym.logger.error(
+                f"Received the following error from Worker-{index} - Shutting it down"
+            )
+            gym.logger.error(f"{trace}")
+            pipe = self.parent_pipes[index]
+            assert pipe is not None
+            pipe.close()
+            self.parent_pipes[index] = None
+            if i == num_errors - 1:
+                raise exctype(value)
+
+    def _assert_is_running(self) -> None:
+        if self.closed:
+            raise ClosedEnvironmentError(
+                f"Trying to operate on `{type(self).__name__}`, after a call to `close()`."
+            )
+
+    def _assert_not_pending(self, method: str) -> None:
+        if self._state != AsyncState.DEFAULT:
+            raise AlreadyPendingCallError(
+                f"Calling `{method}` while waiting for a pending call to `{self._state.value}` to complete.",
+                str(self._state.value),
+            )
+        if self._stepping.any() or self._ready.any():
+            raise AlreadyPendingCallError(
+                f"Calling `{method}` while some sub-environments stepped with `send` haven't been returned by `recv`.",
+                AsyncState.WAITING_STEP.value,
+            )
+
+
+def _shared_memory_worker(
+    index: int,
+    env_fns: list[tuple[int, CloudpickleWrapper]],
+    pipe: Connection,
+    parent_pipe: Connection,
+    records_buffer: Any,
+    actions_buffer: Any,
+    record_dtype: np.dtype,
+    action_shape: tuple[int, ...],
+    action_dtype: np.dtype,
+    error_queue: multiprocessing.Queue,
+    autoreset_mode: AutoresetMode,
+    num_threads: int,
+) -> None:
+    envs = {i: env_fn() for i, env_fn in env_fns}
+    parent_pipe.close()
+    records = np.frombuffer(records_buffer, dtype=record_dtype)
+    actions = np.frombuffer(actions_buffer, dtype=action_dtype).reshape(action_shape)
+    autoreset = dict.fromkeys(envs, False)
+    executor = ThreadPoolExecutor(max_workers=num_threads) if num_threads > 1 else None
+
+    def step(i: int) -> dict[str, Any] | None:
+        env, record = envs[i], records[i, ...]
+        final = False
+        if autoreset_mode == AutoresetMode.NEXT_STEP and autoreset[i]:
+            observation, info = env.reset()
+            reward, terminated, truncated = 0.0, False, False
+        else:
+            # Copy, the main process may write the next actions before this step is read
+            observation, reward, terminated, truncated, info = env.step(
+                actions[i].copy()
+            )
+            if autoreset_mode == AutoresetMode.SAME_STEP and (terminated or truncated):
+                final = True
+                record["final_obs"] = observation
+                extra = write_info(record["final_info"], info)
+                observation, info = env.reset()
+                if extra is not None:
+                    info = {**info, "final_info": extra}
+        autoreset[i] = terminated or truncated
+
+        record["obs"] = observation
+        record["reward"] = reward
+        record["terminated"] = terminated
+        record["truncated"] = truncated
+        record["_final"] = final
+        return write_info(record["info"], info)
+
+    try:
+        while True:
+            command, items = pipe.recv()
+            results: list[tuple[int, Any]] = []
+            if command == "reset":
+                for i, data in items:
+                    observation, info = envs[i].reset(**data)
+                    records[i, ...]["obs"] = observation
+                    autoreset[i] = False
+                    results.append((i, info))
+            elif command == "step":
+                env_ids = [i for i, _ in items]
+                if executor is None:
+                    results = [(i, step(i)) for i in env_ids]
+                else:
+                    results = list(zip(env_ids, executor.map(step, env_ids)))
+            elif command == "close":
+                pipe.send((None, True))
+                break
+            elif command == "_call":
+                for i, (name, args, kwargs) in items:
+                    if name in ["reset", "step", "close", "_setattr", "_check_spaces"]:
+                        raise ValueError(
+                            f"Trying to call function `{name}` with `call`, use `{name}` directly instead."
+                        )
+                    attr = envs[i].get_wrapper_attr(name)
+                    results.append(
+                        (i, attr(*args, **kwargs) if callable(attr) else attr)
+                    )
+            elif command == "_setattr":
+                for i, (name, value) in items:
+                    envs[i].set_wrapper_attr(name, value)
+                    results.append((i, None))
+            elif command == "_get_checkpoint":
+                for i, physics in items:
+                    env_ckpt = envs[i].get_wrapper_attr("get_checkpoint")(
+                        tasks=True, physics=physics
+                    )
+                    results.append((i, (env_ckpt, autoreset[i])))
+            elif command == "_load_checkpoint":
+                for i, (env_ckpt, env_autoreset) in items:
+                    envs[i].get_wrapper_attr("load_checkpoint")([env_ckpt])
+                    if env_autoreset is not None:
+                        autoreset[i] = env_autoreset
+                    results.append((i, None))
+            elif command == "_check_spaces":
+                for i, (observation_space, action_space) in items:
+                    results.append(
+                        (
+                            i,
+                            (
+                                observation_space == envs[i].observation_space,
+                                action_space == envs[i].action_space,
+                            ),
+                        )
+                    )
+            else:
+                raise RuntimeError(
+                    f"Received unknown command `{command}`. Must be one of [`reset`, `step`, `close`, `_call`, `_setattr`, `_get_checkpoint`, `_load_checkpoint`, `_check_spaces`]."
+                )
+            pipe.send((results, True))
+    except (KeyboardInterrupt, Exception):
+        error_type, error_message, _ = sys.exc_info()
+        trace = traceback.format_exc()
+        error_queue.put((index, error_type, error_message, trace))
+        pipe.send((None, False))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        for env in envs.values():
+            env.close()
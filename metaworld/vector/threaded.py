@@ -0,0 +1,86 @@
+"""A vector environment that steps the physics of Metaworld sub-environments on a pool of threads."""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Sequence
+
+import gymnasium as gym
+import numpy as np
+import numpy.typing as npt
+from gymnasium.vector import AutoresetMode
+
+from metaworld.vector.native import NativeVectorEnv
+
+
+class ThreadedVectorEnv(NativeVectorEnv):
+    """Vectorized environment that steps the physics of the Metaworld sub-environments on several threads.
+
+    Works like `NativeVectorEnv`, but the simulation part of each step (`SawyerXYZEnv._step_physics()`)
+    is split across `num_workers` threads, one contiguous chunk of sub-environments per thread. MuJoCo
+    releases the GIL while it simulates, so the chunks run in parallel on multiple cores without the
+    processes, duplicated memory and pickling of `gymnasium.vector.AsyncVectorEnv`. The observations,
+    rewards and infos are then computed on the calling thread, so the results are the same as
+    `NativeVectorEnv`'s for any number of threads.
+    """
+
+    def __init__(
+        self,
+        env_fns: Sequence[Callable[[], gym.Env]],
+        copy: bool = True,
+        autoreset_mode: str | AutoresetMode = AutoresetMode.NEXT_STEP,
+        num_workers: int | None = None,
+    ):
+        """Creates the sub-environments and the thread pool.
+
+        Args:
+            env_fns: Functions that create the sub-environments.
+            copy: Whether `reset()` and `step()` return a copy of the observations.
+            autoreset_mode: The autoreset mode of the sub-environments.
+            num_workers: The number of threads stepping the physics, including the calling thread.
+                Defaults to the number of CPUs, capped by the number of sub-environments.
+        """
+        super().__init__(env_fns, copy=copy, autoreset_mode=autoreset_mode)
+        if num_workers is None:
+            num_workers = min(self.num_envs, os.cpu_count() or 1)
+        if num_workers < 1:
+            raise ValueError(f"num_workers must be at least 1, got {num_workers}")
+        self.num_workers = num_workers
+        # The calling thread steps a chunk too
+        self._executor = (
+            ThreadPoolExecutor(
+                max_workers=num_workers - 1,
+                thread_name_prefix=f"Worker<{type(self).__name__}>",
+            )
+            if num_workers > 1
+            else None
+        )
+
+    def _step_physics(
+        self, actions: npt.NDArray[Any], step_ids: npt.NDArray[Any]
+    ) -> None:
+        """Steps the physics of the given sub-environments, one chunk per thread."""
+        num_chunks = min(self.num_workers, len(step_ids))
+        if self._executor is None or num_chunks <= 1:
+            super()._step_physics(actions, step_ids)
+            return
+        step_chunk = super()._step_physics
+        chunks = np.array_split(step_ids, num_chunks)
+        futures = [
+            self._executor.submit(step_chunk, actions, chunk) for chunk in chunks[1:]
+        ]
+        try:
+            step_chunk(actions, chunks[0])
+        finally:
+            # Wait for all the chunks, even if one of them failed
+            for future in futures:
+                future.exception()
+        for future in futures:
+            future.result()
+
+    def close_extras(self, **kwargs: Any) -> None:
+        """Shuts down the thread pool and closes the sub-environments."""
+        if getattr(self, "_executor", None) is not None:
+            self._executor.shutdown()
+        super().close_extras(**kwargs)
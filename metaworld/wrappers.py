@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import base64
+from typing import Sequence
 
 import gymnasium as gym
 import numpy as np
@@ -8,6 +9,7 @@ from gymnasium import Env
 from numpy.typing import NDArray
 
 from metaworld.sawyer_xyz_env import SawyerXYZEnv
+from metaworld.task_set import TaskSet
 from metaworld.types import Task
 
 
@@ -32,13 +34,6 @@ class OneHotWrapper(gym.ObservationWrapper, gym.utils.RecordConstructorArgs):
         return np.concatenate([obs, self.one_hot])
 
 
-def _serialize_task(task: Task) -> dict:
-    return {
-        "env_name": task.env_name,
-        "data": base64.b64encode(task.data).decode("ascii"),
-    }
-
-
 def _deserialize_task(task_dict: dict[str, str]) -> Task:
     assert "env_name" in task_dict and "data" in task_dict
 
@@ -47,6 +42,18 @@ def _deserialize_task(task_dict: dict[str, str]) -> Task:
     )
 
 
+def _load_checkpoint_tasks(tasks: TaskSet, ckpt: dict) -> TaskSet:
+    """Returns the tasks of a task select wrapper's checkpoint.
+
+    Checkpoints store the indices of the tasks in `tasks.source`, or in their own `"task_set"` if they
+    have one. Older checkpoints store the tasks themselves.
+    """
+    if "task_indices" in ckpt:
+        return ckpt.get("task_set", tasks).with_indices(ckpt["task_indices"])
+    assert "tasks" in ckpt
+    return TaskSet.from_tasks(_deserialize_task(task) for task in ckpt["tasks"])
+
+
 class RNNBasedMetaRLWrapper(gym.Wrapper):
     """A Gymnasium Wrapper to automatically include prev_action / reward / done info in the observation.
     For use with RNN-based meta-RL algorithms."""
@@ -92,7 +99,7 @@ class RandomTaskSelectWrapper(gym.Wrapper):
     """A Gymnasium Wrapper to automatically set / reset the environment to a random
     task."""
 
-    tasks: list[Task]
+    tasks: TaskSet
     sample_tasks_on_reset: bool = True
 
     def _set_random_task(self):
@@ -102,12 +109,12 @@ class RandomTaskSelectWrapper(gym.Wrapper):
     def __init__(
         self,
         env: Env,
-        tasks: list[Task],
+        tasks: Sequence[Task],
         sample_tasks_on_reset: bool = True,
     ):
         super().__init__(env)
         self.unwrapped: SawyerXYZEnv
-        self.tasks = tasks
+        self.tasks = tasks if isinstance(tasks, TaskSet) else TaskSet.from_tasks(tasks)
         self.sample_tasks_on_reset = sample_tasks_on_reset
 
     def toggle_sample_tasks_on_reset(self, on: bool):
@@ -122,21 +129,23 @@ class RandomTaskSelectWrapper(gym.Wrapper):
         self._set_random_task()
         return self.env.reset(seed=seed, options=options)
 
-    def get_checkpoint(self) -> dict:
-        return {
-            "tasks": [_serialize_task(task) for task in self.tasks],
+    def get_checkpoint(self, tasks: bool = False) -> dict:
+        ckpt = {
+            "task_indices": self.tasks.indices.tolist(),
             "rng_state": self.np_random.bit_generator.state,
             "sample_tasks_on_reset": self.sample_tasks_on_reset,
             "env_rng_state": get_env_rng_checkpoint(self.unwrapped),
         }
+        if tasks:
+            ckpt["task_set"] = self.tasks.source
+        return ckpt
 
     def load_checkpoint(self, ckpt: dict):
-        assert "tasks" in ckpt
         assert "rng_state" in ckpt
         assert "sample_tasks_on_reset" in ckpt
         assert "env_rng_state" in ckpt
 
-        self.tasks = [_deserialize_task(task) for task in ckpt["tasks"]]
+        self.tasks = _load_checkpoint_tasks(self.tasks, ckpt)
         self.np_random.__setstate__(ckpt["rng_state"])
         self.sample_tasks_on_reset = ckpt["sample_tasks_on_reset"]
         set_env_rng(self.unwrapped, ckpt["env_rng_state"])
@@ -151,14 +160,16 @@ class PseudoRandomTaskSelectWrapper(gym.Wrapper):
     Doesn't sample new tasks on reset by default.
     """
 
-    tasks: list[Task]
+    tasks: TaskSet
     current_task_idx: int
     sample_tasks_on_reset: bool = False
 
     def _set_pseudo_random_task(self):
         self.current_task_idx = (self.current_task_idx + 1) % len(self.tasks)
         if self.current_task_idx == 0:
-            self.np_random.shuffle(self.tasks)  # pyright: ignore [reportArgumentType]
+            task_indices = self.tasks.indices
+            self.np_random.shuffle(task_indices)
+            self.tasks = self.tasks.with_indices(task_indices)
         self.unwrapped.set_task(self.tasks[self.current_task_idx])
 
     def toggle_sample_tasks_on_reset(self, on: bool):
@@ -167,12 +178,12 @@ class PseudoRandomTaskSelectWrapper(gym.Wrapper):
     def __init__(
         self,
         env: Env,
-        tasks: list[Task],
+        tasks: Sequence[Task],
         sample_tasks_on_reset: bool = False,
     ):
         super().__init__(env)
         self.sample_tasks_on_reset = sample_tasks_on_reset
-        self.tasks = tasks
+        self.tasks = tasks if isinstance(tasks, TaskSet) else TaskSet.from_tasks(tasks)
         self.current_task_idx = -1
 
     def reset(self, *, seed: int | None = None, options: dict | None = None):
@@ -184,21 +195,23 @@ class PseudoRandomTaskSelectWrapper(gym.Wrapper):
         self._set_pseudo_random_task()
         return self.env.reset(seed=seed, options=options)
 
-    def get_checkpoint(self) -> dict:
-        return {
-            "tasks": [_serialize_task(task) for task in self.tasks],
+    def get_checkpoint(self, tasks: bool = False) -> dict:
+        ckpt = {
+            "task_indices": self.tasks.indices.tolist(),
             "current_task_idx": self.current_task_idx,
             "sample_tasks_on_reset": self.sample_tasks_on_reset,
             "env_rng_state": get_env_rng_checkpoint(self.unwrapped),
         }
+        if tasks:
+            ckpt["task_set"] = self.tasks.source
+        return ckpt
 
     def load_checkpoint(self, ckpt: dict):
-        assert "tasks" in ckpt
         assert "current_task_idx" in ckpt
         assert "sample_tasks_on_reset" in ckpt
         assert "env_rng_state" in ckpt
 
-        self.tasks = [_deserialize_task(task) for task in ckpt["tasks"]]
+        self.tasks = _load_checkpoint_tasks(self.tasks, ckpt)
         self.current_task_idx = ckpt["current_task_idx"]
         self.sample_tasks_on_reset = ckpt["sample_tasks_on_reset"]
         set_env_rng(self.unwrapped, ckpt["env_rng_state"])
@@ -283,8 +296,22 @@ class CheckpointWrapper(gym.Wrapper):
         )
         self.env_id = env_id
 
-    def get_checkpoint(self) -> tuple[str, dict]:
-        ckpt: dict = self.env.get_checkpoint()
+    def get_checkpoint(
+        self, tasks: bool = False, physics: bool = False
+    ) -> tuple[str, dict]:
+        """Returns the checkpoint of the env, along with its ID.
+
+        Args:
+            tasks: Whether to include the tasks the env was created with, see `metaworld.vector.pack_checkpoints()`.
+            physics: Whether to include a snapshot of the env (see `SawyerXYZEnv.snapshot()`), to restore
+                the simulation, task and RNG of the current episode as well.
+
+        Returns:
+            The `(env_id, checkpoint)` tuple.
+        """
+        ckpt: dict = self.env.get_checkpoint(tasks=tasks)
+        if physics:
+            ckpt["physics"] = self.unwrapped.snapshot()
         return (self.env_id, ckpt)
 
     def load_checkpoint(self, ckpts: list[tuple[str, dict]]) -> None:
@@ -299,6 +326,14 @@ class CheckpointWrapper(gym.Wrapper):
                 [env_id for env_id, _ in ckpts],
             )
         self.env.load_checkpoint(my_ckpt)
+        if "physics" in my_ckpt:
+            self.unwrapped.restore(my_ckpt["physics"])
+            # Resume the time limit of the restored episode
+            env = self.env
+            while isinstance(env, gym.Wrapper):
+                if isinstance(env, gym.wrappers.TimeLimit):
+                    env._elapsed_steps = self.unwrapped.curr_path_length
+                env = env.env
 
 
 def get_env_rng_checkpoint(env: SawyerXYZEnv) -> dict[str, dict]:
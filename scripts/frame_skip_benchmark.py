@@ -0,0 +1,83 @@
+"""Reports the success rate of the scripted policies and the throughput of the envs at several `frame_skip`s.
+
+Usage: python scripts/frame_skip_benchmark.py [--frame-skips 2 5 10 20] [--episodes 10] [--per-env]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+import metaworld
+from metaworld.policies import ENV_POLICY_MAP
+
+
+def run(env_name: str, frame_skip: int, episodes: int) -> tuple[float, int, float]:
+    """Returns the success rate, the number of env steps and the wall-clock time of `episodes` episodes."""
+    benchmark = metaworld.MT1(env_name, seed=0)
+    env = benchmark.train_classes[env_name](frame_skip=frame_skip, visual_assets="none")
+    env.cache_hand_reset = True
+    policy = ENV_POLICY_MAP[env_name]()
+    successes, steps = 0, 0
+    start = time.perf_counter()
+    for task in benchmark.train_tasks[:episodes]:
+        env.set_task(task)
+        obs, _ = env.reset()
+        for _ in range(env.max_path_length):
+            obs, _, _, _, info = env.step(policy.get_action(obs.copy()))
+            steps += 1
+            if info["success"]:
+                successes += 1
+                break
+    return successes / episodes, steps, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--frame-skips", type=int, nargs="+", default=[2, 5, 10, 20])
+    parser.add_argument("--episodes", type=int, default=10)
+    parser.add_argument("--per-env", action="store_true")
+    args = parser.parse_args()
+
+    results: dict[int, dict[str, tuple[float, int, float]]] = {
+        frame_skip: {} for frame_skip in args.frame_skips
+    }
+    for env_name in sorted(metaworld.ALL_V3_ENVIRONMENTS):
+        for frame_skip in args.frame_skips:
+            results[frame_skip][env_name] = run(env_name, frame_skip, args.episodes)
+        if args.per_env:
+            print(
+                env_name,
+                " ".join(
+                    f"{results[frame_skip][env_name][0]:.0%}"
+                    for frame_skip in args.frame_skips
+                ),
+                flush=True,
+            )
+
+    print(
+        "| frame_skip | control_dt | max_path_length | success rate | env steps/s | simulated s/s |"
+    )
+    print("|---|---|---|---|---|---|")
+    for frame_skip, env_results in results.items():
+        success_rate = np.mean([result[0] for result in env_results.values()])
+        steps = sum(result[1] for result in env_results.values())
+        wall_time = sum(result[2] for result in env_results.values())
+        control_dt = frame_skip * metaworld.SawyerXYZEnv.SIM_TIMESTEP
+        max_path_length = int(
+            np.ceil(
+                metaworld.SawyerXYZEnv.max_path_length
+                * metaworld.SawyerXYZEnv.DEFAULT_FRAME_SKIP
+                / frame_skip
+            )
+        )
+        print(
+            f"| {frame_skip} | {control_dt:g}s | {max_path_length} | {success_rate:.1%} "
+            f"| {steps / wall_time:.0f} | {steps * control_dt / wall_time:.1f} |"
+        )
+
+
+if __name__ == "__main__":
+    main()
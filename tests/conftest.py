@@ -0,0 +1,14 @@
+import pytest
+
+from metaworld.goal_bank import GOAL_BANK_DIR_ENV_VAR
+from metaworld.model_cache import MODEL_CACHE_DIR_ENV_VAR
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_caches(tmp_path_factory):
+    """Keeps the goal banks and compiled models of the test session out of the user's cache directory."""
+    cache_dir = tmp_path_factory.mktemp("metaworld_cache")
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv(GOAL_BANK_DIR_ENV_VAR, str(cache_dir / "goal_banks"))
+        monkeypatch.setenv(MODEL_CACHE_DIR_ENV_VAR, str(cache_dir / "models"))
+        yield
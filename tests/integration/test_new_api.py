@@ -1,10 +1,9 @@
-import pickle
-
 import numpy as np
 import pytest
 
 import metaworld
 from metaworld import ML1, ML10, ML45, MT10, MT50
+from metaworld.task_set import decode_task_data
 from tests.helpers import step_env
 
 STEPS = 3
@@ -237,7 +236,7 @@ def check_tasks_unique(tasks, env_names):
     for env_name in env_names:
         env_to_rand_vecs[env_name] = np.array(
             [
-                pickle.loads(task.data)["rand_vec"]
+                decode_task_data(task.data)[2]
                 for task in tasks
                 if (task.env_name == env_name)
             ]
@@ -278,14 +277,14 @@ def check_target_poss_unique(env_instances, env_rand_vecs):
 def test_identical_environments():
     def helper(env, env_2):
         for i in range(len(env.train_tasks)):
-            rand_vec_1 = pickle.loads(env.train_tasks[i].data)["rand_vec"]
-            rand_vec_2 = pickle.loads(env_2.train_tasks[i].data)["rand_vec"]
+            rand_vec_1 = decode_task_data(env.train_tasks[i].data)[2]
+            rand_vec_2 = decode_task_data(env_2.train_tasks[i].data)[2]
             np.testing.assert_equal(rand_vec_1, rand_vec_2)
 
     def helper_neq(env, env_2):
         for i in range(len(env.train_tasks)):
-            rand_vec_1 = pickle.loads(env.train_tasks[i].data)["rand_vec"]
-            rand_vec_2 = pickle.loads(env_2.train_tasks[i].data)["rand_vec"]
+            rand_vec_1 = decode_task_data(env.train_tasks[i].data)[2]
+            rand_vec_2 = decode_task_data(env_2.train_tasks[i].data)[2]
             assert not (rand_vec_1 == rand_vec_2).all()
 
     # testing MT1
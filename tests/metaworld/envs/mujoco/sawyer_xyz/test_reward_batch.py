@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+import metaworld
+from metaworld.policies import ENV_POLICY_MAP
+
+BATCHED_REWARD_ENVS = [
+    env_name
+    for env_name, env_cls in metaworld.ALL_V3_ENVIRONMENTS.items()
+    if env_cls.supports_compute_reward_batch()
+]
+UNSUPPORTED_ENVS = {
+    "assembly-v3",
+    "bin-picking-v3",
+    "disassemble-v3",
+    "door-lock-v3",
+    "door-open-v3",
+    "hammer-v3",
+    "lever-pull-v3",
+    "peg-insert-side-v3",
+    "stick-pull-v3",
+}
+
+
+def _rollout(env, policy, rng, num_steps=150):
+    obs, _ = env.reset()
+    context = env.get_reward_context()
+    steps = {key: [] for key in ("actions", "obs", "rewards", "tcp_center", "pad_y")}
+    for _ in range(num_steps):
+        action = policy.get_action(obs) + rng.normal(0, 0.3, size=4)
+        action = np.clip(action, -1, 1).astype(np.float32)
+        obs, reward, *_ = env.step(action)
+        steps["actions"].append(action)
+        steps["obs"].append(obs.copy())
+        steps["rewards"].append(reward)
+        tcp_center, pad_y = env.get_gripper_positions()
+        steps["tcp_center"].append(tcp_center)
+        steps["pad_y"].append(pad_y)
+    return context, {key: np.array(value) for key, value in steps.items()}
+
+
+@pytest.mark.parametrize("env_name", BATCHED_REWARD_ENVS)
+def test_compute_reward_batch_matches_compute_reward(env_name):
+    benchmark = metaworld.MT1(env_name, seed=0)
+    env = benchmark.train_classes[env_name](visual_assets="none")
+    policy = ENV_POLICY_MAP[env_name]()
+    rng = np.random.default_rng(0)
+
+    for task in benchmark.train_tasks[:2]:
+        env.set_task(task)
+        context, steps = _rollout(env, policy, rng)
+        rewards = env.compute_reward_batch(
+            steps["actions"],
+            steps["obs"],
+            context,
+            tcp_center=steps["tcp_center"],
+            pad_y=steps["pad_y"],
+        )
+        assert rewards.shape == steps["rewards"].shape
+        # Within the float32 rounding of the rewards returned by `step()`
+        np.testing.assert_allclose(rewards, steps["rewards"], rtol=1e-6, atol=1e-6)
+
+
+def test_compute_reward_batch_mixes_episodes():
+    benchmark = metaworld.MT1("push-v3", seed=0)
+    env = benchmark.train_classes["push-v3"]()
+    policy = ENV_POLICY_MAP["push-v3"]()
+    rng = np.random.default_rng(0)
+
+    episodes = []
+    for task in benchmark.train_tasks[:2]:
+        env.set_task(task)
+        episodes.append(_rollout(env, policy, rng, num_steps=20))
+
+    def stack(*values):
+        if isinstance(values[0], dict):
+            return {key: stack(*(v[key] for v in values)) for key in values[0]}
+        return np.concatenate([np.broadcast_to(v, (20,) + v.shape) for v in values])
+
+    context = stack(*(context for context, _ in episodes))
+    steps = {
+        key: np.concatenate([steps[key] for _, steps in episodes])
+        for key in episodes[0][1]
+    }
+    rewards = env.compute_reward_batch(
+        steps["actions"],
+        steps["obs"],
+        context,
+        tcp_center=steps["tcp_center"],
+        pad_y=steps["pad_y"],
+    )
+    np.testing.assert_allclose(rewards, steps["rewards"], rtol=1e-6, atol=1e-6)
+
+
+def test_compute_reward_batch_unsupported_envs():
+    assert set(metaworld.ALL_V3_ENVIRONMENTS) - set(BATCHED_REWARD_ENVS) == (
+        UNSUPPORTED_ENVS
+    )
+    benchmark = metaworld.MT1("door-open-v3", seed=0)
+    env = benchmark.train_classes["door-open-v3"]()
+    env.set_task(benchmark.train_tasks[0])
+    env.reset()
+    with pytest.raises(NotImplementedError):
+        env.get_reward_context()
+    with pytest.raises(NotImplementedError):
+        env.compute_reward_batch(
+            np.zeros((1, 4)), np.zeros((1, 39)), {}, np.zeros((1, 3)), np.zeros((1, 2))
+        )
@@ -1,8 +1,13 @@
+import pickle
 import random
 
 import numpy as np
+import pytest
+from scipy.spatial.transform import Rotation
 
 import metaworld
+from metaworld import sawyer_xyz_env
+from metaworld.policies import ENV_POLICY_MAP
 
 
 def test_reset_returns_same_obj_and_goal():
@@ -43,3 +48,322 @@ def test_reset_returns_same_obj_and_goal():
             violating_envs_goals.append(env_name)
     assert not violating_envs_obs
     assert not violating_envs_goals
+
+
+@pytest.mark.parametrize("env_name", sorted(metaworld.ALL_V3_ENVIRONMENTS.keys()))
+def test_cached_hand_reset_matches_uncached(env_name):
+    benchmark = metaworld.MT1(env_name, seed=0)
+    env_cls = benchmark.train_classes[env_name]
+    envs = [env_cls(), env_cls()]
+    envs[1].cache_hand_reset = True
+
+    actions = np.random.default_rng(0).uniform(-1, 1, size=(5, 4))
+    for task in benchmark.train_tasks[:3] * 2:
+        for env in envs:
+            env.set_task(task)
+        (obs1, _), (obs2, _) = envs[0].reset(), envs[1].reset()
+        assert (obs1 == obs2).all()
+        assert (envs[0].init_tcp == envs[1].init_tcp).all()
+        for a in actions:
+            obs1, r1, *_ = envs[0].step(a)
+            obs2, r2, *_ = envs[1].step(a)
+            assert (obs1 == obs2).all()
+            assert r1 == r2
+
+
+def _touching_object_reference(env, object_geom_id):
+    pad_geom_ids = [env.data.geom(f"{pad}_geom").id for pad in ("leftpad", "rightpad")]
+    forces = [
+        sum(
+            env.data.efc_force[x.efc_address]
+            for x in env.data.contact
+            if pad_geom_id in (x.geom1, x.geom2)
+            and object_geom_id in (x.geom1, x.geom2)
+        )
+        for pad_geom_id in pad_geom_ids
+    ]
+    return all(0 < force for force in forces)
+
+
+@pytest.mark.parametrize("env_name", ["pick-place-v3", "stick-pull-v3", "sweep-v3"])
+def test_touching_object_matches_contact_loop(env_name):
+    benchmark = metaworld.MT1(env_name, seed=0)
+    env = benchmark.train_classes[env_name]()
+    env.set_task(benchmark.train_tasks[0])
+    policy = ENV_POLICY_MAP[env_name]()
+
+    obs, _ = env.reset()
+    object_geom_id = env._get_id_main_object()
+    touching = []
+    for _ in range(200):
+        obs, *_ = env.step(policy.get_action(obs))
+        touching.append(env.touching_object(object_geom_id))
+        assert touching[-1] == _touching_object_reference(env, object_geom_id)
+    assert any(touching) and not all(touching)
+
+
+@pytest.mark.parametrize("env_name", ["pick-place-v3", "stick-pull-v3", "reach-v3"])
+def test_obs_buffer_matches_default(env_name):
+    benchmark = metaworld.MT1(env_name, seed=0)
+    env_cls = benchmark.train_classes[env_name]
+    envs = [env_cls(), env_cls(), env_cls()]
+    envs[1].obs_buffer = "copy"
+    envs[2].obs_buffer = "view"
+
+    actions = np.random.default_rng(0).uniform(-1, 1, size=(20, 4))
+    for task in benchmark.train_tasks[:2]:
+        for env in envs:
+            env.set_task(task)
+        reset_obs = [env.reset()[0] for env in envs]
+        assert all((obs == reset_obs[0]).all() for obs in reset_obs)
+        for a in actions:
+            steps = [env.step(a) for env in envs]
+            for obs, reward, *_ in steps[1:]:
+                assert (obs == steps[0][0]).all()
+                assert reward == steps[0][1]
+            assert steps[1][0] is not envs[1]._last_stable_obs
+            assert steps[2][0] is envs[2]._obs_out_buffer
+
+
+def _scipy_xmat_to_quat(xmat):
+    return Rotation.from_matrix(xmat.reshape(3, 3)).as_quat()
+
+
+def test_xmat_to_quat_matches_scipy():
+    env = metaworld.ALL_V3_ENVIRONMENTS["reach-v3"]()
+    matrices = Rotation.random(1000, random_state=0).as_matrix()
+    # 180 degree rotations, where the sign of the quaternion is decided by the diagonal
+    matrices = np.concatenate(
+        [matrices, np.diag([1.0, -1.0, -1.0])[None], np.diag([-1.0, 1.0, -1.0])[None]]
+    )
+    for matrix in matrices:
+        xmat = matrix.ravel()
+        assert np.allclose(
+            env._xmat_to_quat(xmat), _scipy_xmat_to_quat(xmat), atol=1e-12
+        )
+
+
+@pytest.mark.parametrize("env_name", sorted(metaworld.ALL_V3_ENVIRONMENTS.keys()))
+def test_quat_objects_match_scipy(env_name):
+    benchmark = metaworld.MT1(env_name, seed=0)
+    env_cls = benchmark.train_classes[env_name]
+    envs = [env_cls(), env_cls()]
+    envs[1]._xmat_to_quat = _scipy_xmat_to_quat
+
+    actions = np.random.default_rng(0).uniform(-1, 1, size=(20, 4))
+    for env in envs:
+        env.set_task(benchmark.train_tasks[0])
+    (obs1, _), (obs2, _) = envs[0].reset(), envs[1].reset()
+    assert np.allclose(obs1, obs2, atol=1e-12)
+    for a in actions:
+        obs1, *_ = envs[0].step(a)
+        obs2, *_ = envs[1].step(a)
+        assert np.allclose(obs1, obs2, atol=1e-12)
+
+
+@pytest.mark.parametrize("env_name", sorted(metaworld.ALL_V3_ENVIRONMENTS.keys()))
+def test_restore_snapshot(env_name):
+    benchmark = metaworld.MT1(env_name, seed=0)
+    env_cls = benchmark.train_classes[env_name]
+    env = env_cls()
+    env.seed(0)
+    env.set_task(benchmark.train_tasks[0])
+    policy = ENV_POLICY_MAP[env_name]()
+    rng = np.random.default_rng(0)
+
+    obs, _ = env.reset()
+    for _ in range(30):
+        obs, *_ = env.step(policy.get_action(obs.copy()))
+    snapshot = env.snapshot()
+    actions = rng.uniform(-1, 1, size=(40, 4))
+
+    def rollout(env):
+        steps = []
+        for i, action in enumerate(actions):
+            obs, reward, *_ = env.step(action)
+            steps.append(np.append(obs, reward))
+            if i == 20:
+                steps.append(env.reset()[0])
+        return np.concatenate(steps)
+
+    expected = rollout(env)
+    env.restore(snapshot)
+    assert np.array_equal(rollout(env), expected)
+
+    other_env = env_cls()
+    other_env.set_task(benchmark.train_tasks[1])
+    other_env.reset()
+    other_env.restore(pickle.loads(pickle.dumps(snapshot)))
+    assert np.array_equal(rollout(other_env), expected)
+
+
+def test_restore_snapshot_of_other_env_class():
+    snapshot = metaworld.ALL_V3_ENVIRONMENTS["reach-v3"]().snapshot()
+    with pytest.raises(ValueError):
+        metaworld.ALL_V3_ENVIRONMENTS["push-v3"]().restore(snapshot)
+
+
+@pytest.mark.parametrize("env_name", sorted(metaworld.ALL_V3_ENVIRONMENTS.keys()))
+def test_set_physics_state(env_name):
+    benchmark = metaworld.MT1(env_name, seed=0)
+    env = benchmark.train_classes[env_name]()
+    env.set_task(benchmark.train_tasks[0])
+    policy = ENV_POLICY_MAP[env_name]()
+    actions = np.random.default_rng(0).uniform(-1, 1, size=(30, 4))
+
+    obs, _ = env.reset()
+    for _ in range(30):
+        obs, *_ = env.step(policy.get_action(obs.copy()))
+    state = env.get_physics_state()
+    assert state.shape == (env.physics_state_size,)
+
+    def rollout(env):
+        return np.concatenate([np.append(*env.step(action)[:2]) for action in actions])
+
+    expected = rollout(env)
+    assert not np.array_equal(env.get_physics_state(), state)
+    env.set_physics_state(state)
+    assert np.array_equal(env.get_physics_state(), state)
+    assert np.array_equal(rollout(env), expected)
+
+
+def test_set_physics_states_batch():
+    benchmark = metaworld.MT1("pick-place-v3", seed=0)
+    envs = [benchmark.train_classes["pick-place-v3"]() for _ in range(3)]
+    rng = np.random.default_rng(0)
+    for env in envs:
+        env.set_task(benchmark.train_tasks[0])
+        env.reset()
+        for action in rng.uniform(-1, 1, size=(10, 4)):
+            env.step(action)
+
+    states = sawyer_xyz_env.get_physics_states(envs)
+    assert states.shape == (3, envs[0].physics_state_size)
+    actions = rng.uniform(-1, 1, size=(20, 4))
+    expected = [[env.step(action)[0] for action in actions] for env in envs]
+
+    # Every env continues from the state of the next one
+    sawyer_xyz_env.set_physics_states(envs, np.roll(states, -1, axis=0))
+    for i, env in enumerate(envs):
+        observations = [env.step(action)[0] for action in actions]
+        assert np.array_equal(observations, expected[(i + 1) % len(envs)])
+
+
+def test_get_physics_states_of_different_env_classes():
+    envs = [
+        metaworld.ALL_V3_ENVIRONMENTS["reach-v3"](),
+        metaworld.ALL_V3_ENVIRONMENTS["push-v3"](),
+    ]
+    with pytest.raises(ValueError):
+        sawyer_xyz_env.get_physics_states(envs)
+
+
+@pytest.mark.parametrize("env_name", sorted(metaworld.ALL_V3_ENVIRONMENTS.keys()))
+def test_step_forward_kinematics_matches_full(env_name):
+    benchmark = metaworld.MT1(env_name, seed=0)
+    envs = [benchmark.train_classes[env_name]() for _ in range(2)]
+    for env in envs:
+        env.set_task(benchmark.train_tasks[0])
+    full_env, kinematics_env = envs
+    kinematics_env.step_forward = "kinematics"
+    policy = ENV_POLICY_MAP[env_name]()
+    rng = np.random.default_rng(0)
+
+    obs, _ = full_env.reset()
+    assert np.array_equal(kinematics_env.reset()[0], obs)
+    for _ in range(150):
+        # `mj_forward()` also updates the solver's warm start, which slightly changes the next step,
+        # so start both envs from the same physics state
+        kinematics_env.set_physics_state(full_env.get_physics_state())
+        action = np.clip(policy.get_action(obs.copy()) + rng.normal(0, 0.3, 4), -1, 1)
+        obs, reward, _, truncated, info = full_env.step(action)
+        (
+            kinematics_obs,
+            kinematics_reward,
+            _,
+            kinematics_truncated,
+            kinematics_info,
+        ) = kinematics_env.step(action)
+        assert np.array_equal(kinematics_obs, obs)
+        assert kinematics_reward == reward
+        assert kinematics_truncated == truncated
+        assert kinematics_info == info
+
+
+@pytest.mark.parametrize("env_name", ["reach-v3", "pick-place-v3", "drawer-open-v3"])
+def test_frame_skip_keeps_simulated_time(env_name):
+    benchmark = metaworld.MT1(env_name, seed=0)
+    env = benchmark.train_classes[env_name](frame_skip=10)
+    assert env.model.opt.timestep == env.SIM_TIMESTEP
+    assert env.dt == 10 * env.SIM_TIMESTEP
+    assert env.max_path_length == 250
+    assert env.metadata["render_fps"] == 40
+
+    policy = ENV_POLICY_MAP[env_name]()
+    for task in benchmark.train_tasks[:3]:
+        env.set_task(task)
+        obs, _ = env.reset()
+        assert env.data.time == pytest.approx(50 * 5 * env.SIM_TIMESTEP)
+        for _ in range(env.max_path_length):
+            obs, _, _, truncated, info = env.step(policy.get_action(obs.copy()))
+            if info["success"]:
+                break
+        assert info["success"]
+
+
+def test_make_envs_with_control_dt():
+    env = metaworld.make_mt_envs("reach-v3", seed=0, control_dt=0.025)
+    assert env.unwrapped.frame_skip == 10
+    assert env.unwrapped.max_path_length == 250
+    obs, _ = env.reset()
+    for _ in range(250):
+        obs, _, _, truncated, _ = env.step(env.action_space.sample())
+    assert truncated
+
+    with pytest.raises(ValueError):
+        metaworld.make_mt_envs("reach-v3", control_dt=0.026)
+    with pytest.raises(ValueError):
+        metaworld.make_mt_envs("reach-v3", frame_skip=10, control_dt=0.025)
+
+
+@pytest.mark.parametrize(
+    "env_name", ["pick-place-v3", "coffee-push-v3", "sweep-into-v3"]
+)
+def test_sample_rand_vecs_matches_resets(env_name):
+    envs = [metaworld.ALL_V3_ENVIRONMENTS[env_name]() for _ in range(2)]
+    for env in envs:
+        env._freeze_rand_vec = False
+        env.seeded_rand_vec = True
+        env.seed(0)
+    env, batched_env = envs
+    assert env.RAND_VEC_CONSTRAINTS
+    expected = np.stack([env._get_state_rand_vec() for _ in range(300)])
+    rand_vecs = batched_env.sample_rand_vecs(300)
+    assert np.array_equal(expected, rand_vecs)
+    assert batched_env.rand_vec_is_valid(rand_vecs).all()
+    # The RNGs are left in the same state
+    assert np.array_equal(env._get_state_rand_vec(), batched_env.sample_rand_vecs(1)[0])
+    # Some candidates must have been rejected
+    candidates = np.random.default_rng(0).uniform(
+        env._random_reset_space.low, env._random_reset_space.high, size=(1000, 6)
+    )
+    assert not env.rand_vec_is_valid(candidates).all()
+
+
+def test_sample_rand_vecs_consumes_rng_up_to_last_valid(monkeypatch):
+    env = metaworld.ALL_V3_ENVIRONMENTS["pick-place-v3"]()
+    num = 5
+    # Exactly `num` of the first batch of candidates are valid, the last at index 2 * num - 2
+    monkeypatch.setattr(
+        env,
+        "rand_vec_is_valid",
+        lambda candidates: (np.arange(len(candidates)) < 2 * num - 1)
+        & (np.arange(len(candidates)) % 2 == 0),
+    )
+    low, high = env._random_reset_space.low, env._random_reset_space.high
+    np_random = np.random.default_rng(0)
+    expected_rng = np.random.default_rng(0)
+    rand_vecs = env.sample_rand_vecs(num, np_random)
+    expected = expected_rng.uniform(low, high, size=(2 * num - 1, low.size))[::2]
+    assert np.array_equal(rand_vecs, expected)
+    assert np_random.bit_generator.state == expected_rng.bit_generator.state
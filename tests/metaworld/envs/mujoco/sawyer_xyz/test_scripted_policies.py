@@ -1,10 +1,13 @@
 import random
+import warnings
 
+import gymnasium as gym
 import numpy as np
 import pytest
 
 from metaworld import MT1
 from metaworld.policies import ENV_POLICY_MAP
+from metaworld.policies.rollout import Trajectories, rollout
 
 
 @pytest.mark.parametrize("env_name", MT1.ENV_NAMES)
@@ -33,3 +36,56 @@ def test_policy(env_name):
                 completed += 1
                 break
     assert (float(completed) / 50) >= 0.80
+
+
+@pytest.mark.parametrize("env_name", sorted(ENV_POLICY_MAP))
+def test_policy_batch_matches_scalar(env_name):
+    rng = np.random.default_rng(0)
+    num_obs = 2000
+    # Objects and goals at several distances from the hand, to reach every branch
+    hand_pos = rng.uniform([-0.3, 0.4, 0.0], [0.3, 0.9, 0.4], (num_obs, 3))
+    scale = rng.choice([0.005, 0.02, 0.05, 0.2], (num_obs, 1))
+    obs = rng.normal(size=(num_obs, 39)) * 0.1
+    obs[:, :3] = hand_pos
+    obs[:, 3] = rng.uniform(0.0, 1.0, num_obs)
+    for pos in (slice(4, 7), slice(11, 14), slice(36, 39)):
+        obs[:, pos] = hand_pos + rng.normal(size=(num_obs, 3)) * scale
+    obs_copy = obs.copy()
+
+    p = ENV_POLICY_MAP[env_name]()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        expected = np.stack([p.get_action(o.copy()) for o in obs])
+        actions = p.get_action_batch(obs)
+    assert actions.dtype == np.float32
+    assert np.array_equal(actions, expected)
+    assert np.array_equal(obs, obs_copy)
+
+
+def test_rollout(tmp_path):
+    envs = gym.make_vec(
+        "Meta-World/custom-mt-envs",
+        vector_strategy="native",
+        envs_list=["reach-v3", "drawer-open-v3", "reach-v3"],
+        seed=42,
+        use_one_hot=True,
+        terminate_on_success=True,
+    )
+    trajectories = rollout(envs, num_steps=150, seed=42)
+    assert trajectories.observations.shape == (150, 3, 42)
+    assert trajectories.actions.shape == (150, 3, 4)
+    policies = [ENV_POLICY_MAP[name]() for name in ("reach-v3", "drawer-open-v3")]
+    for i, p in enumerate([policies[0], policies[1], policies[0]]):
+        expected = np.stack(
+            [p.get_action(o[:39].copy()) for o in trajectories.observations[:, i]]
+        )
+        assert np.array_equal(trajectories.actions[:, i], expected)
+    ends = trajectories.terminations & trajectories.valid
+    assert np.array_equal(ends, trajectories.successes & trajectories.valid)
+    assert ends.any(axis=0).all()
+
+    trajectories.save(tmp_path / "trajectories.npz")
+    loaded = Trajectories.load(tmp_path / "trajectories.npz")
+    for field, loaded_field in zip(trajectories, loaded):
+        assert np.array_equal(field, loaded_field)
+    envs.close()
@@ -0,0 +1,53 @@
+import numpy as np
+from gymnasium.spaces import Box
+
+import metaworld
+from metaworld.goal_bank import GOAL_BANK_DIR_ENV_VAR, goal_bank_path
+
+
+def _make_benchmark():
+    return metaworld.CustomML(["reach-v3", "push-v3"], ["door-open-v3"], seed=42)
+
+
+def test_goal_bank_matches_generated_goals(tmp_path, monkeypatch):
+    monkeypatch.setenv(GOAL_BANK_DIR_ENV_VAR, "")
+    generated = _make_benchmark()
+    assert not any(tmp_path.iterdir())
+
+    monkeypatch.setenv(GOAL_BANK_DIR_ENV_VAR, str(tmp_path))
+    saved = _make_benchmark()
+    assert len(list(tmp_path.glob("*.npz"))) == 2
+    loaded = _make_benchmark()
+
+    for benchmark in (saved, loaded):
+        assert benchmark.train_tasks == generated.train_tasks
+        assert benchmark.test_tasks == generated.test_tasks
+
+
+def test_goal_bank_ignores_invalid_files(tmp_path, monkeypatch):
+    monkeypatch.setenv(GOAL_BANK_DIR_ENV_VAR, str(tmp_path))
+    expected = _make_benchmark()
+    for path in tmp_path.glob("*.npz"):
+        path.write_bytes(b"not a goal bank")
+    assert _make_benchmark().train_tasks == expected.train_tasks
+
+
+def test_goal_bank_key_covers_reset_space(tmp_path, monkeypatch):
+    monkeypatch.setenv(GOAL_BANK_DIR_ENV_VAR, str(tmp_path))
+
+    def make_env_cls(goal_high):
+        class Reach(metaworld.ALL_V3_ENVIRONMENTS["reach-v3"]):
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                self._random_reset_space = Box(
+                    self._random_reset_space.low, goal_high, dtype=np.float64
+                )
+
+        return Reach
+
+    high = metaworld.ALL_V3_ENVIRONMENTS["reach-v3"]()._random_reset_space.high
+    paths = {
+        goal_bank_path({"reach-v3": make_env_cls(goal_high)}, seed=42, num_goals=50)
+        for goal_high in (high, high + 0.01, high)
+    }
+    assert len(paths) == 2
@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+import metaworld
+from metaworld import model_cache
+from metaworld.model_cache import MODEL_CACHE_DIR_ENV_VAR
+from metaworld.policies import ENV_POLICY_MAP
+
+
+def _rollout(env_name):
+    benchmark = metaworld.MT1(env_name, seed=0)
+    env = benchmark.train_classes[env_name]()
+    env.set_task(benchmark.train_tasks[0])
+    obs, _ = env.reset()
+    trajectory = [obs]
+    for action in np.random.default_rng(0).uniform(-1, 1, size=(20, 4)):
+        trajectory.append(env.step(action)[0])
+    return np.array(trajectory)
+
+
+def test_cached_models_match_compiled_models(tmp_path, monkeypatch):
+    monkeypatch.setattr(model_cache, "_MODELS", model_cache._MODELS.__class__())
+    monkeypatch.setenv(MODEL_CACHE_DIR_ENV_VAR, "")
+    compiled = _rollout("pick-place-v3")
+    assert not any(tmp_path.iterdir())
+
+    monkeypatch.setenv(MODEL_CACHE_DIR_ENV_VAR, str(tmp_path))
+    model_cache._MODELS.clear()
+    saved = _rollout("pick-place-v3")
+    assert len(list(tmp_path.glob("*.mjb"))) == 1
+    model_cache._MODELS.clear()
+    loaded = _rollout("pick-place-v3")
+    in_process = _rollout("pick-place-v3")
+
+    for trajectory in (saved, loaded, in_process):
+        assert np.array_equal(trajectory, compiled)
+
+
+def test_envs_get_their_own_model(monkeypatch):
+    monkeypatch.setenv(MODEL_CACHE_DIR_ENV_VAR, "")
+    env_cls = metaworld.ALL_V3_ENVIRONMENTS["reach-v3"]
+    env1, env2 = env_cls(), env_cls()
+    assert env1.model is not env2.model
+    env1.model.body_pos[1] += 1.0
+    assert not np.array_equal(env1.model.body_pos, env2.model.body_pos)
+
+
+def test_model_cache_ignores_invalid_files(tmp_path, monkeypatch):
+    # MuJoCo logs the rejected files to MUJOCO_LOG.TXT in the working directory
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(model_cache, "_MODELS", model_cache._MODELS.__class__())
+    monkeypatch.setenv(MODEL_CACHE_DIR_ENV_VAR, str(tmp_path))
+    expected = _rollout("reach-v3")
+    for path in tmp_path.glob("*.mjb"):
+        path.write_bytes(b"not a model")
+    model_cache._MODELS.clear()
+    assert np.array_equal(_rollout("reach-v3"), expected)
+
+
+def _collision_geometry(model):
+    collides = (model.geom_contype != 0) | (model.geom_conaffinity != 0)
+    return [
+        getattr(model, name)[collides]
+        for name in (
+            "geom_type",
+            "geom_bodyid",
+            "geom_contype",
+            "geom_conaffinity",
+            "geom_size",
+            "geom_pos",
+            "geom_quat",
+            "geom_friction",
+            "geom_margin",
+        )
+    ]
+
+
+@pytest.mark.parametrize("env_name", sorted(metaworld.ALL_V3_ENVIRONMENTS.keys()))
+def test_no_visual_assets_matches_full(env_name):
+    benchmark = metaworld.MT1(env_name, seed=0)
+    env_cls = benchmark.train_classes[env_name]
+    full, stripped = env_cls(), env_cls(visual_assets="none")
+    assert stripped.model.ntex == 0
+
+    for name in ("body_mass", "body_inertia", "body_ipos", "body_iquat"):
+        assert np.array_equal(getattr(full.model, name), getattr(stripped.model, name))
+    for expected, actual in zip(
+        _collision_geometry(full.model), _collision_geometry(stripped.model)
+    ):
+        assert np.array_equal(expected, actual)
+
+    policy = ENV_POLICY_MAP[env_name]()
+    rng = np.random.default_rng(0)
+    for env in (full, stripped):
+        env.set_task(benchmark.train_tasks[0])
+    (obs, _), (stripped_obs, _) = full.reset(), stripped.reset()
+    assert np.array_equal(obs, stripped_obs)
+    for _ in range(100):
+        action = np.clip(policy.get_action(obs.copy()) + rng.normal(0, 0.3, 4), -1, 1)
+        obs, reward, *_ = full.step(action)
+        stripped_obs, stripped_reward, *_ = stripped.step(action)
+        assert np.array_equal(obs, stripped_obs)
+        assert reward == stripped_reward
@@ -0,0 +1,107 @@
+import pickle
+
+import numpy as np
+import pytest
+
+import metaworld
+from metaworld.task_set import TaskSet, decode_task_data
+from metaworld.types import Task
+
+
+def _rand_vec(task):
+    return decode_task_data(task.data)[2]
+
+
+def test_num_goals():
+    benchmark = metaworld.MT1("reach-v3", seed=0, num_goals=2000)
+    tasks = benchmark.train_tasks
+    assert isinstance(tasks, TaskSet)
+    assert len(tasks) == 2000
+    rand_vecs = np.stack([_rand_vec(task) for task in tasks])
+    assert len(np.unique(rand_vecs, axis=0)) == 2000
+    # The first goals don't depend on the number of goals
+    assert metaworld.MT1("reach-v3", seed=0).train_tasks == tasks[:50]
+
+    env = benchmark.train_classes["reach-v3"]()
+    env.set_task(tasks[1234])
+    env.reset()
+    assert np.array_equal(env._last_rand_vec, rand_vecs[1234])
+
+
+def test_subsets():
+    benchmark = metaworld.CustomML(["reach-v3", "push-v3"], ["door-open-v3"], seed=0)
+    tasks = benchmark.train_tasks
+    assert tasks.env_names == ["reach-v3", "push-v3"]
+    eager_tasks = TaskSet.from_tasks(list(tasks))
+    assert eager_tasks == tasks
+
+    for task_set in (tasks, eager_tasks):
+        push_tasks = task_set.for_env("push-v3")
+        assert push_tasks == [task for task in tasks if task.env_name == "push-v3"]
+        subset = push_tasks.take(slice(3, None, 4))
+        assert subset == push_tasks[3::4]
+        assert subset.with_indices(subset.indices[::-1]) == push_tasks[3::4][::-1]
+        assert pickle.loads(pickle.dumps(subset)) == subset
+
+
+def test_task_select_checkpoint():
+    def make_env():
+        return metaworld.make_mt_envs(
+            "reach-v3", seed=0, num_goals=500, task_select="pseudorandom"
+        )
+
+    env = make_env()
+    for _ in range(600):
+        env.get_wrapper_attr("_set_pseudo_random_task")()
+    ckpt = env.get_checkpoint()
+    assert len(pickle.dumps(ckpt)) < 10_000
+
+    loaded_env = make_env()
+    loaded_env.load_checkpoint([ckpt])
+    for _ in range(500):
+        for e in (env, loaded_env):
+            e.get_wrapper_attr("_set_pseudo_random_task")()
+        assert np.array_equal(
+            env.unwrapped._last_rand_vec, loaded_env.unwrapped._last_rand_vec
+        )
+
+
+def test_binary_task_data():
+    benchmark = metaworld.MT1("reach-v3", seed=0)
+    env_cls = benchmark.train_classes["reach-v3"]
+    task = benchmark.train_tasks[7]
+    env_id, partially_observable, rand_vec = decode_task_data(task.data)
+    assert env_id == env_cls.TASK_ENV_ID
+    assert not partially_observable
+    assert len(task.data) == 8 + 8 * len(rand_vec)
+
+    # Pickled task data is still supported
+    pickled_task = Task(
+        env_name="reach-v3",
+        data=pickle.dumps(
+            dict(env_cls=env_cls, rand_vec=rand_vec.copy(), partially_observable=False)
+        ),
+    )
+    observations = []
+    for t in (task, pickled_task):
+        env = env_cls()
+        env.set_task(t)
+        observations.append(env.reset(seed=0)[0])
+    assert np.array_equal(*observations)
+
+    with pytest.raises(ValueError):
+        benchmark.train_classes["reach-v3"]().set_task(
+            metaworld.MT1("push-v3", seed=0).train_tasks[0]
+        )
+
+
+def test_task_env_ids():
+    env_ids = [
+        env_cls.__dict__.get("TASK_ENV_ID")
+        for env_cls in metaworld.ALL_V3_ENVIRONMENTS.values()
+    ]
+    # Declared by each env, and the same as their `task_id`s
+    assert env_ids == list(range(len(metaworld.ALL_V3_ENVIRONMENTS)))
+    for env_name, args in metaworld.env_dict.MT50_V3_ARGS_KWARGS.items():
+        env_cls = metaworld.ALL_V3_ENVIRONMENTS[env_name]
+        assert args["kwargs"]["task_id"] == env_cls.TASK_ENV_ID
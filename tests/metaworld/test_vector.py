@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import pickle
+from functools import partial
+
+import gymnasium as gym
+import numpy as np
+import pytest
+
+import metaworld
+from metaworld.vector import NativeVectorEnv, SharedMemoryVectorEnv, ThreadedVectorEnv
+
+ENVS_LIST = ["reach-v3", "pick-place-v3", "bin-picking-v3", "door-open-v3"]
+VECTOR_ENVS = {
+    "native": NativeVectorEnv,
+    "shared_memory": SharedMemoryVectorEnv,
+    "threaded": ThreadedVectorEnv,
+}
+VECTOR_CASES = [
+    ("native", {}),
+    ("shared_memory", {}),
+    ("shared_memory", {"num_workers": 3}),
+    ("threaded", {"num_workers": 3}),
+]
+
+
+def _make_envs(
+    vector_strategy: str, autoreset_mode: gym.vector.AutoresetMode, **kwargs
+):
+    return gym.make_vec(
+        "Meta-World/custom-mt-envs",
+        vector_strategy=vector_strategy,
+        envs_list=ENVS_LIST,
+        seed=42,
+        use_one_hot=True,
+        autoreset_mode=autoreset_mode,
+        **kwargs,
+    )
+
+
+def _assert_infos_equal(expected: dict, actual: dict):
+    for key, value in expected.items():
+        if key.startswith("_") or key == "final_obs":
+            continue
+        assert key in actual, key
+        if isinstance(value, dict):
+            _assert_infos_equal(value, actual[key])
+            continue
+        mask = expected[f"_{key}"]
+        assert np.array_equal(mask, actual[f"_{key}"]), key
+        if key == "t":  # wall-clock episode time
+            continue
+        assert np.array_equal(
+            np.asarray(value, dtype=np.float64)[mask], actual[key][mask]
+        ), key
+
+
+@pytest.mark.parametrize("vector_strategy,vector_kwargs", VECTOR_CASES)
+@pytest.mark.parametrize(
+    "autoreset_mode,recurrent_info_in_obs",
+    (
+        (gym.vector.AutoresetMode.SAME_STEP, False),
+        (gym.vector.AutoresetMode.NEXT_STEP, True),
+    ),
+)
+def test_matches_sync(
+    vector_strategy: str,
+    vector_kwargs: dict,
+    autoreset_mode: gym.vector.AutoresetMode,
+    recurrent_info_in_obs: bool,
+):
+    kwargs = dict(
+        max_episode_steps=15,
+        terminate_on_success=True,
+        recurrent_info_in_obs=recurrent_info_in_obs,
+    )
+    sync_envs = _make_envs("sync", autoreset_mode, **kwargs)
+    envs = _make_envs(
+        vector_strategy,
+        autoreset_mode,
+        **kwargs,
+        **vector_kwargs,
+    )
+    assert isinstance(envs, VECTOR_ENVS[vector_strategy])
+    assert envs.observation_space == sync_envs.observation_space
+
+    sync_obs, _ = sync_envs.reset()
+    obs, _ = envs.reset()
+    assert np.array_equal(sync_obs, obs)
+
+    action_space = sync_envs.action_space
+    action_space.seed(0)
+    for _ in range(40):
+        actions = action_space.sample()
+        sync_step = sync_envs.step(actions)
+        step = envs.step(actions)
+        for expected, actual in zip(sync_step[:4], step[:4]):
+            assert np.array_equal(expected, actual)
+        _assert_infos_equal(sync_step[4], step[4])
+        if "final_obs" in sync_step[4]:
+            mask = sync_step[4]["_final_obs"]
+            assert np.array_equal(
+                np.stack(sync_step[4]["final_obs"][mask]),
+                np.stack(step[4]["final_obs"][mask]),
+            )
+
+    assert envs.get_attr("task_name") == sync_envs.get_attr("task_name")
+    envs.call("toggle_terminate_on_success", False)
+    assert not any(envs.get_attr("terminate_on_success"))
+    envs.close()
+    sync_envs.close()
+
+
+def test_native_rejects_unsupported_wrappers():
+    with pytest.raises(ValueError):
+        _make_envs(
+            "native",
+            gym.vector.AutoresetMode.SAME_STEP,
+            reward_normalization_method="exponential",
+        )
+
+
+def test_threaded_raises_sub_env_errors():
+    envs = _make_envs("threaded", gym.vector.AutoresetMode.DISABLED, num_workers=2)
+    envs.reset()
+    envs.set_attr("curr_path_length", [0, 0, 0, 500])
+    with pytest.raises(ValueError):
+        envs.step(envs.action_space.sample())
+    envs.close()
+
+
+def test_num_workers_requires_worker_strategy():
+    with pytest.raises(ValueError):
+        _make_envs("sync", gym.vector.AutoresetMode.SAME_STEP, num_workers=2)
+
+
+def test_shared_memory_threaded_workers():
+    env_fns = [
+        partial(metaworld.make_mt_envs, env_name, seed=42, max_episode_steps=15)
+        for env_name in ENVS_LIST
+    ]
+    expected_envs = SharedMemoryVectorEnv(env_fns)
+    envs = SharedMemoryVectorEnv(env_fns, num_workers=2, worker_threads=2)
+    assert len(envs.processes) == 2
+    assert np.array_equal(envs.reset(seed=0)[0], expected_envs.reset(seed=0)[0])
+    envs.action_space.seed(0)
+    for _ in range(20):
+        actions = envs.action_space.sample()
+        expected = expected_envs.step(actions)
+        step = envs.step(actions)
+        for expected_value, value in zip(expected[:4], step[:4]):
+            assert np.array_equal(expected_value, value)
+        _assert_infos_equal(expected[4], step[4])
+    assert envs.get_attr("max_path_length") == expected_envs.get_attr("max_path_length")
+    envs.close()
+    expected_envs.close()
+
+
+def test_shared_memory_send_recv():
+    sync_envs = _make_envs(
+        "sync", gym.vector.AutoresetMode.NEXT_STEP, max_episode_steps=15
+    )
+    envs = _make_envs(
+        "shared_memory",
+        gym.vector.AutoresetMode.NEXT_STEP,
+        max_episode_steps=15,
+        num_workers=4,
+    )
+    assert np.array_equal(sync_envs.reset()[0], envs.reset()[0])
+    groups = [np.array([0, 1]), np.array([2, 3])]
+    action_space = sync_envs.action_space
+    action_space.seed(0)
+    for step in range(20):
+        actions = action_space.sample()
+        expected = sync_envs.step(actions)
+        if step % 2 == 0:
+            # Double-buffered groups
+            for group in groups:
+                envs.send(actions[group], group)
+            with pytest.raises(gym.error.AlreadyPendingCallError):
+                envs.send(actions[groups[0]], groups[0])
+            results = [envs.recv(group) for group in groups]
+        else:
+            # Whichever sub-environments finish first
+            envs.send(actions)
+            with pytest.raises(gym.error.AlreadyPendingCallError):
+                envs.step(actions)
+            results, received = [], 0
+            while received < envs.num_envs:
+                results.append(envs.recv())
+                received += len(results[-1][5])
+        env_ids = np.concatenate([result[5] for result in results])
+        assert sorted(env_ids) == list(range(envs.num_envs))
+        for i, expected_value in enumerate(expected[:4]):
+            value = np.concatenate([result[i] for result in results])
+            assert np.array_equal(expected_value[env_ids], value)
+        for result in results:
+            _assert_infos_equal(
+                metaworld.vector.shared_memory._select_info(expected[4], result[5]),
+                result[4],
+            )
+    with pytest.raises(gym.error.NoAsyncCallError):
+        envs.recv()
+    envs.close()
+    sync_envs.close()
+
+
+def _run_first_k_ready(**vector_kwargs):
+    env_fns = [
+        partial(metaworld.make_mt_envs, env_name, seed=42, max_episode_steps=15)
+        for env_name in ENVS_LIST
+    ]
+    envs = SharedMemoryVectorEnv(env_fns, **vector_kwargs)
+    envs.reset(seed=0)
+    envs.single_action_space.seed(0)
+    envs.send(np.stack([envs.single_action_space.sample() for _ in env_fns]))
+    results = []
+    for _ in range(20):
+        obs, rewards, *_, env_ids = envs.recv(batch_size=2)
+        assert len(env_ids) == 2
+        assert envs._stepping.sum() + envs._ready.sum() == len(env_fns) - 2
+        results.append((obs, rewards, env_ids))
+        actions = np.stack([envs.single_action_space.sample() for _ in env_ids])
+        envs.send(actions, env_ids)
+    envs.close()
+    return results
+
+
+def test_shared_memory_first_k_ready():
+    expected = _run_first_k_ready(recv_seed=0)
+    # The returned sub-environments don't depend on the timing of the workers
+    for results in (
+        _run_first_k_ready(recv_seed=0),
+        _run_first_k_ready(recv_seed=0, num_workers=2),
+    ):
+        for expected_values, values in zip(expected, results):
+            for expected_value, value in zip(expected_values, values):
+                assert np.array_equal(expected_value, value)
+    _run_first_k_ready()
+
+
+@pytest.mark.parametrize("vector_strategy,vector_kwargs", VECTOR_CASES[:3])
+def test_checkpoint(vector_strategy: str, vector_kwargs: dict):
+    def make_envs(seed):
+        return gym.make_vec(
+            "Meta-World/custom-mt-envs",
+            vector_strategy=vector_strategy,
+            envs_list=ENVS_LIST,
+            seed=seed,
+            use_one_hot=True,
+            max_episode_steps=15,
+            autoreset_mode=gym.vector.AutoresetMode.NEXT_STEP,
+            **vector_kwargs,
+        )
+
+    envs = make_envs(seed=42)
+    envs.reset(seed=0)
+    envs.action_space.seed(0)
+    for _ in range(12):
+        envs.step(envs.action_space.sample())
+    ckpt = envs.get_checkpoint(physics=True)
+    assert len(ckpt["task_bank"]) == len(ENVS_LIST)
+    actions = [envs.action_space.sample() for _ in range(10)]
+    expected = [envs.step(action) for action in actions]
+    envs.close()
+
+    # Envs with other goals and RNGs resume from the checkpoint
+    loaded_envs = make_envs(seed=7)
+    loaded_envs.reset(seed=1)
+    loaded_envs.load_checkpoint(ckpt)
+    for action, expected_step in zip(actions, expected):
+        step = loaded_envs.step(action)
+        for expected_value, value in zip(expected_step[:4], step[:4]):
+            assert np.array_equal(expected_value, value)
+        # The episode statistics aren't part of the checkpoint
+        expected_info = {k: v for k, v in expected_step[4].items() if k != "episode"}
+        _assert_infos_equal(expected_info, step[4])
+    loaded_envs.close()
+
+
+def test_checkpoint_shares_tasks():
+    envs = NativeVectorEnv(
+        [
+            partial(
+                metaworld.make_mt_envs, "reach-v3", seed=42, num_goals=1000, num_tasks=1
+            )
+            for _ in range(20)
+        ]
+    )
+    envs.reset(seed=0)
+    ckpt = envs.get_checkpoint()
+    assert len(ckpt["task_bank"]) == 1
+    # The sub-envs' checkpoints only store their task indices and RNG states
+    assert len(pickle.dumps(ckpt)) < 250_000
+    envs.load_checkpoint(pickle.loads(pickle.dumps(ckpt)))
+    envs.close()
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from metaworld.utils import reward_utils
+
+SIGMOIDS = [
+    "gaussian",
+    "hyperbolic",
+    "long_tail",
+    "reciprocal",
+    "cosine",
+    "linear",
+    "quadratic",
+    "tanh_squared",
+]
+
+
+@pytest.mark.parametrize("sigmoid", SIGMOIDS)
+def test_tolerance_batch_matches_tolerance(sigmoid):
+    rng = np.random.default_rng(0)
+    x = rng.uniform(-1.0, 1.0, size=200)
+    lower = rng.uniform(-0.5, 0.0, size=200)
+    upper = lower + rng.uniform(0.0, 0.5, size=200)
+    margin = rng.uniform(0.0, 0.5, size=200)
+    margin[::4] = 0.0
+
+    batch = reward_utils.tolerance_batch(
+        x, bounds=(lower, upper), margin=margin, sigmoid=sigmoid
+    )
+    expected = [
+        reward_utils.tolerance(x[i], (lower[i], upper[i]), margin[i], sigmoid)
+        for i in range(len(x))
+    ]
+    assert batch.dtype == np.float64
+    assert np.array_equal(batch, expected)
+
+
+def test_tolerance_batch_raises_on_invalid_arguments():
+    with pytest.raises(ValueError):
+        reward_utils.tolerance_batch(np.zeros(3), bounds=(np.ones(3), np.zeros(3)))
+    with pytest.raises(ValueError):
+        reward_utils.tolerance_batch(np.zeros(3), margin=np.array([0.1, -0.1, 0.1]))
+
+
+def test_hamacher_product_batch_matches_hamacher_product():
+    rng = np.random.default_rng(0)
+    a = rng.uniform(0.0, 1.0, size=200)
+    b = rng.uniform(0.0, 1.0, size=200)
+    a[:10], b[:5] = 0.0, 0.0
+
+    batch = reward_utils.hamacher_product_batch(a, b)
+    expected = [reward_utils.hamacher_product(a[i], b[i]) for i in range(len(a))]
+    assert np.array_equal(batch, expected)
+
+    with pytest.raises(ValueError):
+        reward_utils.hamacher_product_batch(a, b + 1.0)
+
+
+def test_rect_prism_tolerance_batch_matches_rect_prism_tolerance():
+    rng = np.random.default_rng(0)
+    zero = np.array([0.1, 0.6, 0.3])
+    one = np.array([-0.1, 0.8, 0.0])
+    curr = rng.uniform([-0.2, 0.5, -0.1], [0.2, 0.9, 0.4], size=(200, 3))
+
+    batch = reward_utils.rect_prism_tolerance_batch(curr, zero, one)
+    expected = [reward_utils.rect_prism_tolerance(c, zero, one) for c in curr]
+    assert np.array_equal(batch, expected)